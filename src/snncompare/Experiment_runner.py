@@ -6,7 +6,10 @@ setting of the experiment configuration settings.
 
 import copy
 import multiprocessing
-from typing import Dict, List, Optional, Union
+import time
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import customshowme
 import networkx as nx
@@ -39,6 +42,14 @@ from snncompare.export_results.analysis.create_performance_plots import (
     create_performance_plots,
     get_completed_and_missing_run_configs,
 )
+from snncompare.export_results.async_writer import (
+    flush_writes,
+    submit_write_job,
+)
+from snncompare.export_results.output_run_metrics import (
+    get_run_metrics_filepath,
+    output_run_metrics,
+)
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     output_stage_1_configs_and_input_graphs,
 )
@@ -74,6 +85,11 @@ from snncompare.run_config.Run_config import Run_config
 from snncompare.simulation.add_radiation_graphs import (
     ensure_empty_rad_snns_exist,
 )
+from snncompare.simulation.memory_budget import (
+    Peak_rss_monitor,
+    get_spill_dir,
+    release_simulation_arrays,
+)
 
 from .graph_generation.stage_1_create_graphs import (
     get_graphs_stage_1,
@@ -103,6 +119,8 @@ class Experiment_runner:
         reverse: bool,
         perform_run: Optional[bool] = True,
         specific_run_config: Optional[Run_config] = None,
+        run_config_filter: Optional[str] = None,
+        shard: Optional[Tuple[int, int]] = None,
     ) -> None:
         # Ensure output directories are created for stages 1 to 4.
         create_root_dir_if_not_exists(root_dir_name="results")
@@ -118,12 +136,17 @@ class Experiment_runner:
         self.supp_exp_config = Supported_experiment_settings()
         create_mdsa_input_graphs_from_exp_config(exp_config=exp_config)
         self.run_configs = generate_run_configs(
-            exp_config=exp_config, specific_run_config=specific_run_config
+            exp_config=exp_config,
+            specific_run_config=specific_run_config,
+            filter_expression=run_config_filter,
+            shard=shard,
         )
 
         if reverse:
             self.run_configs.reverse()
 
+        # The stages that are computed, instead of loaded, in the current run.
+        self.computed_stages: Set[int] = set()
         if perform_run:  # Used to get quick Experiment_runner for testing.
             print("Performing run.\n\n")
             self.__perform_run(
@@ -131,6 +154,8 @@ class Experiment_runner:
                 output_config=output_config,
                 run_configs=self.run_configs,
             )
+        # Barrier: stages 5, 6 and the failure modes read the outputted files.
+        flush_writes()
 
         if 5 in output_config.output_json_stages:
             print("Generating boxplot results.\n\n")
@@ -162,39 +187,94 @@ class Experiment_runner:
         """
         plot_config = get_default_plot_config()
         results_nx_graphs: Dict
+        memory_budget = output_config.extra_storing_config.memory_budget
         for i, run_config in enumerate(run_configs):
             print(f"\n{i+1}/{len(run_configs)} [runs]")
             run_config.print_run_config_dict()
-            results_nx_graphs = self.perform_run_stage_1(
-                exp_config=exp_config,
-                output_config=output_config,
-                plot_config=plot_config,
-                run_config=run_config,
-            )
+            # Wall time per computed stage, used to calibrate the cost
+            # estimator. Stages that are loaded from file are not recorded.
+            stage_durations: Dict[int, float] = {}
+            self.computed_stages = set()
+            spill_dir: Optional[str] = None
+            with Peak_rss_monitor() as peak_rss_monitor:
+                start: float = time.perf_counter()
+                results_nx_graphs = self.perform_run_stage_1(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    plot_config=plot_config,
+                    run_config=run_config,
+                )
+                stage_durations[1] = time.perf_counter() - start
 
-            results_nx_graphs = self.__perform_run_stage_2(
-                results_nx_graphs=results_nx_graphs,
-                output_config=output_config,
-                run_config=run_config,
-            )
+                start = time.perf_counter()
+                results_nx_graphs = self.__perform_run_stage_2(
+                    results_nx_graphs=results_nx_graphs,
+                    output_config=output_config,
+                    run_config=run_config,
+                )
+                stage_durations[2] = time.perf_counter() - start
 
-            self.__perform_run_stage_3(
-                exp_config=exp_config,
-                output_config=output_config,
-                results_nx_graphs=results_nx_graphs,
-                run_config=run_config,
+                if memory_budget is not None:
+                    # Stage 2 spilled the simulation arrays into this
+                    # directory, if they exceeded the memory budget.
+                    spill_dir = get_spill_dir(unique_id=run_config.unique_id)
+
+                self.__perform_run_stage_3(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    results_nx_graphs=results_nx_graphs,
+                    run_config=run_config,
+                )
+
+                start = time.perf_counter()
+                self.__perform_run_stage_4(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    results_nx_graphs=results_nx_graphs,
+                    run_config=run_config,
+                )
+                stage_durations[4] = time.perf_counter() - start
+            stage_durations = {
+                stage_index: duration
+                for stage_index, duration in stage_durations.items()
+                if stage_index in self.computed_stages
+            }
+            print(
+                "Peak memory of run: "
+                + f"{peak_rss_monitor.peak_rss/1024**2:.1f} MB"
             )
 
-            self.__perform_run_stage_4(
-                exp_config=exp_config,
-                output_config=output_config,
-                results_nx_graphs=results_nx_graphs,
-                run_config=run_config,
+            # Only the first (computing) run is representative of the cost,
+            # later runs mainly load the results from file.
+            run_metrics_filepath: str = get_run_metrics_filepath(
+                unique_id=run_config.unique_id
             )
-            # Store run results in dict of Experiment_runner.
-            self.results_nx_graphs: Dict = {
-                run_config.unique_id: results_nx_graphs  # type:ignore[index]
-            }
+            if not Path(run_metrics_filepath).is_file():
+                # Queued after the output files of the run, whose sizes it
+                # stores.
+                submit_write_job(
+                    filepath=run_metrics_filepath,
+                    job=partial(
+                        output_run_metrics,
+                        graphs_dict=results_nx_graphs["graphs_dict"],
+                        run_config=run_config,
+                        stage_durations=stage_durations,
+                        peak_rss_bytes=peak_rss_monitor.peak_rss,
+                    ),
+                )
+            if memory_budget is None:
+                # Store run results in dict of Experiment_runner.
+                self.results_nx_graphs: Dict = {
+                    run_config.unique_id: results_nx_graphs
+                }
+            else:
+                # The results of the run are persisted, so its simulation
+                # arrays are released before the next run.
+                release_simulation_arrays(
+                    graphs_dict=results_nx_graphs["graphs_dict"],
+                    spill_dir=spill_dir,
+                )
+                self.results_nx_graphs = {}
 
     @customshowme.time
     @typechecked
@@ -258,6 +338,7 @@ class Experiment_runner:
                     graphs_dict=results_nx_graphs["graphs_dict"],
                     with_adaptation=with_adaptation,
                 )
+            self.computed_stages.add(1)
 
         else:
             results_nx_graphs["graphs_dict"] = load_stage1_simsnn_graphs(
@@ -300,11 +381,17 @@ class Experiment_runner:
         )
 
         # Run simulation on networkx or lava backend.
-        sim_graphs(
+        simulated_graph_names: List[str] = sim_graphs(
             output_config=output_config,
             run_config=run_config,
             stage_1_graphs=results_nx_graphs["graphs_dict"],
         )
+        # The duration of a partially loaded stage 2 is not representative.
+        if (
+            len(simulated_graph_names)
+            == len(results_nx_graphs["graphs_dict"]) - 1
+        ):
+            self.computed_stages.add(2)
 
         # TODO: include check to se if stage 2 output is skipped.
         output_stage_2_snns(
@@ -341,8 +428,6 @@ class Experiment_runner:
                 output_config = create_default_output_config(
                     exp_config=exp_config,
                 )
-            # Override output config from exp_config.
-            output_config.extra_storing_config.show_images = True
             output_config.hover_info.neuron_properties = [
                 "spikes",
                 "a_in_next",
@@ -354,6 +439,19 @@ class Experiment_runner:
                 "vth",
             ]
 
+            # Write the queued files before forking the plot processes.
+            flush_writes()
+            if not output_config.extra_storing_config.show_images:
+                # Render the frames of the graphs to files, without a server,
+                # they can be viewed later with --view-run.
+                create_svg_plot(
+                    output_config.graph_types or get_snn_graph_names(),
+                    results_nx_graphs["graphs_dict"],
+                    output_config,
+                    run_config,
+                )
+                return
+
             # Generate Dash plots using multiprocessing.
             jobs = []
             for i, graph_name in enumerate(get_snn_graph_names()):
@@ -438,6 +536,7 @@ class Experiment_runner:
                 run_config=run_config,
                 stage_index=4,
             )
+            self.computed_stages.add(4)
 
     def load_pickled_boxplot_data(
         self,
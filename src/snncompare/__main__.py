@@ -2,14 +2,40 @@
 that invokes this script."""
 
 
-from snncompare.arg_parser.arg_verification import verify_args
+import os
+import sys
+from argparse import Namespace
 
-from .arg_parser.arg_parser import parse_cli_args
-from .arg_parser.process_args import process_args
+# The execution profile is read when the modules are imported.
+if any(arg in ["-fast", "--fast"] for arg in sys.argv[1:]):
+    os.environ["SNNCOMPARE_PROFILE"] = "fast"
+
+# The client only forwards the arguments to the worker of --serve, so it
+# does not import the (slow to import) experiment code.
+if any(
+    arg in ["-sub", "--submit", "-stop", "--stop-server"]
+    for arg in sys.argv[1:]
+):
+    from .server.client import run_client
+
+    sys.exit(run_client(argv=sys.argv[1:]))
+
+# pylint: disable=C0413
+from snncompare.arg_parser.arg_verification import verify_args  # noqa: E402
+
+from .arg_parser.arg_parser import parse_cli_args  # noqa: E402
+from .arg_parser.process_args import process_args  # noqa: E402
 
 custom_config_path = "src/snncompare/json_configurations/"
 
 # Parse command line interface arguments to determine what this script does.
 args = parse_cli_args()
-verify_args(args=args, custom_config_path=custom_config_path)
-process_args(args=args, custom_config_path=custom_config_path)
+if not isinstance(args, Namespace):
+    raise TypeError(f"Error, expected parsed arguments, got:{type(args)}")
+if args.serve:
+    from .server.serve import serve
+
+    serve(custom_config_path=custom_config_path, socket_path=args.socket_path)
+else:
+    verify_args(args=args, custom_config_path=custom_config_path)
+    process_args(args=args, custom_config_path=custom_config_path)
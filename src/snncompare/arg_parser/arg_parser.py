@@ -90,6 +90,17 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-est",
+        "--estimate",
+        action="store_true",
+        default=False,
+        help=(
+            "Estimate the neurons, synapses, timesteps, disk usage and wall "
+            + "time of the experiment settings, without running them."
+        ),
+    )
+
     parser.add_argument(
         "-efm",
         "--export-failure-modes",
@@ -190,6 +201,34 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-f",
+        "--filter",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Only run the run configs for which the expression over: seed, "
+            + "size, graph_nr, m_val, algorithm, adaptation, redundancy, "
+            + "radiation, probability and simulator is True, e.g. "
+            + "'seed in [1, 2] and size <= 10'."
+        ),
+    )
+
+    parser.add_argument(
+        "-sh",
+        "--shard",
+        action="store",
+        type=str,
+        default=None,
+        metavar="K/N",
+        help=(
+            "Only run every N-th (filtered) run config, starting at the "
+            + "K-th. The N shards of an experiment are disjoint, and can be "
+            + "run by independent processes."
+        ),
+    )
+
     parser.add_argument(
         "-r1",
         "--recreate-stage-1",
@@ -272,6 +311,29 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-sb",
+        "--storage-backend",
+        action="store",
+        type=str,
+        choices=["flat", "sharded"],
+        default="flat",
+        help=(
+            "Store the result json files flat with indent=4 (default), or "
+            + "compact in subdirectories named after their hash prefix."
+        ),
+    )
+
+    parser.add_argument(
+        "-sc",
+        "--storage-compression",
+        action="store",
+        type=str,
+        choices=["gzip", "zlib"],
+        default=None,
+        help=("Compress the result json files of the sharded backend."),
+    )
+
     parser.add_argument(
         "-sfm",
         "--show-failure-modes",
@@ -310,6 +372,19 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-vr",
+        "--view-run",
+        action="store",
+        type=str,
+        default=None,
+        metavar="RUN_CONFIG_UNIQUE_ID",
+        help=(
+            "Show the stage 3 images of a run config, that were exported "
+            + "with -x svg or -x png, in dash app/browser on --port."
+        ),
+    )
+
     parser.add_argument(
         "-sdn",
         "--store-died-neurons",
@@ -318,6 +393,236 @@ def parse_cli_args(
         help=("Store which neurons died due to radiation."),
     )
 
+    parser.add_argument(
+        "-vp",
+        "--verification-policy",
+        action="store",
+        type=str,
+        choices=["full", "checksum", "none"],
+        default="checksum",
+        help=(
+            "Verify written files by reading them back (full), by storing "
+            + "their checksum in a manifest per results (shard) directory, "
+            + "in results/manifests/ (checksum, default), or not at all "
+            + "(none)."
+        ),
+    )
+
+    parser.add_argument(
+        "-mb",
+        "--memory-budget",
+        action="store",
+        type=int,
+        default=None,
+        help=(
+            "The resident memory in MB above which the simulation arrays of "
+            + "a run are spilled to memory mapped files. With a budget, the "
+            + "arrays are released after stage 4 of each run."
+        ),
+    )
+
+    parser.add_argument(
+        "-fast",
+        "--fast",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip the runtime type checks of the functions on the hot paths "
+            + "(sets SNNCOMPARE_PROFILE=fast). For jobs that are submitted "
+            + "to a server, pass it to --serve instead."
+        ),
+    )
+
+    parser.add_argument(
+        "-bp",
+        "--benchmark-profiles",
+        action="store_true",
+        default=False,
+        help=(
+            "Run the experiment with and without the --fast profile, and "
+            + "print the duration per stage of both."
+        ),
+    )
+
+    parser.add_argument(
+        "-bs",
+        "--benchmark-stages",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Time the operations of each stage on synthetic input graphs, "
+            + "and store the durations in the given json file, e.g. "
+            + "results/benchmarks/baseline.json."
+        ),
+    )
+
+    parser.add_argument(
+        "-bsz",
+        "--benchmark-sizes",
+        action="store",
+        type=int,
+        nargs="+",
+        default=list(range(3, 21)),
+        help=("The graph sizes of --benchmark-stages."),
+    )
+
+    parser.add_argument(
+        "-bm",
+        "--benchmark-m-vals",
+        action="store",
+        type=int,
+        nargs="+",
+        default=list(range(0, 6)),
+        help=("The m_vals of --benchmark-stages."),
+    )
+
+    parser.add_argument(
+        "-br",
+        "--benchmark-repetitions",
+        action="store",
+        type=int,
+        default=3,
+        help=(
+            "The number of repetitions of --benchmark-stages, of which the "
+            + "median duration is stored."
+        ),
+    )
+
+    parser.add_argument(
+        "-bsim",
+        "--benchmark-simulators",
+        action="store",
+        type=str,
+        nargs="+",
+        default=["simsnn"],
+        help=("The simulators of --benchmark-stages."),
+    )
+
+    parser.add_argument(
+        "-bc",
+        "--benchmark-compare",
+        action="store",
+        type=str,
+        nargs=2,
+        default=None,
+        metavar=("BASELINE", "CURRENT"),
+        help=(
+            "Compare two --benchmark-stages json files, and exit with an "
+            + "error if an operation is slower than the baseline by more "
+            + "than the --benchmark-threshold."
+        ),
+    )
+
+    parser.add_argument(
+        "-bt",
+        "--benchmark-threshold",
+        action="store",
+        type=float,
+        default=0.2,
+        help=(
+            "The fraction an operation may be slower than the baseline, "
+            + "before it is reported as a regression."
+        ),
+    )
+
+    parser.add_argument(
+        "-serve",
+        "--serve",
+        action="store_true",
+        default=False,
+        help=(
+            "Start a long-lived worker that executes the jobs that are "
+            + "submitted with --submit, with warm imports and caches."
+        ),
+    )
+
+    parser.add_argument(
+        "-sub",
+        "--submit",
+        action="store_true",
+        default=False,
+        help=(
+            "Submit the other arguments as a job to the worker of --serve, "
+            + "and stream its output."
+        ),
+    )
+
+    parser.add_argument(
+        "-stop",
+        "--stop-server",
+        action="store_true",
+        default=False,
+        help=("Stop the worker of --serve after its current job."),
+    )
+
+    parser.add_argument(
+        "-sp",
+        "--socket-path",
+        action="store",
+        type=str,
+        default="results/snncompare.sock",
+        help=("The Unix socket of the worker of --serve."),
+    )
+
+    parser.add_argument(
+        "-wqe",
+        "--work-queue-enqueue",
+        action="store_true",
+        default=False,
+        help=(
+            "Add the run configs of the experiment to the work queue in "
+            + "results/work_queue/<experiment settings name>/, and exit."
+        ),
+    )
+
+    parser.add_argument(
+        "-wqw",
+        "--work-queue-worker",
+        action="store_true",
+        default=False,
+        help=(
+            "Run the enqueued run configs of the experiment, together with "
+            + "the workers on other hosts that share the results directory."
+        ),
+    )
+
+    parser.add_argument(
+        "-wqh",
+        "--work-queue-hosts",
+        action="store",
+        type=int,
+        default=None,
+        help=(
+            "Simulate the given number of hosts on this machine, by running "
+            + "a work queue worker per host in a separate process."
+        ),
+    )
+
+    parser.add_argument(
+        "-lt",
+        "--lease-timeout",
+        action="store",
+        type=float,
+        default=300.0,
+        help=(
+            "Seconds without heartbeat after which the work queue item of a "
+            + "crashed worker is reclaimed."
+        ),
+    )
+
+    parser.add_argument(
+        "-aw",
+        "--async-writes",
+        action="store",
+        type=int,
+        default=None,
+        help=(
+            "Write the stage 1, 2, 4 and 7 output files in a background "
+            + "thread, with at most the given number of queued files."
+        ),
+    )
+
     # Ensure SNN behaviour visualisation in stage 3 is exported to images.
     parser.add_argument(
         "-x",
@@ -2,6 +2,7 @@
 import argparse
 import os
 import shutil
+import sys
 from typing import List, Union
 
 from typeguard import typechecked
@@ -10,14 +11,45 @@ from snncompare.arg_parser.helper import convert_csv_list_arg_to_list
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.Experiment_runner import Experiment_runner
 from snncompare.export_plots.plot_graphs import create_root_dir_if_not_exists
+from snncompare.export_plots.view_rendered_run import view_rendered_run
+from snncompare.export_results.async_writer import start_async_writer
+from snncompare.export_results.storage_backend import (
+    Storage_config,
+    set_storage_config,
+)
 from snncompare.helper import get_snn_graph_names
 from snncompare.optional_config.Output_config import (
     Extra_storing_config,
     Output_config,
     Zoom,
 )
+from snncompare.progress_report.benchmark_profiles import (
+    benchmark_profiles,
+    print_profile_benchmark,
+)
+from snncompare.progress_report.benchmark_stages import (
+    benchmark_stages,
+    compare_benchmarks,
+    load_benchmark,
+    print_benchmark_regressions,
+    store_benchmark,
+)
+from snncompare.progress_report.estimate_costs import (
+    Cost_calibration,
+    calibrate_from_run_metrics,
+    estimate_exp_config_costs,
+    print_cost_estimate,
+)
 from snncompare.run_config.helper import get_run_config_filepath
 from snncompare.run_config.Run_config import Run_config
+from snncompare.run_config.run_config_space import parse_shard
+from snncompare.work_queue.Work_queue import Work_queue, get_default_worker_id
+from snncompare.work_queue.worker import (
+    Run_config_runner,
+    enqueue_run_configs,
+    run_worker,
+    simulate_hosts,
+)
 
 from ..json_configurations.algo_test import (
     load_exp_config_from_file,
@@ -34,12 +66,91 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
     TODO: list existing exp_configs
     TODO: list existing exp_configs
     """
+    set_storage_config(
+        storage_config=Storage_config(
+            sharded=args.storage_backend == "sharded",
+            compression=args.storage_compression,
+            verification=args.verification_policy,
+        )
+    )
+    if args.async_writes is not None:
+        start_async_writer(max_pending_jobs=args.async_writes)
+
+    if args.view_run is not None:
+        view_rendered_run(
+            port=8050 if args.dash_port is None else args.dash_port,
+            unique_id=args.view_run,
+        )
+        return
+
     # if args.experiment_settings_name is not None:
     exp_config: Exp_config = load_exp_config_from_file(
         custom_config_path=custom_config_path,
         filename=args.experiment_settings_name,
     )
 
+    if args.estimate:
+        calibration: Cost_calibration = calibrate_from_run_metrics(
+            calibration=Cost_calibration()
+        )
+        print_cost_estimate(
+            calibration=calibration,
+            estimates=estimate_exp_config_costs(
+                exp_config=exp_config, calibration=calibration
+            ),
+        )
+        return
+
+    if args.benchmark_profiles:
+        cli_args: List[str] = []
+        if args.export_failure_modes:
+            cli_args.append("-efm")
+        print_profile_benchmark(
+            profile_durations=benchmark_profiles(
+                cli_args=cli_args,
+                custom_config_path=custom_config_path,
+                exp_config_name=args.experiment_settings_name,
+            )
+        )
+        return
+
+    if args.benchmark_stages is not None:
+        store_benchmark(
+            benchmark=benchmark_stages(
+                graph_sizes=args.benchmark_sizes,
+                m_vals=args.benchmark_m_vals,
+                repetitions=args.benchmark_repetitions,
+                simulators=args.benchmark_simulators,
+            ),
+            filepath=args.benchmark_stages,
+        )
+        print(f"Stored the benchmark in:{args.benchmark_stages}")
+        return
+
+    if args.benchmark_compare is not None:
+        regressions: List = compare_benchmarks(
+            baseline=load_benchmark(filepath=args.benchmark_compare[0]),
+            current=load_benchmark(filepath=args.benchmark_compare[1]),
+            threshold=args.benchmark_threshold,
+        )
+        print_benchmark_regressions(
+            regressions=regressions, threshold=args.benchmark_threshold
+        )
+        if regressions:
+            sys.exit(1)
+        return
+
+    if args.work_queue_enqueue:
+        nr_of_added_runs: int = enqueue_run_configs(
+            exp_config=exp_config,
+            work_queue=Work_queue(
+                queue_name=args.experiment_settings_name,
+                lease_timeout=args.lease_timeout,
+            ),
+        )
+        print(f"Enqueued {nr_of_added_runs} run configs.")
+        return
+
     # If a specific run_config id is given, get the filepath that contains the
     # run_config dict, and then use run_config_path to execute only that single
     # run_config.
@@ -65,6 +176,29 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
 
     output_config: Output_config = manage_export_parsing(args=args)
 
+    if args.work_queue_worker or args.work_queue_hosts is not None:
+        run_config_runner: Run_config_runner = Run_config_runner(
+            exp_config=exp_config, output_config=output_config
+        )
+        if args.work_queue_hosts is not None:
+            simulate_hosts(
+                queue_name=args.experiment_settings_name,
+                run_item=run_config_runner,
+                nr_of_hosts=args.work_queue_hosts,
+                lease_timeout=args.lease_timeout,
+            )
+        else:
+            run_worker(
+                work_queue=Work_queue(
+                    queue_name=args.experiment_settings_name,
+                    lease_timeout=args.lease_timeout,
+                ),
+                run_item=run_config_runner,
+                worker_id=get_default_worker_id(),
+            )
+        print("Done")
+        return
+
     # python -m src.snncompare -e mdsa_creation_only_size_3_4 -v
     Experiment_runner(
         exp_config=exp_config,
@@ -74,6 +208,8 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
         ),
         reverse=args.reverse,
         specific_run_config=specific_run_config,
+        run_config_filter=args.filter,
+        shard=None if args.shard is None else parse_shard(shard=args.shard),
     )
     # TODO: verify expected output results have been generated successfully.
     print("Done")
@@ -161,6 +297,7 @@ def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
         "export_failure_modes"
     ] = args.export_failure_modes
     extra_storing_config_dict["show_failure_modes"] = args.show_failure_modes
+    extra_storing_config_dict["memory_budget"] = args.memory_budget
     optional_config_args_dict["extra_storing_config"] = Extra_storing_config(
         **extra_storing_config_dict
     )
@@ -1,15 +1,17 @@
 """Contains helper functions that are used throughout this repository."""
-from typing import Dict, List, Optional, Tuple, Union
+from typing import List, Optional, Tuple
 
 import customshowme
-from snnadaptation.Adaptation import Adaptation
-from snnradiation.Rad_damage import Rad_damage
-
-# from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.run_config.Run_config import Run_config, run_configs_are_equal
+from snncompare.run_config.run_config_space import (
+    Run_config_space,
+    get_selected_run_configs,
+)
+
+# from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
+from snncompare.typecheck_profile import typechecked
 
 # if TYPE_CHECKING:
 # from snncompare.exp_config.Exp_config import Exp_config
@@ -21,17 +23,24 @@ def generate_run_configs(
     *,
     exp_config: "Exp_config",
     specific_run_config: Optional[Run_config] = None,
+    filter_expression: Optional[str] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> List[Run_config]:
-    """Generates the run configs belonging to an experiment config, and then
-    removes all run configs except for the desired run config.
+    """Generates the run configs belonging to an experiment config that pass
+    the filter expression and belong to the shard, and then removes all run
+    configs except for the desired run config.
 
     Throws an error if the desired run config is not within the expected
     run configs.
     """
     found_run_config = False
     # Generate run configurations.
-    run_configs: List[Run_config] = exp_config_to_run_configs(
-        exp_config=exp_config
+    run_configs: List[Run_config] = list(
+        get_selected_run_configs(
+            exp_config=exp_config,
+            filter_expression=filter_expression,
+            shard=shard,
+        )
     )
     # run_configs = run_configs[:3]  # TODO: comment out.
     if specific_run_config is not None:
@@ -65,82 +74,9 @@ def exp_config_to_run_configs(
     exp_config: "Exp_config",
 ) -> List[Run_config]:
     """Generates all the run_config dictionaries of a single experiment
-    configuration. Then verifies whether each run_config is valid.
-
-    TODO: Ensure this can be done modular, and lower the depth of the loop.
-    """
-    # pylint: disable=R0914
-
-    run_configs: List[Run_config] = []
-    # pylint: disable=R1702
-    # TODO: make it loop through a list of keys.
-    # for algorithm in exp_config.algorithms:
-    for algorithm_name, algo_specs in exp_config.algorithms.items():
-        for algo_config in algo_specs:
-            algorithm = {algorithm_name: algo_config}
-            for run_config_adaptation in exp_config.adaptations:
-                for run_config_radiation in exp_config.radiations:
-                    fill_remaining_run_config_settings(
-                        adaptation=run_config_adaptation,
-                        algorithm=algorithm,
-                        exp_config=exp_config,
-                        radiation=run_config_radiation,
-                        run_configs=run_configs,
-                    )
-    return list(reversed(run_configs))
-
-
-@typechecked
-def fill_remaining_run_config_settings(
-    *,
-    adaptation: Union[None, Adaptation],
-    algorithm: Dict,
-    exp_config: "Exp_config",
-    radiation: Rad_damage,
-    run_configs: List[Run_config],
-) -> None:
-    """Generate basic settings for a run config."""
-    for seed in exp_config.seeds:
-        for size_and_max_graph in exp_config.size_and_max_graphs:
-            for simulator in exp_config.simulators:
-                for graph_nr in range(0, size_and_max_graph[1]):
-                    run_config: Run_config = run_parameters_to_dict(
-                        adaptation=adaptation,
-                        algorithm=algorithm,
-                        seed=seed,
-                        size_and_max_graph=size_and_max_graph,
-                        graph_nr=graph_nr,
-                        radiation=radiation,
-                        simulator=simulator,
-                    )
-                    run_configs.append(run_config)
-
+    configuration.
 
-# pylint: disable=R0913
-@typechecked
-def run_parameters_to_dict(
-    *,
-    adaptation: Union[None, Adaptation],
-    algorithm: Dict[str, Dict[str, int]],
-    seed: int,
-    size_and_max_graph: Tuple[int, int],
-    graph_nr: int,
-    radiation: Rad_damage,
-    simulator: str,
-) -> Run_config:
-    """Stores selected parameters into a dictionary.
-
-    Written as separate argument to keep code width under 80 lines. #
-    TODO: verify typing.
+    The run configs are created in the order of their index in the
+    Run_config_space of the exp_config.
     """
-    run_config: Run_config = Run_config(
-        adaptation=adaptation,
-        algorithm=algorithm,
-        seed=seed,
-        graph_size=size_and_max_graph[0],
-        graph_nr=graph_nr,
-        radiation=radiation,
-        simulator=simulator,
-    )
-
-    return run_config
+    return list(Run_config_space(exp_config=exp_config))
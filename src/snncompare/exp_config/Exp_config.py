@@ -1,7 +1,6 @@
 """"Stores the run config Dict type."""
 from __future__ import annotations
 
-import copy
 import hashlib
 import json
 from typing import Any
@@ -19,6 +18,7 @@ from snncompare.exp_config.adap_dict2obj import (
 from snncompare.exp_config.rad_dict2obj import (
     get_radiations_from_exp_config_dict,
 )
+from snncompare.run_config.interned_settings import get_setting_hash
 
 
 # pylint: disable=R0902
@@ -78,22 +78,18 @@ class Exp_config:
         self,
     ) -> str:
         """Returns a unique hash for the exp_config object."""
-        some_exp_config: Exp_config = copy.deepcopy(self)
-        # rad_hashes: list[str] = []
-        # for rad_obj in self.radiations:
-        # rad_hashes.append(rad_obj.get_hash())
-        # del some_exp_config.radiations
-        # some_exp_config.radiations = sorted(rad_hashes)
-
+        # A shallow copy suffices, as the settings are replaced by their
+        # hashes, not modified.
+        some_exp_config_dict: dict = dict(self.__dict__)
         self.convert_exp_config_attributes_into_hashes(
-            some_exp_config=some_exp_config.__dict__
+            some_exp_config=some_exp_config_dict
         )
 
         # sorted(__dict__) returns a list of the sorted dictionary keys ONLY.
         key_sorted_value_list: list = []
         # .keys() is not needed in next line:
-        for sorted_key in sorted(some_exp_config.__dict__.keys()):
-            key_sorted_value_list.append(some_exp_config.__dict__[sorted_key])
+        for sorted_key in sorted(some_exp_config_dict.keys()):
+            key_sorted_value_list.append(some_exp_config_dict[sorted_key])
 
         unique_id = str(
             hashlib.sha256(
@@ -116,13 +112,13 @@ class Exp_config:
             if sorted_key == "adaptations":
                 adaptation_hashes: list[str] = []
                 for adaptation in some_exp_config[sorted_key]:
-                    adaptation_hash: str = adaptation.get_hash()
+                    adaptation_hash: str = get_setting_hash(setting=adaptation)
                     adaptation_hashes.append(adaptation_hash)
                 some_exp_config[sorted_key] = adaptation_hashes
             if sorted_key == "radiations":
                 radiation_hashes: list[str] = []
                 for radiation in some_exp_config[sorted_key]:
-                    radiation_hash: str = radiation.get_hash()
+                    radiation_hash: str = get_setting_hash(setting=radiation)
                     radiation_hashes.append(radiation_hash)
                 some_exp_config[sorted_key] = radiation_hashes
 
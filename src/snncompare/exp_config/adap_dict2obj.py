@@ -7,6 +7,8 @@ from snnadaptation.Adaptation import Adaptation
 # from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
 from typeguard import typechecked
 
+from snncompare.run_config.interned_settings import get_interned_setting
+
 
 @typechecked
 def get_adaptations_from_exp_config_dict(
@@ -23,7 +25,8 @@ def get_adaptations_from_exp_config_dict(
         for adaptation_type, redundancies in adaptations.items():
             for redundancy in redundancies:
                 adaptation_objs.append(
-                    Adaptation(
+                    get_interned_setting(
+                        setting_class=Adaptation,
                         adaptation_type=str(adaptation_type),
                         redundancy=int(redundancy),
                     )
@@ -7,6 +7,8 @@ from snnradiation.Rad_damage import Rad_damage
 # from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
 from typeguard import typechecked
 
+from snncompare.run_config.interned_settings import get_interned_setting
+
 
 @typechecked
 def get_radiations_from_exp_config_dict(
@@ -24,7 +26,8 @@ def get_radiations_from_exp_config_dict(
     for effect_type, rad_settings in radiations.items():
         if effect_type == "neuron_death":
             for probability_per_t in rad_settings["probability_per_t"]:
-                rad_damage = Rad_damage(
+                rad_damage = get_interned_setting(
+                    setting_class=Rad_damage,
                     amplitude=float(-(10**10)),
                     # amplitude=-inf,
                     effect_type=effect_type,
@@ -67,7 +70,8 @@ def add_generic_exp_config_rad_dict(
                             for nswi in rad_settings[
                                 "nr_of_synaptic_weight_increases"
                             ]:
-                                rad_damage = Rad_damage(
+                                rad_damage = get_interned_setting(
+                                    setting_class=Rad_damage,
                                     amplitude=amplitude,
                                     effect_type=effect_type,
                                     excitatory=excitatory,
@@ -76,7 +80,8 @@ def add_generic_exp_config_rad_dict(
                                     nr_of_synaptic_weight_increases=nswi,
                                 )
                         else:
-                            rad_damage = Rad_damage(
+                            rad_damage = get_interned_setting(
+                                setting_class=Rad_damage,
                                 amplitude=amplitude,
                                 effect_type=effect_type,
                                 excitatory=excitatory,
@@ -1,5 +1,4 @@
 """Generates interactive view of graph."""
-from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import dash
@@ -12,18 +11,22 @@ from snnbackends.simsnn.simsnn_to_nx_lif import (
 )
 from typeguard import typechecked
 
-from snncompare.export_plots.create_dash_fig_obj import create_svg_with_dash
+from snncompare.export_plots.export_frames import export_frames
 from snncompare.export_plots.Plot_config import (
     Plot_config,
     get_default_plot_config,
 )
-from snncompare.export_plots.plot_graphs import create_root_dir_if_not_exists
 from snncompare.export_plots.show_dash_plot import (
     show_dash_figures,
     show_fig_in_dash,
 )
 from snncompare.export_plots.store_plot_data_in_graph import (
-    store_plot_params_in_graph,
+    store_temporal_plot_params_in_graph,
+)
+from snncompare.export_plots.temporal_frames import (
+    Temporal_frames,
+    apply_temporal_frame,
+    create_figure_with_temporal_frames,
 )
 from snncompare.helper import get_some_duration
 from snncompare.optional_config.Output_config import Output_config
@@ -48,11 +51,9 @@ def create_svg_plot(
     print("INSIDE")
     plot_config: Plot_config = get_default_plot_config()
 
-    app = dash.Dash(__name__)
-
     # pylint: disable=R1702
-    dash_figures: Dict[str, List[go.Figure]] = {}
-    plotted_graphs: Dict[str, nx.DiGraph] = {}
+    dash_figures: Dict[str, go.Figure] = {}
+    temporal_frames_dict: Dict[str, Temporal_frames] = {}
 
     for _, (graph_name, snn_graph) in enumerate(graphs.items()):
         if graph_name in graph_names:
@@ -91,20 +92,20 @@ def create_svg_plot(
                 plot_config=plot_config,
                 sim_duration=sim_duration,
                 snn_graph=nx_snn,
-                single_timestep=single_timestep,
                 dash_figures=dash_figures,
-                plotted_graphs=plotted_graphs,
+                temporal_frames_dict=temporal_frames_dict,
             )
 
-    show_figures(
-        app=app,
-        dash_figures=dash_figures,
-        output_config=output_config,
-        plot_config=plot_config,
-        plotted_graphs=plotted_graphs,
-        single_timestep=single_timestep,
-        port=output_config.dash_port,
-    )
+    if output_config.extra_storing_config.show_images:
+        show_figures(
+            app=dash.Dash(__name__),
+            dash_figures=dash_figures,
+            output_config=output_config,
+            plot_config=plot_config,
+            temporal_frames_dict=temporal_frames_dict,
+            single_timestep=single_timestep,
+            port=output_config.dash_port,
+        )
 
 
 # pylint: disable=R0913
@@ -116,95 +117,73 @@ def create_figures(
     plot_config: Plot_config,
     sim_duration: int,
     snn_graph: nx.DiGraph,
-    single_timestep: Optional[bool],
-    dash_figures: Dict[str, List[go.Figure]],
-    plotted_graphs: Dict[str, nx.DiGraph],
+    dash_figures: Dict[str, go.Figure],
+    temporal_frames_dict: Dict[str, Temporal_frames],
 ) -> None:
-    """Creates the dash figures."""
-    dash_screens: List[go.Figure] = []
+    """Creates the dash figure of the first timestep, and the properties that
+    change in the other timesteps. Exports the images of each timestep that
+    do not yet exist."""
     plotted_graph: nx.DiGraph = nx.DiGraph()
-    for t in range(
-        0,
-        sim_duration,
-        # 1,
-    ):
-        print(f"t={t}/{sim_duration}")
-
-        # Create and store the svg images per timestep.
-        filename: str = f"{graph_name}_{run_config_filename}_{t}"
-        svg_filepath: str = f"latex/Images/graphs/{filename}.svg"
-        if not Path(svg_filepath).is_file() or (
-            output_config.extra_storing_config.show_images
-            and single_timestep is None
-        ):
-            dash_figure: go.Figure = create_dash_figure(
-                output_config=output_config,
-                plot_config=plot_config,
-                plotted_graph=plotted_graph,
-                snn_graph=snn_graph,
-                t=t,
-            )
-            dash_screens.append(dash_figure)
-        if not Path(svg_filepath).is_file():
-            # TODO move storing into separate function.
-            create_root_dir_if_not_exists(root_dir_name="latex/Images/graphs")
-            dash_figure.write_image(svg_filepath)
-    dash_figures[graph_name] = dash_screens
-    plotted_graphs[graph_name] = plotted_graph
+    store_temporal_plot_params_in_graph(
+        hover_info=output_config.hover_info,
+        plotted_graph=plotted_graph,
+        snn_graph=snn_graph,
+        sim_duration=sim_duration,
+    )
+    dash_figure, temporal_frames = create_figure_with_temporal_frames(
+        plotted_graph=plotted_graph, plot_config=plot_config
+    )
+    export_frames(
+        dash_figure=dash_figure,
+        export_types=output_config.export_types,
+        filename=f"{graph_name}_{run_config_filename}",
+        plot_config=plot_config,
+        temporal_frames=temporal_frames,
+    )
+    # Show the figure from the first timestep onwards.
+    apply_temporal_frame(
+        dash_figure=dash_figure,
+        plot_config=plot_config,
+        temporal_frames=temporal_frames,
+        t=0,
+    )
+    dash_figures[graph_name] = dash_figure
+    temporal_frames_dict[graph_name] = temporal_frames
 
 
 # pylint: disable=R0913
 @typechecked
 def show_figures(
     app: dash.dash.Dash,
-    dash_figures: Dict[str, List[go.Figure]],
+    dash_figures: Dict[str, go.Figure],
     output_config: Output_config,
     plot_config: Plot_config,
-    plotted_graphs: Dict[str, nx.DiGraph],
+    temporal_frames_dict: Dict[str, Temporal_frames],
     port: int,
-    single_timestep: Optional[bool],
+    single_timestep: Optional[int],
 ) -> None:
     """Shows the dash figures."""
     # Show the images
     if output_config.extra_storing_config.show_images:
-        for dash_screens in dash_figures.values():
-            if single_timestep is not None:
-                # Show only a single timestep from dash object or svg file.
-                if len(dash_screens) >= single_timestep:
-                    # TODO: This can be done faster, not complete .svg arr.
-                    # needs to be created.
-                    show_fig_in_dash(
-                        app=app, fig=dash_screens[single_timestep]
+        if single_timestep is not None:
+            for graph_name, dash_figure in dash_figures.items():
+                # Show only a single timestep from dash object.
+                if temporal_frames_dict[graph_name].nr_of_timesteps > (
+                    single_timestep
+                ):
+                    apply_temporal_frame(
+                        dash_figure=dash_figure,
+                        plot_config=plot_config,
+                        temporal_frames=temporal_frames_dict[graph_name],
+                        t=single_timestep,
                     )
-            else:
-                # Show a whole timeseries of dash figures.
-                # TODO: allow showing multiple graphs.
-                show_dash_figures(
-                    app=app,
-                    plot_config=plot_config,
-                    plotted_graphs=plotted_graphs,
-                    port=port,
-                )
-
-
-def create_dash_figure(
-    output_config: Output_config,
-    plot_config: Plot_config,
-    plotted_graph: nx.DiGraph,
-    snn_graph: nx.DiGraph,
-    t: int,
-) -> go.Figure:
-    """Creates and stores a dash figure object as .svg."""
-    store_plot_params_in_graph(
-        hover_info=output_config.hover_info,
-        plotted_graph=plotted_graph,
-        snn_graph=snn_graph,
-        t=t,
-    )
-
-    # TODO: determine whether identified_annotations are needed lateron.
-    dash_figure, _ = create_svg_with_dash(
-        graph=plotted_graph,
-        plot_config=plot_config,
-    )
-    return dash_figure
+                    show_fig_in_dash(app=app, fig=dash_figure)
+        else:
+            # Show a whole timeseries of dash figures.
+            show_dash_figures(
+                app=app,
+                dash_figures=dash_figures,
+                plot_config=plot_config,
+                port=port,
+                temporal_frames_dict=temporal_frames_dict,
+            )
@@ -0,0 +1,223 @@
+"""Exports the figure of each timestep of a plotted snn as image files.
+
+Many consecutive timesteps look the same, e.g. when no neuron spikes. So
+the frames are grouped on a hash of their visual state (the node colours and
+opacities, which also determine the edge colours and opacities). Only the
+first frame of each group is rendered, in a process pool, and the files of
+the other frames of the group are (hard) links to it. A gif is assembled
+from the png frames.
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+from typing import Dict, List, Optional
+
+import imageio.v2 as imageio
+import plotly.graph_objs as go
+from typeguard import typechecked
+
+from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.export_plots.plot_graphs import create_root_dir_if_not_exists
+from snncompare.export_plots.temporal_frames import (
+    Temporal_frames,
+    apply_temporal_frame,
+)
+
+FRAMES_DIR: str = "latex/Images/graphs"
+
+# The figure that is rendered by the processes of the pool.
+_worker_figure: Dict = {}
+
+
+@typechecked
+def get_frame_filepath(
+    *, export_type: str, filename: str, t: Optional[int] = None
+) -> str:
+    """Returns the filepath of the image of a timestep, or of the gif of all
+    timesteps if t is None."""
+    if t is None:
+        return f"{FRAMES_DIR}/{filename}.{export_type}"
+    return f"{FRAMES_DIR}/{filename}_{t}.{export_type}"
+
+
+@typechecked
+def get_frame_hash(*, temporal_frames: Temporal_frames, t: int) -> str:
+    """Returns a hash of the visual state of the figure at timestep t."""
+    return hashlib.sha256(
+        json.dumps(
+            [
+                temporal_frames.node_colours[t],
+                temporal_frames.node_opacities[t],
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+@typechecked
+def group_identical_frames(
+    *, temporal_frames: Temporal_frames
+) -> List[List[int]]:
+    """Returns the timesteps per group of visually identical frames, ordered
+    on their first timestep."""
+    groups: Dict[str, List[int]] = {}
+    for t in range(temporal_frames.nr_of_timesteps):
+        groups.setdefault(
+            get_frame_hash(temporal_frames=temporal_frames, t=t), []
+        ).append(t)
+    return list(groups.values())
+
+
+@typechecked
+def get_image_export_types(*, export_types: List[str]) -> List[str]:
+    """Returns the image types that are rendered per frame. A gif is
+    assembled from the png frames."""
+    image_export_types: List[str] = [
+        export_type for export_type in export_types if export_type != "gif"
+    ]
+    if "gif" in export_types and "png" not in image_export_types:
+        image_export_types.append("png")
+    return image_export_types
+
+
+def init_frame_worker(
+    fig_dict: Dict, plot_config: Plot_config, temporal_frames: Temporal_frames
+) -> None:
+    """Creates the figure once per process of the pool."""
+    _worker_figure["dash_figure"] = go.Figure(fig_dict)
+    _worker_figure["plot_config"] = plot_config
+    _worker_figure["temporal_frames"] = temporal_frames
+
+
+def render_frame_in_worker(t: int, filepaths: List[str]) -> None:
+    """Renders timestep t of the figure of this process."""
+    render_frame(
+        dash_figure=_worker_figure["dash_figure"],
+        filepaths=filepaths,
+        plot_config=_worker_figure["plot_config"],
+        temporal_frames=_worker_figure["temporal_frames"],
+        t=t,
+    )
+
+
+@typechecked
+def render_frame(
+    *,
+    dash_figure: go.Figure,
+    filepaths: List[str],
+    plot_config: Plot_config,
+    temporal_frames: Temporal_frames,
+    t: int,
+) -> None:
+    """Updates the figure to timestep t, and writes it to the filepaths."""
+    apply_temporal_frame(
+        dash_figure=dash_figure,
+        plot_config=plot_config,
+        temporal_frames=temporal_frames,
+        t=t,
+    )
+    for filepath in filepaths:
+        dash_figure.write_image(filepath)
+
+
+@typechecked
+def link_frame(*, source: str, target: str) -> None:
+    """Links the image of a duplicate frame to the image of its unique frame,
+    or copies it if the filesystem does not support hard links."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+# pylint: disable=R0913
+# pylint: disable=R0914
+@typechecked
+def export_frames(
+    *,
+    dash_figure: go.Figure,
+    export_types: List[str],
+    filename: str,
+    plot_config: Plot_config,
+    temporal_frames: Temporal_frames,
+    nr_of_processes: Optional[int] = None,
+) -> None:
+    """Writes the image of each timestep that does not yet exist, for the
+    export types, and assembles the gif if it is an export type."""
+    create_root_dir_if_not_exists(root_dir_name=FRAMES_DIR)
+    image_export_types: List[str] = get_image_export_types(
+        export_types=export_types
+    )
+    frame_groups: List[List[int]] = group_identical_frames(
+        temporal_frames=temporal_frames
+    )
+
+    # Render the first frame of each group with missing images.
+    render_jobs: List[tuple] = []
+    for timesteps in frame_groups:
+        filepaths: List[str] = [
+            get_frame_filepath(
+                export_type=export_type, filename=filename, t=timesteps[0]
+            )
+            for export_type in image_export_types
+        ]
+        missing_filepaths: List[str] = [
+            filepath for filepath in filepaths if not os.path.isfile(filepath)
+        ]
+        if missing_filepaths:
+            render_jobs.append((timesteps[0], missing_filepaths))
+    if nr_of_processes is None:
+        nr_of_processes = os.cpu_count() or 1
+    if len(render_jobs) > 1 and nr_of_processes > 1:
+        with multiprocessing.Pool(
+            processes=min(nr_of_processes, len(render_jobs)),
+            initializer=init_frame_worker,
+            initargs=(dash_figure.to_dict(), plot_config, temporal_frames),
+        ) as pool:
+            pool.starmap(render_frame_in_worker, render_jobs)
+    else:
+        for t, missing_filepaths in render_jobs:
+            render_frame(
+                dash_figure=dash_figure,
+                filepaths=missing_filepaths,
+                plot_config=plot_config,
+                temporal_frames=temporal_frames,
+                t=t,
+            )
+
+    # Link the images of the other frames of each group to the first frame.
+    for timesteps in frame_groups:
+        for export_type in image_export_types:
+            source: str = get_frame_filepath(
+                export_type=export_type, filename=filename, t=timesteps[0]
+            )
+            for t in timesteps[1:]:
+                target: str = get_frame_filepath(
+                    export_type=export_type, filename=filename, t=t
+                )
+                if not os.path.isfile(target):
+                    link_frame(source=source, target=target)
+
+    if "gif" in export_types:
+        assemble_gif(
+            filename=filename, nr_of_timesteps=temporal_frames.nr_of_timesteps
+        )
+
+
+@typechecked
+def assemble_gif(*, filename: str, nr_of_timesteps: int) -> None:
+    """Creates a gif of the png frames, if it does not yet exist."""
+    gif_filepath: str = get_frame_filepath(
+        export_type="gif", filename=filename
+    )
+    if os.path.isfile(gif_filepath):
+        return
+    images: List = []
+    for t in range(nr_of_timesteps):
+        images.append(
+            imageio.imread(
+                get_frame_filepath(export_type="png", filename=filename, t=t)
+            )
+        )
+    imageio.mimsave(gif_filepath, images, loop=0)
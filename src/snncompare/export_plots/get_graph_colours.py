@@ -2,7 +2,8 @@
 from typing import Dict
 
 import networkx as nx
-from typeguard import typechecked
+
+from snncompare.typecheck_profile import typechecked
 
 
 @typechecked
@@ -1,20 +1,19 @@
 """Creates a gif of an SNN propagation."""
 
 import logging
-from typing import Dict, List
+from typing import Dict
 
 import dash
-import networkx as nx
 import plotly.graph_objs as go
 from dash import dcc, html
 from typeguard import typechecked
 
-from snncompare.export_plots.create_dash_fig_obj import create_svg_with_dash
 from snncompare.export_plots.dash_plot_updaters import (
     create_app_layout,
     support_updates,
 )
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.export_plots.temporal_frames import Temporal_frames
 
 
 @typechecked
@@ -37,49 +36,23 @@ def show_fig_in_dash(*, app: dash.Dash, fig: go.Figure) -> None:
 def show_dash_figures(
     *,
     app: dash.Dash,
+    dash_figures: Dict[str, go.Figure],
     plot_config: Plot_config,
-    plotted_graphs: Dict[str, nx.DiGraph],
     port: int,
+    temporal_frames_dict: Dict[str, Temporal_frames],
 ) -> None:
-    """Shows a figure in dash using browser."""
-    dash_figures: Dict[str, go.Figure] = {}
-    identified_annotations_dict: Dict[str, List] = {}
-    temporal_node_colours_dict: Dict[str, List] = {}
-    temporal_node_opacity_dict: Dict[str, List] = {}
-    for graph_name, plotted_graph in plotted_graphs.items():
-        # Start Dash app.
-        (
-            dash_figures[graph_name],
-            identified_annotations_dict[graph_name],
-        ) = create_svg_with_dash(
-            graph=plotted_graph,
-            plot_config=plot_config,
-        )
-
-        temporal_node_colours_dict[graph_name] = list(
-            plotted_graph.nodes[n]["temporal_colour"]
-            for n in plotted_graph.nodes()
-        )
-        temporal_node_opacity_dict[graph_name] = list(
-            plotted_graph.nodes[n]["temporal_opacity"]
-            for n in plotted_graph.nodes()
-        )
-
+    """Shows the figures in dash using browser, with a slider per figure that
+    updates the properties that change per timestep."""
     app = create_app_layout(
         app=app,
         dash_figures=dash_figures,
-        plotted_graphs=plotted_graphs,
-        temporal_node_colours_dict=temporal_node_colours_dict,
+        temporal_frames_dict=temporal_frames_dict,
     )
 
     support_updates(
         app=app,
-        dash_figures=dash_figures,
-        identified_annotations_dict=identified_annotations_dict,
         plot_config=plot_config,
-        plotted_graphs=plotted_graphs,
-        temporal_node_colours_dict=temporal_node_colours_dict,
-        temporal_node_opacity_dict=temporal_node_opacity_dict,
+        temporal_frames_dict=temporal_frames_dict,
     )
 
     # Silence the dash app verbosity to console.
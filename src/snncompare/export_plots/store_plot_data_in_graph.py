@@ -1,12 +1,17 @@
 """Stores the plot data in graph."""
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple, Union
 
 import networkx as nx
 from snnbackends.networkx.LIF_neuron import LIF_neuron
-from typeguard import typechecked
 
 from snncompare.export_plots.get_graph_colours import get_nx_node_colours
 from snncompare.optional_config.Output_config import Hover_info
+from snncompare.simulation.network_index import (
+    CONNECTOR_ROLE,
+    Network_index,
+    get_network_index,
+)
+from snncompare.typecheck_profile import typechecked
 
 
 @typechecked
@@ -63,6 +68,51 @@ def store_plot_params_in_graph(
     store_edge_labels(plotted_graph=plotted_graph, snn_graph=snn_graph)
 
 
+@typechecked
+def store_temporal_plot_params_in_graph(
+    hover_info: Hover_info,
+    plotted_graph: nx.DiGraph,
+    snn_graph: nx.DiGraph,
+    sim_duration: int,
+) -> None:
+    """Stores the graph plot parameters of all timesteps into the networkx
+    graph. The nodes, edges, positions and edge labels do not change over
+    time, so they are stored once, only the node labels, colours and
+    opacities are stored per timestep. The colours and opacities of the
+    nodes and edges are set to those of the first timestep."""
+    add_nodes_and_edges(
+        lif_neurons=get_neurons_in_graph(snn_graph, 0),
+        plotted_graph=plotted_graph,
+        snn_graph=snn_graph,
+    )
+    store_node_position(plotted_graph=plotted_graph, snn_graph=snn_graph, t=0)
+    Node_hovertexts(
+        hover_info=hover_info,
+        lif_neurons=get_neurons_in_graph(snn_graph, 0),
+        snn_graph=snn_graph,
+        timesteps=list(range(0, sim_duration)),
+    ).store_in_graph(plotted_graph=plotted_graph)
+    for t in range(0, sim_duration):
+        store_node_colours_and_opacity(
+            plotted_graph=plotted_graph, snn_graph=snn_graph, t=t
+        )
+    for node_name in plotted_graph.nodes():
+        plotted_graph.nodes[node_name]["colour"] = plotted_graph.nodes[
+            node_name
+        ]["temporal_colour"][0]
+        plotted_graph.nodes[node_name]["opacity"] = plotted_graph.nodes[
+            node_name
+        ]["temporal_opacity"][0]
+    store_edge_colour_and_opacity(plotted_graph=plotted_graph)
+    store_edge_labels(plotted_graph=plotted_graph, snn_graph=snn_graph)
+
+
+@typechecked
+def get_connector_names(snn_graph: nx.DiGraph) -> Set[str]:
+    """Returns the names of the connector neurons, which are not plotted."""
+    return get_network_index(snn=snn_graph).role_names[CONNECTOR_ROLE]
+
+
 # pylint: disable=R0912
 @typechecked
 def add_nodes_and_edges(
@@ -72,11 +122,12 @@ def add_nodes_and_edges(
 ) -> None:
     """Creates/copies the nodes and edges into the plotted graph."""
     # TODO: remove making a duplicate graph.
+    connectors: Set[str] = get_connector_names(snn_graph=snn_graph)
     for neuron in lif_neurons:
-        if "connector" not in neuron.full_name:
+        if neuron.full_name not in connectors:
             plotted_graph.add_node(neuron.full_name)
     for edge in snn_graph.edges():
-        if "connector" not in edge[0] and "connector" not in edge[1]:
+        if edge[0] not in connectors and edge[1] not in connectors:
             plotted_graph.add_edge(edge[0], edge[1])
 
 
@@ -90,55 +141,13 @@ def store_node_labels(
     t: int,
 ) -> None:
     """Stores the node labels into the plotted graph."""
-
-    # TODO: move into separate function.
-    used_node_names: List[str] = []
-    for neuron in lif_neurons:
-        if "connector" not in neuron.full_name:
-            # Assert no duplicate node_names exist.
-            if neuron.full_name in used_node_names:
-                raise ValueError(
-                    f"Error, duplicate node_names:{neuron.full_name} not "
-                    + " supported."
-                )
-            used_node_names.append(neuron.full_name)
-
-    hovertext: Dict[str, str] = {
-        node_name: "" for node_name in used_node_names
-    }
-    for node_name in used_node_names:
-        # Initialise the list of node hovertexts, per node.
-        if (
-            "temporal_node_hovertext"
-            not in plotted_graph.nodes[node_name].keys()
-        ):
-            plotted_graph.nodes[node_name]["temporal_node_hovertext"] = []
-
-        # Add node hovertext data per node
-        if hover_info.node_names:
-            hovertext[node_name] = hovertext[node_name] + node_name
-        if hover_info.neuron_properties:
-            hovertext[node_name] = hovertext[
-                node_name
-            ] + get_desired_neuron_properties(
-                snn_graph=snn_graph,
-                neuron_properties=hover_info.neuron_properties,
-                node_name=node_name,
-                t=t,
-            )
-        if hover_info.incoming_synapses:
-            hovertext[node_name] = hovertext[node_name] + get_edges_of_node(
-                snn_graph=snn_graph, node_name=node_name, outgoing=False, t=t
-            )
-        if hover_info.outgoing_synapses:
-            hovertext[node_name] = hovertext[node_name] + get_edges_of_node(
-                snn_graph=snn_graph, node_name=node_name, outgoing=True, t=t
-            )
-
-        # plotted_graph.nodes[node_name]["label"] = hovertext[node_name]
-        plotted_graph.nodes[node_name]["temporal_node_hovertext"].append(
-            hovertext[node_name]
-        )
+    node_hovertexts: Node_hovertexts = Node_hovertexts(
+        hover_info=hover_info,
+        lif_neurons=lif_neurons,
+        snn_graph=snn_graph,
+        timesteps=[t],
+    )
+    node_hovertexts.store_in_graph(plotted_graph=plotted_graph)
 
 
 # pylint: disable=R0912
@@ -149,8 +158,9 @@ def store_node_colours_and_opacity(
     """Creates/copies the nodes and edges into the plotted graph."""
 
     colour_dict = get_nx_node_colours(G=snn_graph, t=t)
+    connectors: Set[str] = get_connector_names(snn_graph=snn_graph)
     for node_name, colour in colour_dict.items():
-        if "connector" not in node_name:
+        if node_name not in connectors:
             # Store colours over time.
             if "temporal_colour" not in plotted_graph.nodes[node_name].keys():
                 plotted_graph.nodes[node_name]["temporal_colour"] = []
@@ -187,67 +197,167 @@ def store_edge_colour_and_opacity(
 
 
 @typechecked
-def get_desired_neuron_properties(
-    snn_graph: nx.DiGraph,
-    neuron_properties: List[str],
-    node_name: str,
-    t: int,
-) -> str:
-    """Returns a list with one string per node."""
-    properties: List[str] = ["<br />"]
-    for neuron_property_name in neuron_properties:
-        neuron_property_obj = getattr(
-            snn_graph.nodes[node_name]["nx_lif"][t], neuron_property_name
-        )
-
-        # Boilerplate because LIF_neuron attributes are objects instead of
-        # values.
-        if not isinstance(neuron_property_obj, (bool, float, int)):
-            neuron_property = getattr(
-                neuron_property_obj, neuron_property_name
-            )
-        else:
-            neuron_property = neuron_property_obj
-
-        properties.append(f"{neuron_property_name}:{neuron_property}<br />")
-    return "".join(properties)
-
+def get_neuron_property(
+    lif_neuron: LIF_neuron, neuron_property_name: str
+) -> Union[bool, float, int]:
+    """Returns the value of a property of a neuron."""
+    neuron_property_obj = getattr(lif_neuron, neuron_property_name)
+
+    # Boilerplate because LIF_neuron attributes are objects instead of
+    # values.
+    if not isinstance(neuron_property_obj, (bool, float, int)):
+        return getattr(neuron_property_obj, neuron_property_name)
+    return neuron_property_obj
+
+
+# pylint: disable=R0902
+class Node_hovertexts:
+    """Creates the hovertexts of the nodes at the timesteps.
+
+    The incoming and outgoing synapses of each node, and the spikes and
+    requested properties of the neurons are gathered once per graph, instead
+    of per node and timestep. The synapse lines only depend on whether the
+    input neuron spikes, so both variants are created once per synapse.
+    """
 
-@typechecked
-def get_edges_of_node(
-    snn_graph: nx.DiGraph,
-    node_name: str,
-    outgoing: bool,
-    t: int,
-) -> str:
-    """Returns (the other) node_names of the edges of a node."""
-    node_edges: List[str] = ["<br />"]
-    if outgoing:
-        node_edges.append("outgoing:<br />")
-    else:
-        node_edges.append("incoming:<br />")
+    @typechecked
+    def __init__(
+        self,
+        hover_info: Hover_info,
+        lif_neurons: List[LIF_neuron],
+        snn_graph: nx.DiGraph,
+        timesteps: List[int],
+    ) -> None:
+        self.hover_info: Hover_info = hover_info
+        self.timesteps: List[int] = timesteps
+
+        network_index: Network_index = get_network_index(snn=snn_graph)
+        connectors: Set[str] = network_index.role_names[CONNECTOR_ROLE]
+        self.node_names: List[str] = []
+        for neuron in lif_neurons:
+            if neuron.full_name not in connectors:
+                # Assert no duplicate node_names exist.
+                if neuron.full_name in self.node_names:
+                    raise ValueError(
+                        f"Error, duplicate node_names:{neuron.full_name} not "
+                        + " supported."
+                    )
+                self.node_names.append(neuron.full_name)
+
+        # Column index of each neuron in the spike matrix.
+        node_indices: Dict[str, int] = network_index.name_indices
+        # Rows are the timesteps, columns are the neurons.
+        self.spikes: List[List[bool]] = []
+        if hover_info.incoming_synapses or hover_info.outgoing_synapses:
+            self.spikes = [
+                [
+                    bool(snn_graph.nodes[node_name]["nx_lif"][t].spikes)
+                    for node_name in snn_graph.nodes()
+                ]
+                for t in timesteps
+            ]
 
-    for edge in snn_graph.edges():
-        if edge[0] == node_name and outgoing:
-            if snn_graph.nodes[edge[0]]["nx_lif"][t].spikes:
-                node_edges.append(
-                    f'{edge[0]}: {snn_graph.edges[edge]["synapse"].weight}'
-                    + "<br /> "
+        # The (input neuron index, line if it spikes, line otherwise) of the
+        # incoming and outgoing synapses per node, in the order of the edges.
+        self.incoming: Dict[str, List[Tuple[int, str, str]]] = {
+            node_name: [] for node_name in self.node_names
+        }
+        self.outgoing: Dict[str, List[Tuple[int, str, str]]] = {
+            node_name: [] for node_name in self.node_names
+        }
+        for edge in snn_graph.edges():
+            spike_line: str = (
+                f'{edge[0]}: {snn_graph.edges[edge]["synapse"].weight}'
+                + "<br /> "
+            )
+            if edge[0] in self.outgoing:
+                self.outgoing[edge[0]].append(
+                    (node_indices[edge[0]], spike_line, f"{edge[1]}<br /> ")
                 )
-            else:
-                node_edges.append(f"{edge[1]}<br /> ")
-        elif edge[1] == node_name and not outgoing:
-            if snn_graph.nodes[edge[0]]["nx_lif"][t].spikes:
-                node_edges.append(
-                    f'{edge[0]}: {snn_graph.edges[edge]["synapse"].weight}'
-                    + "<br /> "
+            if edge[1] in self.incoming:
+                self.incoming[edge[1]].append(
+                    (node_indices[edge[0]], spike_line, f"{edge[0]}<br /> ")
                 )
-            else:
-                node_edges.append(f"{edge[0]}<br /> ")
 
-    node_edge_str = "".join(node_edges)
+        # The neuron properties per timestep, per node.
+        self.neuron_properties: List[Dict[str, str]] = [
+            {
+                node_name: "<br />"
+                + "".join(
+                    f"{neuron_property_name}:"
+                    + str(
+                        get_neuron_property(
+                            snn_graph.nodes[node_name]["nx_lif"][t],
+                            neuron_property_name,
+                        )
+                    )
+                    + "<br />"
+                    for neuron_property_name in hover_info.neuron_properties
+                )
+                for node_name in self.node_names
+            }
+            for t in timesteps
+        ]
+
+    @typechecked
+    def get_synapse_lines(
+        self,
+        synapses: List[Tuple[int, str, str]],
+        header: str,
+        spikes: List[bool],
+    ) -> str:
+        """Returns the lines of the incoming or outgoing synapses of a node."""
+        return (
+            "<br />"
+            + header
+            + "".join(
+                spike_line if spikes[input_index] else line
+                for input_index, spike_line, line in synapses
+            )
+        )
 
-    return node_edge_str
+    @typechecked
+    def get_hovertexts(self, timestep_index: int) -> List[str]:
+        """Returns the hovertext per node at a timestep."""
+        hovertexts: List[str] = []
+        for node_name in self.node_names:
+            hovertext: List[str] = []
+            if self.hover_info.node_names:
+                hovertext.append(node_name)
+            if self.hover_info.neuron_properties:
+                hovertext.append(
+                    self.neuron_properties[timestep_index][node_name]
+                )
+            if self.hover_info.incoming_synapses:
+                hovertext.append(
+                    self.get_synapse_lines(
+                        self.incoming[node_name],
+                        "incoming:<br />",
+                        self.spikes[timestep_index],
+                    )
+                )
+            if self.hover_info.outgoing_synapses:
+                hovertext.append(
+                    self.get_synapse_lines(
+                        self.outgoing[node_name],
+                        "outgoing:<br />",
+                        self.spikes[timestep_index],
+                    )
+                )
+            hovertexts.append("".join(hovertext))
+        return hovertexts
+
+    @typechecked
+    def store_in_graph(self, plotted_graph: nx.DiGraph) -> None:
+        """Appends the hovertexts of the timesteps to the hovertexts of the
+        nodes in the plotted graph."""
+        for timestep_index in range(len(self.timesteps)):
+            for node_name, hovertext in zip(
+                self.node_names, self.get_hovertexts(timestep_index)
+            ):
+                plotted_graph.nodes[node_name].setdefault(
+                    "temporal_node_hovertext", []
+                ).append(hovertext)
 
 
 # pylint: disable=R0912
@@ -257,8 +367,9 @@ def store_edge_labels(
     snn_graph: nx.DiGraph,
 ) -> None:
     """Stores the edge labels into the plotted graph."""
+    connectors: Set[str] = get_connector_names(snn_graph=snn_graph)
     for edge in plotted_graph.edges():
-        if "connector" not in edge[0] and "connector" not in edge[1]:
+        if edge[0] not in connectors and edge[1] not in connectors:
             plotted_graph.edges[edge][
                 "label"
             ] = f"W:{snn_graph.edges[edge]['synapse'].weight}"
@@ -270,8 +381,9 @@ def store_node_position(
     plotted_graph: nx.DiGraph, snn_graph: nx.DiGraph, t: int
 ) -> None:
     """Stores the node position the plotted graph."""
+    connectors: Set[str] = get_connector_names(snn_graph=snn_graph)
     for node_name in plotted_graph.nodes():
-        if "connector" not in node_name:
+        if node_name not in connectors:
             plotted_graph.nodes[node_name]["pos"] = snn_graph.nodes[node_name][
                 "nx_lif"
             ][t].pos
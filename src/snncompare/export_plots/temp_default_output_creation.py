@@ -35,6 +35,8 @@ def create_default_output_config(*, exp_config: Exp_config) -> Output_config:
             skip_stage_2_output=True,
             show_images=True,
             store_died_neurons=False,
+            export_failure_modes=False,
+            show_failure_modes=False,
         ),
     )
     return output_config
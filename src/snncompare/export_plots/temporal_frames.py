@@ -0,0 +1,198 @@
+"""Stores the properties of a plotted snn that change over time, such that
+the figure of the snn is created once, and each timestep only updates the
+node colours, hovertexts, and the colours and opacities of the edges.
+
+Per timestep, the changing properties are stored as a row of a matrix with
+a column per node. The edge arrows and recursive edge circles take the
+colour and opacity of their (input) node, so they store the column of that
+node.
+
+The changing properties of a timestep are returned as a dict from the path
+of each property in the figure to its value, such that they can be written
+into the figure itself, or into a dash.Patch that only sends those
+properties to the browser.
+"""
+import os
+from typing import Dict, List, Tuple, Union
+
+import networkx as nx
+import plotly.graph_objs as go
+from typeguard import typechecked
+
+from snncompare.export_plots.create_dash_fig_obj import (
+    NamedAnnotation,
+    create_svg_with_dash,
+)
+from snncompare.export_plots.Plot_config import Plot_config
+
+# The path of a property in the figure, e.g. ("data", 0, "marker", "color").
+Property_path = Tuple[Union[str, int], ...]
+Property_value = Union[str, float, List[str], List[float]]
+
+
+@typechecked
+def limit_line_length(
+    *, line_separation_chars: str, some_str: str, limit: int
+) -> str:
+    """Returns first <limit> lines of a string. Assumes new line character is:
+
+     \n
+    .
+    """
+    if some_str.count(line_separation_chars) <= limit:
+        return some_str
+    split_lines: List[str] = some_str.split(line_separation_chars)
+    merged_lines: List[str] = []
+    for i in range(0, min(limit, len(split_lines))):
+        merged_lines.append(
+            os.linesep.join([split_lines[i], line_separation_chars])
+        )
+    return os.linesep.join(merged_lines)
+
+
+# pylint: disable=R0903
+class Temporal_frames:
+    """Stores the node colours, opacities and hovertexts per timestep, and
+    the node of each edge annotation and recursive edge shape."""
+
+    @typechecked
+    def __init__(
+        self,
+        plotted_graph: nx.DiGraph,
+        identified_annotations: List[NamedAnnotation],
+    ) -> None:
+        node_names: List[str] = list(plotted_graph.nodes())
+        self.nr_of_timesteps: int = (
+            len(plotted_graph.nodes[node_names[0]]["temporal_colour"])
+            if node_names
+            else 0
+        )
+
+        # Rows are timesteps, columns are nodes.
+        self.node_colours: List[List[str]] = [
+            [
+                plotted_graph.nodes[node_name]["temporal_colour"][t]
+                for node_name in node_names
+            ]
+            for t in range(self.nr_of_timesteps)
+        ]
+        self.node_opacities: List[List[float]] = [
+            [
+                plotted_graph.nodes[node_name]["temporal_opacity"][t]
+                for node_name in node_names
+            ]
+            for t in range(self.nr_of_timesteps)
+        ]
+        self.node_hovertexts: List[List[str]] = [
+            [
+                limit_line_length(
+                    line_separation_chars="<br />",
+                    some_str=plotted_graph.nodes[node_name][
+                        "temporal_node_hovertext"
+                    ][t],
+                    limit=25,
+                )
+                for node_name in node_names
+            ]
+            for t in range(self.nr_of_timesteps)
+        ]
+
+        # The (annotation index, node index) of the edge arrows, and the node
+        # index of each recursive edge circle, in the order of the shapes.
+        node_indices: dict = {
+            node_name: i for i, node_name in enumerate(node_names)
+        }
+        self.edge_annotations: List[Tuple[int, int]] = [
+            (i, node_indices[identified_annotation.edge[0]])
+            for i, identified_annotation in enumerate(identified_annotations)
+            if identified_annotation.category == "non_recur_edge"
+        ]
+        self.shape_nodes: List[int] = list(range(len(node_names)))
+
+
+@typechecked
+def create_figure_with_temporal_frames(
+    *,
+    plotted_graph: nx.DiGraph,
+    plot_config: Plot_config,
+) -> Tuple[go.Figure, Temporal_frames]:
+    """Creates the figure of the plotted graph at the first timestep, and the
+    properties that change in the other timesteps."""
+    dash_figure, identified_annotations = create_svg_with_dash(
+        graph=plotted_graph,
+        plot_config=plot_config,
+    )
+    temporal_frames: Temporal_frames = Temporal_frames(
+        plotted_graph=plotted_graph,
+        identified_annotations=identified_annotations,
+    )
+    # The recursive edge circles are only drawn if the plot config shows
+    # them.
+    temporal_frames.shape_nodes = temporal_frames.shape_nodes[
+        : len(dash_figure.layout.shapes)
+    ]
+    return dash_figure, temporal_frames
+
+
+@typechecked
+def get_temporal_frame_updates(
+    *,
+    plot_config: Plot_config,
+    temporal_frames: Temporal_frames,
+    t: int,
+) -> Dict[Property_path, Property_value]:
+    """Returns the path and value of each property of the figure that changes
+    over time, at timestep t."""
+    if t < 0 or t >= temporal_frames.nr_of_timesteps:
+        raise ValueError(
+            f"Error, t={t} is not in range [0,"
+            + f"{temporal_frames.nr_of_timesteps})."
+        )
+    node_colours: List[str] = temporal_frames.node_colours[t]
+    node_opacities: List[float] = temporal_frames.node_opacities[t]
+    updates: Dict[Property_path, Property_value] = {}
+    if plot_config.update_node_colours:
+        updates[("data", 0, "marker", "color")] = node_colours
+    if plot_config.update_node_labels:
+        updates[("data", 0, "hovertext")] = temporal_frames.node_hovertexts[t]
+    if plot_config.update_edge_colours:
+        for annotation_index, node_index in temporal_frames.edge_annotations:
+            annotation_path: Property_path = (
+                "layout",
+                "annotations",
+                annotation_index,
+            )
+            updates[annotation_path + ("arrowcolor",)] = node_colours[
+                node_index
+            ]
+            if plot_config.update_edge_opacity:
+                updates[annotation_path + ("opacity",)] = node_opacities[
+                    node_index
+                ]
+        for shape_index, node_index in enumerate(temporal_frames.shape_nodes):
+            shape_path: Property_path = ("layout", "shapes", shape_index)
+            updates[shape_path + ("line", "color")] = node_colours[node_index]
+            if plot_config.update_edge_opacity:
+                updates[shape_path + ("opacity",)] = node_opacities[node_index]
+    return updates
+
+
+@typechecked
+def apply_temporal_frame(
+    *,
+    dash_figure: go.Figure,
+    plot_config: Plot_config,
+    temporal_frames: Temporal_frames,
+    t: int,
+) -> None:
+    """Updates the properties of the figure that change over time to those of
+    timestep t."""
+    updates: Dict[Property_path, Property_value] = get_temporal_frame_updates(
+        plot_config=plot_config, temporal_frames=temporal_frames, t=t
+    )
+    with dash_figure.batch_update():
+        for path, value in updates.items():
+            parent = dash_figure
+            for key in path[:-1]:
+                parent = parent[key]
+            parent[path[-1]] = value
@@ -0,0 +1,123 @@
+"""Serves the frames that stage 3 rendered for a run config from disk, with a
+slider per graph, such that the rendering does not need a Dash server and
+the frames can be viewed at any later moment."""
+import base64
+import logging
+import os
+from typing import Dict, List
+
+import dash
+from dash import dcc, html
+from dash.dependencies import Input, Output
+from typeguard import typechecked
+
+from snncompare.export_plots.dash_plot_updaters import get_slider_marks
+from snncompare.export_plots.export_frames import get_frame_filepath
+from snncompare.helper import get_snn_graph_names
+
+# The frame types that a browser shows, in order of preference.
+VIEWABLE_EXPORT_TYPES: Dict[str, str] = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+}
+
+
+@typechecked
+def get_rendered_frames(*, unique_id: str) -> Dict[str, List[str]]:
+    """Returns the filepaths of the rendered frames per graph of a run
+    config, ordered on timestep."""
+    rendered_frames: Dict[str, List[str]] = {}
+    for graph_name in get_snn_graph_names():
+        for export_type in VIEWABLE_EXPORT_TYPES:
+            filepaths: List[str] = []
+            while os.path.isfile(
+                get_frame_filepath(
+                    export_type=export_type,
+                    filename=f"{graph_name}_{unique_id}",
+                    t=len(filepaths),
+                )
+            ):
+                filepaths.append(
+                    get_frame_filepath(
+                        export_type=export_type,
+                        filename=f"{graph_name}_{unique_id}",
+                        t=len(filepaths),
+                    )
+                )
+            if filepaths:
+                rendered_frames[graph_name] = filepaths
+                break
+    return rendered_frames
+
+
+@typechecked
+def get_frame_src(*, filepath: str) -> str:
+    """Returns the image of a frame as data url."""
+    mime_type: str = VIEWABLE_EXPORT_TYPES[filepath.split(".")[-1]]
+    with open(filepath, "rb") as frame_file:
+        encoded: str = base64.b64encode(frame_file.read()).decode("ascii")
+    return f"data:{mime_type};base64,{encoded}"
+
+
+@typechecked
+def create_viewer_app(*, unique_id: str) -> dash.Dash:
+    """Creates the Dash app that shows the rendered frames of a run config,
+    and loads a frame when its timestep is selected."""
+    rendered_frames: Dict[str, List[str]] = get_rendered_frames(
+        unique_id=unique_id
+    )
+    if not rendered_frames:
+        raise FileNotFoundError(
+            f"Error, no rendered frames of run config:{unique_id} found, "
+            + "export them in stage 3 with: -x svg"
+        )
+    app = dash.Dash(__name__)
+    html_figures: List = []
+    for graph_name, filepaths in rendered_frames.items():
+        html_figures.append(html.H3(graph_name))
+        html_figures.append(
+            dcc.Slider(
+                id=f"frame-slider{graph_name}",
+                min=0,
+                max=len(filepaths) - 1,
+                value=0,
+                marks=get_slider_marks(nr_of_timesteps=len(filepaths)),
+                step=1,
+            )
+        )
+        html_figures.append(
+            html.Img(
+                id=f"Frame{graph_name}",
+                src=get_frame_src(filepath=filepaths[0]),
+            )
+        )
+        add_frame_callback(app=app, filepaths=filepaths, graph_name=graph_name)
+    app.layout = html.Div(html_figures)
+    return app
+
+
+@typechecked
+def add_frame_callback(
+    *, app: dash.Dash, filepaths: List[str], graph_name: str
+) -> None:
+    """Shows the frame of the timestep that is selected with the slider."""
+
+    @app.callback(
+        Output(f"Frame{graph_name}", "src"),
+        [Input(f"frame-slider{graph_name}", "value")],
+    )
+    def update_frame(t: int) -> str:
+        """Loads the frame of timestep t."""
+        return get_frame_src(filepath=filepaths[t])
+
+
+@typechecked
+def view_rendered_run(*, port: int, unique_id: str) -> None:
+    """Serves the rendered frames of a run config in the browser."""
+    app: dash.Dash = create_viewer_app(unique_id=unique_id)
+
+    # Silence the dash app verbosity to console.
+    log = logging.getLogger("werkzeug")
+    log.setLevel(logging.ERROR)
+    print(f"Showing the frames of:{unique_id} on http://127.0.0.1:{port}")
+    app.run_server(port=port)
@@ -1,9 +1,7 @@
 """Helps in computing the adaptation cost plot data."""
-import json
 from typing import Dict, List, Set, Union
 
 import networkx as nx
-from simsnn.core.simulators import Simulator
 from snnadaptation.Adaptation import Adaptation
 from snnalgorithms.get_input_graphs import (
     add_mdsa_initialisation_properties_to_input_graph,
@@ -12,18 +10,18 @@ from snnradiation.Rad_damage import Rad_damage
 from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
-from snncompare.export_plots.Plot_config import get_default_plot_config
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
 from snncompare.graph_generation.export_input_graphs import (
     load_input_graph_based_on_nr,
 )
-from snncompare.graph_generation.stage_1_create_graphs import (
-    get_graphs_stage_1,
-)
-from snncompare.helper import get_snn_graph_from_graphs_dict
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.load_snn_counts import (
+    load_stage_1_counts,
+    load_stage_2_counts,
+)
+from snncompare.run_config.interned_settings import get_interned_setting
 from snncompare.run_config.Run_config import Run_config
 
 
@@ -68,7 +66,7 @@ class Raw_adap_cost_data:
         input_graph: nx.Graph,
         dummy_run_config: Run_config,
         seed: int,
-        snn_graph: Union[nx.DiGraph, Simulator],
+        costs: Dict[str, int],
     ) -> None:
         self.adaptation: Union[None, Adaptation] = adaptation
         self.algorithm_name: str = algorithm_name
@@ -78,31 +76,11 @@ class Raw_adap_cost_data:
         self.input_graph: nx.Graph = input_graph
         self.dummy_run_config: Run_config = dummy_run_config
         self.seed: int = seed
-        self.snn_graph: Union[nx.DiGraph, Simulator] = snn_graph
-        self.costs: Dict[str, int] = {}
         self.cost_types: List[str] = ["neuronal", "synaptic", "spikes"]
         for cost_type in self.cost_types:
-            self.costs[cost_type] = self.get_cost_value(cost_type=cost_type)
-
-    @typechecked
-    def get_cost_value(self, cost_type: str) -> int:
-        """Returns the adaptation cost belonging to the snn for the desired
-        cost_type."""
-        if cost_type == "spikes":
-            if self.adaptation is None:
-                with_adaptation = False
-            else:
-                with_adaptation = True
-            return get_nr_of_spikes_in_snn(
-                input_graph=self.input_graph,
-                run_config=self.dummy_run_config,
-                with_adaptation=with_adaptation,
-            )
-        if cost_type == "neuronal":
-            return len(self.snn_graph.network.nodes)
-        if cost_type == "synaptic":
-            return len(self.snn_graph.network.synapses)
-        raise NotImplementedError(f"Error, {cost_type} not supported.")
+            if cost_type not in costs:
+                raise KeyError(f"Error, {cost_type} cost not found.")
+        self.costs: Dict[str, int] = costs
 
 
 @typechecked
@@ -138,13 +116,7 @@ def get_raw_adap_cost_datas(
                 seed=base_cost_setting["seed"],
             )
 
-            # Get the snns for these adaptations.
-            # pprint(dummy_run_config.__dict__)
-            adapted_snn = get_snn(
-                dummy_run_config=dummy_run_config,
-                with_adaptation=True,
-            )
-            # print(len(adapted_snn.network.graph.nodes))
+            # Get the stored counts of the snns for these adaptations.
 
             raw_plot_data: Raw_adap_cost_data = Raw_adap_cost_data(
                 adaptation=adaptation,
@@ -155,16 +127,16 @@ def get_raw_adap_cost_datas(
                 input_graph=input_graph,
                 dummy_run_config=dummy_run_config,
                 seed=base_cost_setting["seed"],
-                snn_graph=adapted_snn,
+                costs=get_snn_costs(
+                    input_graph=input_graph,
+                    run_config=dummy_run_config,
+                    with_adaptation=True,
+                ),
             )
             raw_plot_datas.append(raw_plot_data)
 
         # Also get an unadapted snn for each base-setting, using an arbitrary
         # adaptation.
-        un_adapted_snn = get_snn(
-            dummy_run_config=dummy_run_config,
-            with_adaptation=False,
-        )
         raw_plot_data_without_adaptation = Raw_adap_cost_data(
             # adaptation=adaptation,
             adaptation=None,
@@ -175,7 +147,11 @@ def get_raw_adap_cost_datas(
             input_graph=input_graph,
             dummy_run_config=dummy_run_config,
             seed=base_cost_setting["seed"],
-            snn_graph=un_adapted_snn,
+            costs=get_snn_costs(
+                input_graph=input_graph,
+                run_config=dummy_run_config,
+                with_adaptation=False,
+            ),
         )
         raw_plot_datas.append(raw_plot_data_without_adaptation)
     return raw_plot_datas
@@ -272,7 +248,8 @@ def get_run_config(
     seed: int,
 ) -> Run_config:
     """Returns the input graph."""
-    dummy_rad_damage: Rad_damage = Rad_damage(
+    dummy_rad_damage: Rad_damage = get_interned_setting(
+        setting_class=Rad_damage,
         amplitude=0,
         effect_type="neuron_death",
         excitatory=False,
@@ -293,59 +270,43 @@ def get_run_config(
 
 
 @typechecked
-def get_snn(
-    *,
-    dummy_run_config: Run_config,
-    with_adaptation: bool,
-) -> Union[nx.DiGraph, Simulator]:
-    """Get dummy run config."""
-    # Get snn graph with or without adaptation, based on input
-    # graph.
-    stage_1_graphs: Dict[
-        str, Union[nx.Graph, nx.DiGraph, Simulator]
-    ] = get_graphs_stage_1(
-        plot_config=get_default_plot_config(),
-        run_config=dummy_run_config,
-    )
-
-    snn_graph: Union[nx.DiGraph, Simulator] = get_snn_graph_from_graphs_dict(
-        with_adaptation=with_adaptation,
-        with_radiation=False,
-        graphs_dict=stage_1_graphs,
-    )
-    return snn_graph
-
-
-@typechecked
-def get_nr_of_spikes_in_snn(
+def get_snn_costs(
     *,
     input_graph: nx.Graph,
     run_config: Run_config,
     with_adaptation: bool,
-) -> int:
-    """Returns the adaptation costs for this experiment setting."""
+) -> Dict[str, int]:
+    """Returns the number of neurons, synapses and spikes of the (un)adapted
+    snn of this experiment setting, from the stored stage 1 and stage 2
+    counts, without creating the snn."""
     _, rand_nrs_hash = get_rand_nrs_and_hash(input_graph=input_graph)
 
-    (
-        simsnn_exists,
-        simsnn_filepath,
-    ) = simsnn_files_exists_and_get_path(
-        output_category="snns",
-        input_graph=input_graph,
-        run_config=run_config,
-        with_adaptation=with_adaptation,
-        stage_index=2,
-        rad_affected_neurons_hash=None,
-        rand_nrs_hash=rand_nrs_hash,
-    )
-
-    if not simsnn_exists:
-        raise FileNotFoundError(f"Error, {simsnn_filepath} not found.")
+    simsnn_filepaths: Dict[int, str] = {}
+    for stage_index in [1, 2]:
+        (
+            simsnn_exists,
+            simsnn_filepaths[stage_index],
+        ) = simsnn_files_exists_and_get_path(
+            output_category="snns",
+            input_graph=input_graph,
+            run_config=run_config,
+            with_adaptation=with_adaptation,
+            stage_index=stage_index,
+            rad_affected_neurons_hash=None,
+            rand_nrs_hash=rand_nrs_hash,
+        )
+        if not simsnn_exists:
+            raise FileNotFoundError(
+                f"Error, {simsnn_filepaths[stage_index]} not found."
+            )
 
-    # Read snn graph propagation JSON file into dict.
-    with open(simsnn_filepath, encoding="utf-8") as json_file:
-        snn_propagation = json.load(json_file)
-        json_file.close()
-    # TODO: determine why spikes is list in list, remove [0] if desirable.
-    nr_of_spikes: int = sum(snn_propagation["spikes"][0])
-    return nr_of_spikes
+    stage_1_counts: Dict[str, int] = load_stage_1_counts(
+        stage_1_simsnn_filepath=simsnn_filepaths[1]
+    )
+    return {
+        "neuronal": stage_1_counts["neurons"],
+        "synaptic": stage_1_counts["synapses"],
+        "spikes": load_stage_2_counts(
+            stage_2_simsnn_filepath=simsnn_filepaths[2]
+        )["spikes"],
+    }
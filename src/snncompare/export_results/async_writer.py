@@ -0,0 +1,171 @@
+"""Writes the stage output files in a background thread, such that the
+simulation of the next snn/run config overlaps with the serialisation and
+disk I/O of the previous one.
+
+The queue is bounded, so the simulation blocks if the writer falls behind
+(which limits the memory of the queued outputs). The writer keeps track of
+the (logical) filepaths it still has to write. Checking whether such a file
+exists, or reading it, first waits until the queued writes are flushed.
+Without a started writer, the write jobs are executed directly.
+"""
+import atexit
+import os
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from typeguard import typechecked
+
+
+class Async_writer:
+    """Executes write jobs in a single background thread."""
+
+    @typechecked
+    def __init__(self, max_pending_jobs: int) -> None:
+        if max_pending_jobs < 1:
+            raise ValueError("Error, max_pending_jobs should be >0.")
+        self.jobs: queue.Queue = queue.Queue(maxsize=max_pending_jobs)
+        self.pending_filepaths: Dict[str, int] = {}
+        self.errors: List[BaseException] = []
+        self.lock: threading.Lock = threading.Lock()
+        self.thread: threading.Thread = threading.Thread(
+            target=self.process_jobs, daemon=True
+        )
+        self.thread.start()
+
+    @typechecked
+    def submit(self, *, filepath: str, job: Callable[[], None]) -> None:
+        """Queues a job that writes a filepath. Blocks while the queue is
+        full."""
+        with self.lock:
+            self.pending_filepaths[filepath] = (
+                self.pending_filepaths.get(filepath, 0) + 1
+            )
+        self.jobs.put((filepath, job))
+
+    def process_jobs(self) -> None:
+        """Executes the queued jobs until the stop sentinel (None) is
+        received."""
+        while True:
+            item: Optional[Tuple[str, Callable[[], None]]] = self.jobs.get()
+            if item is None:
+                self.jobs.task_done()
+                return
+            filepath, job = item
+            try:
+                job()
+            # Errors are re-raised in the main thread by flush.
+            except BaseException as error:  # pylint: disable=W0718
+                with self.lock:
+                    self.errors.append(error)
+            finally:
+                with self.lock:
+                    self.pending_filepaths[filepath] -= 1
+                    if self.pending_filepaths[filepath] == 0:
+                        self.pending_filepaths.pop(filepath)
+                self.jobs.task_done()
+
+    @typechecked
+    def is_pending(self, *, filepath: str) -> bool:
+        """Returns True if the filepath is queued, or being written. Jobs that
+        run in the writer thread itself see the files of earlier jobs as
+        written, as the jobs are executed in order."""
+        if threading.current_thread() is self.thread:
+            return False
+        with self.lock:
+            return filepath in self.pending_filepaths
+
+    @typechecked
+    def flush(self) -> None:
+        """Waits until all queued jobs are written, and raises the first
+        error of a failed job."""
+        self.jobs.join()
+        with self.lock:
+            errors: List[BaseException] = self.errors
+            self.errors = []
+        if errors:
+            raise errors[0]
+
+    @typechecked
+    def stop(self) -> None:
+        """Flushes the queued jobs and stops the background thread."""
+        try:
+            self.flush()
+        finally:
+            self.jobs.put(None)
+            self.thread.join()
+
+
+_async_writer: Optional[Async_writer] = None
+
+
+@typechecked
+def start_async_writer(*, max_pending_jobs: int) -> None:
+    """Starts the background writer of this process."""
+    # pylint: disable=W0603
+    global _async_writer
+    if _async_writer is not None:
+        raise ValueError("Error, the async writer is already started.")
+    _async_writer = Async_writer(max_pending_jobs=max_pending_jobs)
+
+
+def restart_async_writer_in_child() -> None:
+    """Replaces the writer that a forked child process inherits, as its
+    thread only runs in the parent process."""
+    # pylint: disable=W0603
+    global _async_writer
+    if _async_writer is not None:
+        _async_writer = Async_writer(
+            max_pending_jobs=_async_writer.jobs.maxsize
+        )
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=restart_async_writer_in_child)
+
+
+@typechecked
+def stop_async_writer() -> None:
+    """Writes all queued jobs and stops the background writer."""
+    # pylint: disable=W0603
+    global _async_writer
+    if _async_writer is not None:
+        async_writer: Async_writer = _async_writer
+        _async_writer = None
+        async_writer.stop()
+
+
+# Ensure the queued results are written before the process exits. This is
+# registered once per process, also if a (server) process starts a writer
+# per job.
+atexit.register(stop_async_writer)
+
+
+@typechecked
+def submit_write_job(*, filepath: str, job: Callable[[], None]) -> None:
+    """Queues a job that writes a (logical) filepath, or executes it directly
+    if no background writer is started.
+
+    The job should only use data that is not modified afterwards.
+    """
+    if _async_writer is None:
+        job()
+    else:
+        _async_writer.submit(filepath=filepath, job=job)
+
+
+@typechecked
+def flush_writes() -> None:
+    """Barrier that waits until all queued jobs are written."""
+    if _async_writer is not None:
+        _async_writer.flush()
+
+
+@typechecked
+def wait_for_pending_write(*, filepath: str) -> None:
+    """Flushes the queued jobs if the (logical) filepath is still to be
+    written."""
+    if _async_writer is not None and _async_writer.is_pending(
+        filepath=filepath
+    ):
+        _async_writer.flush()
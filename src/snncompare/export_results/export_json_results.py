@@ -1,45 +1,61 @@
 """Exports the test results to a json file."""
 import json
-from pathlib import Path
 from typing import Any, Dict, List, Union
 
 import networkx as nx
 from networkx.readwrite import json_graph
 from typeguard import typechecked
 
+from snncompare.export_results.storage_backend import (
+    find_stored_filepath,
+    get_storage_config,
+    read_json_bytes,
+    serialise_json,
+    store_json_bytes,
+)
+from snncompare.export_results.verify_output import verify_written_json
+
 
 @typechecked
 def write_to_json(
     *, output_filepath: str, some_dict: Union[Dict, List[Union[int, str]]]
 ) -> None:
-    """Writes a dict file to a .json file.
+    """Writes a dict file to a .json file, at the location and in the format
+    of the storage backend. Then verifies it according to the verification
+    policy.
 
     TODO: Rename some_dict to some_text.
     """
-
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        if isinstance(some_dict, Dict):
-            json.dump(some_dict, fp, indent=4, sort_keys=True)
-        elif isinstance(some_dict, List):
-            json.dump(some_dict, fp, indent=4, sort_keys=True)
-        fp.close()
-
-    # Verify the file exists.
-    if not Path(output_filepath).is_file():
-        raise FileExistsError(
-            f"Error, filepath:{output_filepath} was not created."
-        )
+    json_bytes: bytes = serialise_json(
+        some_dict=some_dict, compact=get_storage_config().sharded
+    )
+    storage_filepath: str = store_json_bytes(
+        filepath=output_filepath, json_bytes=json_bytes
+    )
+    verify_written_json(
+        filepath=output_filepath,
+        storage_filepath=storage_filepath,
+        json_bytes=json_bytes,
+    )
 
 
 def verify_loaded_json_content_is_nx_graph(
     output_filepath: str, some_dict: Dict
 ) -> None:
-    """Verifies an exported graph can be loaded correctly."""
+    """Verifies an exported graph can be loaded correctly, if the
+    verification policy is full."""
     # TODO: verify the file content is valid.
+    if get_storage_config().verification != "full":
+        return
     if "graph" in some_dict.keys():
-        with open(output_filepath, encoding="utf-8") as json_file:
-            graph_dict = json.load(json_file)
-            json_file.close()
+        storage_filepath: Union[None, str] = find_stored_filepath(
+            filepath=output_filepath
+        )
+        if storage_filepath is None:
+            raise FileNotFoundError(f"Error, {output_filepath} not found.")
+        graph_dict = json.loads(
+            read_json_bytes(storage_filepath=storage_filepath)
+        )
         some_graph = json_graph.node_link_graph(graph_dict)
         if not isinstance(some_graph, (nx.Graph, nx.DiGraph)):
             raise ImportError(
@@ -0,0 +1,137 @@
+"""Writes files such that multiple processes (or hosts on a shared
+filesystem) can write the same results tree concurrently.
+
+Whole files are written to a hidden temporary file in the same directory,
+which is then renamed onto the target filepath. A reader therefore sees the
+old file, or the complete new file, never a partially written file. Lines
+that are shared by processes (the seed hash files and the manifest) are
+checked and appended while holding an advisory (POSIX record) lock on the
+file, which is also supported by NFS. The advisory lock does not exclude
+the threads of a process, so the appends are also guarded by a lock per
+filepath within the process.
+"""
+import os
+import tempfile
+import threading
+from typing import IO, Dict
+
+from typeguard import typechecked
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows has no fcntl, there the appends are not locked.
+    fcntl = None  # type: ignore[assignment]
+
+TEMPORARY_FILE_PREFIX: str = "."
+TEMPORARY_FILE_SUFFIX: str = ".tmp"
+
+# The umask of the process, read once at import, because reading it requires
+# setting it, which affects all threads.
+_UMASK: int = os.umask(0)
+os.umask(_UMASK)
+
+# The lock per filepath that the threads of this process append under.
+_append_locks: Dict[str, threading.Lock] = {}
+_append_locks_lock: threading.Lock = threading.Lock()
+
+
+@typechecked
+def is_temporary_filename(*, filename: str) -> bool:
+    """Returns True if a filename is a (hidden) temporary file that is still
+    being written, False otherwise."""
+    return filename.startswith(TEMPORARY_FILE_PREFIX)
+
+
+@typechecked
+def atomic_write_bytes(*, filepath: str, some_bytes: bytes) -> None:
+    """Writes the bytes to a temporary file and renames it onto the
+    filepath."""
+    dirname: str = os.path.dirname(filepath) or "."
+    os.makedirs(dirname, exist_ok=True)
+    file_descriptor, tmp_filepath = tempfile.mkstemp(
+        dir=dirname,
+        prefix=f"{TEMPORARY_FILE_PREFIX}{os.path.basename(filepath)}.",
+        suffix=TEMPORARY_FILE_SUFFIX,
+    )
+    try:
+        # mkstemp creates the file as owner-only, use the default mode.
+        if hasattr(os, "fchmod"):
+            os.fchmod(file_descriptor, 0o666 & ~_UMASK)
+        else:  # pragma: no cover
+            os.chmod(tmp_filepath, 0o666 & ~_UMASK)
+        with os.fdopen(file_descriptor, "wb") as tmp_file:
+            tmp_file.write(some_bytes)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+
+
+@typechecked
+def lock_file(*, some_file: IO) -> None:
+    """Blocks until this process holds the exclusive lock on an opened
+    file."""
+    if fcntl is not None:
+        fcntl.lockf(some_file.fileno(), fcntl.LOCK_EX)
+
+
+@typechecked
+def unlock_file(*, some_file: IO) -> None:
+    """Releases the lock on an opened file."""
+    if fcntl is not None:
+        fcntl.lockf(some_file.fileno(), fcntl.LOCK_UN)
+
+
+@typechecked
+def get_append_lock(*, filepath: str) -> threading.Lock:
+    """Returns the lock that the threads of this process hold while they
+    append to a file."""
+    abs_filepath: str = os.path.abspath(filepath)
+    with _append_locks_lock:
+        if abs_filepath not in _append_locks:
+            _append_locks[abs_filepath] = threading.Lock()
+        return _append_locks[abs_filepath]
+
+
+@typechecked
+def append_line(*, filepath: str, line: str) -> None:
+    """Appends a line to a file while holding the lock on the file."""
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with get_append_lock(filepath=filepath), open(
+        filepath, "a", encoding="utf-8"
+    ) as txt_file:
+        lock_file(some_file=txt_file)
+        try:
+            txt_file.write(f"{line}\n")
+            txt_file.flush()
+        finally:
+            unlock_file(some_file=txt_file)
+
+
+@typechecked
+def append_line_if_missing(*, filepath: str, line: str) -> bool:
+    """Appends a line to a file if the file does not yet contain it. The
+    check and append happen while holding the lock on the file, such that
+    concurrent processes do not append duplicate lines.
+
+    Returns True if the line was appended, False otherwise.
+    """
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with get_append_lock(filepath=filepath), open(
+        filepath, "a+", encoding="utf-8"
+    ) as txt_file:
+        lock_file(some_file=txt_file)
+        try:
+            txt_file.seek(0)
+            if any(line in existing_line for existing_line in txt_file):
+                return False
+            txt_file.seek(0, os.SEEK_END)
+            txt_file.write(f"{line}\n")
+            txt_file.flush()
+            return True
+        finally:
+            unlock_file(some_file=txt_file)
@@ -1,6 +1,5 @@
 """Contains helper functions for exporting simulation results."""
 import collections
-import copy
 import hashlib
 import json
 from typing import Any, Dict, List, Union
@@ -11,6 +10,7 @@ from snnradiation.Rad_damage import list_of_hashes_to_hash
 from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.run_config.interned_settings import get_setting_hash
 
 from ..helper import get_some_duration
 
@@ -45,16 +45,15 @@ def exp_config_to_filename(
     # TODO: order dictionaries by alphabetical order by default.
     # TODO: allow user to specify a custom order of parameters.
 
-    # stripped_run_config:Dict = copy.deepcopy(run_config).__dict__
-    stripped_exp_config: Exp_config = copy.deepcopy(exp_config)
-    stripped_exp_config_dict: Dict = stripped_exp_config.__dict__
+    # A shallow copy suffices, as the settings are replaced, not modified.
+    stripped_exp_config_dict: Dict = dict(exp_config.__dict__)
     unique_id = stripped_exp_config_dict["unique_id"]
     stripped_exp_config_dict.pop("unique_id")
 
     # Convert all the radiation settings into a list of hashes.
     list_of_rad_hashes: List[str] = list(
         map(
-            lambda radiation: radiation.get_hash(),
+            lambda radiation: get_setting_hash(setting=radiation),
             stripped_exp_config_dict["radiations"],
         )
     )
@@ -136,46 +135,20 @@ def get_unique_run_config_id(  # type:ignore[misc]
     identifier.
 
     If it does contains the identifier, throws an error. Otherwise
-    computes the unique identifier hash and appends it.
+    computes the unique identifier hash of the canonical serialisation of
+    the run config.
     """
-    if "unique_id" in run_config.__dict__.keys():
+    if getattr(run_config, "unique_id", None) is not None:
         raise KeyError(
             f"Error, the exp_config:{run_config}\n"
             + "already contains a unique identifier."
         )
 
-    # Create deepcopy.
-    some_config = copy.deepcopy(run_config)
-
-    # Convert Rad_damage into hash
-
-    convert_run_config_attributes_into_hashes(some_config=some_config.__dict__)
-
-    # sorted(__dict__) returns a list of the sorted dictionary keys ONLY.
-    key_sorted_value_list: List = []
-    # .keys() is not needed in next line:
-    for sorted_key in sorted(some_config.__dict__.keys()):
-        key_sorted_value_list.append(some_config.__dict__[sorted_key])
-
     # Compute a unique code belonging to this particular experiment
     # configuration.
     unique_id = str(
         hashlib.sha256(
-            # json.dumps(sorted(some_config.__dict__)).encode("utf-8")
-            json.dumps(key_sorted_value_list).encode("utf-8")
+            json.dumps(run_config.get_canonical_values()).encode("utf-8")
         ).hexdigest()
     )
     return unique_id
-
-
-def convert_run_config_attributes_into_hashes(some_config: Dict) -> None:
-    """Converts the run_config dictionary into a dictionary with keys and
-    hashes as values."""
-    # sorted(__dict__) returns a list of the sorted dictionary keys ONLY.
-    for sorted_key in sorted(some_config.keys()):
-        if sorted_key == "adaptation":
-            adaptation_hash: str = some_config[sorted_key].get_hash()
-            some_config[sorted_key] = adaptation_hash
-        if sorted_key == "radiation":
-            radiation_hash: str = some_config[sorted_key].get_hash()
-            some_config[sorted_key] = radiation_hash
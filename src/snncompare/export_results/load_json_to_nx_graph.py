@@ -69,14 +69,14 @@ def load_verified_json_graphs_from_json(
     if run_config.unique_id != results_json_graphs[
         "run_config"
     ].unique_id or not dicts_are_equal(
-        left=results_json_graphs["run_config"].__dict__,
-        right=run_config.__dict__,
+        left=results_json_graphs["run_config"].to_dict(),
+        right=run_config.to_dict(),
         without_unique_id=True,
     ):
         print("Current run_config:")
         run_config.print_run_config_dict()
         print("Loaded run_config:")
-        pprint(results_json_graphs["run_config"].__dict__)
+        pprint(results_json_graphs["run_config"].to_dict())
         raise TabError("Error, difference in run configs, see above.")
 
     return results_json_graphs["graphs_dict"]
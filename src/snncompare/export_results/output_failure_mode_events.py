@@ -0,0 +1,100 @@
+"""Exports the failure modes of a radiated adapted snn as a flat event table.
+
+The table is a numpy .npz archive stored next to the stage 7 json file,
+with a row per (timestep, failure kind, neuron name) and the columns:
+    run_config_id, adaptation, algorithm_setting, neuron_name: str arrays.
+    seed, graph_size, timestep: int arrays.
+    failure_kind: the int8 index of the failure kind in FAILURE_KINDS.
+"""
+import io
+from typing import Dict, List
+
+import numpy as np
+from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import atomic_write_bytes
+from snncompare.export_results.storage_backend import get_sharded_filepath
+from snncompare.run_config.Run_config import Run_config
+
+FAILURE_MODE_EVENTS_EXTENSION: str = "_events.npz"
+
+# The failure kinds, in the order of their index in the failure_kind column.
+FAILURE_KINDS: List[str] = [
+    "incorrectly_spikes",
+    "incorrectly_silent",
+    "excitatory_delta_u",
+    "inhibitory_delta_u",
+]
+SPIKE_FAILURE_KINDS: List[str] = ["incorrectly_silent", "incorrectly_spikes"]
+U_FAILURE_KINDS: List[str] = ["inhibitory_delta_u", "excitatory_delta_u"]
+
+
+@typechecked
+def get_failure_mode_events_filepath(*, json_filepath: str) -> str:
+    """Returns the filepath of the event table that belongs to a stage 7 json
+    file. It is stored in the same (shard) directory as the json file."""
+    if not json_filepath.endswith(".json"):
+        raise ValueError(f"Error, {json_filepath} is not a json filepath.")
+    sharded_filepath: str = get_sharded_filepath(filepath=json_filepath)
+    return f"{sharded_filepath[:-5]}{FAILURE_MODE_EVENTS_EXTENSION}"
+
+
+@typechecked
+def get_failure_mode_event_columns(
+    *, failure_modes: Dict, run_config: Run_config
+) -> Dict[str, np.ndarray]:
+    """Returns the columns of the event table of the failure modes of a run
+    config. The timesteps may be int or str (json) keys."""
+    timesteps: List[int] = []
+    failure_kinds: List[int] = []
+    neuron_names: List[str] = []
+    for kind_index, failure_kind in enumerate(FAILURE_KINDS):
+        for timestep, failed_neuron_names in failure_modes.get(
+            failure_kind, {}
+        ).items():
+            for neuron_name in failed_neuron_names:
+                timesteps.append(int(timestep))
+                failure_kinds.append(kind_index)
+                neuron_names.append(neuron_name)
+
+    nr_of_events: int = len(timesteps)
+    return {
+        "run_config_id": np.full(nr_of_events, run_config.unique_id),
+        "adaptation": np.full(
+            nr_of_events,
+            f"{run_config.adaptation.adaptation_type}_"
+            + f"{run_config.adaptation.redundancy}",
+        ),
+        "algorithm_setting": np.full(
+            nr_of_events,
+            get_algorithm_setting_name(algorithm_setting=run_config.algorithm),
+        ),
+        "seed": np.full(nr_of_events, run_config.seed, dtype=np.int64),
+        "graph_size": np.full(
+            nr_of_events, run_config.graph_size, dtype=np.int64
+        ),
+        "timestep": np.asarray(timesteps, dtype=np.int64),
+        "failure_kind": np.asarray(failure_kinds, dtype=np.int8),
+        "neuron_name": np.asarray(neuron_names, dtype=str),
+    }
+
+
+@typechecked
+def output_failure_mode_events(
+    *,
+    output_filepath: str,
+    failure_modes: Dict,
+    run_config: Run_config,
+) -> None:
+    """Writes the event table of the failure modes of a run config."""
+    npz_buffer = io.BytesIO()
+    np.savez_compressed(
+        npz_buffer,
+        **get_failure_mode_event_columns(
+            failure_modes=failure_modes, run_config=run_config
+        ),
+    )
+    atomic_write_bytes(
+        filepath=output_filepath, some_bytes=npz_buffer.getvalue()
+    )
@@ -0,0 +1,134 @@
+"""Stores the size, duration and disk usage of a completed run, such that the
+pre-run cost estimator can calibrate its predictions against them."""
+import os
+from typing import Dict, Optional, Union
+
+import networkx as nx
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.export_results.export_json_results import write_to_json
+from snncompare.export_results.output_stage1_configs_and_input_graph import (
+    get_rand_nrs_and_hash,
+)
+from snncompare.helper import (
+    get_some_duration,
+    get_with_adaptation_bool,
+    get_with_radiation_bool,
+)
+from snncompare.import_results.helper import (
+    create_relative_path,
+    get_algorithm_description,
+    simsnn_files_exists_and_get_path,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.stage2_sim import (
+    get_output_category_and_rad_affected_neuron_hash,
+)
+
+RUN_METRICS_DIR: str = "results/run_metrics/"
+
+
+@typechecked
+def get_run_metrics_filepath(*, unique_id: str) -> str:
+    """Returns the filepath of the run metrics of a run config."""
+    return f"{RUN_METRICS_DIR}{unique_id}.json"
+
+
+@typechecked
+def output_run_metrics(
+    *,
+    graphs_dict: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
+    run_config: Run_config,
+    stage_durations: Dict[int, float],
+    peak_rss_bytes: Optional[int] = None,
+) -> None:
+    """Writes the neuron and synapse counts, simulated timesteps, on-disk
+    bytes per stage, wall time per stage and peak resident memory of a
+    completed run to: results/run_metrics/<run_config.unique_id>.json."""
+    algorithm_name, algorithm_parameter = get_algorithm_description(
+        run_config=run_config
+    )
+    input_graph: nx.Graph = graphs_dict["input_graph"]
+    run_metrics: Dict = {
+        "algorithm_name": algorithm_name,
+        "algorithm_parameter": algorithm_parameter,
+        "adaptation_type": run_config.adaptation.adaptation_type,
+        "redundancy": run_config.adaptation.redundancy,
+        "graph_size": run_config.graph_size,
+        "nr_of_edges": input_graph.number_of_edges(),
+        "simulator": run_config.simulator,
+        "stage_durations": {
+            str(stage_index): duration
+            for stage_index, duration in stage_durations.items()
+        },
+        "peak_rss_bytes": peak_rss_bytes,
+        "graphs": {},
+    }
+
+    for graph_name, snn in graphs_dict.items():
+        if graph_name != "input_graph" and isinstance(snn, Simulator):
+            run_metrics["graphs"][graph_name] = {
+                "neurons": len(snn.network.nodes),
+                "synapses": len(snn.network.synapses),
+                "timesteps": get_some_duration(
+                    simulator=run_config.simulator,
+                    snn_graph=snn,
+                    duration_name="actual_duration",
+                ),
+                "bytes": get_stage_bytes_of_graph(
+                    graphs_dict=graphs_dict,
+                    graph_name=graph_name,
+                    run_config=run_config,
+                ),
+            }
+
+    create_relative_path(some_path=RUN_METRICS_DIR)
+    write_to_json(
+        output_filepath=get_run_metrics_filepath(
+            unique_id=run_config.unique_id
+        ),
+        some_dict=run_metrics,
+    )
+
+
+@typechecked
+def get_stage_bytes_of_graph(
+    *,
+    graphs_dict: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
+    graph_name: str,
+    run_config: Run_config,
+) -> Dict[str, int]:
+    """Returns the size in bytes of the stage 1, 2 and 4 output files of a
+    single snn graph. Files that were not (yet) outputted count as 0 bytes."""
+    with_adaptation: bool = get_with_adaptation_bool(graph_name=graph_name)
+    with_radiation: bool = get_with_radiation_bool(graph_name=graph_name)
+    _, rand_nrs_hash = get_rand_nrs_and_hash(
+        input_graph=graphs_dict["input_graph"]
+    )
+    (
+        output_category,
+        rad_affected_neurons_hash,
+    ) = get_output_category_and_rad_affected_neuron_hash(
+        graphs_dict=graphs_dict,
+        run_config=run_config,
+        with_adaptation=with_adaptation,
+        with_radiation=with_radiation,
+        stage_index=1,
+    )
+
+    stage_bytes: Dict[str, int] = {}
+    for stage_index in [1, 2, 4]:
+        exists, filepath = simsnn_files_exists_and_get_path(
+            output_category=output_category,
+            input_graph=graphs_dict["input_graph"],
+            run_config=run_config,
+            with_adaptation=with_adaptation,
+            stage_index=stage_index,
+            rad_affected_neurons_hash=rad_affected_neurons_hash,
+            rand_nrs_hash=rand_nrs_hash,
+        )
+        stage_bytes[str(stage_index)] = (
+            os.path.getsize(filepath) if exists else 0
+        )
+    return stage_bytes
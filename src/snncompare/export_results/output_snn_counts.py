@@ -0,0 +1,43 @@
+"""Exports the neuron, synapse and spike counts of a stage 1 or stage 2 snn.
+
+The counts are a small json file stored next to the stage 1 json file, such
+that the adaptation costs can be computed without building the snn:
+    stage 1: {"neurons": int, "synapses": int}
+The spike count of a stage 2 snn is stored in its trace summary.
+"""
+import json
+from typing import Dict
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import atomic_write_bytes
+from snncompare.export_results.storage_backend import get_sharded_filepath
+
+SNN_COUNTS_EXTENSION: str = "_counts.json"
+
+
+@typechecked
+def get_snn_counts_filepath(*, json_filepath: str) -> str:
+    """Returns the filepath of the counts that belong to a stage 1 or stage 2
+    json file. It is stored in the same (shard) directory as the json
+    file."""
+    if not json_filepath.endswith(".json"):
+        raise ValueError(f"Error, {json_filepath} is not a json filepath.")
+    sharded_filepath: str = get_sharded_filepath(filepath=json_filepath)
+    return f"{sharded_filepath[:-5]}{SNN_COUNTS_EXTENSION}"
+
+
+@typechecked
+def output_snn_counts(*, json_filepath: str, counts: Dict[str, int]) -> None:
+    """Writes the counts that belong to a stage 1 or stage 2 json file."""
+    atomic_write_bytes(
+        filepath=get_snn_counts_filepath(json_filepath=json_filepath),
+        some_bytes=json.dumps(counts, sort_keys=True).encode("utf-8"),
+    )
+
+
+@typechecked
+def get_nr_of_spikes(*, spikes: np.ndarray) -> int:
+    """Returns the number of spikes in a [timestep, neuron] spike raster."""
+    return int(np.count_nonzero(spikes))
@@ -17,7 +17,6 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import jsons
 import networkx as nx
-from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
@@ -27,6 +26,7 @@ from snncompare.export_results.export_json_results import (
     verify_loaded_json_content_is_nx_graph,
     write_to_json,
 )
+from snncompare.export_results.file_locks import append_line_if_missing
 from snncompare.export_results.helper import exp_config_to_filename
 from snncompare.graph_generation.export_input_graphs import (
     output_input_graph_if_not_exist,
@@ -40,6 +40,7 @@ from snncompare.import_results.helper import (
     simsnn_files_exists_and_get_path,
 )
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.network_index import get_network_index
 
 
 # pylint: disable=R0902
@@ -168,11 +169,11 @@ def output_simsnn_stage1_run_config(
     # Write exp_config to file.
     write_to_json(
         output_filepath=f"{relative_dir}{run_config.unique_id}.json",
-        some_dict=jsons.dump(run_config.__dict__),
+        some_dict=jsons.dump(run_config.to_dict()),
     )
     verify_loaded_json_content_is_nx_graph(
         output_filepath=f"{relative_dir}{run_config.unique_id}.json",
-        some_dict=jsons.dump(run_config.__dict__),
+        some_dict=jsons.dump(run_config.to_dict()),
     )
 
 
@@ -256,15 +257,12 @@ def output_mdsa_rand_nrs(
         stage_index=stage_index,
     )
 
-    if not rand_nrs_data.seed_hash_file_exists or not file_contains_line(
-        filepath=rand_nrs_data.seed_hash_filepath,
-        expected_line=rand_nrs_data.rand_nrs_hash,
-    ):
-        with open(
-            rand_nrs_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{rand_nrs_data.rand_nrs_hash}\n")
-            txt_file.close()
+    if not rand_nrs_data.seed_in_seed_hash_file:
+        # Checks the line again while holding the lock on the file.
+        append_line_if_missing(
+            filepath=rand_nrs_data.seed_hash_filepath,
+            line=rand_nrs_data.rand_nrs_hash,
+        )
 
     if not rand_nrs_data.rand_nrs_file_exists:
         output_unique_list_int_or_dict(
@@ -306,11 +304,10 @@ def get_rad_name_filepath_and_exists(
 
     # Get the type of radiation used in this run_config.
     if isinstance(snn_graph, Simulator):
-        # if isinstance(simsnn_node, LIF):
-        snn_neuron_names: List[str] = []
-        for node in snn_graph.network.nodes:
-            if isinstance(node, LIF):
-                snn_neuron_names.append(node.name)
+        # A copy, such that the cached names of the index are not modified.
+        snn_neuron_names: List[str] = list(
+            get_network_index(snn=snn_graph).lif_names
+        )
     else:
         snn_neuron_names = snn_graph.nodes
     rad_affected_neurons_hash: str = run_config.radiation.get_rad_hash(
@@ -405,12 +402,9 @@ def output_radiation_data(
 
     # Also append the affected_neuron_hash to the list of radiation settings
     # per seed.
-    if not radiation_data.seed_hash_file_exists or not file_contains_line(
-        filepath=radiation_data.seed_hash_filepath,
-        expected_line=radiation_data.rad_affected_neurons_hash,
-    ):
-        with open(
-            radiation_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{radiation_data.rad_affected_neurons_hash}\n")
-            txt_file.close()
+    if not radiation_data.seed_in_seed_hash_file:
+        # Checks the line again while holding the lock on the file.
+        append_line_if_missing(
+            filepath=radiation_data.seed_hash_filepath,
+            line=radiation_data.rad_affected_neurons_hash,
+        )
@@ -0,0 +1,123 @@
+"""Exports a stage 1 simsnn network as a compact, array-backed binary file.
+
+The file is a numpy .npz archive stored next to the stage 1 json file,
+with:
+    neuron_names: the name table, the index of a name is the neuron index.
+    neuron_<property>: an array per scalar neuron property.
+    synapse_pre, synapse_post: the COO neuron indices of the synapses.
+    synapse_<property>: an array per scalar synapse property.
+    object_columns: a json string with the non-scalar properties (e.g. pos).
+"""
+import io
+import json
+from typing import Dict, List, Tuple
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import atomic_write_bytes
+from snncompare.export_results.storage_backend import get_sharded_filepath
+
+STAGE1_ARRAYS_EXTENSION: str = ".npz"
+
+
+@typechecked
+def get_stage1_arrays_filepath(*, json_filepath: str) -> str:
+    """Returns the filepath of the binary network file that belongs to a stage
+    1 json file. It is stored in the same (shard) directory as the json
+    file."""
+    if not json_filepath.endswith(".json"):
+        raise ValueError(f"Error, {json_filepath} is not a json filepath.")
+    sharded_filepath: str = get_sharded_filepath(filepath=json_filepath)
+    return f"{sharded_filepath[:-5]}{STAGE1_ARRAYS_EXTENSION}"
+
+
+@typechecked
+def is_scalar_column(*, values: List) -> bool:
+    """Returns True if all values are bools, all values are ints or all
+    values are floats, such that they can be stored in a single numpy array
+    without changing their type, False otherwise. E.g. a mix of ints and
+    floats is stored as an object column, as numpy would convert the ints
+    into floats."""
+    for scalar_type in [bool, int, float]:
+        # A bool is also an int, so compare the exact type.
+        if all(type(value) is scalar_type for value in values):
+            return True
+    return False
+
+
+@typechecked
+def split_columns(
+    *, some_dicts: List[Dict], skip_keys: List[str]
+) -> Tuple[Dict[str, np.ndarray], Dict[str, List]]:
+    """Converts a list of dicts with the same keys into a dict with a numpy
+    array per scalar property, and a dict with a list per other property."""
+    scalar_columns: Dict[str, np.ndarray] = {}
+    object_columns: Dict[str, List] = {}
+    if not some_dicts:
+        return scalar_columns, object_columns
+    for key in some_dicts[0].keys():
+        if key in skip_keys:
+            continue
+        values: List = [some_dict[key] for some_dict in some_dicts]
+        if is_scalar_column(values=values):
+            scalar_columns[key] = np.asarray(values)
+        else:
+            object_columns[key] = values
+    return scalar_columns, object_columns
+
+
+@typechecked
+def output_snn_arrays_stage_1(
+    *,
+    output_filepath: str,
+    json_neurons: List[Dict],
+    json_synapses: List[Dict],
+) -> None:
+    """Writes the json-compatible neuron and synapse dicts of a stage 1 snn
+    into the compact binary network format."""
+    neuron_names: List[str] = [
+        neuron_dict["name"] for neuron_dict in json_neurons
+    ]
+    name_indices: Dict[str, int] = {
+        name: index for index, name in enumerate(neuron_names)
+    }
+    if len(name_indices) != len(neuron_names):
+        raise ValueError("Error, the neuron names are not unique.")
+
+    neuron_columns, neuron_object_columns = split_columns(
+        some_dicts=json_neurons, skip_keys=["name"]
+    )
+    synapse_columns, synapse_object_columns = split_columns(
+        some_dicts=json_synapses, skip_keys=["ID"]
+    )
+
+    arrays: Dict[str, np.ndarray] = {
+        "neuron_names": np.asarray(neuron_names, dtype=str),
+        "synapse_pre": np.asarray(
+            [name_indices[synapse["ID"][0]] for synapse in json_synapses],
+            dtype=np.int32,
+        ),
+        "synapse_post": np.asarray(
+            [name_indices[synapse["ID"][1]] for synapse in json_synapses],
+            dtype=np.int32,
+        ),
+        "object_columns": np.asarray(
+            json.dumps(
+                {
+                    "neurons": neuron_object_columns,
+                    "synapses": synapse_object_columns,
+                }
+            )
+        ),
+    }
+    for key, column in neuron_columns.items():
+        arrays[f"neuron_{key}"] = column
+    for key, column in synapse_columns.items():
+        arrays[f"synapse_{key}"] = column
+
+    npz_buffer = io.BytesIO()
+    np.savez_compressed(npz_buffer, **arrays)
+    atomic_write_bytes(
+        filepath=output_filepath, some_bytes=npz_buffer.getvalue()
+    )
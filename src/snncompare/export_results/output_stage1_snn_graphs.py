@@ -7,6 +7,7 @@
     radiation type, Died neurons list with adaptation.
 """
 import copy
+from functools import partial
 from typing import Dict, List, Union
 
 import networkx as nx
@@ -16,10 +17,16 @@ from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.export_results.async_writer import submit_write_job
 from snncompare.export_results.export_json_results import write_to_json
+from snncompare.export_results.output_snn_counts import output_snn_counts
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
+from snncompare.export_results.output_stage1_snn_arrays import (
+    get_stage1_arrays_filepath,
+    output_snn_arrays_stage_1,
+)
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
 from snncompare.run_config.Run_config import Run_config
 
@@ -84,18 +91,55 @@ def output_snn_graph_stage_1(
             simsnn_synapses=copy.deepcopy(snn_graph.network.synapses)
         )
 
-        write_to_json(
-            output_filepath=output_filepath,
-            some_dict={
-                "neurons": json_simsns_neurons,
-                "synapses": json_simsnn_synapses,
-            },
+        # The json dicts are copies of the network, so they can be written
+        # in the background while the network is simulated.
+        submit_write_job(
+            filepath=output_filepath,
+            job=partial(
+                write_stage_1_files,
+                output_filepath=output_filepath,
+                json_neurons=json_simsns_neurons,
+                json_synapses=json_simsnn_synapses,
+            ),
         )
 
     else:
         raise NotImplementedError("TODO: convert into simsnn and export.")
 
 
+@typechecked
+def write_stage_1_files(
+    *,
+    output_filepath: str,
+    json_neurons: List[Dict],
+    json_synapses: List[Dict],
+) -> None:
+    """Writes the json file of a stage 1 snn, the compact binary network file
+    that is loaded instead of the json file, and its neuron and synapse
+    counts."""
+    write_to_json(
+        output_filepath=output_filepath,
+        some_dict={
+            "neurons": json_neurons,
+            "synapses": json_synapses,
+        },
+    )
+    output_snn_arrays_stage_1(
+        output_filepath=get_stage1_arrays_filepath(
+            json_filepath=output_filepath
+        ),
+        json_neurons=json_neurons,
+        json_synapses=json_synapses,
+    )
+    output_snn_counts(
+        json_filepath=output_filepath,
+        counts={
+            "neurons": len(json_neurons),
+            "synapses": len(json_synapses),
+        },
+    )
+
+
 @typechecked
 def simsnn_nodes_to_json(*, simsnn_neurons: List[LIF]) -> List[Dict]:
     """Converts list of simsnn LIF neurons into dict that can be exported to
@@ -6,20 +6,28 @@
     rad_snn_algo_graph: spikes, du, dv.
     rad_adapted_snn_algo_graph: spikes, du, dv.
 """
-import json
-from pathlib import Path
+from functools import partial
 from typing import Dict, List, Union
 
 import networkx as nx
+import numpy as np
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.export_results.async_writer import submit_write_job
+from snncompare.export_results.export_json_results import write_to_json
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
+from snncompare.export_results.output_stage2_trace_summary import (
+    get_trace_summary_columns,
+    get_trace_summary_filepath,
+    output_trace_summary,
+)
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.network_index import get_network_index
 from snncompare.simulation.stage2_sim import (
     get_output_category_and_rad_affected_neuron_hash,
     simulate_load_or_skip,
@@ -124,19 +132,38 @@ def output_snn_graph_stage_2(
         i: List = snn_graph.multimeter.I.tolist()
         spikes: List = snn_graph.raster.spikes.tolist()
         neuron_dict: Dict = {"V": v, "I": i, "spikes": spikes}
-        with open(output_filepath, "w", encoding="utf-8") as fp:
-            json.dump(
-                neuron_dict,
-                fp,
-                indent=4,
-                sort_keys=True,
-            )
-            fp.close()
-
-        # Verify the file exists.
-        if not Path(output_filepath).is_file():
-            raise FileExistsError(
-                f"Error, filepath:{output_filepath} was not created."
-            )
+        # The lists are copies of the simulation arrays.
+        submit_write_job(
+            filepath=output_filepath,
+            job=partial(
+                write_stage_2_files,
+                output_filepath=output_filepath,
+                neuron_dict=neuron_dict,
+                summary_columns=get_trace_summary_columns(
+                    neuron_names=get_network_index(snn=snn_graph).neuron_names,
+                    spikes=snn_graph.raster.spikes,
+                    v=snn_graph.multimeter.V,
+                    i=snn_graph.multimeter.I,
+                ),
+            ),
+        )
     else:
         raise NotImplementedError(f"Error, {type(snn_graph)} not supported.")
+
+
+@typechecked
+def write_stage_2_files(
+    *,
+    output_filepath: str,
+    neuron_dict: Dict,
+    summary_columns: Dict[str, np.ndarray],
+) -> None:
+    """Writes the json file of a stage 2 snn, and the summary of its traces
+    that is loaded instead of the json file by aggregate consumers."""
+    write_to_json(output_filepath=output_filepath, some_dict=neuron_dict)
+    output_trace_summary(
+        output_filepath=get_trace_summary_filepath(
+            json_filepath=output_filepath
+        ),
+        columns=summary_columns,
+    )
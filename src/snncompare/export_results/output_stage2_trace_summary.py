@@ -0,0 +1,117 @@
+"""Exports a summary of the stage 2 neuron behaviour of a simsnn network.
+
+The summary is a numpy .npz archive stored next to the stage 2 json file,
+such that aggregates can be loaded without reading the [timestep, neuron]
+traces. It contains:
+    neuron_names: the name of each neuron, in the order of the traces.
+    spike_count, first_spike_t, last_spike_t: int arrays per neuron, the
+    spike times are -1 for neurons that do not spike.
+    V_min, V_max, V_mean, I_min, I_max, I_mean: float arrays per neuron.
+    total_spikes, active_timesteps: int scalars of the network, an active
+    timestep has at least one spike.
+"""
+import io
+from typing import Dict, List
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import atomic_write_bytes
+from snncompare.export_results.storage_backend import get_sharded_filepath
+
+TRACE_SUMMARY_EXTENSION: str = "_summary.npz"
+
+
+@typechecked
+def get_trace_summary_filepath(*, json_filepath: str) -> str:
+    """Returns the filepath of the summary that belongs to a stage 2 json
+    file. It is stored in the same (shard) directory as the json file."""
+    if not json_filepath.endswith(".json"):
+        raise ValueError(f"Error, {json_filepath} is not a json filepath.")
+    sharded_filepath: str = get_sharded_filepath(filepath=json_filepath)
+    return f"{sharded_filepath[:-5]}{TRACE_SUMMARY_EXTENSION}"
+
+
+@typechecked
+def get_spike_times(*, spikes: np.ndarray) -> Dict[str, np.ndarray]:
+    """Returns the first and last spike time of each neuron of a [timestep,
+    neuron] spike raster, or -1 if the neuron does not spike."""
+    spikes = spikes.astype(bool, copy=False)
+    nr_of_timesteps: int = spikes.shape[0]
+    has_spiked: np.ndarray = spikes.any(axis=0)
+    if nr_of_timesteps == 0:
+        first_spike_t = last_spike_t = np.zeros(spikes.shape[1], np.int64)
+    else:
+        first_spike_t = np.argmax(spikes, axis=0)
+        last_spike_t = nr_of_timesteps - 1 - np.argmax(spikes[::-1], axis=0)
+    return {
+        "first_spike_t": np.where(has_spiked, first_spike_t, -1).astype(
+            np.int64
+        ),
+        "last_spike_t": np.where(has_spiked, last_spike_t, -1).astype(
+            np.int64
+        ),
+    }
+
+
+@typechecked
+def get_trace_statistics(
+    *, trace: np.ndarray, trace_name: str
+) -> Dict[str, np.ndarray]:
+    """Returns the minimum, maximum and mean of each neuron of a [timestep,
+    neuron] trace, or nan if there are no timesteps."""
+    if trace.shape[0] == 0:
+        nans: np.ndarray = np.full(trace.shape[1], np.nan)
+        return {
+            f"{trace_name}_min": nans,
+            f"{trace_name}_max": nans,
+            f"{trace_name}_mean": nans,
+        }
+    return {
+        f"{trace_name}_min": trace.min(axis=0).astype(np.float64),
+        f"{trace_name}_max": trace.max(axis=0).astype(np.float64),
+        f"{trace_name}_mean": trace.mean(axis=0).astype(np.float64),
+    }
+
+
+@typechecked
+def get_trace_summary_columns(
+    *,
+    neuron_names: List[str],
+    spikes: np.ndarray,
+    v: np.ndarray,
+    i: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Returns the summary of the [timestep, neuron] spike, voltage and
+    current traces of a stage 2 snn."""
+    for trace in [spikes, v, i]:
+        if trace.ndim != 2 or trace.shape[1] != len(neuron_names):
+            raise ValueError(
+                f"Error, expected a trace of {len(neuron_names)} neurons, "
+                + f"got shape:{trace.shape}"
+            )
+    spikes = spikes.astype(bool, copy=False)
+    columns: Dict[str, np.ndarray] = {
+        "neuron_names": np.asarray(neuron_names, dtype=str),
+        "spike_count": np.count_nonzero(spikes, axis=0).astype(np.int64),
+        "total_spikes": np.asarray(np.count_nonzero(spikes), dtype=np.int64),
+        "active_timesteps": np.asarray(
+            np.count_nonzero(spikes.any(axis=1)), dtype=np.int64
+        ),
+    }
+    columns.update(get_spike_times(spikes=spikes))
+    columns.update(get_trace_statistics(trace=v, trace_name="V"))
+    columns.update(get_trace_statistics(trace=i, trace_name="I"))
+    return columns
+
+
+@typechecked
+def output_trace_summary(
+    *, output_filepath: str, columns: Dict[str, np.ndarray]
+) -> None:
+    """Writes the summary of the traces of a stage 2 snn."""
+    npz_buffer = io.BytesIO()
+    np.savez_compressed(npz_buffer, **columns)
+    atomic_write_bytes(
+        filepath=output_filepath, some_bytes=npz_buffer.getvalue()
+    )
@@ -6,14 +6,20 @@
     rad_snn_algo_graph: spikes, du, dv.
     rad_adapted_snn_algo_graph: spikes, du, dv.
 """
-import json
-from pathlib import Path
+import copy
+from functools import partial
 from typing import Dict, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.export_results.async_writer import submit_write_job
+from snncompare.export_results.export_json_results import write_to_json
+from snncompare.export_results.output_failure_mode_events import (
+    get_failure_mode_events_filepath,
+    output_failure_mode_events,
+)
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
     get_rad_name_filepath_and_exists,
@@ -90,6 +96,17 @@ def output_snn_results(
                     ),
                     simulator=run_config.simulator,
                 )
+                if (
+                    output_data_type == "failure_modes"
+                    and with_adaptation
+                    and with_radiation
+                    and run_config.simulator == "simsnn"
+                ):
+                    output_failure_mode_events_of_snn(
+                        json_filepath=simsnn_filepath,
+                        run_config=run_config,
+                        snn_graph=snn_graph,
+                    )
 
 
 @typechecked
@@ -118,21 +135,42 @@ def output_some_graph_property_dict(
             f"Error, simulator:{simulator} not implemented."
         )
 
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        json.dump(
-            dict_content,
-            fp,
-            indent=4,
-            sort_keys=True,
-        )
-        fp.close()
-
-    # Verify the file exists.
-    if not Path(output_filepath).is_file():
-        raise FileExistsError(
-            f"Error, filepath:{output_filepath} was not created."
-        )
+    # Copy the dict, as the graph may still be modified while the dict is
+    # written in the background.
+    submit_write_job(
+        filepath=output_filepath,
+        job=partial(
+            write_to_json,
+            output_filepath=output_filepath,
+            some_dict=copy.deepcopy(dict_content),
+        ),
+    )
 
     # loaded_results: Dict = load_json_file_into_dict(
     #     json_filepath=output_filepath
     # )
+
+
+@typechecked
+def output_failure_mode_events_of_snn(
+    *,
+    json_filepath: str,
+    run_config: Run_config,
+    snn_graph: Simulator,
+) -> None:
+    """Outputs the failure modes of the radiated adapted snn as event table,
+    next to their stage 7 json file."""
+    events_filepath: str = get_failure_mode_events_filepath(
+        json_filepath=json_filepath
+    )
+    submit_write_job(
+        filepath=events_filepath,
+        job=partial(
+            output_failure_mode_events,
+            output_filepath=events_filepath,
+            failure_modes=copy.deepcopy(
+                snn_graph.network.graph.graph["failure_modes"]
+            ),
+            run_config=run_config,
+        ),
+    )
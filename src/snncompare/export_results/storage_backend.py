@@ -0,0 +1,253 @@
+"""Maps the (logical) json filepaths of the results onto the files on disk.
+
+By default, the files are stored as indent=4 json at their logical path.
+The sharded backend instead stores a file like:
+results/stage2/MDSA_0/no_adaptation/snns/<wlhash>_rand_<h>.json
+as compact json in a subdirectory named after the first characters of the
+filename:
+results/stage2/MDSA_0/no_adaptation/snns/<wl>/<wlhash>_rand_<h>.json[.gz]
+which keeps the number of entries per directory small. Files are found at
+any of their possible locations, so switching the backend does not require
+converting earlier results.
+"""
+import copy
+import gzip
+import json
+import os
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import wait_for_pending_write
+from snncompare.export_results.file_locks import atomic_write_bytes
+
+# The files in these directories are listed, or searched for text, so they
+# remain flat and uncompressed.
+UNSHARDED_DIRS: List[str] = [
+    "results/stage1/input_graphs/",
+    "results/stage1/run_configs/",
+    "results/stage1/exp_configs/",
+    "results/run_metrics/",
+]
+COMPRESSION_EXTENSIONS: Dict[str, str] = {"gzip": ".gz", "zlib": ".zlib"}
+# full: re-read and compare each written file, checksum: store the hash of
+# the serialised bytes in the manifest, none: no verification.
+VERIFICATION_POLICIES: List[str] = ["full", "checksum", "none"]
+# The number of parsed json files that are kept in memory by load_cached_json.
+JSON_CACHE_SIZE: int = 256
+
+
+# pylint: disable=R0903
+class Storage_config:
+    """Stores how the json files of the results are stored on disk, and how
+    they are verified after writing."""
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        sharded: bool = False,
+        compression: Optional[str] = None,
+        shard_prefix_length: int = 2,
+        verification: str = "checksum",
+    ) -> None:
+        if compression is not None and compression not in (
+            COMPRESSION_EXTENSIONS
+        ):
+            raise ValueError(
+                f"Error, compression:{compression} is not supported, choose "
+                + f"from:{list(COMPRESSION_EXTENSIONS.keys())}"
+            )
+        if compression is not None and not sharded:
+            raise ValueError(
+                "Error, compression is only supported for the sharded "
+                + "storage backend."
+            )
+        if shard_prefix_length < 1:
+            raise ValueError("Error, shard_prefix_length should be >0.")
+        if verification not in VERIFICATION_POLICIES:
+            raise ValueError(
+                f"Error, verification:{verification} is not supported, "
+                + f"choose from:{VERIFICATION_POLICIES}"
+            )
+        self.sharded: bool = sharded
+        self.compression: Optional[str] = compression
+        self.shard_prefix_length: int = shard_prefix_length
+        self.verification: str = verification
+
+
+# The storage config of this process, set once from the CLI arguments.
+_storage_config: Storage_config = Storage_config()
+
+
+@typechecked
+def set_storage_config(*, storage_config: Storage_config) -> None:
+    """Sets the storage config that is used by write_to_json and
+    load_json_file_into_dict."""
+    # pylint: disable=W0603
+    global _storage_config
+    _storage_config = storage_config
+
+
+@typechecked
+def get_storage_config() -> Storage_config:
+    """Returns the storage config of this process."""
+    return _storage_config
+
+
+@typechecked
+def is_shardable(*, filepath: str) -> bool:
+    """Returns True if the file belongs to the results that may be sharded
+    and compressed."""
+    normalised: str = os.path.normpath(filepath)
+    if not normalised.startswith("results/stage"):
+        return False
+    return not any(
+        normalised.startswith(os.path.normpath(unsharded_dir))
+        for unsharded_dir in UNSHARDED_DIRS
+    )
+
+
+@typechecked
+def get_sharded_filepath(
+    *, filepath: str, storage_config: Optional[Storage_config] = None
+) -> str:
+    """Returns the filepath within its hash prefix shard directory, if the
+    (given or process) storage config is sharded. Returns the filepath itself
+    otherwise."""
+    if storage_config is None:
+        storage_config = get_storage_config()
+    if not storage_config.sharded or not is_shardable(filepath=filepath):
+        return filepath
+    dirname, filename = os.path.split(filepath)
+    return os.path.join(
+        dirname, filename[: storage_config.shard_prefix_length], filename
+    )
+
+
+@typechecked
+def get_storage_filepath(
+    *, filepath: str, storage_config: Optional[Storage_config] = None
+) -> str:
+    """Returns the path on disk at which the storage config stores a logical
+    json filepath."""
+    if storage_config is None:
+        storage_config = get_storage_config()
+    storage_filepath: str = get_sharded_filepath(
+        filepath=filepath, storage_config=storage_config
+    )
+    if storage_config.compression is not None and is_shardable(
+        filepath=filepath
+    ):
+        storage_filepath += COMPRESSION_EXTENSIONS[storage_config.compression]
+    return storage_filepath
+
+
+@typechecked
+def get_candidate_filepaths(*, filepath: str) -> List[str]:
+    """Returns the locations at which a logical json filepath may be stored,
+    starting with the location of the current storage config."""
+    candidates: List[str] = [get_storage_filepath(filepath=filepath)]
+    if is_shardable(filepath=filepath):
+        prefix_length: int = get_storage_config().shard_prefix_length
+        for sharded in [False, True]:
+            for compression in [None, *COMPRESSION_EXTENSIONS.keys()]:
+                if compression is not None and not sharded:
+                    continue
+                candidate: str = get_storage_filepath(
+                    filepath=filepath,
+                    storage_config=Storage_config(
+                        sharded=sharded,
+                        verification="none",
+                        compression=compression,
+                        shard_prefix_length=prefix_length,
+                    ),
+                )
+                if candidate not in candidates:
+                    candidates.append(candidate)
+    elif filepath not in candidates:
+        candidates.append(filepath)
+    return candidates
+
+
+@typechecked
+def find_stored_filepath(*, filepath: str) -> Optional[str]:
+    """Returns the path on disk of a logical json filepath, or None if it is
+    not stored. Waits for the file if it is still queued to be written."""
+    wait_for_pending_write(filepath=filepath)
+    for candidate in get_candidate_filepaths(filepath=filepath):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+@typechecked
+def stored_file_exists(*, filepath: str) -> bool:
+    """Returns True if a logical json filepath is stored, False otherwise."""
+    return find_stored_filepath(filepath=filepath) is not None
+
+
+@typechecked
+def serialise_json(*, some_dict: Union[Dict, List], compact: bool) -> bytes:
+    """Returns the json encoding of a dict or list."""
+    if compact:
+        return json.dumps(
+            some_dict, separators=(",", ":"), sort_keys=True
+        ).encode("utf-8")
+    return json.dumps(some_dict, indent=4, sort_keys=True).encode("utf-8")
+
+
+@typechecked
+def store_json_bytes(*, filepath: str, json_bytes: bytes) -> str:
+    """Writes the json bytes of a logical filepath to disk according to the
+    storage config, and returns the path on disk."""
+    storage_filepath: str = get_storage_filepath(filepath=filepath)
+    if storage_filepath.endswith(COMPRESSION_EXTENSIONS["gzip"]):
+        json_bytes = gzip.compress(json_bytes)
+    elif storage_filepath.endswith(COMPRESSION_EXTENSIONS["zlib"]):
+        json_bytes = zlib.compress(json_bytes)
+    atomic_write_bytes(filepath=storage_filepath, some_bytes=json_bytes)
+    return storage_filepath
+
+
+@typechecked
+def read_json_bytes(*, storage_filepath: str) -> bytes:
+    """Returns the (decompressed) json bytes of a file on disk."""
+    with open(storage_filepath, "rb") as some_file:
+        json_bytes: bytes = some_file.read()
+        some_file.close()
+    if storage_filepath.endswith(COMPRESSION_EXTENSIONS["gzip"]):
+        return gzip.decompress(json_bytes)
+    if storage_filepath.endswith(COMPRESSION_EXTENSIONS["zlib"]):
+        return zlib.decompress(json_bytes)
+    return json_bytes
+
+
+@lru_cache(maxsize=JSON_CACHE_SIZE)
+def parse_json_file_version(
+    storage_filepath: str,
+    mtime_ns: int,  # pylint: disable=W0613
+    nr_of_bytes: int,  # pylint: disable=W0613
+) -> Union[Dict, List]:
+    """Parses a json file on disk. The modification time and size identify
+    the version of the file in the cache, so a changed file is parsed
+    again."""
+    return json.loads(read_json_bytes(storage_filepath=storage_filepath))
+
+
+@typechecked
+def load_cached_json(*, filepath: str) -> Union[Dict, List]:
+    """Returns a copy of the parsed json of a logical filepath, and keeps the
+    parsed json in memory for the next call (e.g. for the jobs of a long-lived
+    worker)."""
+    storage_filepath: Optional[str] = find_stored_filepath(filepath=filepath)
+    if storage_filepath is None:
+        raise FileNotFoundError(f"Error, filepath does not exist:{filepath}")
+    file_stat: os.stat_result = os.stat(storage_filepath)
+    return copy.deepcopy(
+        parse_json_file_version(
+            storage_filepath, file_stat.st_mtime_ns, file_stat.st_size
+        )
+    )
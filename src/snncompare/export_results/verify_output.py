@@ -0,0 +1,153 @@
+"""Verifies the json files that are written, according to the verification
+policy of the storage config.
+
+- full: re-reads the written file and compares it with the serialised bytes.
+- checksum: stores the sha256 of the serialised bytes in the manifest of
+  the (shard) directory of the file, without reading the file back. The
+  manifests can be verified later with verify_manifests. A manifest per
+  directory keeps each manifest small, and spreads the locked appends of
+  parallel runs over the directories. The manifests are stored in
+  results/manifests/, e.g. the manifest of results/stage1/run_configs/ is
+  results/manifests/stage1/run_configs.jsonl, such that the result
+  directories only contain result files.
+- none: no verification.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import append_line
+from snncompare.export_results.storage_backend import (
+    find_stored_filepath,
+    get_sharded_filepath,
+    get_storage_config,
+    read_json_bytes,
+)
+
+RESULTS_DIR: str = "results/"
+MANIFESTS_DIR: str = f"{RESULTS_DIR}manifests/"
+MANIFEST_EXTENSION: str = ".jsonl"
+
+
+@typechecked
+def get_checksum(*, json_bytes: bytes) -> str:
+    """Returns the sha256 of the (uncompressed) serialised json."""
+    return hashlib.sha256(json_bytes).hexdigest()
+
+
+@typechecked
+def get_manifest_filepath(*, filepath: str) -> str:
+    """Returns the manifest of the (shard) directory in which a logical
+    filepath is stored, at the mirrored path in the manifests directory."""
+    storage_dir: str = os.path.dirname(
+        os.path.normpath(get_sharded_filepath(filepath=filepath))
+    )
+    relative_dir: str = os.path.relpath(storage_dir, RESULTS_DIR)
+    if relative_dir == os.curdir or relative_dir.startswith(os.pardir):
+        raise ValueError(
+            f"Error, filepath:{filepath} is not in a directory of:"
+            + f"{RESULTS_DIR}"
+        )
+    return f"{MANIFESTS_DIR}{relative_dir}{MANIFEST_EXTENSION}"
+
+
+@typechecked
+def append_to_manifest(
+    *,
+    filepath: str,
+    json_bytes: bytes,
+    manifest_filepath: Optional[str] = None,
+) -> None:
+    """Appends the checksum of a logical filepath as a single json line to
+    the manifest of its directory. Later lines overwrite earlier lines of the
+    same file."""
+    if manifest_filepath is None:
+        manifest_filepath = get_manifest_filepath(filepath=filepath)
+    manifest_line: str = json.dumps(
+        {
+            "filepath": filepath,
+            "nr_of_bytes": len(json_bytes),
+            "sha256": get_checksum(json_bytes=json_bytes),
+        },
+        sort_keys=True,
+    )
+    append_line(filepath=manifest_filepath, line=manifest_line)
+
+
+@typechecked
+def load_manifest(*, manifest_filepath: str) -> Dict[str, str]:
+    """Returns the latest checksum per logical filepath in the manifest."""
+    checksums: Dict[str, str] = {}
+    if not os.path.isfile(manifest_filepath):
+        return checksums
+    with open(manifest_filepath, encoding="utf-8") as manifest_file:
+        for line in manifest_file:
+            if line.strip():
+                entry: Dict = json.loads(line)
+                checksums[entry["filepath"]] = entry["sha256"]
+        manifest_file.close()
+    return checksums
+
+
+@typechecked
+def verify_manifest(*, manifest_filepath: str) -> List[str]:
+    """Returns the logical filepaths in the manifest that are missing, or
+    whose content does not match their checksum."""
+    invalid_filepaths: List[str] = []
+    for filepath, checksum in load_manifest(
+        manifest_filepath=manifest_filepath
+    ).items():
+        storage_filepath = find_stored_filepath(filepath=filepath)
+        if storage_filepath is None or checksum != get_checksum(
+            json_bytes=read_json_bytes(storage_filepath=storage_filepath)
+        ):
+            invalid_filepaths.append(filepath)
+    return invalid_filepaths
+
+
+@typechecked
+def get_manifest_filepaths(*, manifests_dir: str = MANIFESTS_DIR) -> List[str]:
+    """Returns the manifests in the manifests directory."""
+    return sorted(
+        os.path.join(dirpath, filename)
+        for dirpath, _, filenames in os.walk(manifests_dir)
+        for filename in filenames
+        if filename.endswith(MANIFEST_EXTENSION)
+    )
+
+
+@typechecked
+def verify_manifests(*, manifests_dir: str = MANIFESTS_DIR) -> List[str]:
+    """Returns the logical filepaths in the manifests that are missing, or
+    whose content does not match their checksum."""
+    return [
+        filepath
+        for manifest_filepath in get_manifest_filepaths(
+            manifests_dir=manifests_dir
+        )
+        for filepath in verify_manifest(manifest_filepath=manifest_filepath)
+    ]
+
+
+@typechecked
+def verify_written_json(
+    *, filepath: str, storage_filepath: str, json_bytes: bytes
+) -> None:
+    """Verifies a json file that was just written, according to the
+    verification policy of the storage config."""
+    verification: str = get_storage_config().verification
+    if verification == "full":
+        if not os.path.isfile(storage_filepath):
+            raise FileExistsError(
+                f"Error, filepath:{filepath} was not created."
+            )
+        if read_json_bytes(storage_filepath=storage_filepath) != json_bytes:
+            raise ValueError(
+                f"Error, the content of:{filepath} differs from the "
+                + "outputted content."
+            )
+    elif verification == "checksum":
+        append_to_manifest(filepath=filepath, json_bytes=json_bytes)
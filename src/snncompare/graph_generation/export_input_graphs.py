@@ -10,6 +10,17 @@ import networkx as nx
 from networkx.readwrite import json_graph
 from typeguard import typechecked
 
+from snncompare.export_results.file_locks import (
+    atomic_write_bytes,
+    is_temporary_filename,
+)
+from snncompare.export_results.storage_backend import (
+    get_storage_config,
+    load_cached_json,
+    serialise_json,
+)
+from snncompare.export_results.verify_output import append_to_manifest
+
 # if TYPE_CHECKING:
 from snncompare.import_results.helper import (
     create_relative_path,
@@ -31,14 +42,14 @@ def load_input_graph_based_on_nr(graph_size: int, graph_nr: int) -> nx.Graph:
         name
         for name in os.listdir(output_dir)
         if os.path.isfile(os.path.join(output_dir, name))
+        and not is_temporary_filename(filename=name)
     ]
     output_filepath: str = f"{output_dir}{input_graph_hashes[graph_nr]}"
 
-    # Load graph from file and verify it results in the same graph.
-    with open(output_filepath, encoding="utf-8") as json_file:
-        some_json_graph = json.load(json_file)
-        json_file.close()
-    loaded_input_graph = nx.node_link_graph(some_json_graph)
+    # Load graph from file, the parsed file is cached between runs.
+    loaded_input_graph = nx.node_link_graph(
+        load_cached_json(filepath=output_filepath)
+    )
     return loaded_input_graph
 
 
@@ -55,6 +66,7 @@ def has_outputted_input_graph_for_graph_size_and_nr(
             name
             for name in os.listdir(output_dir)
             if os.path.isfile(os.path.join(output_dir, name))
+            and not is_temporary_filename(filename=name)
         ]
     )
 
@@ -100,13 +112,20 @@ def output_input_graph_if_not_exist(
 def write_undirected_graph_to_json(
     *, output_filepath: str, the_graph: nx.Graph
 ) -> None:
-    """Writes an undirected graph to json and verifies it can be loaded back
-    into the graph."""
-    with open(output_filepath, "w", encoding="utf-8") as fp:
-        # json.dump(the_graph.__dict__, fp, indent=4, sort_keys=True)
-        some_json_graph: Dict = json_graph.node_link_data(the_graph)
-        json.dump(some_json_graph, fp, indent=4, sort_keys=True)
-        fp.close()
+    """Writes an undirected graph to json and verifies it according to the
+    verification policy. With the full policy, it verifies the file can be
+    loaded back into the graph."""
+    some_json_graph: Dict = json_graph.node_link_data(the_graph)
+    json_bytes: bytes = serialise_json(
+        some_dict=some_json_graph, compact=False
+    )
+    atomic_write_bytes(filepath=output_filepath, some_bytes=json_bytes)
+
+    verification: str = get_storage_config().verification
+    if verification == "checksum":
+        append_to_manifest(filepath=output_filepath, json_bytes=json_bytes)
+    if verification != "full":
+        return
 
     # Verify the file exists.
     if not Path(output_filepath).is_file():
@@ -134,8 +153,10 @@ def write_undirected_graph_to_json(
 @typechecked
 def store_pickle(*, run_configs: List[Run_config], filepath: str) -> None:
     """Stores run_config list into pickle file."""
-    with open(filepath, "wb") as handle:
-        pickle.dump(run_configs, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    atomic_write_bytes(
+        filepath=filepath,
+        some_bytes=pickle.dumps(run_configs, protocol=pickle.HIGHEST_PROTOCOL),
+    )
 
 
 @typechecked
@@ -0,0 +1,358 @@
+"""Shares the stage 1 snn topology of an input graph, algorithm and
+adaptation across the seeds.
+
+The snns of different seeds only differ in the synapse weights that are
+the rand_edge_weights of the seed. These are the weights of the synapses
+from the (redundant) rand_ neurons to the (redundant) degree_receiver_
+neurons. A Seed_batch stores the parameter and synapse arrays of the snns
+of one seed, and those rand synapses, which are selected by the roles of
+their neurons. The snns of another seed are derived by writing its
+rand_edge_weights into those synapses, instead of building the snns. The
+arrays that are derived for the second seed are verified against the arrays
+of its built snns, before the snns of later seeds are derived.
+"""
+import copy
+import json
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.graph_generation.snn_arrays import nx_lif_graph_to_snn_arrays
+from snncompare.import_results.load_stage1_snn_arrays import (
+    Stage1_snn_arrays,
+    stage1_snn_arrays_to_simulator,
+)
+from snncompare.run_config.interned_settings import get_setting_hash
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.network_index import Network_index
+
+# The number of topologies that are kept in memory.
+MAX_SEED_BATCHES: int = 64
+# The name of a rand_ neuron, or of a redundant copy of it, e.g. r_1_rand_3.
+RAND_NEURON_PATTERN: re.Pattern = re.compile(r"^(?:r_\d+_)?rand_(\d+)$")
+# The name of a (redundant) degree_receiver_ neuron.
+DEGREE_RECEIVER_PATTERN: re.Pattern = re.compile(
+    r"^(?:r_\d+_)?degree_receiver_"
+)
+
+# The seed batch per topology key, or None if the snns of the topology can
+# not be derived, in the order of their last use.
+_seed_batches: "OrderedDict[Tuple, Optional[Seed_batch]]" = OrderedDict()
+
+
+class Seed_batch:
+    """Stores the arrays of the snns of a seed, and the synapses from the
+    rand_ to the degree_receiver_ neurons, per snn graph name."""
+
+    @typechecked
+    def __init__(self, nx_lif_graphs: Dict, seed: int) -> None:
+        self.seed: int = seed
+        self.rand_edge_weights: List[int] = list(
+            nx_lif_graphs["input_graph"].graph["alg_props"][
+                "rand_edge_weights"
+            ]
+        )
+        self.arrays: Dict[str, Dict[str, np.ndarray]] = {}
+        self.graph_properties: Dict[str, Dict] = {}
+        # The synapse indices and the input graph node of their weight.
+        self.rand_synapses: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self.is_verified: bool = False
+
+        for graph_name in ["snn_algo_graph", "adapted_snn_graph"]:
+            if graph_name in nx_lif_graphs:
+                snn_graph: nx.DiGraph = nx_lif_graphs[graph_name]
+                self.arrays[graph_name] = get_arrays(
+                    snn_arrays=nx_lif_graph_to_snn_arrays(snn_graph=snn_graph)
+                )
+                self.graph_properties[graph_name] = copy.deepcopy(
+                    snn_graph.graph
+                )
+                self.rand_synapses[graph_name] = get_rand_synapses(
+                    arrays=self.arrays[graph_name],
+                    rand_edge_weights=self.rand_edge_weights,
+                )
+
+    @typechecked
+    def get_synapse_weights(
+        self, graph_name: str, rand_edge_weights: List[int]
+    ) -> np.ndarray:
+        """Returns the synapse weights of an snn for the rand_edge_weights of
+        a seed."""
+        synapse_indices, nodes = self.rand_synapses[graph_name]
+        weights: np.ndarray = self.arrays[graph_name]["synapse_w"].copy()
+        if len(synapse_indices) > 0:
+            weights = weights.astype(
+                np.result_type(weights, np.asarray(rand_edge_weights))
+            )
+            weights[synapse_indices] = np.asarray(rand_edge_weights)[nodes]
+        return weights
+
+    @typechecked
+    def get_weight_matrix(
+        self, graph_name: str, rand_edge_weights_per_seed: List[List[int]]
+    ) -> np.ndarray:
+        """Returns the [seed, synapse] weights of an snn for the
+        rand_edge_weights of each seed. The synapses of all seeds share the
+        synapse_pre and synapse_post arrays of the snn, such that a batched
+        simulator can simulate the seeds with a single topology."""
+        return np.stack(
+            [
+                self.get_synapse_weights(
+                    graph_name=graph_name, rand_edge_weights=rand_edge_weights
+                )
+                for rand_edge_weights in rand_edge_weights_per_seed
+            ]
+        )
+
+    @typechecked
+    def get_seed_arrays(
+        self, graph_name: str, input_graph: nx.Graph
+    ) -> Dict[str, np.ndarray]:
+        """Returns the arrays of an snn for the seed of the input graph."""
+        arrays: Dict[str, np.ndarray] = dict(self.arrays[graph_name])
+        arrays["synapse_w"] = self.get_synapse_weights(
+            graph_name=graph_name,
+            rand_edge_weights=input_graph.graph["alg_props"][
+                "rand_edge_weights"
+            ],
+        )
+        return arrays
+
+    @typechecked
+    def get_seed_graph_properties(
+        self, graph_name: str, input_graph: nx.Graph
+    ) -> Dict:
+        """Returns the graph properties of an snn for the seed of the input
+        graph."""
+        graph_properties: Dict = copy.deepcopy(
+            self.graph_properties[graph_name]
+        )
+        if "alg_props" in graph_properties:
+            graph_properties["alg_props"] = copy.deepcopy(
+                input_graph.graph["alg_props"]
+            )
+        return graph_properties
+
+    @typechecked
+    def get_simsnn_graphs(self, input_graph: nx.Graph) -> Dict:
+        """Returns the input graph and the simsnn graphs of its seed."""
+        simsnn_graphs: Dict = {"input_graph": input_graph}
+        for graph_name in self.arrays:
+            sim: Simulator = stage1_snn_arrays_to_simulator(
+                add_to_raster=True,
+                add_to_multimeter=True,
+                snn_arrays=Stage1_snn_arrays(
+                    arrays=self.get_seed_arrays(
+                        graph_name=graph_name, input_graph=input_graph
+                    )
+                ),
+            )
+            # Add (redundant) graph properties.
+            sim.network.graph.graph = self.get_seed_graph_properties(
+                graph_name=graph_name, input_graph=input_graph
+            )
+            simsnn_graphs[graph_name] = sim
+        return simsnn_graphs
+
+    @typechecked
+    def derives(self, seed_batch: "Seed_batch") -> bool:
+        """Returns True if the snns that are derived from this batch for the
+        seed of another batch, equal the snns of that batch."""
+        if set(self.arrays.keys()) != set(seed_batch.arrays.keys()):
+            return False
+        for graph_name, built_arrays in seed_batch.arrays.items():
+            # The same synapses should have a rand_edge_weight.
+            if not all(
+                np.array_equal(column, other_column)
+                for column, other_column in zip(
+                    self.rand_synapses[graph_name],
+                    seed_batch.rand_synapses[graph_name],
+                )
+            ):
+                return False
+            derived_arrays: Dict[str, np.ndarray] = dict(
+                self.arrays[graph_name]
+            )
+            derived_arrays["synapse_w"] = self.get_synapse_weights(
+                graph_name=graph_name,
+                rand_edge_weights=seed_batch.rand_edge_weights,
+            )
+            if not arrays_are_equal(
+                arrays=derived_arrays, other_arrays=built_arrays
+            ):
+                return False
+            derived_properties: Dict = copy.deepcopy(
+                self.graph_properties[graph_name]
+            )
+            if "alg_props" in derived_properties:
+                derived_properties["alg_props"] = seed_batch.graph_properties[
+                    graph_name
+                ]["alg_props"]
+            if not properties_are_equal(
+                properties=derived_properties,
+                other_properties=seed_batch.graph_properties[graph_name],
+            ):
+                return False
+        return True
+
+
+@typechecked
+def get_arrays(*, snn_arrays: Stage1_snn_arrays) -> Dict[str, np.ndarray]:
+    """Returns the arrays of an snn in the layout of the binary network
+    file."""
+    arrays: Dict[str, np.ndarray] = {
+        "neuron_names": snn_arrays.neuron_names,
+        "synapse_pre": snn_arrays.synapse_pre,
+        "synapse_post": snn_arrays.synapse_post,
+        "object_columns": np.asarray(
+            json.dumps(
+                {
+                    "neurons": snn_arrays.neuron_object_columns,
+                    "synapses": snn_arrays.synapse_object_columns,
+                }
+            )
+        ),
+    }
+    for key, column in snn_arrays.neuron_columns.items():
+        arrays[f"neuron_{key}"] = column
+    for key, column in snn_arrays.synapse_columns.items():
+        arrays[f"synapse_{key}"] = column
+    return arrays
+
+
+@typechecked
+def get_rand_synapses(
+    *, arrays: Dict[str, np.ndarray], rand_edge_weights: List[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the indices of the synapses from the (redundant) rand_ neurons
+    to the (redundant) degree_receiver_ neurons, in the order of the
+    synapses, and the input graph node of the rand_ neuron of each synapse.
+
+    The synapses are selected by the roles of their neurons, through the
+    network index, such that a synapse with a constant weight that happens
+    to equal a rand_edge_weight is not selected. Each selected synapse
+    should have the rand_edge_weight of its node.
+    """
+    neuron_names: List[str] = arrays["neuron_names"].tolist()
+    network_index: Network_index = Network_index(
+        neuron_names=neuron_names,
+        synapse_pre=arrays["synapse_pre"],
+        synapse_post=arrays["synapse_post"],
+    )
+    weights: List = arrays["synapse_w"].tolist()
+    rand_synapses: Dict[int, int] = {}
+    for rand_index in np.concatenate(
+        [
+            network_index.get_role_indices("rand"),
+            network_index.get_role_indices("redundant"),
+        ]
+    ).tolist():
+        match: Optional[re.Match] = RAND_NEURON_PATTERN.match(
+            neuron_names[rand_index]
+        )
+        if match is None:
+            # A redundant neuron of another role.
+            continue
+        node: int = int(match.group(1))
+        for synapse_index in network_index.get_out_synapse_indices(
+            rand_index
+        ).tolist():
+            post_name: str = neuron_names[
+                network_index.synapse_post[synapse_index]
+            ]
+            if DEGREE_RECEIVER_PATTERN.match(post_name) is None:
+                continue
+            if (
+                node >= len(rand_edge_weights)
+                or weights[synapse_index] != rand_edge_weights[node]
+            ):
+                raise ValueError(
+                    "Error, the weight of rand synapse:"
+                    + f"{neuron_names[rand_index]}->{post_name} is:"
+                    + f"{weights[synapse_index]}, which is not the "
+                    + f"rand_edge_weight of node:{node}."
+                )
+            rand_synapses[synapse_index] = node
+
+    synapse_indices: List[int] = sorted(rand_synapses.keys())
+    return (
+        np.asarray(synapse_indices, dtype=np.int64),
+        np.asarray(
+            [
+                rand_synapses[synapse_index]
+                for synapse_index in synapse_indices
+            ],
+            dtype=np.int64,
+        ),
+    )
+
+
+@typechecked
+def arrays_are_equal(
+    *, arrays: Dict[str, np.ndarray], other_arrays: Dict[str, np.ndarray]
+) -> bool:
+    """Returns True if both snns have the same arrays, False otherwise."""
+    if set(arrays.keys()) != set(other_arrays.keys()):
+        return False
+    return all(
+        np.array_equal(column, other_arrays[key])
+        for key, column in arrays.items()
+    )
+
+
+@typechecked
+def properties_are_equal(*, properties: Dict, other_properties: Dict) -> bool:
+    """Returns True if both snns have the same graph properties, False
+    otherwise, or if they can not be compared."""
+    try:
+        return bool(properties == other_properties)
+    except ValueError:
+        # E.g. numpy arrays do not have a single truth value.
+        return False
+
+
+@typechecked
+def get_topology_key(
+    *, plot_config: Plot_config, run_config: Run_config
+) -> Tuple:
+    """Returns the settings that determine the snn topology of a run config,
+    which are all settings that affect stage 1, except for the seed."""
+    return (
+        run_config.graph_size,
+        run_config.graph_nr,
+        json.dumps(run_config.algorithm, sort_keys=True),
+        None
+        if run_config.adaptation is None
+        else get_setting_hash(setting=run_config.adaptation),
+        json.dumps(plot_config.__dict__, sort_keys=True, default=str),
+    )
+
+
+@typechecked
+def get_seed_batch(
+    *, topology_key: Tuple
+) -> Tuple[bool, Optional[Seed_batch]]:
+    """Returns whether the topology has been built, and its seed batch, which
+    is None if the snns of the topology can not be derived."""
+    if topology_key not in _seed_batches:
+        return False, None
+    _seed_batches.move_to_end(topology_key)
+    return True, _seed_batches[topology_key]
+
+
+@typechecked
+def set_seed_batch(
+    *, topology_key: Tuple, seed_batch: Optional[Seed_batch]
+) -> None:
+    """Stores the seed batch of a topology, and removes the least recently
+    used seed batch if there are more than MAX_SEED_BATCHES."""
+    _seed_batches[topology_key] = seed_batch
+    _seed_batches.move_to_end(topology_key)
+    while len(_seed_batches) > MAX_SEED_BATCHES:
+        _seed_batches.popitem(last=False)
@@ -0,0 +1,138 @@
+"""Reads the stage 1 nx_lif snn graphs into the parameter and synapse
+arrays of the binary network format.
+
+The neuron parameters are read once per neuron into a column per
+parameter, and the synapses are stored as COO neuron indices. The arrays
+are read from the built nx_lif graph, so they do not replace the nx_lif
+graph or its direct conversion in stage 1. They are the storage of a seed
+batch, from which the snns of other seeds are derived, see seed_batch.py.
+"""
+import json
+from math import inf
+from typing import Any, Dict, List
+
+import networkx as nx
+import numpy as np
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.import_results.load_stage1_snn_arrays import Stage1_snn_arrays
+
+# The createLIF arguments that are the same for each neuron of a stage 1 snn.
+SIMSNN_LIF_CONSTANTS: Dict[str, Any] = {
+    "V_init": 0,
+    "V_reset": 0,
+    "V_min": -inf,
+    "amplitude": 1,
+    "I_e": 0,
+    "noise": 0,
+    "rng": 0,
+    "ID": 0,
+    "increment_count": False,
+    "spike_only_if_thr_exceeded": True,
+}
+# The createLIF arguments that are compared to verify an snn that is derived
+# from arrays equals the snn that is converted neuron by neuron.
+VERIFIED_LIF_PROPERTIES: List[str] = ["m", "bias", "thr", "du"]
+
+
+@typechecked
+def nx_lif_graph_to_snn_arrays(*, snn_graph: nx.DiGraph) -> Stage1_snn_arrays:
+    """Returns the parameter and synapse arrays of an snn graph of type
+    nx_LIF, with the neurons in the order of the nodes, and the synapses in
+    the order of the edges."""
+    neuron_names: List[str] = list(snn_graph.nodes)
+    name_indices: Dict[str, int] = {
+        name: index for index, name in enumerate(neuron_names)
+    }
+    nx_lifs: List = [
+        snn_graph.nodes[node_name]["nx_lif"][0] for node_name in neuron_names
+    ]
+    dv: np.ndarray = np.asarray(
+        [nx_lif.dv.get() for nx_lif in nx_lifs], dtype=float
+    )
+    out_of_range: np.ndarray = np.flatnonzero((dv > 1) | (dv < -1))
+    if len(out_of_range) > 0:
+        raise ValueError(
+            f"Error, dv={dv[out_of_range[0]]} is not in range [-1,1] for: "
+            + f"{neuron_names[out_of_range[0]]}"
+        )
+
+    arrays: Dict[str, np.ndarray] = {
+        "neuron_names": np.asarray(neuron_names, dtype=str),
+        "neuron_m": 1 - dv,
+        "neuron_bias": np.asarray([nx_lif.bias.get() for nx_lif in nx_lifs]),
+        "neuron_thr": np.asarray([nx_lif.vth.get() for nx_lif in nx_lifs]),
+        "neuron_du": np.asarray([nx_lif.du.get() for nx_lif in nx_lifs]),
+        "synapse_pre": np.asarray(
+            [name_indices[edge[0]] for edge in snn_graph.edges],
+            dtype=np.int32,
+        ),
+        "synapse_post": np.asarray(
+            [name_indices[edge[1]] for edge in snn_graph.edges],
+            dtype=np.int32,
+        ),
+        "synapse_w": np.asarray(
+            [
+                snn_graph.edges[edge]["synapse"].weight
+                for edge in snn_graph.edges
+            ]
+        ),
+        "synapse_d": np.ones(snn_graph.number_of_edges(), dtype=np.int64),
+        "object_columns": np.asarray(
+            json.dumps(
+                {
+                    "neurons": {"pos": [nx_lif.pos for nx_lif in nx_lifs]},
+                    "synapses": {},
+                }
+            )
+        ),
+    }
+    for key, value in SIMSNN_LIF_CONSTANTS.items():
+        arrays[f"neuron_{key}"] = np.full(len(neuron_names), value)
+    return Stage1_snn_arrays(arrays=arrays)
+
+
+@typechecked
+def verify_simsnn_graphs_are_equal(
+    *, expected_snn: Simulator, snn: Simulator
+) -> None:
+    """Verifies an snn has the same neurons, neuron parameters and synapses,
+    in the same order, as the expected snn, e.g. the snn that is converted
+    neuron by neuron from the nx_lif graph."""
+    if len(snn.network.nodes) != len(expected_snn.network.nodes):
+        raise ValueError(
+            f"Error, {len(snn.network.nodes)} neurons, expected:"
+            + f"{len(expected_snn.network.nodes)}"
+        )
+    for neuron, expected_neuron in zip(
+        snn.network.nodes, expected_snn.network.nodes
+    ):
+        for property_name in ["name"] + VERIFIED_LIF_PROPERTIES:
+            if getattr(neuron, property_name) != getattr(
+                expected_neuron, property_name
+            ):
+                raise ValueError(
+                    f"Error, {property_name} of neuron:{neuron.name} is:"
+                    + f"{getattr(neuron, property_name)}, expected:"
+                    + f"{getattr(expected_neuron, property_name)}"
+                )
+
+    if len(snn.network.synapses) != len(expected_snn.network.synapses):
+        raise ValueError(
+            f"Error, {len(snn.network.synapses)} synapses, expected:"
+            + f"{len(expected_snn.network.synapses)}"
+        )
+    for synapse, expected_synapse in zip(
+        snn.network.synapses, expected_snn.network.synapses
+    ):
+        if (
+            synapse.pre.name != expected_synapse.pre.name
+            or synapse.post.name != expected_synapse.post.name
+            or synapse.w != expected_synapse.w
+        ):
+            raise ValueError(
+                f"Error, synapse:{synapse.pre.name}->{synapse.post.name} "
+                + f"w={synapse.w} expected:{expected_synapse.pre.name}->"
+                + f"{expected_synapse.post.name} w={expected_synapse.w}"
+            )
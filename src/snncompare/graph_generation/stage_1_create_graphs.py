@@ -5,7 +5,7 @@ networkx Graph.
 """
 import copy
 from math import inf
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
 import networkx as nx
 from simsnn.core.networks import Network
@@ -38,6 +38,12 @@ from snncompare.export_plots.Plot_config import Plot_config
 from snncompare.graph_generation.export_input_graphs import (
     load_input_graph_based_on_nr,
 )
+from snncompare.graph_generation.seed_batch import (
+    Seed_batch,
+    get_seed_batch,
+    get_topology_key,
+    set_seed_batch,
+)
 from snncompare.run_config.Run_config import Run_config
 
 
@@ -49,6 +55,11 @@ def get_graphs_stage_1(
 ) -> Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]]:
     """Returns the initialised graphs for stage 1 for the different
     simulators."""
+    if run_config.simulator == "simsnn":
+        return get_simsnn_graphs_stage_1(
+            plot_config=plot_config,
+            run_config=run_config,
+        )
     stage_1_graphs: Dict[
         str, Union[nx.Graph, nx.DiGraph, Simulator]
     ] = get_nx_lif_graphs(
@@ -58,17 +69,63 @@ def get_graphs_stage_1(
 
     if run_config.simulator == "nx":
         return stage_1_graphs
-    if run_config.simulator == "simsnn":
-        return nx_lif_graphs_to_simsnn_graphs(
-            stage_1_graphs=stage_1_graphs,
-            reverse_conversion=False,
-            run_config=run_config,
-        )
     raise NotImplementedError(
         "Error, did not yet implement simsnn to nx_lif converter."
     )
 
 
+@typechecked
+def get_simsnn_graphs_stage_1(
+    *,
+    plot_config: Plot_config,
+    run_config: Run_config,
+) -> Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]]:
+    """Returns the simsnn graphs for stage 1.
+
+    The snns are built for the first two seeds of a topology. If the snns
+    of the second seed can be derived from those of the first, the snns of
+    later seeds are derived from the seed batch instead of being built. Later
+    calls for the first seed also reuse its seed batch.
+    """
+    topology_key: Tuple = get_topology_key(
+        plot_config=plot_config, run_config=run_config
+    )
+    is_built, seed_batch = get_seed_batch(topology_key=topology_key)
+    if seed_batch is not None and (
+        seed_batch.is_verified or seed_batch.seed == run_config.seed
+    ):
+        return seed_batch.get_simsnn_graphs(
+            input_graph=load_input_graph_from_file_with_init_props(
+                run_config=run_config
+            )
+        )
+
+    nx_lif_graphs: Dict = get_nx_lif_graphs(
+        plot_config=plot_config,
+        run_config=run_config,
+    )
+    simsnn_graphs: Dict = nx_lif_graphs_to_simsnn_graphs(
+        stage_1_graphs=nx_lif_graphs,
+        reverse_conversion=False,
+        run_config=run_config,
+    )
+    if not is_built:
+        set_seed_batch(
+            topology_key=topology_key,
+            seed_batch=Seed_batch(
+                nx_lif_graphs=nx_lif_graphs, seed=run_config.seed
+            ),
+        )
+    elif seed_batch is not None:
+        if seed_batch.derives(
+            Seed_batch(nx_lif_graphs=nx_lif_graphs, seed=run_config.seed)
+        ):
+            seed_batch.is_verified = True
+        else:
+            set_seed_batch(topology_key=topology_key, seed_batch=None)
+    return simsnn_graphs
+
+
 @typechecked
 def nx_lif_graphs_to_simsnn_graphs(
     *,
@@ -114,7 +171,8 @@ def nx_lif_graph_to_simsnn_graph(
     add_to_multimeter: bool,
     add_to_raster: bool,
 ) -> Simulator:
-    """Converts an snn graph of type nx_LIF to sim snn graph."""
+    """Converts an snn graph of type nx_LIF to sim snn graph, neuron by
+    neuron."""
     net = Network()
     sim = Simulator(net, monitor_I=True)
 
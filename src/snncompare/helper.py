@@ -2,14 +2,18 @@
 import copy
 import random
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 import networkx as nx
 from networkx.classes.graph import Graph
-from simsnn.core.connections import Synapse
 from simsnn.core.simulators import Simulator
 from typeguard import typechecked
 
+from snncompare.simulation.network_index import (
+    Network_index,
+    get_network_index,
+)
+
 if TYPE_CHECKING:
     pass
 
@@ -239,22 +243,32 @@ def get_snn_graph_names() -> List[str]:
 
 @typechecked
 def get_rand_synapse_weights(
-    input_graph: nx.Graph, simsnn_synapses: List[Synapse]
+    *, input_graph: nx.Graph, snn: Simulator
 ) -> List[int]:
     """Returns the synapse weights of the outgoing spikes of the rand_
-    neurons."""
+    neurons.
+
+    Only the outgoing synapses of the rand_ neurons are visited, through the
+    index of the network.
+    """
 
     rand_neurons: List[int] = [0] * len(input_graph.nodes)
     neighbour_count: List[int] = [0] * len(input_graph.nodes)
-    for synapse in simsnn_synapses:
-        if (
-            synapse.pre.name[:5] == "rand_"
-            and synapse.post.name[:15] == "degree_receiver"
-            and synapse.post.name[-2:] == "_0"
-        ):
-            # print(f'{synapse.pre.name} - {synapse.post.name}')
-            rand_neurons[int(synapse.pre.name[5:])] = synapse.w
-            neighbour_count[int(synapse.pre.name[5:])] += 1
+    network_index: Network_index = get_network_index(snn=snn)
+    degree_receivers: Set[str] = network_index.role_names["degree_receiver"]
+    for rand_index in network_index.get_role_indices(role="rand").tolist():
+        node_index: int = int(network_index.neuron_names[rand_index][5:])
+        for synapse_index in network_index.get_out_synapse_indices(
+            neuron_index=rand_index
+        ).tolist():
+            post_name: str = network_index.neuron_names[
+                network_index.synapse_post[synapse_index]
+            ]
+            if post_name in degree_receivers and post_name[-2:] == "_0":
+                rand_neurons[node_index] = snn.network.synapses[
+                    synapse_index
+                ].w
+                neighbour_count[node_index] += 1
 
     expected_isomorphic_hash: str = (
         nx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash(input_graph)
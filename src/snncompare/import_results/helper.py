@@ -7,6 +7,8 @@ from typing import List, Optional, Tuple, Union
 import networkx as nx
 from typeguard import typechecked
 
+from snncompare.export_results.storage_backend import stored_file_exists
+
 # if TYPE_CHECKING:
 from snncompare.run_config.Run_config import Run_config
 
@@ -37,9 +39,10 @@ def prepare_target_file_output(
         f"{output_dir}{isomorphic_hash}{additional_hashes}.json"
     )
 
-    if not Path(output_filepath).is_file():
+    target_file_exists: bool = stored_file_exists(filepath=output_filepath)
+    if not target_file_exists:
         create_relative_path(some_path=output_dir)
-    return Path(output_filepath).is_file(), output_filepath
+    return target_file_exists, output_filepath
 
 
 @typechecked
@@ -0,0 +1,155 @@
+"""Loads the failure mode event tables of stage 7, and filters and groups
+them with vectorised operations for the failure mode table and offline
+analysis."""
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import wait_for_pending_write
+from snncompare.export_results.output_failure_mode_events import (
+    FAILURE_KINDS,
+    get_failure_mode_events_filepath,
+)
+
+FAILURE_MODE_EVENT_COLUMNS: List[str] = [
+    "run_config_id",
+    "adaptation",
+    "algorithm_setting",
+    "seed",
+    "graph_size",
+    "timestep",
+    "failure_kind",
+    "neuron_name",
+]
+
+
+class Failure_mode_events:
+    """Stores the failure mode events of one or more run configs as a column
+    per property."""
+
+    @typechecked
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        if sorted(columns.keys()) != sorted(FAILURE_MODE_EVENT_COLUMNS):
+            raise KeyError(
+                f"Error, expected the columns:{FAILURE_MODE_EVENT_COLUMNS}, "
+                + f"got:{list(columns.keys())}"
+            )
+        self.columns: Dict[str, np.ndarray] = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["timestep"])
+
+    @typechecked
+    def select(self, mask: np.ndarray) -> "Failure_mode_events":
+        """Returns the events for which the mask is True."""
+        return Failure_mode_events(
+            columns={key: column[mask] for key, column in self.columns.items()}
+        )
+
+    # pylint: disable=R0913
+    @typechecked
+    def get_mask(
+        self,
+        algorithm_setting: Optional[str] = None,
+        seed: Optional[int] = None,
+        graph_size: Optional[int] = None,
+        failure_kinds: Optional[List[str]] = None,
+    ) -> np.ndarray:
+        """Returns True for the events that have the given settings, the
+        settings that are None are not filtered."""
+        mask: np.ndarray = np.ones(len(self), dtype=bool)
+        if algorithm_setting is not None:
+            mask &= self.columns["algorithm_setting"] == algorithm_setting
+        if seed is not None:
+            mask &= self.columns["seed"] == seed
+        if graph_size is not None:
+            mask &= self.columns["graph_size"] == graph_size
+        if failure_kinds is not None:
+            mask &= np.isin(
+                self.columns["failure_kind"],
+                [FAILURE_KINDS.index(kind) for kind in failure_kinds],
+            )
+        return mask
+
+    @typechecked
+    def get_first_timesteps(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the run config ids, the index of the run config id of each
+        event, and the first timestep with a failure mode per run config, as
+        a grouped minimum."""
+        run_config_ids, run_config_indices = np.unique(
+            self.columns["run_config_id"], return_inverse=True
+        )
+        first_timesteps: np.ndarray = np.full(
+            len(run_config_ids), np.iinfo(np.int64).max
+        )
+        np.minimum.at(
+            first_timesteps, run_config_indices, self.columns["timestep"]
+        )
+        return run_config_ids, run_config_indices, first_timesteps
+
+    @typechecked
+    def get_first_divergence(self) -> Dict[str, int]:
+        """Returns the first timestep with a failure mode per run config."""
+        run_config_ids, _, first_timesteps = self.get_first_timesteps()
+        return dict(zip(run_config_ids.tolist(), first_timesteps.tolist()))
+
+    @typechecked
+    def get_first_divergence_mask(self) -> np.ndarray:
+        """Returns True for the events at the first timestep with a failure
+        mode of their run config."""
+        _, run_config_indices, first_timesteps = self.get_first_timesteps()
+        return self.columns["timestep"] == first_timesteps[run_config_indices]
+
+
+@typechecked
+def concatenate_failure_mode_events(
+    *, events_list: List[Failure_mode_events]
+) -> Failure_mode_events:
+    """Returns the events of multiple tables as a single table."""
+    if not events_list:
+        return Failure_mode_events(
+            columns={
+                key: np.asarray([], dtype=get_column_dtype(key=key))
+                for key in FAILURE_MODE_EVENT_COLUMNS
+            }
+        )
+    return Failure_mode_events(
+        columns={
+            key: np.concatenate(
+                [events.columns[key] for events in events_list]
+            )
+            for key in FAILURE_MODE_EVENT_COLUMNS
+        }
+    )
+
+
+@typechecked
+def get_column_dtype(*, key: str) -> type:
+    """Returns the type of the values of a column."""
+    if key == "failure_kind":
+        return np.int8
+    if key in ["seed", "graph_size", "timestep"]:
+        return np.int64
+    return str
+
+
+@typechecked
+def load_failure_mode_events(
+    *, stage_7_filepath: str
+) -> Optional[Failure_mode_events]:
+    """Returns the event table that belongs to a stage 7 json filepath, or
+    None if it has not been outputted (e.g. for older results)."""
+    events_filepath: str = get_failure_mode_events_filepath(
+        json_filepath=stage_7_filepath
+    )
+    wait_for_pending_write(filepath=events_filepath)
+    if not Path(events_filepath).is_file():
+        return None
+    with np.load(events_filepath, allow_pickle=False) as npz:
+        return Failure_mode_events(
+            columns={key: npz[key] for key in FAILURE_MODE_EVENT_COLUMNS}
+        )
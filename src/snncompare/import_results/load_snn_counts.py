@@ -0,0 +1,82 @@
+"""Loads the neuron, synapse and spike counts of stage 1 and stage 2 snns,
+without building the snn.
+
+The stage 1 counts sidecar and the stage 2 trace summary are read if they
+exist. Older results fall back on the stage 1 binary network file or the
+stage 1 and stage 2 json files.
+"""
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import wait_for_pending_write
+from snncompare.export_results.output_snn_counts import (
+    get_nr_of_spikes,
+    get_snn_counts_filepath,
+)
+from snncompare.import_results.load_stage1_snn_arrays import (
+    load_stage1_snn_arrays,
+)
+from snncompare.import_results.load_stage2_trace_summary import (
+    Stage2_trace_summary,
+    load_stage2_trace_summary,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+
+
+@typechecked
+def load_snn_counts(*, json_filepath: str) -> Optional[Dict[str, int]]:
+    """Returns the counts that belong to a stage 1 or stage 2 json filepath,
+    or None if they have not been outputted (e.g. for older results)."""
+    wait_for_pending_write(filepath=json_filepath)
+    counts_filepath: str = get_snn_counts_filepath(json_filepath=json_filepath)
+    if not Path(counts_filepath).is_file():
+        return None
+    with open(counts_filepath, encoding="utf-8") as counts_file:
+        return json.load(counts_file)
+
+
+@typechecked
+def load_stage_1_counts(*, stage_1_simsnn_filepath: str) -> Dict[str, int]:
+    """Returns the number of neurons and synapses of a stage 1 snn."""
+    counts: Optional[Dict[str, int]] = load_snn_counts(
+        json_filepath=stage_1_simsnn_filepath
+    )
+    if counts is not None:
+        return counts
+    snn_arrays = load_stage1_snn_arrays(
+        stage_1_simsnn_filepath=stage_1_simsnn_filepath
+    )
+    if snn_arrays is not None:
+        return {
+            "neurons": snn_arrays.get_nr_of_neurons(),
+            "synapses": snn_arrays.get_nr_of_synapses(),
+        }
+    simsnn_dict: Dict = load_json_file_into_dict(
+        json_filepath=stage_1_simsnn_filepath
+    )
+    return {
+        "neurons": len(simsnn_dict["neurons"]),
+        "synapses": len(simsnn_dict["synapses"]),
+    }
+
+
+@typechecked
+def load_stage_2_counts(*, stage_2_simsnn_filepath: str) -> Dict[str, int]:
+    """Returns the number of spikes of a stage 2 snn over all timesteps."""
+    trace_summary: Optional[Stage2_trace_summary] = load_stage2_trace_summary(
+        stage_2_simsnn_filepath=stage_2_simsnn_filepath
+    )
+    if trace_summary is not None:
+        return {"spikes": trace_summary.total_spikes}
+    snn_propagation: Dict = load_json_file_into_dict(
+        json_filepath=stage_2_simsnn_filepath
+    )
+    return {
+        "spikes": get_nr_of_spikes(
+            spikes=np.asarray(snn_propagation["spikes"], dtype=bool)
+        )
+    }
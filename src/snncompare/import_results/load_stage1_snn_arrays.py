@@ -0,0 +1,203 @@
+"""Loads stage 1 simsnn networks from the compact, array-backed binary format.
+
+Consumers that only need the neuron/synapse counts or the parameter arrays
+can use the Stage1_snn_arrays object directly, without building the simsnn
+Simulator.
+"""
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.nodes import LIF
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import wait_for_pending_write
+from snncompare.export_results.output_stage1_snn_arrays import (
+    get_stage1_arrays_filepath,
+)
+from snncompare.simulation.network_index import (
+    Network_index,
+    set_network_index,
+)
+
+
+# pylint: disable=R0902
+class Stage1_snn_arrays:
+    """Stores the neuron parameter arrays, the name table and the COO synapse
+    arrays of a stage 1 snn, in the layout of the binary network file."""
+
+    @typechecked
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        self.neuron_names: np.ndarray = arrays["neuron_names"]
+        self.synapse_pre: np.ndarray = arrays["synapse_pre"]
+        self.synapse_post: np.ndarray = arrays["synapse_post"]
+        object_columns: Dict = json.loads(str(arrays["object_columns"]))
+        self.neuron_columns: Dict[str, np.ndarray] = {
+            key.split("_", 1)[1]: column
+            for key, column in arrays.items()
+            if key.startswith("neuron_") and key != "neuron_names"
+        }
+        self.synapse_columns: Dict[str, np.ndarray] = {
+            key.split("_", 1)[1]: column
+            for key, column in arrays.items()
+            if key.startswith("synapse_")
+            and key not in ["synapse_pre", "synapse_post"]
+        }
+        self.neuron_object_columns: Dict[str, List] = object_columns["neurons"]
+        self.synapse_object_columns: Dict[str, List] = object_columns[
+            "synapses"
+        ]
+
+    @typechecked
+    def get_nr_of_neurons(self) -> int:
+        """Returns the number of neurons in the snn."""
+        return len(self.neuron_names)
+
+    @typechecked
+    def get_nr_of_synapses(self) -> int:
+        """Returns the number of synapses in the snn."""
+        return len(self.synapse_pre)
+
+    @typechecked
+    def get_neuron_kwargs(self) -> List[Dict]:
+        """Returns the createLIF keyword arguments of each neuron."""
+        columns: Dict[str, List] = {
+            key: column.tolist() for key, column in self.neuron_columns.items()
+        }
+        columns.update(self.neuron_object_columns)
+        columns["name"] = self.neuron_names.tolist()
+        return [
+            {key: column[index] for key, column in columns.items()}
+            for index in range(self.get_nr_of_neurons())
+        ]
+
+    @typechecked
+    def get_neuron_rows(self) -> Tuple[List[str], Iterator[Tuple]]:
+        """Returns the createLIF keywords, and the values of those keywords
+        per neuron, without creating a dict per neuron."""
+        keys: List[str] = (
+            ["name"]
+            + list(self.neuron_columns.keys())
+            + list(self.neuron_object_columns.keys())
+        )
+        return keys, zip(
+            self.neuron_names.tolist(),
+            *(column.tolist() for column in self.neuron_columns.values()),
+            *self.neuron_object_columns.values(),
+        )
+
+    @typechecked
+    def get_synapse_column(self, key: str, default: Union[float, int]) -> List:
+        """Returns the values of a synapse property, or the default value for
+        each synapse if the property is not stored."""
+        if key in self.synapse_columns:
+            return self.synapse_columns[key].tolist()
+        if key in self.synapse_object_columns:
+            return self.synapse_object_columns[key]
+        return [default] * self.get_nr_of_synapses()
+
+    @typechecked
+    def get_synapse_kwargs(self) -> List[Dict]:
+        """Returns the stored properties of each synapse, except for the pre-
+        and post synaptic neurons and the ID."""
+        columns: Dict[str, List] = {
+            key: column.tolist()
+            for key, column in self.synapse_columns.items()
+        }
+        columns.update(self.synapse_object_columns)
+        return [
+            {key: column[index] for key, column in columns.items()}
+            for index in range(self.get_nr_of_synapses())
+        ]
+
+
+@lru_cache(maxsize=64)
+def load_stage1_snn_arrays_version(
+    npz_filepath: str,
+    mtime_ns: int,  # pylint: disable=W0613
+    nr_of_bytes: int,  # pylint: disable=W0613
+) -> Stage1_snn_arrays:
+    """Loads the arrays of a binary network file. The modification time and
+    size identify the version of the file in the cache. The arrays are only
+    read, so the cached object is shared."""
+    with np.load(npz_filepath, allow_pickle=False) as npz:
+        return Stage1_snn_arrays(arrays={key: npz[key] for key in npz.files})
+
+
+@typechecked
+def load_stage1_snn_arrays(
+    *, stage_1_simsnn_filepath: str
+) -> Optional[Stage1_snn_arrays]:
+    """Returns the array-backed snn that belongs to a stage 1 json filepath,
+    or None if it has not been outputted (e.g. for older results)."""
+    wait_for_pending_write(filepath=stage_1_simsnn_filepath)
+    npz_filepath: str = get_stage1_arrays_filepath(
+        json_filepath=stage_1_simsnn_filepath
+    )
+    if not Path(npz_filepath).is_file():
+        return None
+    file_stat: os.stat_result = os.stat(npz_filepath)
+    return load_stage1_snn_arrays_version(
+        npz_filepath, file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+
+@typechecked
+def stage1_snn_arrays_to_simulator(
+    *,
+    add_to_raster: bool,
+    add_to_multimeter: bool,
+    snn_arrays: Stage1_snn_arrays,
+) -> Simulator:
+    """Builds the simsnn Simulator from the array-backed snn.
+
+    The synapses are connected through the neuron indices of the COO
+    arrays, instead of looking up each neuron name. The network index is
+    built from the same arrays.
+    """
+    net = Network()
+    sim = Simulator(net, monitor_I=True)
+
+    # simsnn only creates neurons and synapses one at a time, through
+    # createLIF and createSynapse, which also add them to the network graph.
+    # So the columns are passed row by row, only the keywords of createLIF
+    # are collected in a dict per neuron.
+    neuron_keys, neuron_rows = snn_arrays.get_neuron_rows()
+    neurons: List[LIF] = [
+        net.createLIF(**dict(zip(neuron_keys, neuron_row)))
+        for neuron_row in neuron_rows
+    ]
+    names: List[str] = snn_arrays.neuron_names.tolist()
+    for pre, post, weight, delay in zip(
+        snn_arrays.synapse_pre.tolist(),
+        snn_arrays.synapse_post.tolist(),
+        snn_arrays.get_synapse_column(key="w", default=1.0),
+        snn_arrays.get_synapse_column(key="d", default=1),
+    ):
+        net.createSynapse(
+            pre=neurons[pre],
+            post=neurons[post],
+            ID=[names[pre], names[post]],
+            w=weight,
+            d=delay,
+        )
+    if add_to_raster:
+        # Add all neurons to the raster.
+        sim.raster.addTarget(net.nodes)
+    if add_to_multimeter:
+        # Add all neurons to the multimeter.
+        sim.multimeter.addTarget(net.nodes)
+    set_network_index(
+        snn=sim,
+        network_index=Network_index(
+            neuron_names=names,
+            synapse_pre=snn_arrays.synapse_pre,
+            synapse_post=snn_arrays.synapse_post,
+        ),
+    )
+    return sim
@@ -0,0 +1,75 @@
+"""Loads the summary of the stage 2 neuron behaviour of a simsnn network,
+without reading its [timestep, neuron] traces."""
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import wait_for_pending_write
+from snncompare.export_results.output_stage2_trace_summary import (
+    get_trace_summary_filepath,
+)
+
+# The summary properties that are stored per neuron.
+NEURON_SUMMARY_COLUMNS: List[str] = [
+    "spike_count",
+    "first_spike_t",
+    "last_spike_t",
+    "V_min",
+    "V_max",
+    "V_mean",
+    "I_min",
+    "I_max",
+    "I_mean",
+]
+
+
+class Stage2_trace_summary:
+    """Stores the summary per neuron and the spike totals of a stage 2
+    snn."""
+
+    @typechecked
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        self.neuron_names: np.ndarray = columns["neuron_names"]
+        self.neuron_columns: Dict[str, np.ndarray] = {
+            key: columns[key] for key in NEURON_SUMMARY_COLUMNS
+        }
+        self.total_spikes: int = int(columns["total_spikes"])
+        self.active_timesteps: int = int(columns["active_timesteps"])
+
+    @typechecked
+    def get_nr_of_neurons(self) -> int:
+        """Returns the number of neurons in the snn."""
+        return len(self.neuron_names)
+
+    @typechecked
+    def get_neuron_summary(
+        self, neuron_name: str
+    ) -> Dict[str, Union[int, float]]:
+        """Returns the summary properties of a neuron."""
+        indices: np.ndarray = np.flatnonzero(self.neuron_names == neuron_name)
+        if len(indices) != 1:
+            raise KeyError(f"Error, neuron:{neuron_name} not found.")
+        return {
+            key: column[indices[0]].item()
+            for key, column in self.neuron_columns.items()
+        }
+
+
+@typechecked
+def load_stage2_trace_summary(
+    *, stage_2_simsnn_filepath: str
+) -> Optional[Stage2_trace_summary]:
+    """Returns the summary that belongs to a stage 2 json filepath, or None
+    if it has not been outputted (e.g. for older results)."""
+    wait_for_pending_write(filepath=stage_2_simsnn_filepath)
+    summary_filepath: str = get_trace_summary_filepath(
+        json_filepath=stage_2_simsnn_filepath
+    )
+    if not Path(summary_filepath).is_file():
+        return None
+    with np.load(summary_filepath, allow_pickle=False) as npz:
+        return Stage2_trace_summary(
+            columns={key: npz[key] for key in npz.files}
+        )
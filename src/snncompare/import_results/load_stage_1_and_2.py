@@ -7,7 +7,6 @@
     radiation type, died neurons list without adaptation.
     radiation type, Died neurons list with adaptation.
 """
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -25,6 +24,7 @@ from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
     get_rand_nrs_data,
 )
+from snncompare.export_results.storage_backend import stored_file_exists
 from snncompare.graph_generation.export_input_graphs import (
     get_input_graph_output_filepath,
 )
@@ -37,6 +37,11 @@ from snncompare.import_results.helper import simsnn_files_exists_and_get_path
 from snncompare.import_results.load_stage1_results import (
     get_run_config_filepath,
 )
+from snncompare.import_results.load_stage1_snn_arrays import (
+    Stage1_snn_arrays,
+    load_stage1_snn_arrays,
+    stage1_snn_arrays_to_simulator,
+)
 from snncompare.run_config.Run_config import Run_config
 
 from .read_json import load_json_file_into_dict
@@ -242,16 +247,27 @@ def load_simsnn_graph_from_file(
     stage_index: int,
 ) -> Simulator:
     """Loads the simsnn filepath and converts it into a simsnn graph file."""
-    # Read output JSON file into dict.
-    with open(stage_1_simsnn_filepath, encoding="utf-8") as json_file:
-        some_dict: Dict[str, List] = json.load(json_file)
-        json_file.close()
-
-    stage1_simsnn: Simulator = stage1_simsnn_graph_from_file_to_simulator(
-        add_to_raster=True,
-        add_to_multimeter=True,
-        simsnn_dict=some_dict,
+    # Prefer the compact binary network, fall back on the json file.
+    snn_arrays: Optional[Stage1_snn_arrays] = load_stage1_snn_arrays(
+        stage_1_simsnn_filepath=stage_1_simsnn_filepath
     )
+    if snn_arrays is not None:
+        stage1_simsnn: Simulator = stage1_snn_arrays_to_simulator(
+            add_to_raster=True,
+            add_to_multimeter=True,
+            snn_arrays=snn_arrays,
+        )
+    else:
+        # Read output JSON file into dict.
+        some_dict: Dict[str, List] = load_json_file_into_dict(
+            json_filepath=stage_1_simsnn_filepath
+        )
+
+        stage1_simsnn = stage1_simsnn_graph_from_file_to_simulator(
+            add_to_raster=True,
+            add_to_multimeter=True,
+            simsnn_dict=some_dict,
+        )
     add_stage_completion_to_graph(snn=stage1_simsnn, stage_index=1)
 
     if with_radiation:
@@ -354,7 +370,7 @@ def load_snn_graph_stage_2(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not stored_file_exists(filepath=output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -380,7 +396,7 @@ def add_stage4_results_from_file_to_snn(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not stored_file_exists(filepath=output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -398,7 +414,7 @@ def add_stage7_failure_data_from_file_to_snn(
 ) -> None:
     """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
     # Verify the file exists.
-    if not Path(output_filepath).is_file():
+    if not stored_file_exists(filepath=output_filepath):
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
@@ -5,11 +5,14 @@ Appears to also be used to partially convert json graphs back into nx
 graphs.
 """
 import json
-from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from typeguard import typechecked
 
+from snncompare.export_results.storage_backend import (
+    find_stored_filepath,
+    read_json_bytes,
+)
 from snncompare.import_results.json_dict_into_nx_snn import (
     load_json_graph_to_snn,
 )
@@ -54,15 +57,16 @@ def load_json_file_into_dict(
 ) -> Dict:
     """TODO: Include expected type upon loading, or not.
 
-    Loads a json file into dict from a filepath.
+    Loads a json file into dict from a (logical) filepath, wherever the
+    storage backend stored it.
     """
-    if not Path(json_filepath).is_file():
+    storage_filepath: Optional[str] = find_stored_filepath(
+        filepath=json_filepath
+    )
+    if storage_filepath is None:
         raise FileNotFoundError(
             f"Error, filepath does not exist:{json_filepath}"
         )
-    # TODO: verify extension.
     # TODO: verify json formatting is valid.
-    with open(json_filepath, encoding="utf-8") as json_file:
-        the_dict = json.load(json_file)
-        json_file.close()
+    the_dict = json.loads(read_json_bytes(storage_filepath=storage_filepath))
     return the_dict
@@ -166,6 +166,7 @@ class Extra_storing_config:
         store_died_neurons: bool,
         export_failure_modes: bool,
         show_failure_modes: bool,
+        memory_budget: int | None = None,
     ):
         self.count_spikes: bool = count_spikes
         self.skip_stage_2_output: bool = skip_stage_2_output
@@ -187,6 +188,11 @@ class Extra_storing_config:
         self.show_images: bool = show_images
         self.store_died_neurons: bool = store_died_neurons
         self.show_failure_modes: bool = show_failure_modes
+        # The resident memory in MB above which the simulation arrays are
+        # spilled to memory mapped files, and released after stage 4.
+        if memory_budget is not None and memory_budget < 1:
+            raise ValueError("Error, memory_budget should be >0 [MB].")
+        self.memory_budget: int | None = memory_budget
         if self.count_spikes:
             raise NotImplementedError(
                 "Error, count_spikes not yet implemented."
@@ -1,18 +1,25 @@
 """Computes what the failure modes were, and then stores this data in the
 graphs."""
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
-import networkx as nx
+import numpy as np
 from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
 from typeguard import typechecked
 
 from snncompare.exp_config import Exp_config
-from snncompare.graph_generation.stage_1_create_graphs import (
-    load_input_graph_from_file_with_init_props,
+from snncompare.export_results.output_failure_mode_events import (
+    FAILURE_KINDS,
+    SPIKE_FAILURE_KINDS,
+    U_FAILURE_KINDS,
+)
+from snncompare.import_results.load_failure_mode_events import (
+    Failure_mode_events,
+    concatenate_failure_mode_events,
+)
+from snncompare.process_results.failure_mode_index import (
+    Failure_mode_index,
+    Failure_mode_record,
 )
-from snncompare.helper import get_snn_graph_name
-from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
-from snncompare.process_results.helper import graph_of_run_config_passed
 from snncompare.run_config.Run_config import Run_config
 
 # from dash.dependencies import Input, Output
@@ -33,6 +40,7 @@ class Failure_mode_entry:
         incorrect_u_increase: bool,
         incorrect_u_decrease: bool,
         neuron_names: List[str],
+        passed: bool,
         run_config: Run_config,
         timestep: int,
     ) -> None:
@@ -43,6 +51,7 @@ class Failure_mode_entry:
             incorrectly_spikes (bool): Indicates if the neurons spiked
             incorrectly.
             neuron_names (List[str]): List of neuron names.
+            passed (bool): Indicates if the radiated adapted snn passed.
             run_config (Run_config): The run configuration.
             timestep (int): The timestep at which the failure mode occurred.
         """
@@ -52,6 +61,7 @@ class Failure_mode_entry:
         self.incorrect_u_increase: bool = incorrect_u_increase
         self.incorrect_u_decrease: bool = incorrect_u_decrease
         self.neuron_names: List = neuron_names
+        self.passed: bool = passed
         self.run_config: Run_config = run_config
         self.timestep: int = timestep
 
@@ -102,46 +112,10 @@ class Table_settings:
                 f"{adaptation.adaptation_type}_{adaptation.redundancy}"
             )
 
-        self.run_config_and_snns: List[
-            Tuple[Run_config, Dict]
-        ] = self.create_failure_mode_tables()
-
-    @typechecked
-    def create_failure_mode_tables(
-        self,
-    ) -> List[Tuple[Run_config, Dict]]:
-        """Returns the failure mode data for the selected settings.
-
-        Returns:
-            A list of tuples containing the run configuration and the failure
-            mode data.
-        """
-        run_config_and_snns: List[Tuple[Run_config, Dict]] = []
-        print("Creating failure mode table.")
-        for i, run_config in enumerate(self.run_configs):
-            snn_graphs: Dict = {}
-            input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
-                run_config=run_config
-            )
-            print(
-                f"{i}/{len(self.run_configs)},{run_config.adaptation.__dict__}"
-            )
-
-            for with_adaptation in [False, True]:
-                for with_radiation in [False, True]:
-                    graph_name: str = get_snn_graph_name(
-                        with_adaptation=with_adaptation,
-                        with_radiation=with_radiation,
-                    )
-                    snn_graphs[graph_name] = load_simsnn_graphs(
-                        run_config=run_config,
-                        input_graph=input_graph,
-                        with_adaptation=with_adaptation,
-                        with_radiation=with_radiation,
-                        stage_index=7,
-                    )
-            run_config_and_snns.append((run_config, snn_graphs))
-        return run_config_and_snns
+        # The failure modes are loaded when a selection is first shown.
+        self.failure_mode_index: Failure_mode_index = Failure_mode_index(
+            run_configs=run_configs
+        )
 
     # pylint: disable=R0912
     # pylint: disable=R0913
@@ -164,130 +138,86 @@ class Table_settings:
 
         Returns:
             A list of failure mode entries.
-
-        Raises:
-            ValueError: If the run configurations are not equal.
         """
-        failure_mode_entries: List[Failure_mode_entry] = []
-
-        # Loop over the combination of run_config and accompanying snn graphs.
-        for run_config, snn_graphs in self.run_config_and_snns:
-            # Read the failure modes from the graph object.
-            failure_run_config, failure_mode = (
-                run_config,
-                snn_graphs["rad_adapted_snn_graph"].network.graph.graph[
-                    "failure_modes"
-                ],
-            )
-            if run_config != failure_run_config:
-                raise ValueError("Error, run configs not equal.")
-
-            # Check if the run config settings are desired.
-            run_config_algorithm_name: str = get_algorithm_setting_name(
-                algorithm_setting=run_config.algorithm
+        # Only the failure modes of the radiated adapted snns that failed are
+        # shown.
+        failed_records: Dict[str, Failure_mode_record] = {
+            failure_mode_record.run_config.unique_id: failure_mode_record
+            for failure_mode_record in self.failure_mode_index.get_records(
+                algorithm_setting, seed, graph_size
             )
-            adaptation_name: str = (
-                f"{run_config.adaptation.adaptation_type}_"
-                + f"{run_config.adaptation.redundancy}"
+            if not failure_mode_record.passed
+        }
+        events: Failure_mode_events = concatenate_failure_mode_events(
+            events_list=[
+                failure_mode_record.events
+                for failure_mode_record in failed_records.values()
+            ]
+        )
+        events = events.select(
+            events.get_mask(
+                failure_kinds=SPIKE_FAILURE_KINDS
+                if show_spike_failures
+                else U_FAILURE_KINDS
             )
-
-            if (
-                run_config.seed == seed
-                and run_config.graph_size == graph_size
-                and run_config_algorithm_name == algorithm_setting
-                and not graph_of_run_config_passed(
-                    graph_name="rad_adapted_snn_graph",
-                    run_config=run_config,
-                )
-            ):
-                get_failure_mode_obj(
-                    adaptation_name=adaptation_name,
-                    failure_mode=failure_mode,
-                    failure_mode_entries=failure_mode_entries,
-                    first_timestep_only=first_timestep_only,
-                    run_config=run_config,
-                    show_spike_failures=show_spike_failures,
-                )
-
-        return failure_mode_entries
+        )
+        if first_timestep_only:
+            events = events.select(events.get_first_divergence_mask())
+        return get_failure_mode_entries_of_events(
+            events=events, failure_mode_records=failed_records
+        )
 
 
 @typechecked
-def get_failure_mode_obj(
+def get_failure_mode_entries_of_events(
     *,
-    adaptation_name: str,
-    failure_mode: Dict,
-    failure_mode_entries: List[Failure_mode_entry],
-    first_timestep_only: bool,
-    run_config: Run_config,
-    show_spike_failures: bool,
-) -> None:
-    """Parses input data to return a Failure mode object, containing the
-    difference between the radiated and unradiated SNN."""
-
-    @typechecked
-    def create_failure_mode_entry(
-        incorrectly_spikes: bool,
-        incorrectly_silent: bool,
-        incorrect_u_increase: bool,
-        incorrect_u_decrease: bool,
-        neuron_list: List[str],
-    ) -> Failure_mode_entry:
-        """Returns a Failure mode object, containing the difference between the
-        radiated and unradiated SNN."""
-        return Failure_mode_entry(
-            adaptation_name=adaptation_name,
-            incorrectly_spikes=incorrectly_spikes,
-            incorrectly_silent=incorrectly_silent,
-            incorrect_u_increase=incorrect_u_increase,
-            incorrect_u_decrease=incorrect_u_decrease,
-            neuron_names=neuron_list,
-            run_config=run_config,
-            timestep=int(timestep),
+    events: Failure_mode_events,
+    failure_mode_records: Dict[str, Failure_mode_record],
+) -> List[Failure_mode_entry]:
+    """Returns a failure mode entry with the neuron names per run config,
+    timestep and failure kind of the events."""
+    order: np.ndarray = np.lexsort(
+        (
+            events.columns["failure_kind"],
+            events.columns["timestep"],
+            events.columns["run_config_id"],
         )
-
-    @typechecked
-    def append_failure_mode_entry(
-        failure_mode_entry: Failure_mode_entry,
-    ) -> None:
-        if first_timestep_only:
-            failure_mode_entries.append(failure_mode_entry)
-        else:
-            # Optionally handle first timestep only logic here
-            print("passing")
-
-    if show_spike_failures:
-        if "incorrectly_silent" in failure_mode:
-            for timestep, neuron_list in failure_mode[
-                "incorrectly_silent"
-            ].items():
-                failure_mode_entry = create_failure_mode_entry(
-                    False, True, False, False, neuron_list
-                )
-                append_failure_mode_entry(failure_mode_entry)
-
-        if "incorrectly_spikes" in failure_mode:
-            for timestep, neuron_list in failure_mode[
-                "incorrectly_spikes"
-            ].items():
-                failure_mode_entry = create_failure_mode_entry(
-                    True, False, False, False, neuron_list
-                )
-                append_failure_mode_entry(failure_mode_entry)
-    else:
-        if "inhibitory_delta_u" in failure_mode:
-            for timestep, neuron_list in failure_mode[
-                "inhibitory_delta_u"
-            ].items():
-                failure_mode_entry = create_failure_mode_entry(
-                    False, False, False, True, neuron_list
-                )
-                append_failure_mode_entry(failure_mode_entry)
-
-        if "excitatory_delta_u" in failure_mode:
-            for timestep, neuron_list in failure_mode[
-                "excitatory_delta_u"
-            ].items():
-                failure_mode_entry = create_failure_mode_entry(
-                    False, False, True, False, neuron_list
-                )
+    )
+    events = events.select(order)
+    # The events of an entry are consecutive, so an entry starts where the
+    # run config, timestep or failure kind changes.
+    is_new_entry: np.ndarray = np.ones(len(events), dtype=bool)
+    if len(events) > 1:
+        is_new_entry[1:] = np.logical_or.reduce(
+            [
+                events.columns[key][1:] != events.columns[key][:-1]
+                for key in ["run_config_id", "timestep", "failure_kind"]
+            ]
+        )
+    entry_starts: np.ndarray = np.flatnonzero(is_new_entry)
+
+    failure_mode_entries: List[Failure_mode_entry] = []
+    for start, neuron_names in zip(
+        entry_starts.tolist(),
+        np.split(events.columns["neuron_name"], entry_starts[1:]),
+    ):
+        failure_kind: str = FAILURE_KINDS[
+            int(events.columns["failure_kind"][start])
+        ]
+        failure_mode_record: Failure_mode_record = failure_mode_records[
+            str(events.columns["run_config_id"][start])
+        ]
+        failure_mode_entries.append(
+            Failure_mode_entry(
+                adaptation_name=str(events.columns["adaptation"][start]),
+                incorrectly_spikes=failure_kind == "incorrectly_spikes",
+                incorrectly_silent=failure_kind == "incorrectly_silent",
+                incorrect_u_increase=failure_kind == "excitatory_delta_u",
+                incorrect_u_decrease=failure_kind == "inhibitory_delta_u",
+                neuron_names=neuron_names.tolist(),
+                passed=failure_mode_record.passed,
+                run_config=failure_mode_record.run_config,
+                timestep=int(events.columns["timestep"][start]),
+            )
+        )
+    return failure_mode_entries
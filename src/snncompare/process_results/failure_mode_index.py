@@ -0,0 +1,197 @@
+"""Loads the failure mode events and pass flags of the radiated adapted snns
+for the failure mode table, on demand.
+
+The table only shows the stage 7 failure modes and the stage 4 pass flag of
+the rad_adapted_snn_graph of each run config. So instead of building the
+simsnn Simulators of all four graphs of every run config, only the neuron
+names of the stage 1 snn are read to find the filepaths of these two files.
+The run configs are indexed on the dropdown settings: (algorithm setting,
+seed, graph size), and the records of a selection are loaded when it is
+first shown, and kept in a bounded LRU cache.
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import networkx as nx
+from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
+from typeguard import typechecked
+
+from snncompare.export_results.output_failure_mode_events import (
+    get_failure_mode_event_columns,
+)
+from snncompare.export_results.output_stage1_configs_and_input_graph import (
+    Radiation_data,
+    get_rad_name_filepath_and_exists,
+    get_rand_nrs_and_hash,
+)
+from snncompare.export_results.storage_backend import stored_file_exists
+from snncompare.graph_generation.stage_1_create_graphs import (
+    load_input_graph_from_file_with_init_props,
+)
+from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.load_failure_mode_events import (
+    Failure_mode_events,
+    load_failure_mode_events,
+)
+from snncompare.import_results.load_stage1_snn_arrays import (
+    load_stage1_snn_arrays,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+from snncompare.run_config.Run_config import Run_config
+
+# The number of dropdown selections whose records are kept in memory.
+DEFAULT_CACHE_SIZE: int = 64
+
+
+# pylint: disable=R0903
+class Failure_mode_record:
+    """Stores the failure mode events and pass flag of the radiated adapted
+    snn of a run config."""
+
+    @typechecked
+    def __init__(
+        self,
+        events: Failure_mode_events,
+        passed: bool,
+        run_config: Run_config,
+    ) -> None:
+        self.events: Failure_mode_events = events
+        self.passed: bool = passed
+        self.run_config: Run_config = run_config
+
+
+@typechecked
+def load_stage_1_neuron_names(*, stage_1_simsnn_filepath: str) -> List[str]:
+    """Returns the neuron names of a stage 1 snn, without creating the
+    snn."""
+    snn_arrays = load_stage1_snn_arrays(
+        stage_1_simsnn_filepath=stage_1_simsnn_filepath
+    )
+    if snn_arrays is not None:
+        return [str(name) for name in snn_arrays.neuron_names.tolist()]
+    simsnn_dict: Dict = load_json_file_into_dict(
+        json_filepath=stage_1_simsnn_filepath
+    )
+    return [neuron_dict["name"] for neuron_dict in simsnn_dict["neurons"]]
+
+
+@typechecked
+def get_rad_adapted_filepaths(*, run_config: Run_config) -> Dict[int, str]:
+    """Returns the stage 4 and stage 7 filepaths of the radiated adapted snn
+    of a run config."""
+    input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
+        run_config=run_config
+    )
+    _, rand_nrs_hash = get_rand_nrs_and_hash(input_graph=input_graph)
+    _, stage_1_simsnn_filepath = simsnn_files_exists_and_get_path(
+        output_category="snns",
+        input_graph=input_graph,
+        run_config=run_config,
+        with_adaptation=True,
+        stage_index=1,
+        rand_nrs_hash=rand_nrs_hash,
+        rad_affected_neurons_hash=None,
+    )
+
+    # The radiation hash only depends on the neuron names.
+    neuron_graph: nx.DiGraph = nx.DiGraph()
+    neuron_graph.add_nodes_from(
+        load_stage_1_neuron_names(
+            stage_1_simsnn_filepath=stage_1_simsnn_filepath
+        )
+    )
+    radiation_data: Radiation_data = get_rad_name_filepath_and_exists(
+        input_graph=input_graph,
+        snn_graph=neuron_graph,
+        run_config=run_config,
+        stage_index=7,
+        with_adaptation=True,
+    )
+
+    filepaths: Dict[int, str] = {}
+    for stage_index in [4, 7]:
+        _, filepaths[stage_index] = simsnn_files_exists_and_get_path(
+            output_category=radiation_data.radiation_name,
+            input_graph=input_graph,
+            run_config=run_config,
+            with_adaptation=True,
+            stage_index=stage_index,
+            rand_nrs_hash=rand_nrs_hash,
+            rad_affected_neurons_hash=radiation_data.rad_affected_neurons_hash,
+        )
+        if not stored_file_exists(filepath=filepaths[stage_index]):
+            raise FileNotFoundError(
+                f"Error, simsnn not found at:{filepaths[stage_index]}"
+            )
+    return filepaths
+
+
+@typechecked
+def load_failure_mode_record(*, run_config: Run_config) -> Failure_mode_record:
+    """Loads the failure mode events and pass flag of the radiated adapted snn
+    of a run config."""
+    filepaths: Dict[int, str] = get_rad_adapted_filepaths(
+        run_config=run_config
+    )
+    results: Dict = load_json_file_into_dict(json_filepath=filepaths[4])
+    if not isinstance(results["passed"], bool):
+        raise ValueError("Error, pass/fail was expected to be True or False.")
+    events: Optional[Failure_mode_events] = load_failure_mode_events(
+        stage_7_filepath=filepaths[7]
+    )
+    if events is None:
+        # The event table is not outputted for older results.
+        events = Failure_mode_events(
+            columns=get_failure_mode_event_columns(
+                failure_modes=load_json_file_into_dict(
+                    json_filepath=filepaths[7]
+                ),
+                run_config=run_config,
+            )
+        )
+    return Failure_mode_record(
+        events=events,
+        passed=results["passed"],
+        run_config=run_config,
+    )
+
+
+class Failure_mode_index:
+    """Indexes the run configs on (algorithm setting, seed, graph size), and
+    loads the failure mode records of a selection on demand."""
+
+    @typechecked
+    def __init__(
+        self,
+        run_configs: List[Run_config],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.run_configs: Dict[Tuple[str, int, int], List[Run_config]] = {}
+        for run_config in run_configs:
+            self.run_configs.setdefault(
+                get_selection_key(run_config=run_config), []
+            ).append(run_config)
+        self.get_records = lru_cache(maxsize=cache_size)(self.load_records)
+
+    @typechecked
+    def load_records(
+        self, algorithm_setting: str, seed: int, graph_size: int
+    ) -> List[Failure_mode_record]:
+        """Loads the failure mode records of the run configs of a
+        selection."""
+        return [
+            load_failure_mode_record(run_config=run_config)
+            for run_config in self.run_configs.get(
+                (algorithm_setting, seed, graph_size), []
+            )
+        ]
+
+
+@typechecked
+def get_selection_key(*, run_config: Run_config) -> Tuple[str, int, int]:
+    """Returns the dropdown selection to which a run config belongs."""
+    return (
+        get_algorithm_setting_name(algorithm_setting=run_config.algorithm),
+        run_config.seed,
+        run_config.graph_size,
+    )
@@ -4,7 +4,6 @@ from typing import Dict, List, Tuple, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
@@ -12,6 +11,8 @@ from snncompare.export_results.output_stage1_configs_and_input_graph import (
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
 from snncompare.import_results.load_stage_1_and_2 import load_snn_graph_stage_2
 from snncompare.run_config import Run_config
+from snncompare.simulation.network_index import get_network_index
+from snncompare.typecheck_profile import typechecked
 
 
 # pylint: disable=R0912
@@ -175,12 +176,7 @@ def get_incorrect_spikes(
     # Loop over timesteps
     # Loop over neurons
     for neuron_index, neuron_name in enumerate(
-        list(
-            map(
-                lambda neuron: neuron.name,
-                adapted_unradiated_snn.network.nodes,
-            )
-        )
+        get_network_index(snn=adapted_unradiated_snn).neuron_names
     ):
         for t, unradiated_spikes_at_t in enumerate(unradiated_spikes):
             add_neurons_with_spike_difference(
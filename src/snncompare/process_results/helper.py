@@ -1,10 +1,9 @@
 """Computes what the failure modes were, and then stores this data in the
 graphs."""
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
 from typeguard import typechecked
 
-from snncompare.import_results.load_stage4 import load_stage4_results
 from snncompare.run_config.Run_config import Run_config
 
 # from dash.dependencies import Input, Output
@@ -12,33 +11,6 @@ if TYPE_CHECKING:
     from snncompare.process_results.Table_settings import Failure_mode_entry
 
 
-@typechecked
-def append_failure_mode(
-    first_timestep_only: bool,
-    failure_mode_entry: "Failure_mode_entry",
-    failure_mode_entries: List["Failure_mode_entry"],
-) -> None:
-    """If first_timestep only, this function checks whether this timestep
-    already contains a failure mode for the run_config within the failure mode.
-
-    If yes, it does not add anything, otherwise it adds the failure mode
-    to the list of failure modes.
-    """
-    if first_timestep_only:
-        found_entry: bool = False
-        for found_failure_mode in failure_mode_entries:
-            if (
-                failure_mode_entry.run_config.unique_id
-                == found_failure_mode.run_config.unique_id
-            ):
-                found_entry = True
-                break
-        if not found_entry:
-            failure_mode_entries.append(failure_mode_entry)
-    else:
-        failure_mode_entries.append(failure_mode_entry)
-
-
 @typechecked
 def get_adaptation_names(
     run_configs: List[Run_config],
@@ -139,10 +111,7 @@ def apply_cell_formatting(
     else:
         cell_element = failure_mode.run_config.unique_id
 
-    if graph_of_run_config_passed(
-        graph_name="rad_adapted_snn_graph",
-        run_config=failure_mode.run_config,
-    ):
+    if failure_mode.passed:
         cell_element = f'<FONT COLOR="#008000">{cell_element}</FONT>'  # green
     else:
         cell_element = f'<FONT COLOR="#FF0000">{cell_element}</FONT>'  # red
@@ -177,6 +146,44 @@ def convert_table_dict_to_table(
     return rows
 
 
+@typechecked
+def convert_table_to_records(
+    *,
+    table: List[List[Union[List[str], str]]],
+) -> Tuple[Dict[str, str], ...]:
+    """Converts a table in format: lists of lists, with the header as first
+    row, into a record per row, with the html of the cell per column."""
+    header: List[str] = [str(column_head) for column_head in table[0]]
+    return tuple(
+        {
+            column_head: cell if isinstance(cell, str) else "".join(cell)
+            for column_head, cell in zip(header, row)
+        }
+        for row in table[1:]
+    )
+
+
+@typechecked
+def get_table_page(
+    *,
+    records: Tuple[Dict[str, str], ...],
+    page_current: int,
+    page_size: int,
+) -> Tuple[List[Dict[str, str]], int, int]:
+    """Returns the records of a page, the number of pages, and the index of
+    the page, which is moved to the last page if the table became
+    shorter."""
+    page_count: int = max(1, -(-len(records) // page_size))
+    page_current = min(max(page_current, 0), page_count - 1)
+    start: int = page_current * page_size
+    end: int = start + page_size
+    return (
+        list(records[start:end]),
+        page_count,
+        page_current,
+    )
+
+
 # pylint: disable=R0914
 @typechecked
 def get_table_columns(
@@ -190,29 +197,3 @@ def get_table_columns(
     for i, column_head in enumerate(header):
         column_header.append({"id": i, "name": column_head})
     return column_header
-
-
-@typechecked
-def graph_of_run_config_passed(
-    *,
-    graph_name: str,
-    run_config: Run_config,
-) -> bool:
-    """Returns True if the snn graph of the run config fails, True if it
-    passes."""
-    # TODO: determine whether run passed or not.
-
-    stage_4_results_dict = load_stage4_results(
-        run_config=run_config,
-        stage_4_results_dict=None,
-    )
-
-    results_dict: Dict[str, Union[float, bool]] = stage_4_results_dict[
-        graph_name
-    ].network.graph.graph["results"]
-
-    print(results_dict)
-    if not isinstance(results_dict["passed"], bool):
-        raise ValueError("Error, pass/fail was expected to be True or False.")
-
-    return bool(results_dict["passed"])
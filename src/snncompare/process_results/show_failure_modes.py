@@ -1,21 +1,20 @@
 """Computes what the failure modes were, and then stores this data in the
 graphs."""
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
 
 import dash
 import dash_daq as daq
-import pandas as pd
-from dash import Input, Output, dcc, html
-from dash.dcc.Markdown import Markdown
-from pandas import DataFrame
-from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
+from dash import Input, Output, dash_table, dcc, html
 from typeguard import typechecked
 
 from snncompare.exp_config import Exp_config
 from snncompare.process_results.helper import (
     convert_failure_modes_to_table_dict,
     convert_table_dict_to_table,
+    convert_table_to_records,
     get_adaptation_names,
+    get_table_page,
 )
 from snncompare.process_results.Table_settings import (
     Failure_mode_entry,
@@ -23,6 +22,11 @@ from snncompare.process_results.Table_settings import (
 )
 from snncompare.run_config.Run_config import Run_config
 
+# The number of rows that is sent to the browser per page of the table.
+TABLE_PAGE_SIZE: int = 50
+# The number of filter settings whose table is kept in memory.
+TABLE_CACHE_SIZE: int = 32
+
 
 # pylint: disable=R0914
 @typechecked
@@ -41,23 +45,20 @@ def show_failures(
 
     app = dash.Dash(__name__)
     app.scripts.config.serve_locally = True
+    adaptation_names: List[str] = get_adaptation_names(run_configs=run_configs)
 
-    @typechecked
-    def update_table(
-        *,
+    # pylint: disable=R0913
+    @lru_cache(maxsize=TABLE_CACHE_SIZE)
+    def get_table_records(
         algorithm_setting: str,
         first_timestep_only: bool,
         seed: int,
         graph_size: int,
-        table_settings: Table_settings,
         show_run_configs: bool,
         show_spike_failures: bool,
-    ) -> DataFrame:
-        """Updates the displayed table."""
-        adaptation_names: List[str] = get_adaptation_names(
-            run_configs=run_configs
-        )
-
+    ) -> Tuple[Dict[str, str], ...]:
+        """Returns the rows of the table of the filter settings, which are
+        memoised per filter settings."""
         failure_mode_entries: List[
             Failure_mode_entry
         ] = table_settings.get_failure_mode_entries(
@@ -75,26 +76,12 @@ def show_failures(
             show_run_configs=show_run_configs,
         )
 
-        table: List[List[str]] = convert_table_dict_to_table(
+        table: List[List[Union[List[str], str]]] = convert_table_dict_to_table(
             adaptation_names=adaptation_names,
             table=table_dict,
         )
-        updated_df = pd.DataFrame.from_records(table)
-        return updated_df
+        return convert_table_to_records(table=table)
 
-    # table,columns=update_table(seed=8,graph_size=3)
-    # df,columns=update_table(seed=8,graph_size=3)
-    initial_df = update_table(
-        algorithm_setting=get_algorithm_setting_name(
-            algorithm_setting=run_configs[0].algorithm
-        ),
-        first_timestep_only=True,
-        graph_size=run_configs[0].graph_size,
-        table_settings=table_settings,
-        seed=run_configs[0].seed,
-        show_run_configs=False,
-        show_spike_failures=True,
-    )
     app.layout = html.Div(
         [
             # Include dropdown
@@ -190,24 +177,35 @@ def show_failures(
                 ]
             ),
             html.Br(),
-            html.Div(
+            # Only the rows of the current page are sent to the browser.
+            dash_table.DataTable(
                 id="table",
-                children=[
-                    dcc.Markdown(
-                        dangerously_allow_html=True,
-                        children=initial_df.to_html(escape=False),
-                    )
+                columns=[
+                    {"id": column_head, "name": column_head}
+                    if column_head == "Timestep"
+                    else {
+                        "id": column_head,
+                        "name": column_head,
+                        "presentation": "markdown",
+                    }
+                    for column_head in ["Timestep"] + adaptation_names
                 ],
+                markdown_options={"html": True},
+                page_action="custom",
+                page_current=0,
+                page_size=TABLE_PAGE_SIZE,
+                style_cell={"textAlign": "left", "verticalAlign": "top"},
             ),
         ]
     )
 
     @app.callback(
         [
-            Output("table", "children"),
+            Output("table", "data"),
+            Output("table", "page_count"),
+            Output("table", "page_current"),
             Output("show_run_configs_div", "children"),
         ],
-        # [Output("table", "data")],
         [
             Input("alg_setting_selector_id", "value"),
             Input("seed_selector_id", "value"),
@@ -215,6 +213,8 @@ def show_failures(
             Input("show_run_configs", "on"),
             Input("show_spike_failures", "on"),
             Input("first_timestep_only", "on"),
+            Input("table", "page_current"),
+            Input("table", "page_size"),
         ],
     )
     @typechecked
@@ -226,30 +226,23 @@ def show_failures(
         show_run_configs: bool,
         show_spike_failures: bool,
         first_timestep_only: bool,
-    ) -> List[Markdown]:
-        """Updates the table with failure modes based on the user settings."""
-        print(
-            f"algorithm_setting={algorithm_setting}"
-            + f"seed={seed}, graph_size={graph_size}, show_run_configs="
-            + f"{show_run_configs}, show_spike_failures={show_spike_failures}"
-            + f"first_timestep_only={first_timestep_only}"
-        )
-
-        new_df = update_table(
-            algorithm_setting=algorithm_setting,
-            first_timestep_only=first_timestep_only,
-            graph_size=graph_size,
-            table_settings=table_settings,
-            seed=seed,
-            show_run_configs=show_run_configs,
-            show_spike_failures=show_spike_failures,
-        )
-        return [
-            dcc.Markdown(
-                dangerously_allow_html=True,
-                children=new_df.to_html(escape=False),
+        page_current: int,
+        page_size: int,
+    ) -> List:
+        """Updates the page of the table with failure modes based on the user
+        settings."""
+        page_records, page_count, page_current = get_table_page(
+            records=get_table_records(
+                algorithm_setting,
+                first_timestep_only,
+                seed,
+                graph_size,
+                show_run_configs,
+                show_spike_failures,
             ),
-            show_run_configs,
-        ]
+            page_current=page_current,
+            page_size=page_size,
+        )
+        return [page_records, page_count, page_current, show_run_configs]
 
     app.run_server(port=8053)
@@ -0,0 +1,143 @@
+"""Measures the runtime per stage of an experiment in the checked and fast
+execution profiles, to show the overhead of the runtime type checking on
+the hot paths.
+
+Each profile runs the experiment in a separate process (the profile is
+selected when the modules are imported), in an empty temporary working
+directory, such that stages 1, 2 and 4 are computed, and the results and
+run metrics of the user are not touched. The per stage durations are read
+from the run metrics in the temporary directory.
+"""
+import json
+import os
+import shutil
+import subprocess  # nosec
+import sys
+import tempfile
+from typing import Dict, List
+
+from typeguard import typechecked
+
+import snncompare
+from snncompare.export_results.output_run_metrics import RUN_METRICS_DIR
+from snncompare.typecheck_profile import PROFILE_ENV_VAR, PROFILES
+
+
+@typechecked
+def get_summed_stage_durations(
+    *, run_metrics_dir: str = RUN_METRICS_DIR
+) -> Dict[int, float]:
+    """Returns the total duration per stage over the run metrics files."""
+    summed_durations: Dict[int, float] = {}
+    if not os.path.isdir(run_metrics_dir):
+        return summed_durations
+    for filename in sorted(os.listdir(run_metrics_dir)):
+        if not filename.endswith(".json"):
+            continue
+        with open(
+            os.path.join(run_metrics_dir, filename), encoding="utf-8"
+        ) as json_file:
+            run_metrics: Dict = json.load(json_file)
+            json_file.close()
+        for stage_index, duration in run_metrics["stage_durations"].items():
+            summed_durations[int(stage_index)] = (
+                summed_durations.get(int(stage_index), 0.0) + duration
+            )
+    return summed_durations
+
+
+@typechecked
+def get_package_parent_dir() -> str:
+    """Returns the directory that contains the snncompare package, such that
+    it can be imported from another working directory."""
+    return os.path.dirname(
+        os.path.dirname(os.path.abspath(snncompare.__file__))
+    )
+
+
+@typechecked
+def copy_exp_config_file(
+    *, custom_config_path: str, exp_config_name: str, tmp_dir: str
+) -> None:
+    """Copies the experiment config file to the same relative path in the
+    temporary working directory of a benchmark run."""
+    if os.path.isabs(custom_config_path):
+        return
+    relative_filepath: str = os.path.join(
+        custom_config_path, "exp_config", f"{exp_config_name}.json"
+    )
+    tmp_filepath: str = os.path.join(tmp_dir, relative_filepath)
+    os.makedirs(os.path.dirname(tmp_filepath), exist_ok=True)
+    shutil.copyfile(relative_filepath, tmp_filepath)
+
+
+@typechecked
+def run_experiment_in_profile(
+    *,
+    profile: str,
+    cli_args: List[str],
+    custom_config_path: str,
+    exp_config_name: str,
+) -> Dict[int, float]:
+    """Runs the experiment in a separate process with the given profile, in
+    an empty temporary working directory, and returns its total duration per
+    stage."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_exp_config_file(
+            custom_config_path=custom_config_path,
+            exp_config_name=exp_config_name,
+            tmp_dir=tmp_dir,
+        )
+        python_path: List[str] = [get_package_parent_dir()]
+        if os.environ.get("PYTHONPATH"):
+            python_path.append(os.environ["PYTHONPATH"])
+        subprocess.run(  # nosec
+            [sys.executable, "-m", "snncompare", "-r1", "-r2", "-r4"]
+            + ["-e", exp_config_name]
+            + cli_args,
+            cwd=tmp_dir,
+            env=dict(
+                os.environ,
+                **{
+                    PROFILE_ENV_VAR: profile,
+                    "PYTHONPATH": os.pathsep.join(python_path),
+                },
+            ),
+            check=True,
+        )
+        return get_summed_stage_durations(
+            run_metrics_dir=os.path.join(tmp_dir, RUN_METRICS_DIR)
+        )
+
+
+@typechecked
+def benchmark_profiles(
+    *, cli_args: List[str], custom_config_path: str, exp_config_name: str
+) -> Dict[str, Dict[int, float]]:
+    """Returns the total duration per stage of the experiment, per
+    profile."""
+    return {
+        profile: run_experiment_in_profile(
+            profile=profile,
+            cli_args=cli_args,
+            custom_config_path=custom_config_path,
+            exp_config_name=exp_config_name,
+        )
+        for profile in PROFILES
+    }
+
+
+@typechecked
+def print_profile_benchmark(
+    *, profile_durations: Dict[str, Dict[int, float]]
+) -> None:
+    """Prints the duration per stage per profile, and the time saved by the
+    fast profile."""
+    print(f"{'stage':>5} {'checked [s]':>12} {'fast [s]':>12} {'saved':>8}")
+    for stage_index in sorted(profile_durations["checked"].keys()):
+        checked: float = profile_durations["checked"][stage_index]
+        fast: float = profile_durations["fast"].get(stage_index, 0.0)
+        saved: float = 100 * (checked - fast) / checked if checked else 0.0
+        print(
+            f"{stage_index:>5} {checked:>12.3f} {fast:>12.3f} {saved:>7.1f}%"
+        )
@@ -0,0 +1,619 @@
+"""Measures the runtime of the operations of each pipeline stage, per graph
+size and m_val, and compares these runtimes against a stored baseline to
+detect performance regressions.
+
+The benchmark runs offline: it writes a seeded, synthetic (connected) input
+graph per graph size, and performs the runs in a temporary working
+directory, such that the results directory of the user is not touched. Each
+repetition runs in a separate process with that working directory, because
+changing the working directory of this process would also redirect the
+writes of its (background writer) threads. The median duration per
+operation is stored in a json file, e.g. results/benchmarks/baseline.json.
+
+The operations after the simulation use the simsnn output files, so for
+other simulators only the stage 1 construction and the simulation are
+timed.
+"""
+import copy
+import json
+import os
+import platform
+import statistics
+import subprocess  # nosec
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TypeVar, Union
+
+import networkx as nx
+from simsnn.core.simulators import Simulator
+from snnbackends.simsnn.simsnn_to_nx_lif import (
+    add_simsnn_simulation_data_to_reconstructed_nx_lif,
+    simsnn_graph_to_nx_lif_graph,
+)
+from snnradiation.apply_rad_to_simsnn import apply_synapse_weight_increase_rad
+from typeguard import typechecked
+
+from snncompare.create_configs import generate_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.export_plots.Plot_config import (
+    Plot_config,
+    get_default_plot_config,
+)
+from snncompare.export_plots.store_plot_data_in_graph import (
+    store_temporal_plot_params_in_graph,
+)
+from snncompare.export_plots.temp_default_output_creation import (
+    create_default_output_config,
+)
+from snncompare.export_plots.temporal_frames import (
+    apply_temporal_frame,
+    create_figure_with_temporal_frames,
+)
+from snncompare.export_results.analysis.create_performance_plots import (
+    boxplot_data_to_y_series,
+    get_boxplot_datapoints,
+)
+from snncompare.export_results.async_writer import flush_writes
+from snncompare.export_results.file_locks import atomic_write_bytes
+from snncompare.export_results.output_stage1_configs_and_input_graph import (
+    output_stage_1_configs_and_input_graphs,
+)
+from snncompare.export_results.output_stage1_snn_graphs import (
+    output_stage_1_snns,
+)
+from snncompare.export_results.output_stage2_snns import output_stage_2_snns
+from snncompare.export_results.output_stage4_results import output_snn_results
+from snncompare.graph_generation.export_input_graphs import (
+    output_input_graph_if_not_exist,
+)
+from snncompare.graph_generation.stage_1_create_graphs import (
+    get_graphs_stage_1,
+)
+from snncompare.helper import (
+    add_stage_completion_to_graph,
+    get_some_duration,
+    get_with_adaptation_bool,
+    get_with_radiation_bool,
+)
+from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
+from snncompare.optional_config.Output_config import Output_config
+from snncompare.process_results.get_failure_modes import (
+    add_failure_modes_to_graph,
+)
+from snncompare.process_results.process_results import set_results
+from snncompare.progress_report.benchmark_profiles import (
+    get_package_parent_dir,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.add_radiation_graphs import (
+    ensure_empty_rad_snns_exist,
+)
+from snncompare.simulation.stage2_sim import sim_snn
+
+# The file in which a benchmark process stores the durations of a repetition.
+REPETITION_FILENAME: str = "repetition_durations.json"
+# The output of a timed operation.
+Output = TypeVar("Output")
+
+
+@typechecked
+def get_benchmark_exp_config(
+    *,
+    graph_sizes: List[int],
+    m_vals: List[int],
+    seed: int,
+    simulators: List[str],
+) -> Exp_config:
+    """Returns the experiment config with a single adaptation, radiation and
+    input graph per graph size, for the benchmarked graph sizes and
+    m_vals."""
+    return Exp_config(
+        adaptations={"redundancy": [2]},
+        algorithms={"MDSA": [{"m_val": m_val} for m_val in m_vals]},
+        max_graph_size=max(graph_sizes),
+        max_max_graphs=1,
+        min_graph_size=min(graph_sizes),
+        min_max_graphs=1,
+        neuron_models=["LIF"],
+        radiations={
+            "change_u": {
+                "amplitude": [1],
+                "excitatory": [True],
+                "inhibitory": [False],
+                "probability_per_t": [0.001],
+            }
+        },
+        seeds=[seed],
+        simulators=simulators,
+        size_and_max_graphs=[(graph_size, 1) for graph_size in graph_sizes],
+        synaptic_models=["LIF"],
+    )
+
+
+@typechecked
+def create_synthetic_input_graph(*, graph_size: int, seed: int) -> nx.Graph:
+    """Returns a random connected input graph, which is reproducible for the
+    graph size and seed."""
+    attempt: int = 0
+    while True:
+        input_graph: nx.Graph = nx.gnp_random_graph(
+            graph_size, 0.5, seed=seed * 1000 + attempt
+        )
+        if nx.is_connected(input_graph):
+            return input_graph
+        attempt += 1
+
+
+@typechecked
+def time_operation(
+    *,
+    durations: Dict[str, float],
+    operation: str,
+    func: Callable[[], Output],
+) -> Output:
+    """Runs the function, adds its duration to the durations of the
+    operation, and returns its output."""
+    start: float = time.perf_counter()
+    output: Output = func()
+    durations[operation] = (
+        durations.get(operation, 0.0) + time.perf_counter() - start
+    )
+    return output
+
+
+# pylint: disable=R0914
+@typechecked
+def benchmark_run_config(
+    *,
+    exp_config: Exp_config,
+    output_config: Output_config,
+    plot_config: Plot_config,
+    run_config: Run_config,
+) -> Dict[str, float]:
+    """Performs stages 1, 2, 4 and 7 of a run in the way the
+    Experiment_runner does, creates its stage 3 frames, and returns the
+    duration per operation."""
+    durations: Dict[str, float] = {}
+    graphs_dict: Dict = time_operation(
+        durations=durations,
+        operation="stage_1_construction",
+        func=lambda: get_graphs_stage_1(
+            plot_config=plot_config, run_config=run_config
+        ),
+    )
+    for snn in graphs_dict.values():
+        add_stage_completion_to_graph(snn=snn, stage_index=1)
+
+    if run_config.simulator != "simsnn":
+        time_simulations(
+            durations=durations, graphs_dict=graphs_dict, run_config=run_config
+        )
+        return durations
+
+    output_stage_1_configs_and_input_graphs(
+        exp_config=exp_config,
+        run_config=run_config,
+        graphs_dict=graphs_dict,
+    )
+    for with_adaptation in [False, True]:
+        output_stage_1_snns(
+            run_config=run_config,
+            graphs_dict=graphs_dict,
+            with_adaptation=with_adaptation,
+        )
+
+    time_operation(
+        durations=durations,
+        operation="radiation",
+        func=lambda: apply_radiation_to_rad_snns(
+            graphs_dict=graphs_dict, run_config=run_config
+        ),
+    )
+    time_simulations(
+        durations=durations, graphs_dict=graphs_dict, run_config=run_config
+    )
+    for snn in graphs_dict.values():
+        add_stage_completion_to_graph(snn=snn, stage_index=2)
+
+    def export_stage_2() -> None:
+        output_stage_2_snns(
+            graphs_dict=graphs_dict,
+            output_config=output_config,
+            run_config=run_config,
+        )
+        flush_writes()
+
+    time_operation(
+        durations=durations, operation="stage_2_export", func=export_stage_2
+    )
+    time_operation(
+        durations=durations,
+        operation="stage_2_import",
+        func=lambda: load_stage_2_snns(
+            graphs_dict=graphs_dict, run_config=run_config
+        ),
+    )
+    time_operation(
+        durations=durations,
+        operation="set_results",
+        func=lambda: set_results(
+            exp_config=exp_config,
+            output_config=output_config,
+            run_config=run_config,
+            stage_2_graphs=graphs_dict,
+        ),
+    )
+    time_operation(
+        durations=durations,
+        operation="failure_modes",
+        func=lambda: add_failure_modes_to_graph(
+            snn_graphs=graphs_dict, run_config=run_config
+        ),
+    )
+
+    output_snn_results(
+        output_data_type="results",
+        run_config=run_config,
+        graphs_dict=graphs_dict,
+        stage_index=4,
+    )
+    flush_writes()
+    time_operation(
+        durations=durations,
+        operation="performance_plot_aggregation",
+        func=lambda: boxplot_data_to_y_series(
+            boxplot_data=get_boxplot_datapoints(
+                adaptations=exp_config.adaptations,
+                wanted_run_configs=[run_config],
+                seeds=exp_config.seeds,
+            )
+        ),
+    )
+    time_operation(
+        durations=durations,
+        operation="stage_3_frames",
+        func=lambda: create_stage_3_frames(
+            output_config=output_config,
+            plot_config=plot_config,
+            run_config=run_config,
+            simsnn=graphs_dict["snn_algo_graph"],
+        ),
+    )
+    return durations
+
+
+@typechecked
+def time_simulations(
+    *, durations: Dict[str, float], graphs_dict: Dict, run_config: Run_config
+) -> None:
+    """Simulates the snns, and adds their summed duration to the durations."""
+    for graph_name, snn in graphs_dict.items():
+        if graph_name != "input_graph":
+            time_operation(
+                durations=durations,
+                operation="simulation",
+                func=partial(
+                    sim_snn,
+                    input_graph=graphs_dict["input_graph"],
+                    snn=snn,
+                    run_config=run_config,
+                ),
+            )
+
+
+@typechecked
+def apply_radiation_to_rad_snns(
+    *, graphs_dict: Dict, run_config: Run_config
+) -> None:
+    """Creates the radiated snns and applies the radiation to them, like
+    stage 2 does before the simulation."""
+    ensure_empty_rad_snns_exist(
+        run_config=run_config, stage_1_graphs=graphs_dict
+    )
+    for graph_name, snn in graphs_dict.items():
+        if graph_name[:4] == "rad_":
+            apply_synapse_weight_increase_rad(
+                est_sim_duration=graphs_dict[
+                    graph_name[4:]
+                ].network.graph.graph["actual_duration"],
+                ignored_neuron_names=[],
+                rad=run_config.radiation,
+                seed=run_config.seed,
+                snn=snn,
+            )
+
+
+@typechecked
+def load_stage_2_snns(*, graphs_dict: Dict, run_config: Run_config) -> None:
+    """Loads the stage 2 output of the snns from file."""
+    for graph_name in graphs_dict.keys():
+        if graph_name != "input_graph":
+            load_simsnn_graphs(
+                run_config=run_config,
+                input_graph=graphs_dict["input_graph"],
+                with_adaptation=get_with_adaptation_bool(
+                    graph_name=graph_name
+                ),
+                with_radiation=get_with_radiation_bool(graph_name=graph_name),
+                stage_index=2,
+            )
+
+
+@typechecked
+def create_stage_3_frames(
+    *,
+    output_config: Output_config,
+    plot_config: Plot_config,
+    run_config: Run_config,
+    simsnn: Simulator,
+) -> None:
+    """Creates the dash figure of an snn and updates it to each timestep,
+    without storing or showing it."""
+    nx_snn: nx.DiGraph = simsnn_graph_to_nx_lif_graph(simsnn=simsnn)
+    add_simsnn_simulation_data_to_reconstructed_nx_lif(
+        nx_snn=nx_snn, simsnn=simsnn
+    )
+    plotted_graph: nx.DiGraph = nx.DiGraph()
+    store_temporal_plot_params_in_graph(
+        hover_info=output_config.hover_info,
+        plotted_graph=plotted_graph,
+        snn_graph=nx_snn,
+        sim_duration=get_some_duration(
+            simulator=run_config.simulator,
+            snn_graph=simsnn,
+            duration_name="actual_duration",
+        ),
+    )
+    dash_figure, temporal_frames = create_figure_with_temporal_frames(
+        plotted_graph=plotted_graph, plot_config=plot_config
+    )
+    for t in range(temporal_frames.nr_of_timesteps):
+        apply_temporal_frame(
+            dash_figure=dash_figure,
+            plot_config=plot_config,
+            temporal_frames=temporal_frames,
+            t=t,
+        )
+
+
+@typechecked
+def get_benchmark_case_name(*, run_config: Run_config) -> str:
+    """Returns the name under which the durations of a run are stored."""
+    return (
+        f"{run_config.simulator}_size_{run_config.graph_size}_m_"
+        + f'{run_config.algorithm["MDSA"]["m_val"]}'
+    )
+
+
+@typechecked
+def benchmark_repetition(
+    *,
+    graph_sizes: List[int],
+    m_vals: List[int],
+    seed: int,
+    simulators: List[str],
+) -> Dict[str, Dict[str, float]]:
+    """Returns the duration per operation of each benchmarked run, with the
+    outputs stored in the current working directory."""
+    exp_config: Exp_config = get_benchmark_exp_config(
+        graph_sizes=graph_sizes,
+        m_vals=m_vals,
+        seed=seed,
+        simulators=simulators,
+    )
+    output_config: Output_config = create_default_output_config(
+        exp_config=exp_config
+    )
+    output_config.extra_storing_config.skip_stage_2_output = False
+    plot_config: Plot_config = get_default_plot_config()
+
+    for graph_size in graph_sizes:
+        output_input_graph_if_not_exist(
+            input_graph=create_synthetic_input_graph(
+                graph_size=graph_size, seed=seed
+            )
+        )
+    return {
+        get_benchmark_case_name(run_config=run_config): benchmark_run_config(
+            exp_config=exp_config,
+            output_config=copy.deepcopy(output_config),
+            plot_config=plot_config,
+            run_config=run_config,
+        )
+        for run_config in generate_run_configs(exp_config=exp_config)
+    }
+
+
+@typechecked
+def run_benchmark_repetition(
+    *,
+    graph_sizes: List[int],
+    m_vals: List[int],
+    seed: int,
+    simulators: List[str],
+) -> Dict[str, Dict[str, float]]:
+    """Performs a repetition of the benchmark in a separate process, in an
+    empty temporary working directory, and returns its durations.
+
+    The working directory is only changed for that process, such that the
+    (writer threads of the) calling process keep their working directory.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env: Dict[str, str] = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [get_package_parent_dir()]
+            + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        subprocess.run(  # nosec
+            [
+                sys.executable,
+                "-m",
+                "snncompare.progress_report.benchmark_stages",
+                json.dumps(
+                    {
+                        "graph_sizes": graph_sizes,
+                        "m_vals": m_vals,
+                        "seed": seed,
+                        "simulators": simulators,
+                    }
+                ),
+            ],
+            check=True,
+            cwd=tmp_dir,
+            env=env,
+        )
+        with open(
+            os.path.join(tmp_dir, REPETITION_FILENAME), encoding="utf-8"
+        ) as json_file:
+            durations: Dict[str, Dict[str, float]] = json.load(json_file)
+            json_file.close()
+    return durations
+
+
+# pylint: disable=R0913
+@typechecked
+def benchmark_stages(
+    *,
+    graph_sizes: List[int],
+    m_vals: List[int],
+    repetitions: int,
+    seed: int = 7,
+    simulators: Optional[List[str]] = None,
+) -> Dict:
+    """Returns the median duration per operation, per benchmarked graph size,
+    m_val and simulator."""
+    if repetitions < 1:
+        raise ValueError("Error, repetitions should be >0.")
+    if simulators is None:
+        simulators = ["simsnn"]
+    measured: Dict[str, Dict[str, List[float]]] = {}
+    for _ in range(repetitions):
+        for case_name, durations in run_benchmark_repetition(
+            graph_sizes=graph_sizes,
+            m_vals=m_vals,
+            seed=seed,
+            simulators=simulators,
+        ).items():
+            case: Dict[str, List[float]] = measured.setdefault(case_name, {})
+            for operation, duration in durations.items():
+                case.setdefault(operation, []).append(duration)
+
+    return {
+        "metadata": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.node(),
+            "graph_sizes": graph_sizes,
+            "m_vals": m_vals,
+            "repetitions": repetitions,
+            "seed": seed,
+            "simulators": simulators,
+        },
+        "durations": {
+            case_name: {
+                operation: statistics.median(operation_durations)
+                for operation, operation_durations in case.items()
+            }
+            for case_name, case in measured.items()
+        },
+    }
+
+
+@typechecked
+def store_benchmark(*, benchmark: Dict, filepath: str) -> None:
+    """Stores the benchmark durations in a json file."""
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(
+        filepath=filepath,
+        some_bytes=json.dumps(benchmark, indent=2).encode("utf-8"),
+    )
+
+
+@typechecked
+def load_benchmark(*, filepath: str) -> Dict:
+    """Loads the benchmark durations from a json file."""
+    if not Path(filepath).is_file():
+        raise FileNotFoundError(f"Error, benchmark:{filepath} not found.")
+    with open(filepath, encoding="utf-8") as json_file:
+        benchmark: Dict = json.load(json_file)
+        json_file.close()
+    return benchmark
+
+
+@typechecked
+def compare_benchmarks(
+    *,
+    baseline: Dict,
+    current: Dict,
+    threshold: float,
+    min_duration: float = 0.001,
+) -> List[Dict[str, Union[str, float]]]:
+    """Returns the operations that are more than the threshold fraction slower
+    than in the baseline. Operations that took less than min_duration [s] in
+    the baseline are skipped, as their timing is mostly noise."""
+    if threshold < 0:
+        raise ValueError("Error, threshold should be >=0.")
+    regressions: List[Dict[str, Union[str, float]]] = []
+    for case_name, operations in sorted(current["durations"].items()):
+        baseline_operations: Dict[str, float] = baseline["durations"].get(
+            case_name, {}
+        )
+        for operation, duration in sorted(operations.items()):
+            if operation not in baseline_operations:
+                continue
+            baseline_duration: float = baseline_operations[operation]
+            if baseline_duration < min_duration:
+                continue
+            if duration > baseline_duration * (1 + threshold):
+                regressions.append(
+                    {
+                        "case": case_name,
+                        "operation": operation,
+                        "baseline": baseline_duration,
+                        "current": duration,
+                        "slowdown": duration / baseline_duration - 1,
+                    }
+                )
+    return regressions
+
+
+@typechecked
+def print_benchmark_regressions(
+    *,
+    regressions: List[Dict[str, Union[str, float]]],
+    threshold: float,
+) -> None:
+    """Prints the operations that are slower than in the baseline."""
+    if not regressions:
+        print(f"No operations are more than {100*threshold:.0f}% slower.")
+        return
+    print(
+        f"{len(regressions)} operations are more than {100*threshold:.0f}% "
+        + "slower than the baseline:"
+    )
+    print(
+        f"{'case':<24} {'operation':<30} {'baseline [s]':>12} "
+        + f"{'current [s]':>12} {'slower':>8}"
+    )
+    for regression in regressions:
+        print(
+            f"{regression['case']:<24} {regression['operation']:<30} "
+            + f"{regression['baseline']:>12.4f} "
+            + f"{regression['current']:>12.4f} "
+            + f"{100*float(regression['slowdown']):>7.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    # Performs a repetition of the benchmark in the working directory, see:
+    # run_benchmark_repetition.
+    atomic_write_bytes(
+        filepath=REPETITION_FILENAME,
+        some_bytes=json.dumps(
+            benchmark_repetition(**json.loads(sys.argv[1]))
+        ).encode("utf-8"),
+    )
@@ -0,0 +1,501 @@
+"""Estimates the cost of running an experiment configuration before it is
+started.
+
+For each run config of the experiment, the number of neurons, synapses and
+simulated timesteps of its 4 snn graphs are predicted with a first-order
+model of the MDSA snn. These predictions are converted into disk bytes per
+stage and wall time with coefficients that are calibrated against the run
+metrics that completed runs wrote into results/run_metrics/.
+"""
+import json
+import os
+from typing import Dict, List, Tuple
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.create_configs import exp_config_to_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.export_results.output_run_metrics import RUN_METRICS_DIR
+from snncompare.graph_generation.export_input_graphs import (
+    has_outputted_input_graph_for_graph_size_and_nr,
+    load_input_graph_based_on_nr,
+)
+from snncompare.helper import (
+    get_max_sim_duration,
+    get_snn_graph_names,
+    get_with_adaptation_bool,
+    get_with_radiation_bool,
+)
+from snncompare.import_results.helper import get_algorithm_description
+from snncompare.run_config.Run_config import Run_config
+
+
+# pylint: disable=R0902
+# pylint: disable=R0903
+class Cost_calibration:
+    """Stores the coefficients that convert predicted snn sizes into disk
+    bytes and wall time.
+
+    The default values are rough measurements of the simsnn backend with
+    indent=4 json output, they are overwritten by
+    calibrate_from_run_metrics if completed runs are available.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        neuron_scale: float = 1.0,
+        synapse_scale: float = 1.0,
+        bytes_per_element_stage_1: float = 250.0,
+        bytes_per_neuron_timestep_stage_2: float = 60.0,
+        bytes_per_graph_stage_4: float = 2000.0,
+        seconds_per_element_stage_1: float = 5e-5,
+        seconds_per_element_timestep: float = 2e-6,
+        seconds_per_graph_stage_4: float = 0.05,
+        default_edge_density: float = 0.5,
+    ) -> None:
+        self.neuron_scale: float = neuron_scale
+        self.synapse_scale: float = synapse_scale
+        self.bytes_per_element_stage_1: float = bytes_per_element_stage_1
+        self.bytes_per_neuron_timestep_stage_2: float = (
+            bytes_per_neuron_timestep_stage_2
+        )
+        self.bytes_per_graph_stage_4: float = bytes_per_graph_stage_4
+        self.seconds_per_element_stage_1: float = seconds_per_element_stage_1
+        self.seconds_per_element_timestep: float = seconds_per_element_timestep
+        self.seconds_per_graph_stage_4: float = seconds_per_graph_stage_4
+        self.default_edge_density: float = default_edge_density
+        self.nr_of_calibration_runs: int = 0
+
+
+# pylint: disable=R0902
+# pylint: disable=R0903
+class Run_cost_estimate:
+    """Stores the predicted cost of a single run config, summed over its snn
+    graphs."""
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        cell: Tuple[str, int, str, int],
+        neurons: int,
+        synapses: int,
+        timesteps: int,
+        disk_bytes: Dict[int, int],
+        wall_time: float,
+    ) -> None:
+        # The cell is: (algorithm name, algorithm parameter, adaptation,
+        # graph size).
+        self.cell: Tuple[str, int, str, int] = cell
+        self.neurons: int = neurons
+        self.synapses: int = synapses
+        self.timesteps: int = timesteps
+        self.disk_bytes: Dict[int, int] = disk_bytes
+        self.wall_time: float = wall_time
+
+
+@typechecked
+def predict_mdsa_snn_size(
+    *,
+    graph_size: int,
+    m_val: int,
+    nr_of_edges: int,
+) -> Tuple[float, float]:
+    """Returns the predicted number of neurons and synapses of an unadapted
+    MDSA snn.
+
+    Neurons: a spike_once, rand and counter neuron per node, a selector
+    neuron per node per round, a degree_receiver per directed edge per
+    round, a next_round neuron per round, a connecting- and terminator
+    neuron. Synapses: the degree_receivers of a node inhibit each other
+    (avg. degree squared per node), and excite/are excited by the spike_once,
+    rand and selector neurons.
+    """
+    rounds: int = m_val + 1
+    directed_edges: int = 2 * nr_of_edges
+    neurons: float = (
+        2 + m_val + 3 * graph_size + rounds * (graph_size + directed_edges)
+    )
+    avg_degree: float = directed_edges / max(graph_size, 1)
+    synapses: float = (
+        rounds
+        * (3 * directed_edges + graph_size * avg_degree**2 + graph_size)
+        + 3 * graph_size
+    )
+    return neurons, synapses
+
+
+@typechecked
+def get_adaptation_multipliers(
+    *, adaptation_type: str, redundancy: int
+) -> Tuple[int, int]:
+    """Returns the factor with which the adaptation multiplies the neurons
+    and synapses of the snn.
+
+    Each neuron gets redundancy copies, and each synapse is duplicated
+    between all copies of its pre- and post synaptic neuron.
+    """
+    if adaptation_type in ["redundancy", "population"]:
+        return redundancy + 1, (redundancy + 1) ** 2
+    raise NotImplementedError(
+        f"Error, adaptation_type:{adaptation_type} is not supported."
+    )
+
+
+@typechecked
+def get_adaptation_label(*, run_config: Run_config) -> str:
+    """Returns the adaptation name as it is used in the results dirs."""
+    return (
+        f"{run_config.adaptation.adaptation_type}_"
+        + f"{run_config.adaptation.redundancy}"
+    )
+
+
+@typechecked
+def get_nr_of_input_graph_edges(
+    *,
+    calibration: Cost_calibration,
+    graph_size: int,
+    graph_nr: int,
+    edge_cache: Dict[Tuple[int, int], int],
+) -> int:
+    """Returns the nr of edges of the input graph if it already exists in
+    results/stage1/input_graphs, otherwise estimates it with the default edge
+    density."""
+    if (graph_size, graph_nr) not in edge_cache:
+        if has_outputted_input_graph_for_graph_size_and_nr(
+            graph_size=graph_size, graph_nr=graph_nr
+        ):
+            edge_cache[(graph_size, graph_nr)] = load_input_graph_based_on_nr(
+                graph_size=graph_size, graph_nr=graph_nr
+            ).number_of_edges()
+        else:
+            edge_cache[(graph_size, graph_nr)] = int(
+                calibration.default_edge_density
+                * graph_size
+                * (graph_size - 1)
+                / 2
+            )
+    return edge_cache[(graph_size, graph_nr)]
+
+
+@typechecked
+def predict_graph_size(
+    *,
+    adaptation_type: str,
+    calibration: Cost_calibration,
+    graph_name: str,
+    graph_size: int,
+    m_val: int,
+    nr_of_edges: int,
+    redundancy: int,
+) -> Tuple[float, float]:
+    """Returns the predicted number of neurons and synapses of one of the 4
+    snn graphs of a run config, without calibration scales."""
+    neurons, synapses = predict_mdsa_snn_size(
+        graph_size=graph_size,
+        m_val=m_val,
+        nr_of_edges=nr_of_edges,
+    )
+    if get_with_adaptation_bool(graph_name=graph_name):
+        neuron_factor, synapse_factor = get_adaptation_multipliers(
+            adaptation_type=adaptation_type, redundancy=redundancy
+        )
+        neurons *= neuron_factor
+        synapses *= synapse_factor
+    return neurons * calibration.neuron_scale, (
+        synapses * calibration.synapse_scale
+    )
+
+
+@typechecked
+def estimate_run_config_cost(
+    *,
+    calibration: Cost_calibration,
+    edge_cache: Dict[Tuple[int, int], int],
+    run_config: Run_config,
+) -> Run_cost_estimate:
+    """Returns the predicted cost of the 4 snn graphs of a run config."""
+    algorithm_name, algorithm_parameter = get_algorithm_description(
+        run_config=run_config
+    )
+    if algorithm_name != "MDSA":
+        raise NotImplementedError(
+            f"Error, {algorithm_name} cost estimation is not supported."
+        )
+    nr_of_edges: int = get_nr_of_input_graph_edges(
+        calibration=calibration,
+        graph_size=run_config.graph_size,
+        graph_nr=run_config.graph_nr,
+        edge_cache=edge_cache,
+    )
+    # The duration only depends on the nr of nodes of the input graph.
+    timesteps: int = get_max_sim_duration(
+        input_graph=nx.empty_graph(run_config.graph_size),
+        run_config=run_config,
+    )
+
+    total_neurons: float = 0.0
+    total_synapses: float = 0.0
+    disk_bytes: Dict[int, float] = {1: 0.0, 2: 0.0, 4: 0.0}
+    wall_time: float = 0.0
+    for graph_name in get_snn_graph_names():
+        neurons, synapses = predict_graph_size(
+            adaptation_type=run_config.adaptation.adaptation_type,
+            calibration=calibration,
+            graph_name=graph_name,
+            graph_size=run_config.graph_size,
+            m_val=algorithm_parameter,
+            nr_of_edges=nr_of_edges,
+            redundancy=run_config.adaptation.redundancy,
+        )
+        total_neurons += neurons
+        total_synapses += synapses
+
+        # Only the unradiated snns are stored in stage 1.
+        if not get_with_radiation_bool(graph_name=graph_name):
+            disk_bytes[1] += calibration.bytes_per_element_stage_1 * (
+                neurons + synapses
+            )
+        disk_bytes[2] += (
+            calibration.bytes_per_neuron_timestep_stage_2 * neurons * timesteps
+        )
+        disk_bytes[4] += calibration.bytes_per_graph_stage_4
+        wall_time += (
+            calibration.seconds_per_element_stage_1 * (neurons + synapses)
+            + calibration.seconds_per_element_timestep
+            * (neurons + synapses)
+            * timesteps
+            + calibration.seconds_per_graph_stage_4
+        )
+
+    return Run_cost_estimate(
+        cell=(
+            algorithm_name,
+            algorithm_parameter,
+            get_adaptation_label(run_config=run_config),
+            run_config.graph_size,
+        ),
+        neurons=int(total_neurons),
+        synapses=int(total_synapses),
+        timesteps=timesteps * len(get_snn_graph_names()),
+        disk_bytes={
+            stage_index: int(nr_of_bytes)
+            for stage_index, nr_of_bytes in disk_bytes.items()
+        },
+        wall_time=wall_time,
+    )
+
+
+# pylint: disable=R0914
+@typechecked
+def calibrate_from_run_metrics(
+    *,
+    calibration: Cost_calibration,
+    run_metrics_dir: str = RUN_METRICS_DIR,
+) -> Cost_calibration:
+    """Overwrites the coefficients of the calibration with the ratios between
+    the predicted and the measured values of completed runs.
+
+    Coefficients for which no measurements exist keep their default value.
+    """
+    if not os.path.isdir(run_metrics_dir):
+        return calibration
+
+    sums: Dict[str, float] = {
+        key: 0.0
+        for key in [
+            "pred_neurons",
+            "obs_neurons",
+            "pred_synapses",
+            "obs_synapses",
+            "elements_stage_1",
+            "bytes_stage_1",
+            "neuron_timesteps_stage_2",
+            "bytes_stage_2",
+            "graphs_stage_4",
+            "bytes_stage_4",
+            "elements_with_stage_1_duration",
+            "seconds_stage_1",
+            "element_timesteps",
+            "seconds_stage_2",
+            "graphs_with_stage_4_duration",
+            "seconds_stage_4",
+        ]
+    }
+    unscaled: Cost_calibration = Cost_calibration()
+    for filename in sorted(os.listdir(run_metrics_dir)):
+        if not filename.endswith(".json"):
+            continue
+        with open(
+            f"{run_metrics_dir}{filename}", encoding="utf-8"
+        ) as json_file:
+            run_metrics: Dict = json.load(json_file)
+            json_file.close()
+        if run_metrics["algorithm_name"] != "MDSA":
+            continue
+
+        run_elements: float = 0.0
+        run_element_timesteps: float = 0.0
+        for graph_name, graph_metrics in run_metrics["graphs"].items():
+            pred_neurons, pred_synapses = predict_graph_size(
+                adaptation_type=run_metrics["adaptation_type"],
+                calibration=unscaled,
+                graph_name=graph_name,
+                graph_size=run_metrics["graph_size"],
+                m_val=run_metrics["algorithm_parameter"],
+                nr_of_edges=run_metrics["nr_of_edges"],
+                redundancy=run_metrics["redundancy"],
+            )
+            neurons: int = graph_metrics["neurons"]
+            elements: int = neurons + graph_metrics["synapses"]
+            sums["pred_neurons"] += pred_neurons
+            sums["obs_neurons"] += neurons
+            sums["pred_synapses"] += pred_synapses
+            sums["obs_synapses"] += graph_metrics["synapses"]
+            run_elements += elements
+            run_element_timesteps += elements * graph_metrics["timesteps"]
+
+            if graph_metrics["bytes"]["1"] > 0:
+                sums["elements_stage_1"] += elements
+                sums["bytes_stage_1"] += graph_metrics["bytes"]["1"]
+            if graph_metrics["bytes"]["2"] > 0:
+                sums["neuron_timesteps_stage_2"] += (
+                    neurons * graph_metrics["timesteps"]
+                )
+                sums["bytes_stage_2"] += graph_metrics["bytes"]["2"]
+            if graph_metrics["bytes"]["4"] > 0:
+                sums["graphs_stage_4"] += 1
+                sums["bytes_stage_4"] += graph_metrics["bytes"]["4"]
+
+        if "1" in run_metrics["stage_durations"]:
+            sums["elements_with_stage_1_duration"] += run_elements
+            sums["seconds_stage_1"] += run_metrics["stage_durations"]["1"]
+        if "2" in run_metrics["stage_durations"]:
+            sums["element_timesteps"] += run_element_timesteps
+            sums["seconds_stage_2"] += run_metrics["stage_durations"]["2"]
+        if "4" in run_metrics["stage_durations"]:
+            sums["graphs_with_stage_4_duration"] += len(run_metrics["graphs"])
+            sums["seconds_stage_4"] += run_metrics["stage_durations"]["4"]
+        calibration.nr_of_calibration_runs += 1
+
+    for attribute, numerator, denominator in [
+        ("neuron_scale", "obs_neurons", "pred_neurons"),
+        ("synapse_scale", "obs_synapses", "pred_synapses"),
+        ("bytes_per_element_stage_1", "bytes_stage_1", "elements_stage_1"),
+        (
+            "bytes_per_neuron_timestep_stage_2",
+            "bytes_stage_2",
+            "neuron_timesteps_stage_2",
+        ),
+        ("bytes_per_graph_stage_4", "bytes_stage_4", "graphs_stage_4"),
+        (
+            "seconds_per_element_stage_1",
+            "seconds_stage_1",
+            "elements_with_stage_1_duration",
+        ),
+        (
+            "seconds_per_element_timestep",
+            "seconds_stage_2",
+            "element_timesteps",
+        ),
+        (
+            "seconds_per_graph_stage_4",
+            "seconds_stage_4",
+            "graphs_with_stage_4_duration",
+        ),
+    ]:
+        if sums[denominator] > 0:
+            setattr(
+                calibration, attribute, sums[numerator] / sums[denominator]
+            )
+    return calibration
+
+
+@typechecked
+def estimate_exp_config_costs(
+    *,
+    exp_config: Exp_config,
+    calibration: Cost_calibration,
+) -> List[Run_cost_estimate]:
+    """Returns the predicted cost of each run config of the experiment."""
+    edge_cache: Dict[Tuple[int, int], int] = {}
+    return [
+        estimate_run_config_cost(
+            calibration=calibration,
+            edge_cache=edge_cache,
+            run_config=run_config,
+        )
+        for run_config in exp_config_to_run_configs(exp_config=exp_config)
+    ]
+
+
+@typechecked
+def group_estimates_per_cell(
+    *,
+    estimates: List[Run_cost_estimate],
+) -> Dict[Tuple[str, int, str, int], Run_cost_estimate]:
+    """Sums the estimates of all run configs that share an algorithm,
+    adaptation and graph size."""
+    cells: Dict[Tuple[str, int, str, int], Run_cost_estimate] = {}
+    for estimate in estimates:
+        if estimate.cell not in cells:
+            cells[estimate.cell] = Run_cost_estimate(
+                cell=estimate.cell,
+                neurons=0,
+                synapses=0,
+                timesteps=0,
+                disk_bytes={stage_index: 0 for stage_index in [1, 2, 4]},
+                wall_time=0.0,
+            )
+        cell: Run_cost_estimate = cells[estimate.cell]
+        cell.neurons += estimate.neurons
+        cell.synapses += estimate.synapses
+        cell.timesteps += estimate.timesteps
+        cell.wall_time += estimate.wall_time
+        for stage_index, nr_of_bytes in estimate.disk_bytes.items():
+            cell.disk_bytes[stage_index] += nr_of_bytes
+    return cells
+
+
+@typechecked
+def print_cost_estimate(
+    *,
+    calibration: Cost_calibration,
+    estimates: List[Run_cost_estimate],
+    nr_of_dominant_cells: int = 10,
+) -> None:
+    """Prints the total predicted cost of the experiment, and the cells that
+    dominate the wall time."""
+    total_bytes: Dict[int, int] = {1: 0, 2: 0, 4: 0}
+    for estimate in estimates:
+        for stage_index, nr_of_bytes in estimate.disk_bytes.items():
+            total_bytes[stage_index] += nr_of_bytes
+    total_wall_time: float = sum(estimate.wall_time for estimate in estimates)
+
+    print(
+        f"Estimated cost of {len(estimates)} run configs, calibrated on "
+        + f"{calibration.nr_of_calibration_runs} completed runs:"
+    )
+    print(f"neurons:{sum(estimate.neurons for estimate in estimates)}")
+    print(f"synapses:{sum(estimate.synapses for estimate in estimates)}")
+    print(f"timesteps:{sum(estimate.timesteps for estimate in estimates)}")
+    for stage_index, nr_of_bytes in total_bytes.items():
+        print(f"stage {stage_index} disk:{nr_of_bytes/1e6:.1f} [MB]")
+    print(f"wall time:{total_wall_time/3600:.2f} [hours]\n")
+
+    cells: List[Run_cost_estimate] = sorted(
+        group_estimates_per_cell(estimates=estimates).values(),
+        key=lambda cell: cell.wall_time,
+        reverse=True,
+    )
+    print("Dominant cells (algorithm, parameter, adaptation, graph size):")
+    for cell in cells[:nr_of_dominant_cells]:
+        share: float = 100 * cell.wall_time / max(total_wall_time, 1e-12)
+        print(
+            f"{cell.cell}: {share:.1f}% of wall time, "
+            + f"{cell.wall_time/3600:.2f} [hours], "
+            + f"{sum(cell.disk_bytes.values())/1e6:.1f} [MB]"
+        )
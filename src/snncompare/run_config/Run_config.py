@@ -1,14 +1,15 @@
 """"Stores the run config Dict type."""
-import copy
 import sys
 from pprint import pprint
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from snnadaptation.Adaptation import Adaptation
 from snnradiation.Rad_damage import Rad_damage
 from typeguard import typechecked
 
 from snncompare.export_results.helper import get_unique_run_config_id
+from snncompare.run_config.interned_settings import get_setting_hash
+from snncompare.typecheck_profile import typechecked as profile_typechecked
 
 if sys.version_info < (3, 11):
     from typing_extensions import TypedDict
@@ -40,14 +41,34 @@ class Neuron_death:
         self.probability = probability
 
 
+# The settings of a run config, in the (alphabetical) order in which they
+# are serialised for its unique id.
+RUN_CONFIG_SETTINGS: Tuple[str, ...] = (
+    "adaptation",
+    "algorithm",
+    "graph_nr",
+    "graph_size",
+    "max_duration",
+    "radiation",
+    "seed",
+    "simulator",
+)
+
+
 # pylint: disable=R0902
 # pylint: disable=R0903
 class Run_config:
-    """Stores the run configuration object."""
+    """Stores the run configuration object.
+
+    The attributes are stored in slots instead of a __dict__, to keep the
+    run configs of large experiments small.
+    """
+
+    __slots__ = RUN_CONFIG_SETTINGS + ("unique_id",)
 
     # pylint: disable=R0913
     # pylint: disable=R0914
-    @typechecked
+    @profile_typechecked
     def __init__(
         self,
         adaptation: Adaptation,
@@ -79,32 +100,47 @@ class Run_config:
 
         # TODO: Verify run config object.
 
+    @profile_typechecked
+    def get_canonical_values(self) -> List:
+        """Returns the values of the settings in the order of
+        RUN_CONFIG_SETTINGS, with the adaptation and radiation as hashes.
+
+        This is the serialisation from which the unique id is computed,
+        and on which run configs are compared.
+        """
+        return [
+            get_setting_hash(setting=getattr(self, setting_name))
+            if setting_name in ["adaptation", "radiation"]
+            else getattr(self, setting_name)
+            for setting_name in RUN_CONFIG_SETTINGS
+        ]
+
+    @typechecked
+    def to_dict(self) -> Dict:
+        """Returns the attributes of the run config as a dict."""
+        return {
+            attribute_name: getattr(self, attribute_name)
+            for attribute_name in self.__slots__
+            if hasattr(self, attribute_name)
+        }
+
     @typechecked
     def print_run_config_dict(self) -> None:
         """Converts a run_config to a human readable dict and prints it."""
-        run_config_dict: Dict = copy.deepcopy(self.__dict__)
-        run_config_dict["radiation"] = self.radiation.__dict__
-        run_config_dict["adaptation"] = self.adaptation.__dict__
+        run_config_dict: Dict = self.to_dict()
+        run_config_dict["radiation"] = dict(self.radiation.__dict__)
+        run_config_dict["adaptation"] = dict(self.adaptation.__dict__)
         pprint(run_config_dict)
 
 
-@typechecked
+@profile_typechecked
 def run_configs_are_equal(*, left: Run_config, right: Run_config) -> bool:
     """Returns True if the left and right Run_config objects are equal. Returns
     False otherwise.
 
-    TODO: Test function
+    The unique ids are not compared.
     """
-    if sorted(left.__dict__.keys()) != sorted(right.__dict__.keys()):
-        return False
-    for key, left_value in left.__dict__.items():
-        if key in ["adaptation", "radiation"]:
-            if left_value.get_hash() != right.__dict__[key].get_hash():
-                return False
-        elif key != "unique_id":
-            if left_value != right.__dict__[key]:
-                return False
-    return True
+    return left.get_canonical_values() == right.get_canonical_values()
 
 
 @typechecked
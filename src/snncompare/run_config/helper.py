@@ -5,6 +5,7 @@ from typing import List
 
 from typeguard import typechecked
 
+from snncompare.export_results.file_locks import is_temporary_filename
 from snncompare.import_results.helper import file_contains_line
 
 
@@ -25,7 +26,9 @@ def get_all_filepaths_in_dir(*, root_dir: str) -> List[str]:
         for file_name in file_list:
             # if file_name.endswith(".py"):
             full_path = os.path.join(dir_name, file_name)
-            if "build/lib" not in full_path:
+            if "build/lib" not in full_path and not is_temporary_filename(
+                filename=file_name
+            ):
                 filepaths.append(full_path)
     return list(set(filepaths))
 
@@ -0,0 +1,52 @@
+"""Creates a single, shared Adaptation or Rad_damage object per setting.
+
+The run configs of an experiment reference the same few adaptation and
+radiation settings. Interning them keeps one object per setting in memory,
+and computes its hash once, instead of once per run config that is created,
+compared or identified. The interned objects are shared, so they should not
+be modified.
+"""
+from typing import Any, Dict, Tuple, Union
+
+from snnadaptation.Adaptation import Adaptation
+from snnradiation.Rad_damage import Rad_damage
+
+from snncompare.typecheck_profile import typechecked
+
+# The interned settings, per class name and constructor arguments.
+_interned_settings: Dict[Tuple, Union[Adaptation, Rad_damage]] = {}
+# The hash of each interned setting, per object id. The ids are stable as the
+# interned settings are never released.
+_setting_hashes: Dict[int, str] = {}
+
+
+@typechecked
+def get_interned_setting(
+    *, setting_class: type, **kwargs: Any
+) -> Union[Adaptation, Rad_damage]:
+    """Returns the shared object of the setting_class with these constructor
+    arguments, and creates it if it does not yet exist."""
+    # The type is part of the key, because e.g. 1 and 1.0 are equal
+    # arguments, yet they may give different setting hashes.
+    key: Tuple = (
+        setting_class.__name__,
+        tuple(
+            (name, type(value).__name__, value)
+            for name, value in sorted(kwargs.items())
+        ),
+    )
+    if key not in _interned_settings:
+        setting: Union[Adaptation, Rad_damage] = setting_class(**kwargs)
+        _interned_settings[key] = setting
+        _setting_hashes[id(setting)] = setting.get_hash()
+    return _interned_settings[key]
+
+
+@typechecked
+def get_setting_hash(*, setting: Union[Adaptation, Rad_damage]) -> str:
+    """Returns the hash of an adaptation or radiation setting, which is cached
+    for interned settings."""
+    setting_hash: Union[None, str] = _setting_hashes.get(id(setting))
+    if setting_hash is None:
+        return setting.get_hash()
+    return setting_hash
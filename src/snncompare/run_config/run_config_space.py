@@ -0,0 +1,314 @@
+"""Exposes the run configs of an experiment config as a lazy, indexable
+space with a deterministic numbering.
+
+The index of a run config is its position in the list that
+exp_config_to_run_configs returns, so it follows from the exp_config alone.
+A run config is only created when its index is accessed. A filter
+expression over the settings, and a shard k/N, select a subset of the
+indices, such that independent processes can each run a disjoint slice of
+the experiment, without creating all run configs or coordinating.
+"""
+import ast
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from snnadaptation.Adaptation import Adaptation
+
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.run_config.Run_config import Run_config
+from snncompare.typecheck_profile import typechecked
+
+# The variables that can be used in a filter expression.
+FILTER_VARIABLES: List[str] = [
+    "adaptation",
+    "algorithm",
+    "graph_nr",
+    "m_val",
+    "probability",
+    "radiation",
+    "redundancy",
+    "seed",
+    "simulator",
+    "size",
+]
+
+# The expression nodes that a filter expression may consist of.
+FILTER_NODES: Tuple[type, ...] = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+)
+
+
+class Run_config_space:
+    """The run configs of an experiment config, created on access.
+
+    The settings are enumerated as a mixed radix number. The outer digits
+    are the algorithm settings, adaptations, radiations and seeds. The inner
+    digit enumerates the (graph size, simulator, graph nr) combinations,
+    because the number of graphs differs per graph size.
+    """
+
+    @typechecked
+    def __init__(self, exp_config: Exp_config) -> None:
+        self.exp_config: Exp_config = exp_config
+        self.algorithms: List[Dict[str, Dict[str, int]]] = [
+            {algorithm_name: algo_config}
+            for algorithm_name, algo_specs in exp_config.algorithms.items()
+            for algo_config in algo_specs
+        ]
+        self.graphs: List[Tuple[int, str, int]] = [
+            (size_and_max_graph[0], simulator, graph_nr)
+            for size_and_max_graph in exp_config.size_and_max_graphs
+            for simulator in exp_config.simulators
+            for graph_nr in range(0, size_and_max_graph[1])
+        ]
+        # The dimensions, from the outer to the inner digit.
+        self.dimensions: List[List] = [
+            self.algorithms,
+            exp_config.adaptations,
+            exp_config.radiations,
+            exp_config.seeds,
+            self.graphs,
+        ]
+
+    def __len__(self) -> int:
+        nr_of_run_configs: int = 1
+        for dimension in self.dimensions:
+            nr_of_run_configs *= len(dimension)
+        return nr_of_run_configs
+
+    def __getitem__(self, index: int) -> Run_config:
+        algorithm, adaptation, radiation, seed, graph = self.get_digits(
+            index=index
+        )
+        return Run_config(
+            adaptation=adaptation,
+            algorithm=algorithm,
+            graph_size=graph[0],
+            graph_nr=graph[2],
+            radiation=radiation,
+            seed=seed,
+            simulator=graph[1],
+        )
+
+    def __iter__(self) -> Iterator[Run_config]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @typechecked
+    def get_digits(self, *, index: int) -> List:
+        """Returns the setting of each dimension of the run config at an
+        index."""
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"Error, run config index:{index} is not in the range of "
+                + f"the {len(self)} run configs."
+            )
+        # exp_config_to_run_configs returns the run configs in reversed
+        # order.
+        remainder: int = len(self) - 1 - index
+        digits: List = []
+        for dimension in reversed(self.dimensions):
+            remainder, digit = divmod(remainder, len(dimension))
+            digits.append(dimension[digit])
+        return list(reversed(digits))
+
+    @typechecked
+    def get_filter_variables(self, *, index: int) -> Dict[str, Any]:
+        """Returns the values of the filter variables of the run config at
+        an index, without creating the run config."""
+        algorithm, adaptation, radiation, seed, graph = self.get_digits(
+            index=index
+        )
+        algorithm_name: str = list(algorithm.keys())[0]
+        return {
+            "adaptation": get_adaptation_name(adaptation=adaptation),
+            "algorithm": algorithm_name,
+            "graph_nr": graph[2],
+            "m_val": algorithm[algorithm_name].get("m_val"),
+            "probability": radiation.probability_per_t,
+            "radiation": radiation.effect_type,
+            "redundancy": adaptation.redundancy,
+            "seed": seed,
+            "simulator": graph[1],
+            "size": graph[0],
+        }
+
+
+@typechecked
+def get_adaptation_name(*, adaptation: Adaptation) -> str:
+    """Returns the name of an adaptation, e.g. redundancy_2."""
+    return f"{adaptation.adaptation_type}_{adaptation.redundancy}"
+
+
+@typechecked
+def parse_filter_expression(*, filter_expression: str) -> ast.Expression:
+    """Parses a filter expression, e.g.:
+    seed in [1, 2] and size <= 10 and adaptation == "redundancy_2"
+
+    Only comparisons of the FILTER_VARIABLES with constants, combined with
+    and, or and not, are supported.
+    """
+    try:
+        tree: ast.Expression = ast.parse(filter_expression, mode="eval")
+    except SyntaxError as error:
+        raise ValueError(
+            f"Error, filter:{filter_expression} is not an expression."
+        ) from error
+    for node in ast.walk(tree):
+        if not isinstance(node, FILTER_NODES):
+            raise ValueError(
+                f"Error, {type(node).__name__} is not supported in filter:"
+                + f"{filter_expression}"
+            )
+        if isinstance(node, ast.Name) and node.id not in FILTER_VARIABLES:
+            raise ValueError(
+                f"Error, {node.id} is not a filter variable, choose from:"
+                + f"{FILTER_VARIABLES}"
+            )
+    return tree
+
+
+# pylint: disable=R0911
+@typechecked
+def evaluate_filter_node(*, node: ast.AST, variables: Dict[str, Any]) -> Any:
+    """Returns the value of a node of a parsed filter expression."""
+    if isinstance(node, ast.Expression):
+        return evaluate_filter_node(node=node.body, variables=variables)
+    if isinstance(node, ast.BoolOp):
+        values = (
+            evaluate_filter_node(node=value, variables=variables)
+            for value in node.values
+        )
+        return all(values) if isinstance(node.op, ast.And) else any(values)
+    if isinstance(node, ast.UnaryOp):
+        operand = evaluate_filter_node(node=node.operand, variables=variables)
+        return not operand if isinstance(node.op, ast.Not) else -operand
+    if isinstance(node, ast.Compare):
+        left = evaluate_filter_node(node=node.left, variables=variables)
+        for operator, comparator in zip(node.ops, node.comparators):
+            right = evaluate_filter_node(node=comparator, variables=variables)
+            if not compare(left=left, operator=operator, right=right):
+                return False
+            left = right
+        return True
+    if isinstance(node, ast.Name):
+        return variables[node.id]
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [
+            evaluate_filter_node(node=element, variables=variables)
+            for element in node.elts
+        ]
+    raise ValueError(f"Error, {type(node).__name__} is not supported.")
+
+
+# pylint: disable=R0911
+@typechecked
+def compare(*, left: Any, operator: ast.cmpop, right: Any) -> bool:
+    """Returns the outcome of a comparison of a filter expression."""
+    if isinstance(operator, ast.Eq):
+        return bool(left == right)
+    if isinstance(operator, ast.NotEq):
+        return bool(left != right)
+    if isinstance(operator, ast.Lt):
+        return bool(left < right)
+    if isinstance(operator, ast.LtE):
+        return bool(left <= right)
+    if isinstance(operator, ast.Gt):
+        return bool(left > right)
+    if isinstance(operator, ast.GtE):
+        return bool(left >= right)
+    if isinstance(operator, ast.In):
+        return left in right
+    if isinstance(operator, ast.NotIn):
+        return left not in right
+    raise ValueError(f"Error, {type(operator).__name__} is not supported.")
+
+
+@typechecked
+def parse_shard(*, shard: str) -> Tuple[int, int]:
+    """Converts a shard k/N into (k, N), with 1 <= k <= N."""
+    try:
+        shard_index, nr_of_shards = (int(part) for part in shard.split("/"))
+    except ValueError as error:
+        raise ValueError(
+            f"Error, shard:{shard} is not of the form k/N, e.g. 2/8."
+        ) from error
+    if not 1 <= shard_index <= nr_of_shards:
+        raise ValueError(
+            f"Error, shard:{shard} should have 1 <= k <= N, e.g. 2/8."
+        )
+    return shard_index, nr_of_shards
+
+
+@typechecked
+def get_selected_indices(
+    *,
+    run_config_space: Run_config_space,
+    filter_expression: Optional[str] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Iterator[int]:
+    """Yields the indices of the run configs that pass the filter, and of
+    those, the ones of shard k/N: every N-th index, starting at the k-th.
+
+    Every process that uses the same exp_config, filter and N, gets a
+    disjoint subset of the filtered indices, and together the shards cover
+    them.
+    """
+    shard_index, nr_of_shards = (1, 1) if shard is None else shard
+    if filter_expression is None:
+        yield from range(shard_index - 1, len(run_config_space), nr_of_shards)
+        return
+
+    tree: ast.Expression = parse_filter_expression(
+        filter_expression=filter_expression
+    )
+    nr_of_filtered: int = 0
+    for index in range(len(run_config_space)):
+        if evaluate_filter_node(
+            node=tree,
+            variables=run_config_space.get_filter_variables(index=index),
+        ):
+            if nr_of_filtered % nr_of_shards == shard_index - 1:
+                yield index
+            nr_of_filtered += 1
+
+
+@typechecked
+def get_selected_run_configs(
+    *,
+    exp_config: Exp_config,
+    filter_expression: Optional[str] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Iterator[Run_config]:
+    """Yields the run configs of an experiment config that pass the filter,
+    and belong to the shard."""
+    run_config_space: Run_config_space = Run_config_space(
+        exp_config=exp_config
+    )
+    for index in get_selected_indices(
+        run_config_space=run_config_space,
+        filter_expression=filter_expression,
+        shard=shard,
+    ):
+        yield run_config_space[index]
@@ -63,5 +63,5 @@ def verify_run_config_dict_is_complete(
         ]:
             raise KeyError(
                 f"Error:{expected_key} is not in the configuration"
-                + f" settings:{run_config.__dict__.keys()}"
+                + f" settings:{run_config.to_dict().keys()}"
             )
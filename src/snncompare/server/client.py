@@ -0,0 +1,73 @@
+"""Submits a job to the server of serve.py, and streams its output.
+
+The client only imports the standard library, such that submitting a job
+does not pay the import cost of the experiment code.
+"""
+import json
+import socket
+import sys
+from typing import Dict, List, Optional
+
+DEFAULT_SOCKET_PATH: str = "results/snncompare.sock"
+CLIENT_FLAGS: List[str] = ["-sub", "--submit", "-stop", "--stop-server"]
+SOCKET_PATH_FLAGS: List[str] = ["-sp", "--socket-path"]
+
+
+def submit_request(
+    *, request: Dict, socket_path: str = DEFAULT_SOCKET_PATH
+) -> int:
+    """Sends a request to the server, prints the streamed output of the job,
+    and returns the exit code of the job."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError) as error:
+            raise ConnectionError(
+                f"Error, no server is running at:{socket_path}, start it "
+                + "with: python -m src.snncompare --serve"
+            ) from error
+        connection.sendall(f"{json.dumps(request)}\n".encode("utf-8"))
+        with connection.makefile("r", encoding="utf-8") as messages:
+            for message_line in messages:
+                message: Dict = json.loads(message_line)
+                if "output" in message:
+                    sys.stdout.write(message["output"])
+                    sys.stdout.flush()
+                elif message.get("done"):
+                    job_error: Optional[str] = message["error"]
+                    if job_error is not None:
+                        sys.stderr.write(job_error)
+                    return message["exit_code"]
+    raise ConnectionError("Error, the server closed the connection.")
+
+
+def submit_job(
+    *, argv: List[str], socket_path: str = DEFAULT_SOCKET_PATH
+) -> int:
+    """Submits the cli arguments of a job to the server, and returns its exit
+    code."""
+    return submit_request(request={"argv": argv}, socket_path=socket_path)
+
+
+def run_client(*, argv: List[str]) -> int:
+    """Submits the cli arguments, without the client arguments, as a job to
+    the server. Or stops the server if --stop-server is given."""
+    socket_path: str = DEFAULT_SOCKET_PATH
+    job_argv: List[str] = []
+    remaining_argv: List[str] = list(argv)
+    while remaining_argv:
+        arg: str = remaining_argv.pop(0)
+        if arg in SOCKET_PATH_FLAGS:
+            if not remaining_argv:
+                raise ValueError(f"Error, {arg} expects a socket path.")
+            socket_path = remaining_argv.pop(0)
+        elif arg.startswith("--socket-path="):
+            socket_path = arg.split("=", 1)[1]
+        elif arg not in CLIENT_FLAGS:
+            job_argv.append(arg)
+
+    if any(arg in ["-stop", "--stop-server"] for arg in argv):
+        return submit_request(
+            request={"command": "shutdown"}, socket_path=socket_path
+        )
+    return submit_job(argv=job_argv, socket_path=socket_path)
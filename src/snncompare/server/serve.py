@@ -0,0 +1,173 @@
+"""Runs a long-lived worker process that executes CLI jobs, submitted over a
+Unix socket. The imports, and the caches of the input graphs and stage 1
+networks, remain warm between the jobs.
+
+The protocol consists of newline-delimited json messages. A client sends a
+single request:
+    {"argv": [<cli arguments>]}, {"command": "ping"} or
+    {"command": "shutdown"},
+after which the server streams the printed output of the job as:
+    {"output": <text>}
+and finishes with:
+    {"done": true, "exit_code": <int>, "error": <traceback or null>}
+The jobs are executed one at a time, in the order in which they connect.
+"""
+import contextlib
+import json
+import os
+import socket
+import traceback
+from argparse import ArgumentParser
+from typing import Dict, List, Optional, TextIO, Tuple, cast
+
+from typeguard import typechecked
+
+from snncompare.arg_parser.arg_parser import parse_cli_args
+from snncompare.arg_parser.arg_verification import verify_args
+from snncompare.arg_parser.process_args import process_args
+from snncompare.export_results.async_writer import stop_async_writer
+from snncompare.server.client import DEFAULT_SOCKET_PATH
+
+
+@typechecked
+def send_message(*, connection: socket.socket, message: Dict) -> None:
+    """Sends a single json message over the socket."""
+    connection.sendall(f"{json.dumps(message)}\n".encode("utf-8"))
+
+
+class Socket_output:
+    """File-like object that streams the printed text of a job to the
+    client."""
+
+    @typechecked
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection: socket.socket = connection
+
+    @typechecked
+    def write(self, text: str) -> int:
+        """Sends the text to the client."""
+        if text:
+            send_message(connection=self.connection, message={"output": text})
+        return len(text)
+
+    def flush(self) -> None:
+        """The text is sent directly, so there is nothing to flush."""
+
+
+@typechecked
+def run_cli_job(
+    *, argv: List[str], custom_config_path: str, output: Socket_output
+) -> Tuple[int, Optional[str]]:
+    """Executes the cli arguments of a job, and returns the exit code and the
+    traceback of the error, if any.
+
+    The execution profile of the server is fixed when it imports its
+    modules, so a job can not select the --fast profile. Start the server
+    with --fast instead.
+    """
+    # The output only implements the write and flush methods of a text file.
+    text_output = cast(TextIO, output)
+    with contextlib.redirect_stdout(text_output), contextlib.redirect_stderr(
+        text_output
+    ):
+        try:
+            parser = parse_cli_args(parse=False)
+            if not isinstance(parser, ArgumentParser):
+                raise TypeError(
+                    f"Error, expected an argument parser, got:{type(parser)}"
+                )
+            args = parser.parse_args(argv)
+            if args.fast:
+                parser.error(
+                    "--fast only applies to --serve, the profile of a "
+                    + "running server can not be changed by a job."
+                )
+            verify_args(args=args, custom_config_path=custom_config_path)
+            process_args(args=args, custom_config_path=custom_config_path)
+        except SystemExit as system_exit:
+            # Raised by argparse for invalid arguments and --help.
+            exit_code: int = (
+                system_exit.code if isinstance(system_exit.code, int) else 1
+            )
+            return exit_code, None
+        except Exception:  # pylint: disable=W0718
+            return 1, traceback.format_exc()
+        finally:
+            # Each job may start its own async writer.
+            stop_async_writer()
+    return 0, None
+
+
+@typechecked
+def create_server_socket(*, socket_path: str) -> socket.socket:
+    """Binds the Unix socket, after removing the socket file of a server that
+    is no longer running."""
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(socket_path)
+            else:
+                raise ValueError(
+                    f"Error, a server is already running at:{socket_path}"
+                )
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server_socket.bind(socket_path)
+    server_socket.listen()
+    return server_socket
+
+
+@typechecked
+def handle_connection(
+    *, connection: socket.socket, custom_config_path: str
+) -> bool:
+    """Executes the request of a client, and returns False if the server
+    should shut down."""
+    with connection, connection.makefile("r", encoding="utf-8") as requests:
+        request_line: str = requests.readline()
+        if not request_line:
+            return True
+        request: Dict = json.loads(request_line)
+        if request.get("command") in ["ping", "shutdown"]:
+            send_message(
+                connection=connection,
+                message={"done": True, "exit_code": 0, "error": None},
+            )
+            return request["command"] == "ping"
+        try:
+            exit_code, error = run_cli_job(
+                argv=request["argv"],
+                custom_config_path=custom_config_path,
+                output=Socket_output(connection=connection),
+            )
+            send_message(
+                connection=connection,
+                message={"done": True, "exit_code": exit_code, "error": error},
+            )
+        except BrokenPipeError:
+            print("Client disconnected before its job was completed.")
+    return True
+
+
+@typechecked
+def serve(
+    *, custom_config_path: str, socket_path: str = DEFAULT_SOCKET_PATH
+) -> None:
+    """Executes the jobs that are submitted over the Unix socket, until a
+    shutdown request is received."""
+    server_socket: socket.socket = create_server_socket(
+        socket_path=socket_path
+    )
+    print(f"Serving at:{socket_path}")
+    try:
+        while True:
+            connection, _ = server_socket.accept()
+            if not handle_connection(
+                connection=connection, custom_config_path=custom_config_path
+            ):
+                break
+    finally:
+        server_socket.close()
+        os.remove(socket_path)
@@ -10,6 +10,10 @@ from snncompare.graph_generation.stage_1_create_graphs import (
     get_new_radiation_graph,
 )
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.network_index import (
+    Network_index,
+    get_network_index,
+)
 
 
 @typechecked
@@ -70,7 +74,10 @@ def apply_radiation_death_to_empty_simsnn_neuron(
     neuron_name: str,
     snn_graph: Simulator,
 ) -> None:
-    """Applies the radiation type to the simsnn neuron."""
-    for simsnn_lif in snn_graph.network.nodes:
-        if simsnn_lif.name == neuron_name:
-            simsnn_lif.thr = 999
+    """Applies the radiation type to the simsnn neuron. A neuron name that
+    is not in the snn is ignored."""
+    network_index: Network_index = get_network_index(snn=snn_graph)
+    if neuron_name in network_index.name_indices:
+        snn_graph.network.nodes[
+            network_index.name_indices[neuron_name]
+        ].thr = 999
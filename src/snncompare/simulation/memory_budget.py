@@ -0,0 +1,187 @@
+"""Keeps the memory usage of a sweep of runs within a budget.
+
+The simulated V, I and spike arrays of the snns are the largest objects of a
+run. If the resident memory exceeds the budget after an snn is simulated (or
+loaded) in stage 2, the arrays of the simulated snns are spilled to memory
+mapped files in results/memmap/<unique_id>/ before the next snn is
+simulated, such that the operating system can page them out while the
+remaining snns are simulated, and while stages 3 and 4 read them.
+After stage 4, the results of the run are persisted, so the arrays are
+released and the spill files are removed.
+
+The peak resident memory of each run is measured by resetting the peak
+of the process (Linux), and by sampling the resident memory in a background
+thread (other platforms).
+"""
+import gc
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+MEMMAP_DIR: str = "results/memmap/"
+
+# The simsnn attributes that store the arrays of the simulation.
+SIMULATION_ARRAYS: List[List[str]] = [
+    ["multimeter", "V"],
+    ["multimeter", "I"],
+    ["raster", "spikes"],
+]
+
+
+@typechecked
+def get_current_rss_bytes() -> int:
+    """Returns the resident memory of this process in bytes, or 0 if it can
+    not be read on this platform."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm_file:
+            resident_pages: int = int(statm_file.read().split()[1])
+    except (FileNotFoundError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+@typechecked
+def get_peak_rss_bytes() -> Optional[int]:
+    """Returns the peak resident memory of this process since the last reset
+    in bytes, or None if it can not be read on this platform."""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as status_file:
+            for line in status_file:
+                if line.startswith("VmHWM:"):
+                    # The value is in kB.
+                    return int(line.split()[1]) * 1024
+    except FileNotFoundError:
+        pass
+    return None
+
+
+@typechecked
+def reset_peak_rss() -> bool:
+    """Resets the peak resident memory of this process to its current
+    resident memory, and returns True if this is supported."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="utf-8") as refs:
+            refs.write("5")
+    except OSError:
+        return False
+    return True
+
+
+class Peak_rss_monitor:
+    """Measures the peak resident memory of the process while the context is
+    open."""
+
+    @typechecked
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval: float = interval
+        self.peak_rss: int = 0
+        self.has_reset_peak: bool = False
+        self.stopped: threading.Event = threading.Event()
+        self.thread: threading.Thread = threading.Thread(
+            target=self.sample, daemon=True
+        )
+
+    def sample(self) -> None:
+        """Stores the largest resident memory, until stopped."""
+        while True:
+            self.peak_rss = max(self.peak_rss, get_current_rss_bytes())
+            if self.stopped.wait(self.interval):
+                return
+
+    def __enter__(self) -> "Peak_rss_monitor":
+        self.has_reset_peak = reset_peak_rss()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stopped.set()
+        self.thread.join()
+        if self.has_reset_peak:
+            peak_rss: Optional[int] = get_peak_rss_bytes()
+            if peak_rss is not None:
+                self.peak_rss = max(self.peak_rss, peak_rss)
+
+
+@typechecked
+def exceeds_memory_budget(*, memory_budget: Optional[int]) -> bool:
+    """Returns True if a memory budget in MB is set, and the resident memory
+    exceeds it."""
+    if memory_budget is None:
+        return False
+    return get_current_rss_bytes() > memory_budget * 1024**2
+
+
+@typechecked
+def get_spill_dir(*, unique_id: str) -> str:
+    """Returns the directory with the spilled arrays of a run config."""
+    return f"{MEMMAP_DIR}{unique_id}/"
+
+
+@typechecked
+def spill_simulation_arrays(*, graphs_dict: Dict, spill_dir: str) -> int:
+    """Moves the simulation arrays of the snns into memory mapped files, and
+    returns the number of spilled bytes.
+
+    The arrays are mapped copy-on-write, so the later stages can read (and
+    locally modify) them like in-memory arrays.
+    """
+    os.makedirs(spill_dir, exist_ok=True)
+    spilled_bytes: int = 0
+    for graph_name, snn in graphs_dict.items():
+        if not isinstance(snn, Simulator):
+            continue
+        for owner_name, array_name in SIMULATION_ARRAYS:
+            owner = getattr(snn, owner_name)
+            some_array = getattr(owner, array_name, None)
+            if (
+                not isinstance(some_array, np.ndarray)
+                or isinstance(some_array, np.memmap)
+                or some_array.size == 0
+            ):
+                continue
+            filepath: str = os.path.join(
+                spill_dir, f"{graph_name}_{array_name}.npy"
+            )
+            np.save(filepath, some_array)
+            spilled_bytes += some_array.nbytes
+            setattr(owner, array_name, np.load(filepath, mmap_mode="c"))
+    return spilled_bytes
+
+
+@typechecked
+def spill_if_exceeds_memory_budget(
+    *, graphs_dict: Dict, memory_budget: Optional[int], spill_dir: str
+) -> int:
+    """Spills the simulation arrays of the simulated snns if the resident
+    memory exceeds the memory budget, and returns the number of spilled
+    bytes."""
+    if not exceeds_memory_budget(memory_budget=memory_budget):
+        return 0
+    spilled_bytes: int = spill_simulation_arrays(
+        graphs_dict=graphs_dict, spill_dir=spill_dir
+    )
+    gc.collect()
+    return spilled_bytes
+
+
+@typechecked
+def release_simulation_arrays(
+    *, graphs_dict: Dict, spill_dir: Optional[str]
+) -> None:
+    """Drops the simulation arrays of the snns, whose results are persisted,
+    and removes their spill files."""
+    for snn in graphs_dict.values():
+        if not isinstance(snn, Simulator):
+            continue
+        for owner_name, array_name in SIMULATION_ARRAYS:
+            owner = getattr(snn, owner_name)
+            if getattr(owner, array_name, None) is not None:
+                setattr(owner, array_name, np.empty((0, 0)))
+    gc.collect()
+    if spill_dir is not None:
+        shutil.rmtree(spill_dir, ignore_errors=True)
@@ -0,0 +1,307 @@
+"""Indexes the neurons and synapses of an snn by name, role and adjacency.
+
+The index of a network is built once and cached per network object, such
+that radiation, verification, results and plotting can look up a neuron by
+name, the neurons of a role, or the synapses of a neuron, without scanning
+all neurons or synapses. The cached index is rebuilt if its token no longer
+matches the network: the number of neurons and synapses, and the identity
+and name of the first and last neuron (and synapse). This detects added or
+removed neurons and synapses, and renamed or reordered boundary neurons,
+without scanning the network. A network whose neurons are renamed or
+reordered otherwise should be dropped from the cache with
+drop_network_index.
+"""
+import weakref
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import networkx as nx
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.nodes import LIF
+from simsnn.core.simulators import Simulator
+
+from snncompare.typecheck_profile import typechecked
+
+# The name prefix of the neurons of each role of the MDSA snn.
+ROLE_PREFIXES: Dict[str, str] = {
+    "rand": "rand_",
+    "degree_receiver": "degree_receiver_",
+    "selector": "selector",
+    "redundant": "r_",
+}
+# The neurons of this role have the role name anywhere in their name.
+CONNECTOR_ROLE: str = "connector"
+
+# The token and index per simsnn Network or networkx graph. The entries are
+# removed when the network is released.
+_network_indices: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+# pylint: disable=R0902
+class Network_index:
+    """Stores the name to index map, the neuron indices per role and the
+    incoming and outgoing synapses per neuron of an snn.
+
+    The adjacency is stored in compressed sparse row form: the synapse
+    indices of the outgoing synapses of neuron n are:
+    out_synapses[out_offsets[n] : out_offsets[n + 1]], in the order of the
+    synapses of the network. The same holds for the incoming synapses.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        neuron_names: List[str],
+        synapse_pre: np.ndarray,
+        synapse_post: np.ndarray,
+        lif_mask: Optional[np.ndarray] = None,
+    ) -> None:
+        if len(synapse_pre) != len(synapse_post):
+            raise ValueError(
+                f"Error, {len(synapse_pre)} pre- and {len(synapse_post)} "
+                + "post synaptic neurons do not match."
+            )
+        self.neuron_names: List[str] = neuron_names
+        self.name_indices: Dict[str, int] = {
+            name: index for index, name in enumerate(neuron_names)
+        }
+        if len(self.name_indices) != len(neuron_names):
+            raise ValueError("Error, duplicate neuron names not supported.")
+        self.synapse_pre: np.ndarray = np.asarray(synapse_pre, dtype=np.int64)
+        self.synapse_post: np.ndarray = np.asarray(
+            synapse_post, dtype=np.int64
+        )
+
+        self.role_indices: Dict[str, np.ndarray] = {
+            role: np.asarray(
+                [
+                    index
+                    for index, name in enumerate(neuron_names)
+                    if name.startswith(prefix)
+                ],
+                dtype=np.int64,
+            )
+            for role, prefix in ROLE_PREFIXES.items()
+        }
+        self.role_indices[CONNECTOR_ROLE] = np.asarray(
+            [
+                index
+                for index, name in enumerate(neuron_names)
+                if CONNECTOR_ROLE in name
+            ],
+            dtype=np.int64,
+        )
+        self.role_names: Dict[str, Set[str]] = {
+            role: {neuron_names[index] for index in indices.tolist()}
+            for role, indices in self.role_indices.items()
+        }
+
+        if lif_mask is None:
+            lif_mask = np.ones(len(neuron_names), dtype=bool)
+        self.lif_names: List[str] = [
+            name for name, is_lif in zip(neuron_names, lif_mask) if is_lif
+        ]
+
+        self.out_offsets, self.out_synapses = get_csr_adjacency(
+            nr_of_neurons=len(neuron_names), synapse_neurons=self.synapse_pre
+        )
+        self.in_offsets, self.in_synapses = get_csr_adjacency(
+            nr_of_neurons=len(neuron_names), synapse_neurons=self.synapse_post
+        )
+
+    @typechecked
+    def get_nr_of_neurons(self) -> int:
+        """Returns the number of neurons in the snn."""
+        return len(self.neuron_names)
+
+    @typechecked
+    def get_nr_of_synapses(self) -> int:
+        """Returns the number of synapses in the snn."""
+        return len(self.synapse_pre)
+
+    @typechecked
+    def get_neuron_index(self, neuron_name: str) -> int:
+        """Returns the index of a neuron in the nodes of the network."""
+        if neuron_name not in self.name_indices:
+            raise KeyError(f"Error, neuron:{neuron_name} not found.")
+        return self.name_indices[neuron_name]
+
+    @typechecked
+    def get_role_indices(self, role: str) -> np.ndarray:
+        """Returns the indices of the neurons of a role."""
+        if role not in self.role_indices:
+            raise KeyError(
+                f"Error, role:{role} not supported, choose from:"
+                + f"{list(self.role_indices.keys())}"
+            )
+        return self.role_indices[role]
+
+    @typechecked
+    def get_out_synapse_indices(self, neuron_index: int) -> np.ndarray:
+        """Returns the indices of the outgoing synapses of a neuron."""
+        start: int = int(self.out_offsets[neuron_index])
+        end: int = int(self.out_offsets[neuron_index + 1])
+        return self.out_synapses[start:end]
+
+    @typechecked
+    def get_in_synapse_indices(self, neuron_index: int) -> np.ndarray:
+        """Returns the indices of the incoming synapses of a neuron."""
+        start: int = int(self.in_offsets[neuron_index])
+        end: int = int(self.in_offsets[neuron_index + 1])
+        return self.in_synapses[start:end]
+
+    @typechecked
+    def get_successors(self, neuron_index: int) -> np.ndarray:
+        """Returns the indices of the post synaptic neurons of a neuron."""
+        return self.synapse_post[
+            self.get_out_synapse_indices(neuron_index=neuron_index)
+        ]
+
+    @typechecked
+    def get_predecessors(self, neuron_index: int) -> np.ndarray:
+        """Returns the indices of the pre synaptic neurons of a neuron."""
+        return self.synapse_pre[
+            self.get_in_synapse_indices(neuron_index=neuron_index)
+        ]
+
+
+@typechecked
+def get_csr_adjacency(
+    *, nr_of_neurons: int, synapse_neurons: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the offsets per neuron and the synapse indices, sorted by the
+    neuron of each synapse, of the synapses of each neuron."""
+    synapse_indices: np.ndarray = np.argsort(synapse_neurons, kind="stable")
+    offsets: np.ndarray = np.zeros(nr_of_neurons + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(synapse_neurons, minlength=nr_of_neurons),
+        out=offsets[1:],
+    )
+    return offsets, synapse_indices.astype(np.int64)
+
+
+@typechecked
+def get_simsnn_network_index(*, network: Network) -> Network_index:
+    """Builds the index of a simsnn network."""
+    node_indices: Dict[int, int] = {
+        id(node): index for index, node in enumerate(network.nodes)
+    }
+    return Network_index(
+        neuron_names=[node.name for node in network.nodes],
+        synapse_pre=np.asarray(
+            [node_indices[id(synapse.pre)] for synapse in network.synapses],
+            dtype=np.int64,
+        ),
+        synapse_post=np.asarray(
+            [node_indices[id(synapse.post)] for synapse in network.synapses],
+            dtype=np.int64,
+        ),
+        lif_mask=np.asarray(
+            [isinstance(node, LIF) for node in network.nodes], dtype=bool
+        ),
+    )
+
+
+@typechecked
+def get_nx_network_index(*, snn_graph: nx.DiGraph) -> Network_index:
+    """Builds the index of a networkx snn graph, the synapses are in the
+    order of the edges."""
+    neuron_names: List[str] = list(snn_graph.nodes)
+    name_indices: Dict[str, int] = {
+        name: index for index, name in enumerate(neuron_names)
+    }
+    return Network_index(
+        neuron_names=neuron_names,
+        synapse_pre=np.asarray(
+            [name_indices[edge[0]] for edge in snn_graph.edges],
+            dtype=np.int64,
+        ),
+        synapse_post=np.asarray(
+            [name_indices[edge[1]] for edge in snn_graph.edges],
+            dtype=np.int64,
+        ),
+    )
+
+
+@typechecked
+def get_network_token(*, snn: Union[nx.DiGraph, Network]) -> Tuple:
+    """Returns a token that changes if neurons or synapses are added or
+    removed, or if the first or last neuron (or synapse) is replaced,
+    renamed or moved. It is computed without scanning the network.
+
+    Only these changes are detected. If a neuron or synapse in the middle of
+    the network is replaced, renamed or moved, while the number of neurons
+    and synapses and the boundary neurons (and synapses) stay the same, the
+    token does not change. The code that makes such a change should call
+    drop_network_index, otherwise the stale index is returned.
+    """
+    if isinstance(snn, Network):
+        boundary_nodes: List = (
+            [snn.nodes[0], snn.nodes[-1]] if snn.nodes else []
+        )
+        boundary_synapses: List = (
+            [snn.synapses[0], snn.synapses[-1]] if snn.synapses else []
+        )
+        return (
+            len(snn.nodes),
+            len(snn.synapses),
+            tuple((id(node), node.name) for node in boundary_nodes),
+            tuple(id(synapse) for synapse in boundary_synapses),
+        )
+    # The nodes of a networkx graph are their names. The last node can not
+    # be read without iterating, so the index checks it is still present.
+    return (
+        snn.number_of_nodes(),
+        snn.number_of_edges(),
+        next(iter(snn.nodes), None),
+    )
+
+
+@typechecked
+def get_network_index(
+    *, snn: Union[nx.DiGraph, Simulator, Network]
+) -> Network_index:
+    """Returns the cached index of an snn, and builds it if it does not yet
+    exist or if the token of the snn has changed."""
+    if isinstance(snn, Simulator):
+        snn = snn.network
+    token: Tuple = get_network_token(snn=snn)
+
+    cached: Optional[Tuple[Tuple, Network_index]] = _network_indices.get(snn)
+    if cached is not None and cached[0] == token:
+        network_index: Network_index = cached[1]
+        if isinstance(snn, Network) or (
+            network_index.get_nr_of_neurons() == 0
+            or snn.has_node(network_index.neuron_names[-1])
+        ):
+            return network_index
+
+    if isinstance(snn, Network):
+        network_index = get_simsnn_network_index(network=snn)
+    else:
+        network_index = get_nx_network_index(snn_graph=snn)
+    _network_indices[snn] = (token, network_index)
+    return network_index
+
+
+@typechecked
+def set_network_index(*, snn: Simulator, network_index: Network_index) -> None:
+    """Stores an index that was built from the arrays of an snn, e.g. when it
+    is loaded, such that it is not rebuilt from the network objects."""
+    if network_index.get_nr_of_neurons() != len(
+        snn.network.nodes
+    ) or network_index.get_nr_of_synapses() != len(snn.network.synapses):
+        raise ValueError("Error, the index does not match the network.")
+    _network_indices[snn.network] = (
+        get_network_token(snn=snn.network),
+        network_index,
+    )
+
+
+@typechecked
+def drop_network_index(*, snn: Union[nx.DiGraph, Simulator, Network]) -> None:
+    """Removes the cached index of an snn, e.g. after its neurons are renamed
+    or reordered, such that it is rebuilt when it is used next."""
+    if isinstance(snn, Simulator):
+        snn = snn.network
+    _network_indices.pop(snn, None)
@@ -1,6 +1,6 @@
 """Simulates the SNN graphs and returns a deep copy of the graph per
 timestep."""
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
@@ -19,6 +19,10 @@ from snncompare.import_results.helper import simsnn_files_exists_and_get_path
 from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.memory_budget import (
+    get_spill_dir,
+    spill_if_exceeds_memory_budget,
+)
 
 from ..helper import (
     add_stage_completion_to_graph,
@@ -35,11 +39,14 @@ def sim_graphs(
     output_config: Output_config,
     run_config: Run_config,
     stage_1_graphs: Dict,
-) -> None:
+) -> List[str]:
     """Simulates the snn graphs and makes a deep copy for each timestep.
+    Returns the names of the snn graphs that are simulated, instead of loaded
+    or skipped.
 
     :param stage_1_graphs: Dict:
     """
+    simulated_graph_names: List[str] = []
 
     # TODO: ensure order unradiated first.
     for graph_name, snn in stage_1_graphs.items():
@@ -84,6 +91,7 @@ def sim_graphs(
                 add_stage_completion_to_graph(
                     snn=stage_1_graphs[graph_name], stage_index=2
                 )
+                simulated_graph_names.append(graph_name)
 
             elif next_action == "Load":
                 print(f"graph_name={graph_name} - loading.")
@@ -97,9 +105,7 @@ def sim_graphs(
 
                 get_rand_synapse_weights(
                     input_graph=stage_1_graphs["input_graph"],
-                    simsnn_synapses=stage_1_graphs[
-                        graph_name
-                    ].network.synapses,
+                    snn=stage_1_graphs[graph_name],
                 )
             elif next_action == "Skip":
                 print("Skip.")
@@ -107,10 +113,24 @@ def sim_graphs(
                 raise ValueError(
                     f"Error, next action unexpected:{next_action}"
                 )
+            # Spill the arrays of the simulated snns before the next snn is
+            # simulated, if they exceed the memory budget.
+            spill_dir: str = get_spill_dir(unique_id=run_config.unique_id)
+            spilled_bytes: int = spill_if_exceeds_memory_budget(
+                graphs_dict=stage_1_graphs,
+                memory_budget=output_config.extra_storing_config.memory_budget,
+                spill_dir=spill_dir,
+            )
+            if spilled_bytes > 0:
+                print(
+                    f"Spilled {spilled_bytes/1024**2:.1f} MB of simulation "
+                    + f"arrays to:{spill_dir}"
+                )
         else:
             add_stage_completion_to_graph(
                 snn=stage_1_graphs[graph_name], stage_index=2
             )
+    return simulated_graph_names
 
 
 @typechecked
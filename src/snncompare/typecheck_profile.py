@@ -0,0 +1,39 @@
+"""Selects whether the functions on the hot paths are type checked at
+runtime.
+
+Modules opt in to the fast profile by importing typechecked from this
+module instead of from typeguard. With the environment variable
+SNNCOMPARE_PROFILE=fast, the typechecked decorator of these modules returns
+the function unchanged, otherwise it is the typeguard decorator. All other
+modules are always type checked.
+
+The profile is read when a module is imported, so it should be set before
+snncompare is imported. The CLI does this for --fast.
+"""
+import os
+from typing import Any, Callable, List, TypeVar
+
+from typeguard import typechecked as typeguard_typechecked
+
+PROFILE_ENV_VAR: str = "SNNCOMPARE_PROFILE"
+PROFILES: List[str] = ["checked", "fast"]
+
+T_Callable = TypeVar("T_Callable", bound=Callable[..., Any])
+
+
+def get_profile() -> str:
+    """Returns the execution profile of this process."""
+    profile: str = os.environ.get(PROFILE_ENV_VAR, "checked")
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Error, {PROFILE_ENV_VAR}={profile} is not supported, choose "
+            + f"from:{PROFILES}"
+        )
+    return profile
+
+
+def typechecked(func: T_Callable) -> T_Callable:
+    """Type checks the function, unless the fast profile is used."""
+    if get_profile() == "fast":
+        return func
+    return typeguard_typechecked(func)
@@ -0,0 +1,342 @@
+"""Shares the run configs of an experiment between workers on one or more
+hosts, through a queue directory on a shared filesystem (e.g. NFS):
+
+results/work_queue/<queue_name>/
+    items/<unique_id>        : enqueued run config unique_ids.
+    leases/<unique_id>.json  : the worker that is running the item.
+    done/<unique_id>         : completed items.
+    errors/<unique_id>.jsonl : the error of each failed attempt of an item.
+    failed/<unique_id>.txt   : items that failed max_attempts times, with
+                               their errors.
+
+A worker claims an item by exclusively creating its lease file. While it
+runs the item, it touches the lease file periodically (the heartbeat). A
+lease whose modification time is older than the lease timeout belongs to a
+crashed worker, and is reclaimed by another worker. The lease timeout should
+be much larger than the heartbeat interval, and the clock difference between
+the hosts. A worker only completes, or records the failure of, an item while
+it still holds the lease of that item.
+"""
+import json
+import os
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import (
+    append_line,
+    atomic_write_bytes,
+    is_temporary_filename,
+)
+
+WORK_QUEUE_DIR: str = "results/work_queue/"
+
+
+@typechecked
+def get_default_worker_id() -> str:
+    """Returns an id that is unique per process on the shared filesystem."""
+    return f"{socket.gethostname()}_{os.getpid()}"
+
+
+class Work_queue:
+    """Enqueues, claims and completes the items of a queue directory."""
+
+    @typechecked
+    def __init__(
+        self,
+        queue_name: str,
+        lease_timeout: float = 300.0,
+        queue_dir: str = WORK_QUEUE_DIR,
+        max_attempts: int = 3,
+    ) -> None:
+        if lease_timeout <= 0:
+            raise ValueError("Error, lease_timeout should be >0.")
+        if max_attempts < 1:
+            raise ValueError("Error, max_attempts should be >0.")
+        self.queue_dir: str = os.path.join(queue_dir, queue_name)
+        self.lease_timeout: float = lease_timeout
+        self.max_attempts: int = max_attempts
+        for sub_dir in ["items", "leases", "done", "errors", "failed"]:
+            os.makedirs(os.path.join(self.queue_dir, sub_dir), exist_ok=True)
+
+    @typechecked
+    def get_item_filepath(self, *, sub_dir: str, item_id: str) -> str:
+        """Returns the filepath of an item in the items, leases, done, errors
+        or failed directory."""
+        extensions: Dict[str, str] = {
+            "items": "",
+            "leases": ".json",
+            "done": "",
+            "errors": ".jsonl",
+            "failed": ".txt",
+        }
+        return os.path.join(
+            self.queue_dir, sub_dir, f"{item_id}{extensions[sub_dir]}"
+        )
+
+    @typechecked
+    def get_item_ids(self, *, sub_dir: str) -> List[str]:
+        """Returns the sorted item ids in the items, done, errors or failed
+        directory."""
+        dirname: str = os.path.join(self.queue_dir, sub_dir)
+        return sorted(
+            filename.split(".")[0]
+            for filename in os.listdir(dirname)
+            if not is_temporary_filename(filename=filename)
+        )
+
+    @typechecked
+    def enqueue(self, *, item_ids: List[str]) -> int:
+        """Adds the items that are not yet in the queue, and returns the
+        number of added items."""
+        existing_item_ids: List[str] = self.get_item_ids(sub_dir="items")
+        nr_of_added_items: int = 0
+        for item_id in item_ids:
+            if item_id not in existing_item_ids:
+                atomic_write_bytes(
+                    filepath=self.get_item_filepath(
+                        sub_dir="items", item_id=item_id
+                    ),
+                    some_bytes=b"",
+                )
+                nr_of_added_items += 1
+        return nr_of_added_items
+
+    @typechecked
+    def get_finished_item_ids(self) -> List[str]:
+        """Returns the ids of the items that are done, or failed."""
+        return sorted(
+            set(self.get_item_ids(sub_dir="done"))
+            | set(self.get_item_ids(sub_dir="failed"))
+        )
+
+    @typechecked
+    def get_unfinished_item_ids(self) -> List[str]:
+        """Returns the ids of the items that are not done, nor failed."""
+        finished_item_ids: List[str] = self.get_finished_item_ids()
+        return [
+            item_id
+            for item_id in self.get_item_ids(sub_dir="items")
+            if item_id not in finished_item_ids
+        ]
+
+    @typechecked
+    def read_lease(self, *, lease_filepath: str) -> Optional[Dict]:
+        """Returns the content of a lease file, or None if it does not exist
+        (anymore), or is being written."""
+        try:
+            with open(lease_filepath, encoding="utf-8") as lease_file:
+                lease: Dict = json.load(lease_file)
+                lease_file.close()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return lease
+
+    @typechecked
+    def lease_is_stale(self, *, lease_filepath: str) -> bool:
+        """Returns True if the lease has not received a heartbeat within the
+        lease timeout."""
+        try:
+            last_heartbeat: float = os.path.getmtime(lease_filepath)
+        except FileNotFoundError:
+            return False
+        return time.time() - last_heartbeat > self.lease_timeout
+
+    @typechecked
+    def try_claim(self, *, item_id: str, worker_id: str) -> bool:
+        """Tries to create the lease of an item, and returns True if this
+        worker holds the lease."""
+        lease_filepath: str = self.get_item_filepath(
+            sub_dir="leases", item_id=item_id
+        )
+        if self.lease_is_stale(lease_filepath=lease_filepath):
+            self.reclaim_stale_lease(
+                lease_filepath=lease_filepath, worker_id=worker_id
+            )
+        try:
+            # O_EXCL ensures a single worker creates the lease.
+            file_descriptor: int = os.open(
+                lease_filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+            )
+        except FileExistsError:
+            return False
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as lease_file:
+            json.dump(
+                {
+                    "worker_id": worker_id,
+                    "claimed_at": time.time(),
+                },
+                lease_file,
+            )
+        # An item can complete between listing and claiming it.
+        if item_id in self.get_finished_item_ids():
+            self.release(item_id=item_id, worker_id=worker_id)
+            return False
+        return True
+
+    @typechecked
+    def reclaim_stale_lease(
+        self, *, lease_filepath: str, worker_id: str
+    ) -> None:
+        """Removes a stale lease. The lease is first renamed, such that only
+        one of the reclaiming workers removes it. If another worker has
+        already replaced the stale lease by a new lease, the new lease is
+        restored."""
+        stale_lease: Optional[Dict] = self.read_lease(
+            lease_filepath=lease_filepath
+        )
+        reclaimed_filepath: str = f"{lease_filepath}.reclaimed.{worker_id}"
+        try:
+            os.rename(lease_filepath, reclaimed_filepath)
+        except FileNotFoundError:
+            return
+        if stale_lease is not None and stale_lease != self.read_lease(
+            lease_filepath=reclaimed_filepath
+        ):
+            try:
+                # Fails if yet another worker has claimed the item.
+                os.link(reclaimed_filepath, lease_filepath)
+            except FileExistsError:
+                pass
+        os.remove(reclaimed_filepath)
+
+    @typechecked
+    def holds_lease(self, *, item_id: str, worker_id: str) -> bool:
+        """Returns True if the lease of an item belongs to the worker, False
+        if it has been reclaimed or released."""
+        lease: Optional[Dict] = self.read_lease(
+            lease_filepath=self.get_item_filepath(
+                sub_dir="leases", item_id=item_id
+            )
+        )
+        return lease is not None and lease["worker_id"] == worker_id
+
+    @typechecked
+    def heartbeat(self, *, item_id: str, worker_id: str) -> bool:
+        """Renews the lease of an item, and returns False if the lease has
+        been reclaimed by another worker."""
+        if not self.holds_lease(item_id=item_id, worker_id=worker_id):
+            return False
+        try:
+            os.utime(self.get_item_filepath(sub_dir="leases", item_id=item_id))
+        except FileNotFoundError:
+            return False
+        return True
+
+    @typechecked
+    def release(self, *, item_id: str, worker_id: Optional[str]) -> None:
+        """Removes the lease of an item, if it belongs to the worker, or
+        regardless of its worker if the worker_id is None."""
+        if worker_id is not None and not self.holds_lease(
+            item_id=item_id, worker_id=worker_id
+        ):
+            return
+        try:
+            os.remove(
+                self.get_item_filepath(sub_dir="leases", item_id=item_id)
+            )
+        except FileNotFoundError:
+            pass
+
+    @typechecked
+    def mark_done(self, *, item_id: str, worker_id: str) -> None:
+        """Marks an item as completed and releases its lease."""
+        atomic_write_bytes(
+            filepath=self.get_item_filepath(sub_dir="done", item_id=item_id),
+            some_bytes=b"",
+        )
+        self.release(item_id=item_id, worker_id=worker_id)
+
+    @typechecked
+    def get_errors(self, *, item_id: str) -> List[Dict]:
+        """Returns the recorded error of each failed attempt of an item."""
+        errors_filepath: str = self.get_item_filepath(
+            sub_dir="errors", item_id=item_id
+        )
+        if not os.path.isfile(errors_filepath):
+            return []
+        with open(errors_filepath, encoding="utf-8") as errors_file:
+            errors: List[Dict] = [
+                json.loads(line) for line in errors_file if line.strip()
+            ]
+            errors_file.close()
+        return errors
+
+    @typechecked
+    def record_failure(
+        self, *, item_id: str, worker_id: str, error_message: str
+    ) -> bool:
+        """Records the error of a failed attempt of an item and releases its
+        lease, such that the item is retried. Returns True if the item
+        failed max_attempts times, in which case it is marked as failed."""
+        append_line(
+            filepath=self.get_item_filepath(sub_dir="errors", item_id=item_id),
+            line=json.dumps(
+                {"worker_id": worker_id, "error_message": error_message}
+            ),
+        )
+        errors: List[Dict] = self.get_errors(item_id=item_id)
+        if len(errors) >= self.max_attempts:
+            atomic_write_bytes(
+                filepath=self.get_item_filepath(
+                    sub_dir="failed", item_id=item_id
+                ),
+                some_bytes="\n".join(
+                    error["error_message"] for error in errors
+                ).encode("utf-8"),
+            )
+        self.release(item_id=item_id, worker_id=worker_id)
+        return len(errors) >= self.max_attempts
+
+    @typechecked
+    def claim_next(self, *, worker_id: str) -> Optional[str]:
+        """Returns the id of the next unfinished item this worker claimed, or
+        None if all unfinished items are leased by other workers."""
+        for item_id in self.get_unfinished_item_ids():
+            if self.try_claim(item_id=item_id, worker_id=worker_id):
+                return item_id
+        return None
+
+
+class Lease_heartbeat:
+    """Renews the lease of an item in a background thread, while the item is
+    being run."""
+
+    # pylint: disable=R0913
+    @typechecked
+    def __init__(
+        self,
+        work_queue: Work_queue,
+        item_id: str,
+        worker_id: str,
+        interval: float,
+    ) -> None:
+        self.work_queue: Work_queue = work_queue
+        self.item_id: str = item_id
+        self.worker_id: str = worker_id
+        self.interval: float = interval
+        self.lost_lease: bool = False
+        self.stopped: threading.Event = threading.Event()
+        self.thread: threading.Thread = threading.Thread(
+            target=self.beat, daemon=True
+        )
+
+    def beat(self) -> None:
+        """Touches the lease file every interval, until stopped."""
+        while not self.stopped.wait(self.interval):
+            if not self.work_queue.heartbeat(
+                item_id=self.item_id, worker_id=self.worker_id
+            ):
+                self.lost_lease = True
+                return
+
+    def __enter__(self) -> "Lease_heartbeat":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stopped.set()
+        self.thread.join()
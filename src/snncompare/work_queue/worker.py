@@ -0,0 +1,178 @@
+"""Runs the items of a shared work queue, on one or more (simulated)
+hosts."""
+import multiprocessing
+import time
+import traceback
+from typing import Callable, Dict, List, Optional
+
+from typeguard import typechecked
+
+from snncompare.create_configs import exp_config_to_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.optional_config.Output_config import Output_config
+from snncompare.run_config.Run_config import Run_config
+from snncompare.work_queue.Work_queue import (
+    WORK_QUEUE_DIR,
+    Lease_heartbeat,
+    Work_queue,
+    get_default_worker_id,
+)
+
+
+class Run_config_runner:
+    """Runs a run config of an experiment through the stage pipeline, based
+    on its unique_id."""
+
+    # pylint: disable=R0903
+    @typechecked
+    def __init__(
+        self, exp_config: Exp_config, output_config: Output_config
+    ) -> None:
+        self.exp_config: Exp_config = exp_config
+        self.output_config: Output_config = output_config
+        self.run_configs: Dict[str, Run_config] = {
+            run_config.unique_id: run_config
+            for run_config in exp_config_to_run_configs(exp_config=exp_config)
+        }
+
+    @typechecked
+    def __call__(self, unique_id: str) -> None:
+        if unique_id not in self.run_configs:
+            raise KeyError(
+                f"Error, run config:{unique_id} is not in the experiment."
+            )
+        Experiment_runner(
+            exp_config=self.exp_config,
+            output_config=self.output_config,
+            reverse=False,
+            specific_run_config=self.run_configs[unique_id],
+        )
+
+
+@typechecked
+def enqueue_run_configs(
+    *, exp_config: Exp_config, work_queue: Work_queue
+) -> int:
+    """Adds the run configs of an experiment to the work queue, and returns
+    the number of added run configs."""
+    return work_queue.enqueue(
+        item_ids=[
+            run_config.unique_id
+            for run_config in exp_config_to_run_configs(exp_config=exp_config)
+        ]
+    )
+
+
+# pylint: disable=R0913
+@typechecked
+def run_worker(
+    *,
+    work_queue: Work_queue,
+    run_item: Callable[[str], None],
+    worker_id: str,
+    poll_interval: float = 5.0,
+) -> List[str]:
+    """Claims and runs items until all items are done or failed, and returns
+    the ids of the items this worker completed.
+
+    If no item can be claimed, the worker waits for the leases of the other
+    workers to complete, or to become stale. An item is only marked as done,
+    or its failure recorded, if this worker still holds its lease. Otherwise
+    the worker that reclaimed the lease completes it.
+    """
+    completed_item_ids: List[str] = []
+    while work_queue.get_unfinished_item_ids():
+        item_id = work_queue.claim_next(worker_id=worker_id)
+        if item_id is None:
+            time.sleep(poll_interval)
+            continue
+
+        error_message: Optional[str] = None
+        with Lease_heartbeat(
+            work_queue=work_queue,
+            item_id=item_id,
+            worker_id=worker_id,
+            interval=work_queue.lease_timeout / 5,
+        ):
+            try:
+                run_item(item_id)
+            # Store the error of the item, and continue with the next item.
+            except Exception:  # pylint: disable=W0718
+                error_message = traceback.format_exc()
+
+        if not work_queue.holds_lease(item_id=item_id, worker_id=worker_id):
+            print(f"Lost the lease of:{item_id}, it is run by another worker.")
+        elif error_message is not None:
+            if not work_queue.record_failure(
+                item_id=item_id,
+                worker_id=worker_id,
+                error_message=error_message,
+            ):
+                print(f"Item:{item_id} failed, it will be retried.")
+        else:
+            work_queue.mark_done(item_id=item_id, worker_id=worker_id)
+            completed_item_ids.append(item_id)
+    return completed_item_ids
+
+
+@typechecked
+def run_work_queue_worker(
+    *,
+    queue_name: str,
+    run_item: Callable[[str], None],
+    worker_id: str,
+    lease_timeout: float,
+    poll_interval: float,
+    queue_dir: str,
+) -> None:
+    """Runs a worker in a (separate) process."""
+    run_worker(
+        work_queue=Work_queue(
+            queue_name=queue_name,
+            lease_timeout=lease_timeout,
+            queue_dir=queue_dir,
+        ),
+        run_item=run_item,
+        worker_id=worker_id,
+        poll_interval=poll_interval,
+    )
+
+
+# pylint: disable=R0913
+@typechecked
+def simulate_hosts(
+    *,
+    queue_name: str,
+    run_item: Callable[[str], None],
+    nr_of_hosts: int,
+    lease_timeout: float = 300.0,
+    poll_interval: float = 5.0,
+    queue_dir: str = WORK_QUEUE_DIR,
+) -> List[int]:
+    """Runs a worker per simulated host in a separate process on this
+    machine, and returns the exit codes of the worker processes."""
+    workers: List[multiprocessing.Process] = [
+        multiprocessing.Process(
+            target=run_work_queue_worker,
+            kwargs={
+                "queue_name": queue_name,
+                "run_item": run_item,
+                "worker_id": f"host_{host_nr}_{get_default_worker_id()}",
+                "lease_timeout": lease_timeout,
+                "poll_interval": poll_interval,
+                "queue_dir": queue_dir,
+            },
+        )
+        for host_nr in range(nr_of_hosts)
+    ]
+    for worker in workers:
+        worker.start()
+    exit_codes: List[int] = []
+    for worker in workers:
+        worker.join()
+        # The exit code is only None while the process is running.
+        if worker.exitcode is None:
+            raise ValueError(f"Error, worker:{worker.name} did not finish.")
+        exit_codes.append(worker.exitcode)
+    return exit_codes
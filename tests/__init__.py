@@ -0,0 +1,5 @@
+"""Runs the tests with the runtime type checks of all modules, also if the
+fast profile is set in the environment."""
+import os
+
+os.environ["SNNCOMPARE_PROFILE"] = "checked"
@@ -0,0 +1,142 @@
+"""Verifies the compact Run_config objects keep the unique ids and equality
+of the run configs with a __dict__."""
+import copy
+import hashlib
+import json
+import pickle  # nosec
+import unittest
+from typing import List
+
+from snnadaptation.Adaptation import Adaptation
+from snnradiation.Rad_damage import Rad_damage
+from typeguard import typechecked
+
+from snncompare.run_config.interned_settings import (
+    get_interned_setting,
+    get_setting_hash,
+)
+from snncompare.run_config.Run_config import Run_config, run_configs_are_equal
+
+
+@typechecked
+def get_legacy_unique_id(*, run_config: Run_config) -> str:
+    """Returns the unique id as it was computed from the __dict__ of a run
+    config: the values sorted on their key, with the adaptation and radiation
+    as hashes."""
+    legacy_dict = {
+        "adaptation": run_config.adaptation.get_hash(),
+        "algorithm": copy.deepcopy(run_config.algorithm),
+        "graph_size": run_config.graph_size,
+        "graph_nr": run_config.graph_nr,
+        "radiation": run_config.radiation.get_hash(),
+        "seed": run_config.seed,
+        "simulator": run_config.simulator,
+        "max_duration": run_config.max_duration,
+    }
+    key_sorted_value_list: List = [
+        legacy_dict[key] for key in sorted(legacy_dict.keys())
+    ]
+    return hashlib.sha256(
+        json.dumps(key_sorted_value_list).encode("utf-8")
+    ).hexdigest()
+
+
+class Test_run_config_ids(unittest.TestCase):
+    """Tests the unique ids, equality and interned settings of run
+    configs."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.adaptation = get_interned_setting(
+            setting_class=Adaptation,
+            adaptation_type="redundancy",
+            redundancy=2,
+        )
+        self.radiation = get_interned_setting(
+            setting_class=Rad_damage,
+            amplitude=float(-(10**10)),
+            effect_type="neuron_death",
+            excitatory=False,
+            inhibitory=True,
+            probability_per_t=0.1,
+        )
+
+    @typechecked
+    def get_run_config(self, *, seed: int) -> Run_config:
+        """Returns a run config with the interned settings."""
+        return Run_config(
+            adaptation=self.adaptation,
+            algorithm={"MDSA": {"m_val": 1}},
+            graph_size=4,
+            graph_nr=0,
+            radiation=self.radiation,
+            seed=seed,
+            simulator="simsnn",
+        )
+
+    @typechecked
+    def test_interned_settings(self) -> None:
+        """Tests equal settings are the same object with the same hash."""
+        self.assertIs(
+            self.adaptation,
+            get_interned_setting(
+                setting_class=Adaptation,
+                adaptation_type="redundancy",
+                redundancy=2,
+            ),
+        )
+        self.assertIsNot(
+            self.adaptation,
+            get_interned_setting(
+                setting_class=Adaptation,
+                adaptation_type="redundancy",
+                redundancy=3,
+            ),
+        )
+        self.assertEqual(
+            get_setting_hash(setting=self.radiation),
+            self.radiation.get_hash(),
+        )
+
+    @typechecked
+    def test_unique_id_is_unchanged(self) -> None:
+        """Tests the unique id equals the id of the __dict__ based run
+        config, such that stored results are still found."""
+        run_config = self.get_run_config(seed=7)
+        self.assertEqual(
+            run_config.unique_id, get_legacy_unique_id(run_config=run_config)
+        )
+        self.assertFalse(hasattr(run_config, "__dict__"))
+
+    @typechecked
+    def test_run_configs_are_equal(self) -> None:
+        """Tests run configs are equal on their settings, not on their
+        identity."""
+        self.assertTrue(
+            run_configs_are_equal(
+                left=self.get_run_config(seed=7),
+                right=self.get_run_config(seed=7),
+            )
+        )
+        self.assertFalse(
+            run_configs_are_equal(
+                left=self.get_run_config(seed=7),
+                right=self.get_run_config(seed=8),
+            )
+        )
+
+    @typechecked
+    def test_copies_keep_the_settings(self) -> None:
+        """Tests the run config survives a pickle round trip (e.g. to a
+        worker process) and a deepcopy."""
+        run_config = self.get_run_config(seed=7)
+        for copied_run_config in [
+            pickle.loads(pickle.dumps(run_config)),  # nosec
+            copy.deepcopy(run_config),
+        ]:
+            self.assertEqual(copied_run_config.unique_id, run_config.unique_id)
+            self.assertTrue(
+                run_configs_are_equal(left=copied_run_config, right=run_config)
+            )
@@ -0,0 +1,158 @@
+"""Verifies the lazy run config space numbers the run configs in the order
+of the generated run config list, and that the filter and shards select the
+expected run configs."""
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.run_config.Run_config import Run_config
+from snncompare.run_config.run_config_space import (
+    Run_config_space,
+    get_selected_indices,
+    get_selected_run_configs,
+    parse_filter_expression,
+    parse_shard,
+)
+
+
+@typechecked
+def get_nested_loop_run_configs(*, exp_config: Exp_config) -> List[Run_config]:
+    """Returns the run configs of the exp_config, created with the nested
+    loops of the former exp_config_to_run_configs."""
+    run_configs: List[Run_config] = []
+    for algorithm_name, algo_specs in exp_config.algorithms.items():
+        for algo_config in algo_specs:
+            for adaptation in exp_config.adaptations:
+                for radiation in exp_config.radiations:
+                    for seed in exp_config.seeds:
+                        for (
+                            graph_size,
+                            max_graphs,
+                        ) in exp_config.size_and_max_graphs:
+                            for simulator in exp_config.simulators:
+                                for graph_nr in range(0, max_graphs):
+                                    run_configs.append(
+                                        Run_config(
+                                            adaptation=adaptation,
+                                            algorithm={
+                                                algorithm_name: algo_config
+                                            },
+                                            graph_size=graph_size,
+                                            graph_nr=graph_nr,
+                                            radiation=radiation,
+                                            seed=seed,
+                                            simulator=simulator,
+                                        )
+                                    )
+    return list(reversed(run_configs))
+
+
+class Test_run_config_space(unittest.TestCase):
+    """Tests the numbering, filtering and sharding of the run configs of an
+    experiment."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.exp_config = Exp_config(
+            adaptations={"redundancy": [2, 4]},
+            algorithms={"MDSA": [{"m_val": 0}, {"m_val": 1}]},
+            max_graph_size=4,
+            max_max_graphs=2,
+            min_graph_size=3,
+            min_max_graphs=1,
+            neuron_models=["LIF"],
+            radiations={
+                "change_u": {
+                    "amplitude": [1],
+                    "excitatory": [True],
+                    "inhibitory": [False],
+                    "probability_per_t": [0.001],
+                }
+            },
+            seeds=[5, 6, 7],
+            simulators=["simsnn"],
+            size_and_max_graphs=[(3, 1), (4, 2)],
+            synaptic_models=["LIF"],
+        )
+        self.run_config_space = Run_config_space(exp_config=self.exp_config)
+
+    @typechecked
+    def test_numbering_equals_nested_loops(self) -> None:
+        """Tests the run config at each index equals the run config at that
+        position of the nested loops."""
+        expected_ids: List[str] = [
+            run_config.unique_id
+            for run_config in get_nested_loop_run_configs(
+                exp_config=self.exp_config
+            )
+        ]
+        self.assertEqual(len(self.run_config_space), 2 * 2 * 1 * 3 * 3)
+        self.assertEqual(
+            [run_config.unique_id for run_config in self.run_config_space],
+            expected_ids,
+        )
+        self.assertEqual(self.run_config_space[7].unique_id, expected_ids[7])
+        with self.assertRaises(IndexError):
+            self.run_config_space[len(self.run_config_space)]
+
+    @typechecked
+    def test_filter(self) -> None:
+        """Tests the filter selects the run configs with those settings."""
+        run_configs: List[Run_config] = list(
+            get_selected_run_configs(
+                exp_config=self.exp_config,
+                filter_expression=(
+                    "seed in [5, 7] and size == 4 and not m_val == 1 "
+                    + "and adaptation == 'redundancy_2'"
+                ),
+            )
+        )
+        self.assertEqual(len(run_configs), 2 * 2)
+        for run_config in run_configs:
+            self.assertIn(run_config.seed, [5, 7])
+            self.assertEqual(run_config.graph_size, 4)
+            self.assertEqual(run_config.algorithm, {"MDSA": {"m_val": 0}})
+            self.assertEqual(run_config.adaptation.redundancy, 2)
+
+    @typechecked
+    def test_shards_are_disjoint_and_complete(self) -> None:
+        """Tests the shards of the filtered run configs do not overlap, and
+        together contain all filtered run configs."""
+        filter_expression: str = "size >= 3 and redundancy != 4"
+        filtered: List[int] = list(
+            get_selected_indices(
+                run_config_space=self.run_config_space,
+                filter_expression=filter_expression,
+            )
+        )
+        sharded: List[int] = []
+        for shard_index in range(1, 5):
+            shard: List[int] = list(
+                get_selected_indices(
+                    run_config_space=self.run_config_space,
+                    filter_expression=filter_expression,
+                    shard=parse_shard(shard=f"{shard_index}/4"),
+                )
+            )
+            self.assertLessEqual(len(shard), len(filtered) // 4 + 1)
+            sharded.extend(shard)
+        self.assertEqual(sorted(sharded), filtered)
+
+    @typechecked
+    def test_invalid_filter_and_shard(self) -> None:
+        """Tests unsupported filter expressions and shards are rejected."""
+        for filter_expression in [
+            "__import__('os')",
+            "seed.bit_length() > 1",
+            "unknown_setting == 1",
+            "seed ==",
+        ]:
+            with self.assertRaises(ValueError):
+                parse_filter_expression(filter_expression=filter_expression)
+        for shard in ["0/4", "5/4", "1-4", "a/b"]:
+            with self.assertRaises(ValueError):
+                parse_shard(shard=shard)
@@ -0,0 +1,128 @@
+"""Verifies visually identical frames are grouped, and that only the first
+frame of each group is rendered while the others link to it."""
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.export_plots.export_frames import (
+    export_frames,
+    get_frame_filepath,
+    get_image_export_types,
+    group_identical_frames,
+)
+from snncompare.export_plots.Plot_config import (
+    Plot_config,
+    get_default_plot_config,
+)
+from snncompare.export_plots.temporal_frames import (
+    create_figure_with_temporal_frames,
+)
+
+
+class Test_export_frames(unittest.TestCase):
+    """Tests the deduplicated export of the frames."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.plot_config: Plot_config = get_default_plot_config()
+        # Node a_0 spikes at t=1 and t=3, so t=0,2,4 and t=1,3 look the same.
+        self.spike_times = [1, 3]
+        self.nr_of_timesteps: int = 5
+
+    @typechecked
+    def get_plotted_graph(self) -> nx.DiGraph:
+        """Returns a plotted graph of which node a_0 spikes at the spike
+        times."""
+        plotted_graph: nx.DiGraph = nx.DiGraph()
+        for i, node_name in enumerate(["a_0", "b_1"]):
+            spikes = [
+                i == 0 and t in self.spike_times
+                for t in range(self.nr_of_timesteps)
+            ]
+            plotted_graph.add_node(
+                node_name,
+                pos=(float(i + 1), 1.0),
+                label=node_name,
+                colour="white",
+                opacity=0.1,
+                temporal_colour=[
+                    "green" if spike else "white" for spike in spikes
+                ],
+                temporal_opacity=[0.8 if spike else 0.1 for spike in spikes],
+                # Hovertexts differ per timestep, but are not visible.
+                temporal_node_hovertext=[
+                    f"{node_name} t={t}" for t in range(self.nr_of_timesteps)
+                ],
+            )
+        plotted_graph.add_edge("a_0", "b_1", label="W:1", colour="white")
+        plotted_graph.edges[("a_0", "b_1")]["opacity"] = 0.1
+        return plotted_graph
+
+    @typechecked
+    def test_group_identical_frames(self) -> None:
+        """Verifies the frames are grouped on their visual state."""
+        _, temporal_frames = create_figure_with_temporal_frames(
+            plotted_graph=self.get_plotted_graph(),
+            plot_config=self.plot_config,
+        )
+        self.assertEqual(
+            group_identical_frames(temporal_frames=temporal_frames),
+            [[0, 2, 4], [1, 3]],
+        )
+
+    @typechecked
+    def test_gif_is_assembled_from_png_frames(self) -> None:
+        """Verifies the png frames are rendered if a gif is exported."""
+        self.assertEqual(
+            get_image_export_types(export_types=["svg", "gif"]),
+            ["svg", "png"],
+        )
+        self.assertEqual(
+            get_image_export_types(export_types=["png", "gif"]), ["png"]
+        )
+
+    @typechecked
+    def test_duplicate_frames_link_to_unique_frame(self) -> None:
+        """Verifies the duplicate frames are links to the first frame of their
+        group, if the first frames are already rendered."""
+        dash_figure, temporal_frames = create_figure_with_temporal_frames(
+            plotted_graph=self.get_plotted_graph(),
+            plot_config=self.plot_config,
+        )
+        cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                os.makedirs("latex/Images/graphs")
+                for t in [0, 1]:
+                    with open(
+                        get_frame_filepath(
+                            export_type="svg", filename="some_snn", t=t
+                        ),
+                        "w",
+                        encoding="utf-8",
+                    ) as svg_file:
+                        svg_file.write(f"<svg>{t}</svg>")
+                export_frames(
+                    dash_figure=dash_figure,
+                    export_types=["svg"],
+                    filename="some_snn",
+                    plot_config=self.plot_config,
+                    temporal_frames=temporal_frames,
+                    nr_of_processes=1,
+                )
+                for t in range(self.nr_of_timesteps):
+                    with open(
+                        get_frame_filepath(
+                            export_type="svg", filename="some_snn", t=t
+                        ),
+                        encoding="utf-8",
+                    ) as svg_file:
+                        self.assertEqual(svg_file.read(), f"<svg>{t%2}</svg>")
+            finally:
+                os.chdir(cwd)
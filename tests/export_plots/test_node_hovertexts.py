@@ -0,0 +1,110 @@
+"""Verifies the hovertexts that are created from the precomputed synapses and
+spikes, equal the hovertexts that walk over all edges per node and
+timestep."""
+import unittest
+from typing import List
+
+import networkx as nx
+from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
+from typeguard import typechecked
+
+from snncompare.export_plots.store_plot_data_in_graph import (
+    Node_hovertexts,
+    get_neurons_in_graph,
+)
+from snncompare.optional_config.Output_config import Hover_info
+
+
+@typechecked
+def get_edges_of_node(
+    snn_graph: nx.DiGraph, node_name: str, outgoing: bool, t: int
+) -> str:
+    """Returns the synapse lines of a node by walking over all edges."""
+    node_edges: List[str] = ["<br />"]
+    if outgoing:
+        node_edges.append("outgoing:<br />")
+    else:
+        node_edges.append("incoming:<br />")
+    for edge in snn_graph.edges():
+        if (edge[0] == node_name and outgoing) or (
+            edge[1] == node_name and not outgoing
+        ):
+            if snn_graph.nodes[edge[0]]["nx_lif"][t].spikes:
+                node_edges.append(
+                    f'{edge[0]}: {snn_graph.edges[edge]["synapse"].weight}'
+                    + "<br /> "
+                )
+            elif outgoing:
+                node_edges.append(f"{edge[1]}<br /> ")
+            else:
+                node_edges.append(f"{edge[0]}<br /> ")
+    return "".join(node_edges)
+
+
+class Test_node_hovertexts(unittest.TestCase):
+    """Tests the hovertexts of the nodes per timestep."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.nr_of_timesteps: int = 3
+        self.hover_info: Hover_info = Hover_info(
+            incoming_synapses=True,
+            neuron_models=[],
+            neuron_properties=[],
+            node_names=True,
+            outgoing_synapses=True,
+            synaptic_models=[],
+            synapse_properties=[],
+        )
+
+    @typechecked
+    def get_snn_graph(self) -> nx.DiGraph:
+        """Returns a snn in which neuron i spikes at timestep i."""
+        snn_graph: nx.DiGraph = nx.DiGraph()
+        for i, name in enumerate(["a", "b", "connector"]):
+            lifs: List[LIF_neuron] = []
+            for t in range(self.nr_of_timesteps):
+                lif = LIF_neuron(name=name, bias=0.0, du=0.1, dv=0.1, vth=1.0)
+                lif.spikes = t == i
+                lifs.append(lif)
+            snn_graph.add_node(lifs[0].full_name, nx_lif=lifs)
+        names: List[str] = list(snn_graph.nodes())
+        for weight, edge in enumerate(
+            [
+                (names[0], names[1]),
+                (names[1], names[0]),
+                (names[2], names[0]),
+                (names[1], names[1]),
+            ]
+        ):
+            snn_graph.add_edge(
+                *edge,
+                synapse=Synapse(weight=weight, delay=0, change_per_t=0),
+            )
+        return snn_graph
+
+    @typechecked
+    def test_hovertexts_equal_edge_walk(self) -> None:
+        """Verifies the hovertexts of each node and timestep equal those that
+        are created by walking over all edges."""
+        snn_graph: nx.DiGraph = self.get_snn_graph()
+        node_hovertexts: Node_hovertexts = Node_hovertexts(
+            hover_info=self.hover_info,
+            lif_neurons=get_neurons_in_graph(snn_graph, 0),
+            snn_graph=snn_graph,
+            timesteps=list(range(self.nr_of_timesteps)),
+        )
+        node_names: List[str] = list(snn_graph.nodes())[:2]
+        self.assertEqual(node_hovertexts.node_names, node_names)
+        for t in range(self.nr_of_timesteps):
+            self.assertEqual(
+                node_hovertexts.get_hovertexts(t),
+                [
+                    node_name
+                    + get_edges_of_node(snn_graph, node_name, False, t)
+                    + get_edges_of_node(snn_graph, node_name, True, t)
+                    for node_name in node_names
+                ],
+            )
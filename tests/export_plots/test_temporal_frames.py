@@ -0,0 +1,171 @@
+"""Verifies updating a figure to a timestep gives the same node and edge
+properties as creating the figure of that timestep."""
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.export_plots.create_dash_fig_obj import create_svg_with_dash
+from snncompare.export_plots.Plot_config import (
+    Plot_config,
+    get_default_plot_config,
+)
+from snncompare.export_plots.temporal_frames import (
+    apply_temporal_frame,
+    create_figure_with_temporal_frames,
+    get_temporal_frame_updates,
+)
+
+
+class Test_temporal_frames(unittest.TestCase):
+    """Tests the figure updates per timestep."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.plot_config: Plot_config = get_default_plot_config()
+        self.plot_config.update_node_colours = True
+        self.nr_of_timesteps: int = 3
+
+    @typechecked
+    def get_plotted_graph(self) -> nx.DiGraph:
+        """Returns a plotted graph of which the node at t spikes."""
+        plotted_graph: nx.DiGraph = nx.DiGraph()
+        for i, node_name in enumerate(["a_0", "b_1", "c_2"]):
+            plotted_graph.add_node(
+                node_name,
+                pos=(float(i + 1), float(i % 2 + 1)),
+                label=node_name,
+                temporal_colour=[
+                    "green" if t == i else "white"
+                    for t in range(self.nr_of_timesteps)
+                ],
+                temporal_opacity=[
+                    0.8 if t == i else 0.1 for t in range(self.nr_of_timesteps)
+                ],
+                temporal_node_hovertext=[
+                    f"{node_name} t={t}" for t in range(self.nr_of_timesteps)
+                ],
+            )
+        for edge in [("a_0", "b_1"), ("b_1", "c_2"), ("c_2", "a_0")]:
+            plotted_graph.add_edge(*edge, label="W:1")
+        self.set_timestep(plotted_graph=plotted_graph, t=0)
+        return plotted_graph
+
+    @typechecked
+    def set_timestep(self, *, plotted_graph: nx.DiGraph, t: int) -> None:
+        """Sets the node and edge colours and opacities to those at t."""
+        for node_name in plotted_graph.nodes():
+            node = plotted_graph.nodes[node_name]
+            node["colour"] = node["temporal_colour"][t]
+            node["opacity"] = node["temporal_opacity"][t]
+        for edge in plotted_graph.edges():
+            plotted_graph.edges[edge]["colour"] = plotted_graph.nodes[edge[0]][
+                "colour"
+            ]
+            plotted_graph.edges[edge]["opacity"] = plotted_graph.nodes[
+                edge[0]
+            ]["opacity"]
+
+    @typechecked
+    def test_updated_figure_equals_created_figure(self) -> None:
+        """Verifies the figure that is updated to t, has the colours and
+        opacities of the figure that is created at t."""
+        dash_figure, temporal_frames = create_figure_with_temporal_frames(
+            plotted_graph=self.get_plotted_graph(),
+            plot_config=self.plot_config,
+        )
+        self.assertEqual(temporal_frames.nr_of_timesteps, 3)
+        self.assertEqual(len(temporal_frames.edge_annotations), 3)
+        for t in [2, 1, 0]:
+            apply_temporal_frame(
+                dash_figure=dash_figure,
+                plot_config=self.plot_config,
+                temporal_frames=temporal_frames,
+                t=t,
+            )
+            plotted_graph: nx.DiGraph = self.get_plotted_graph()
+            self.set_timestep(plotted_graph=plotted_graph, t=t)
+            expected_figure, _ = create_svg_with_dash(
+                graph=plotted_graph, plot_config=self.plot_config
+            )
+            self.assertEqual(
+                list(dash_figure.data[0].marker.color),
+                ["green" if t == i else "white" for i in range(3)],
+            )
+            self.assertEqual(
+                list(dash_figure.data[0].hovertext),
+                [f"{name} t={t}" for name in ["a_0", "b_1", "c_2"]],
+            )
+            self.assertEqual(
+                [
+                    (annotation.arrowcolor, annotation.opacity)
+                    for annotation in dash_figure.layout.annotations
+                ],
+                [
+                    (annotation.arrowcolor, annotation.opacity)
+                    for annotation in expected_figure.layout.annotations
+                ],
+            )
+            self.assertEqual(
+                [
+                    (shape.line.color, shape.opacity)
+                    for shape in dash_figure.layout.shapes
+                ],
+                [
+                    (shape.line.color, shape.opacity)
+                    for shape in expected_figure.layout.shapes
+                ],
+            )
+
+    @typechecked
+    def test_updates_only_contain_changing_properties(self) -> None:
+        """Verifies the updates of a timestep only contain the node colours
+        and hovertexts, and the edge colours and opacities, of the shapes and
+        annotations of the figure."""
+        self.plot_config.update_node_labels = True
+        self.plot_config.update_edge_colours = True
+        self.plot_config.update_edge_opacity = True
+        dash_figure, temporal_frames = create_figure_with_temporal_frames(
+            plotted_graph=self.get_plotted_graph(),
+            plot_config=self.plot_config,
+        )
+        updates = get_temporal_frame_updates(
+            plot_config=self.plot_config,
+            temporal_frames=temporal_frames,
+            t=1,
+        )
+        self.assertEqual(
+            updates[("data", 0, "marker", "color")],
+            ["white", "green", "white"],
+        )
+        self.assertEqual(
+            {path[:2] for path in updates},
+            {("data", 0), ("layout", "annotations"), ("layout", "shapes")},
+        )
+        self.assertEqual(
+            {path[-1] for path in updates},
+            {"color", "hovertext", "arrowcolor", "opacity"},
+        )
+        self.assertLess(
+            max(
+                path[2] for path in updates if path[:2] == ("layout", "shapes")
+            ),
+            len(dash_figure.layout.shapes),
+        )
+
+    @typechecked
+    def test_timestep_out_of_range(self) -> None:
+        """Verifies a timestep after the simulation raises an error."""
+        dash_figure, temporal_frames = create_figure_with_temporal_frames(
+            plotted_graph=self.get_plotted_graph(),
+            plot_config=self.plot_config,
+        )
+        with self.assertRaises(ValueError):
+            apply_temporal_frame(
+                dash_figure=dash_figure,
+                plot_config=self.plot_config,
+                temporal_frames=temporal_frames,
+                t=self.nr_of_timesteps,
+            )
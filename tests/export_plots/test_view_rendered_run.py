@@ -0,0 +1,69 @@
+"""Verifies the rendered frames of a run config are found on disk."""
+import base64
+import os
+import tempfile
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.export_plots.export_frames import get_frame_filepath
+from snncompare.export_plots.view_rendered_run import (
+    get_frame_src,
+    get_rendered_frames,
+)
+
+
+class Test_view_rendered_run(unittest.TestCase):
+    """Tests finding and loading the rendered frames of a run config."""
+
+    @typechecked
+    def test_get_rendered_frames(self) -> None:
+        """Verifies the consecutive frames of each rendered graph are found,
+        and that svg frames are preferred over png frames."""
+        cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                os.makedirs("latex/Images/graphs")
+                frames = [
+                    ("snn_algo_graph", "svg", 0),
+                    ("snn_algo_graph", "svg", 1),
+                    ("snn_algo_graph", "png", 0),
+                    # Frames after a missing timestep are not shown.
+                    ("snn_algo_graph", "svg", 3),
+                    ("rad_snn_algo_graph", "png", 0),
+                    ("adapted_snn_graph", "svg", 0),
+                ]
+                for graph_name, export_type, t in frames:
+                    with open(
+                        get_frame_filepath(
+                            export_type=export_type,
+                            filename=f"{graph_name}_some_id",
+                            t=t,
+                        ),
+                        "w",
+                        encoding="utf-8",
+                    ) as frame_file:
+                        frame_file.write("<svg></svg>")
+                rendered_frames = get_rendered_frames(unique_id="some_id")
+                self.assertEqual(
+                    rendered_frames["snn_algo_graph"],
+                    [
+                        "latex/Images/graphs/snn_algo_graph_some_id_0.svg",
+                        "latex/Images/graphs/snn_algo_graph_some_id_1.svg",
+                    ],
+                )
+                self.assertEqual(
+                    rendered_frames["rad_snn_algo_graph"],
+                    ["latex/Images/graphs/rad_snn_algo_graph_some_id_0.png"],
+                )
+                self.assertNotIn("rad_adapted_snn_graph", rendered_frames)
+                self.assertEqual(
+                    get_frame_src(
+                        filepath=rendered_frames["adapted_snn_graph"][0]
+                    ),
+                    "data:image/svg+xml;base64,"
+                    + base64.b64encode(b"<svg></svg>").decode("ascii"),
+                )
+            finally:
+                os.chdir(cwd)
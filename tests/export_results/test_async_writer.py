@@ -0,0 +1,85 @@
+"""Verifies the background writer writes the queued files, and that reading a
+queued file waits until it is written."""
+import os
+import tempfile
+import threading
+import unittest
+from functools import partial
+
+from typeguard import typechecked
+
+from snncompare.export_results.async_writer import (
+    Async_writer,
+    flush_writes,
+    start_async_writer,
+    stop_async_writer,
+    submit_write_job,
+)
+from snncompare.export_results.export_json_results import write_to_json
+from snncompare.import_results.read_json import load_json_file_into_dict
+
+
+class Test_async_writer(unittest.TestCase):
+    """Tests the bounded background writer and its flush barrier."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.filepath: str = "results/stage2/MDSA_0/no_adaptation/snns/a.json"
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd: str = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Stops the background writer and restores the working directory."""
+        stop_async_writer()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_reading_a_queued_file_waits_for_the_write(self) -> None:
+        """Tests a queued file is loaded once the blocked writer continues."""
+        start_async_writer(max_pending_jobs=2)
+        release = threading.Event()
+        submit_write_job(filepath="blocker", job=release.wait)
+        submit_write_job(
+            filepath=self.filepath,
+            job=partial(
+                write_to_json,
+                output_filepath=self.filepath,
+                some_dict={"V": [1, 2]},
+            ),
+        )
+        self.assertFalse(os.path.isfile(self.filepath))
+
+        threading.Timer(0.1, release.set).start()
+        self.assertEqual(
+            load_json_file_into_dict(json_filepath=self.filepath),
+            {"V": [1, 2]},
+        )
+
+    @typechecked
+    def test_flush_raises_the_error_of_a_failed_job(self) -> None:
+        """Tests errors of the writer thread are raised by the barrier."""
+
+        def failing_job() -> None:
+            """Raises an error in the writer thread."""
+            raise ValueError("Error, could not write.")
+
+        start_async_writer(max_pending_jobs=1)
+        submit_write_job(filepath=self.filepath, job=failing_job)
+        with self.assertRaises(ValueError):
+            flush_writes()
+
+    @typechecked
+    def test_max_pending_jobs_is_positive(self) -> None:
+        """Tests the queue of the writer is bounded."""
+        with self.assertRaises(ValueError):
+            Async_writer(max_pending_jobs=0)
@@ -0,0 +1,111 @@
+"""Verifies concurrent processes do not write duplicate seed hash lines, and
+that whole files are written atomically."""
+import multiprocessing
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import (
+    append_line,
+    append_line_if_missing,
+    atomic_write_bytes,
+    is_temporary_filename,
+)
+
+
+@typechecked
+def append_hashes(filepath: str) -> int:
+    """Appends the same hashes to a seed hash file, and returns the number of
+    appended lines."""
+    return sum(
+        append_line_if_missing(filepath=filepath, line=f"hash_{i}")
+        for i in range(20)
+    )
+
+
+class Test_file_locks(unittest.TestCase):
+    """Tests the atomic writes and locked appends of shared files."""
+
+    @typechecked
+    def setUp(self) -> None:
+        """Creates an empty directory for the written files."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Removes the written files."""
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_concurrent_appends_do_not_duplicate_lines(self) -> None:
+        """Tests each line is appended once by 4 concurrent processes."""
+        filepath: str = os.path.join(self.tmp_dir.name, "seeds", "42.txt")
+        with multiprocessing.Pool(4) as pool:
+            nrs_of_appended_lines: List[int] = pool.map(
+                append_hashes, [filepath] * 4
+            )
+        self.assertEqual(sum(nrs_of_appended_lines), 20)
+        with open(filepath, encoding="utf-8") as txt_file:
+            lines: List[str] = txt_file.read().splitlines()
+        self.assertEqual(sorted(lines), sorted(f"hash_{i}" for i in range(20)))
+
+    @typechecked
+    def test_atomic_write_replaces_file_without_temporary_files(self) -> None:
+        """Tests the file is replaced, and no temporary file remains."""
+        filepath: str = os.path.join(self.tmp_dir.name, "graph.json")
+        atomic_write_bytes(filepath=filepath, some_bytes=b"old")
+        atomic_write_bytes(filepath=filepath, some_bytes=b"new")
+        with open(filepath, "rb") as some_file:
+            self.assertEqual(some_file.read(), b"new")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["graph.json"])
+        self.assertFalse(is_temporary_filename(filename="graph.json"))
+        self.assertTrue(is_temporary_filename(filename=".graph.json.1.tmp"))
+
+    @typechecked
+    def test_concurrent_thread_appends_do_not_duplicate_lines(self) -> None:
+        """Tests each line is appended once by 4 threads of one process, and
+        the unconditional appends are not interleaved."""
+        filepath: str = os.path.join(self.tmp_dir.name, "manifest.jsonl")
+        long_line: str = "x" * 100000
+        threads: List[threading.Thread] = [
+            threading.Thread(target=append_hashes, args=(filepath,))
+            for _ in range(4)
+        ] + [
+            threading.Thread(
+                target=append_line,
+                kwargs={"filepath": filepath, "line": long_line},
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with open(filepath, encoding="utf-8") as txt_file:
+            lines: List[str] = txt_file.read().splitlines()
+        self.assertEqual(lines.count(long_line), 4)
+        self.assertEqual(
+            sorted(line for line in lines if line != long_line),
+            sorted(f"hash_{i}" for i in range(20)),
+        )
+
+    @typechecked
+    def test_atomic_write_uses_default_mode(self) -> None:
+        """Tests the written file gets the mode of the process umask, instead
+        of the owner-only mode of the temporary file, and changing the umask
+        afterwards does not affect it."""
+        umask: int = os.umask(0o077)
+        try:
+            filepath: str = os.path.join(self.tmp_dir.name, "graph.json")
+            atomic_write_bytes(filepath=filepath, some_bytes=b"new")
+            self.assertEqual(
+                stat.S_IMODE(os.stat(filepath).st_mode), 0o666 & ~umask
+            )
+        finally:
+            os.umask(umask)
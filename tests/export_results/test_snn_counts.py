@@ -0,0 +1,85 @@
+"""Verifies the stored neuron, synapse and spike counts equal the counts of
+the stored stage 1 and stage 2 snns."""
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.output_snn_counts import (
+    get_nr_of_spikes,
+    get_snn_counts_filepath,
+    output_snn_counts,
+)
+from snncompare.import_results.load_snn_counts import (
+    load_snn_counts,
+    load_stage_1_counts,
+    load_stage_2_counts,
+)
+
+
+class Test_snn_counts(unittest.TestCase):
+    """Tests the counts are loaded from the sidecar, and from the json files
+    of older results."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.spikes = np.asarray(
+            [[True, False, False], [False, True, True], [False, False, True]]
+        )
+
+    @typechecked
+    def test_nr_of_spikes(self) -> None:
+        """Tests the spikes of all timesteps are counted."""
+        self.assertEqual(get_nr_of_spikes(spikes=self.spikes), 4)
+
+    @typechecked
+    def test_counts_round_trip(self) -> None:
+        """Tests the loaded counts equal the outputted counts."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filepath: str = os.path.join(tmp_dir, "some_hash.json")
+            self.assertIsNone(load_snn_counts(json_filepath=json_filepath))
+            output_snn_counts(
+                json_filepath=json_filepath,
+                counts={"neurons": 3, "synapses": 2},
+            )
+            self.assertTrue(
+                os.path.isfile(
+                    get_snn_counts_filepath(json_filepath=json_filepath)
+                )
+            )
+            self.assertEqual(
+                load_stage_1_counts(stage_1_simsnn_filepath=json_filepath),
+                {"neurons": 3, "synapses": 2},
+            )
+
+    @typechecked
+    def test_counts_of_older_results(self) -> None:
+        """Tests the counts are read from the json files if there is no
+        sidecar."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stage_1_filepath: str = os.path.join(tmp_dir, "stage_1.json")
+            with open(stage_1_filepath, "w", encoding="utf-8") as json_file:
+                json.dump(
+                    {
+                        "neurons": [{"name": "a"}, {"name": "b"}],
+                        "synapses": [{"ID": ["a", "b"], "w": 1.0}],
+                    },
+                    json_file,
+                )
+            self.assertEqual(
+                load_stage_1_counts(stage_1_simsnn_filepath=stage_1_filepath),
+                {"neurons": 2, "synapses": 1},
+            )
+
+            stage_2_filepath: str = os.path.join(tmp_dir, "stage_2.json")
+            with open(stage_2_filepath, "w", encoding="utf-8") as json_file:
+                json.dump({"spikes": self.spikes.tolist()}, json_file)
+            self.assertEqual(
+                load_stage_2_counts(stage_2_simsnn_filepath=stage_2_filepath),
+                {"spikes": 4},
+            )
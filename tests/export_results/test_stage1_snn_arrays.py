@@ -0,0 +1,84 @@
+"""Verifies the compact binary stage 1 network format stores the same neuron
+and synapse properties as the json format."""
+import os
+import tempfile
+import unittest
+from math import inf
+
+from typeguard import typechecked
+
+from snncompare.export_results.output_stage1_snn_arrays import (
+    get_stage1_arrays_filepath,
+    output_snn_arrays_stage_1,
+)
+from snncompare.import_results.load_stage1_snn_arrays import (
+    load_stage1_snn_arrays,
+)
+
+
+class Test_stage1_snn_arrays(unittest.TestCase):
+    """Tests the json neuron and synapse dicts survive a round trip through
+    the binary network format."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.json_neurons = [
+            {
+                "name": f"spike_once_{i}",
+                "m": 1.0 - 0.5 * i,
+                "thr": i + 1,
+                # Mixed ints and floats.
+                "bias": 0.5 if i == 0 else i,
+                "V_min": -inf,
+                "increment_count": False,
+                "pos": [float(i), 2.0],
+            }
+            for i in range(3)
+        ]
+        self.json_synapses = [
+            {"ID": ["spike_once_0", "spike_once_2"], "w": 2.5, "d": 1},
+            {"ID": ["spike_once_2", "spike_once_1"], "w": -1.0, "d": 1},
+        ]
+
+    @typechecked
+    def test_round_trip(self) -> None:
+        """Tests the loaded properties equal the outputted properties."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filepath: str = os.path.join(tmp_dir, "some_hash.json")
+            self.assertIsNone(
+                load_stage1_snn_arrays(stage_1_simsnn_filepath=json_filepath)
+            )
+            output_snn_arrays_stage_1(
+                output_filepath=get_stage1_arrays_filepath(
+                    json_filepath=json_filepath
+                ),
+                json_neurons=self.json_neurons,
+                json_synapses=self.json_synapses,
+            )
+            snn_arrays = load_stage1_snn_arrays(
+                stage_1_simsnn_filepath=json_filepath
+            )
+
+        self.assertIsNotNone(snn_arrays)
+        self.assertEqual(snn_arrays.get_nr_of_neurons(), 3)
+        self.assertEqual(snn_arrays.get_nr_of_synapses(), 2)
+        self.assertEqual(snn_arrays.get_neuron_kwargs(), self.json_neurons)
+        # The types of the values are kept.
+        for neuron_kwargs, json_neuron in zip(
+            snn_arrays.get_neuron_kwargs(), self.json_neurons
+        ):
+            for key, value in json_neuron.items():
+                self.assertIs(type(neuron_kwargs[key]), type(value))
+        neuron_keys, neuron_rows = snn_arrays.get_neuron_rows()
+        self.assertEqual(
+            [dict(zip(neuron_keys, row)) for row in neuron_rows],
+            self.json_neurons,
+        )
+        self.assertEqual(snn_arrays.synapse_pre.tolist(), [0, 2])
+        self.assertEqual(snn_arrays.synapse_post.tolist(), [2, 1])
+        self.assertEqual(
+            snn_arrays.get_synapse_kwargs(),
+            [{"w": 2.5, "d": 1}, {"w": -1.0, "d": 1}],
+        )
@@ -0,0 +1,118 @@
+"""Verifies the stage 2 trace summary equals the aggregates of the full
+traces."""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.output_stage2_trace_summary import (
+    get_trace_summary_columns,
+    get_trace_summary_filepath,
+    output_trace_summary,
+)
+from snncompare.import_results.load_snn_counts import load_stage_2_counts
+from snncompare.import_results.load_stage2_trace_summary import (
+    load_stage2_trace_summary,
+)
+
+
+class Test_stage2_trace_summary(unittest.TestCase):
+    """Tests the summary per neuron and per network, and its round trip
+    through the summary file."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.neuron_names = ["spike_once_0", "rand_0", "selector_0"]
+        self.spikes = np.asarray(
+            [
+                [True, False, False],
+                [False, False, False],
+                [True, False, True],
+                [False, False, False],
+            ]
+        )
+        self.v = np.asarray(
+            [[1.0, 0.0, 2.0], [0.0, 0.5, 3.0], [1.0, 1.0, 0.0], [2.0, 0, 1.0]]
+        )
+        self.i = -self.v
+
+    @typechecked
+    def test_summary_columns(self) -> None:
+        """Tests the summary equals the aggregates of the traces."""
+        columns = get_trace_summary_columns(
+            neuron_names=self.neuron_names,
+            spikes=self.spikes,
+            v=self.v,
+            i=self.i,
+        )
+        self.assertEqual(columns["spike_count"].tolist(), [2, 0, 1])
+        self.assertEqual(columns["first_spike_t"].tolist(), [0, -1, 2])
+        self.assertEqual(columns["last_spike_t"].tolist(), [2, -1, 2])
+        self.assertEqual(int(columns["total_spikes"]), 3)
+        self.assertEqual(int(columns["active_timesteps"]), 2)
+        np.testing.assert_array_equal(columns["V_min"], self.v.min(axis=0))
+        np.testing.assert_array_equal(columns["V_max"], self.v.max(axis=0))
+        np.testing.assert_array_equal(columns["V_mean"], self.v.mean(axis=0))
+        np.testing.assert_array_equal(columns["I_max"], -columns["V_min"])
+
+    @typechecked
+    def test_wrong_nr_of_neurons(self) -> None:
+        """Tests traces of another number of neurons are rejected."""
+        with self.assertRaises(ValueError):
+            get_trace_summary_columns(
+                neuron_names=self.neuron_names[:2],
+                spikes=self.spikes,
+                v=self.v,
+                i=self.i,
+            )
+
+    @typechecked
+    def test_round_trip(self) -> None:
+        """Tests the loaded summary equals the outputted summary."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filepath: str = os.path.join(tmp_dir, "some_hash.json")
+            self.assertIsNone(
+                load_stage2_trace_summary(
+                    stage_2_simsnn_filepath=json_filepath
+                )
+            )
+            output_trace_summary(
+                output_filepath=get_trace_summary_filepath(
+                    json_filepath=json_filepath
+                ),
+                columns=get_trace_summary_columns(
+                    neuron_names=self.neuron_names,
+                    spikes=self.spikes,
+                    v=self.v,
+                    i=self.i,
+                ),
+            )
+            trace_summary = load_stage2_trace_summary(
+                stage_2_simsnn_filepath=json_filepath
+            )
+            self.assertIsNotNone(trace_summary)
+            self.assertEqual(trace_summary.get_nr_of_neurons(), 3)
+            self.assertEqual(trace_summary.total_spikes, 3)
+            self.assertEqual(trace_summary.active_timesteps, 2)
+            self.assertEqual(
+                trace_summary.get_neuron_summary(neuron_name="selector_0"),
+                {
+                    "spike_count": 1,
+                    "first_spike_t": 2,
+                    "last_spike_t": 2,
+                    "V_min": 0.0,
+                    "V_max": 3.0,
+                    "V_mean": 1.5,
+                    "I_min": -3.0,
+                    "I_max": -0.0,
+                    "I_mean": -1.5,
+                },
+            )
+            self.assertEqual(
+                load_stage_2_counts(stage_2_simsnn_filepath=json_filepath),
+                {"spikes": 3},
+            )
@@ -0,0 +1,125 @@
+"""Verifies the sharded, compressed storage backend is transparent to the
+json writer and reader."""
+import os
+import tempfile
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.export_results.export_json_results import write_to_json
+from snncompare.export_results.storage_backend import (
+    Storage_config,
+    get_storage_filepath,
+    load_cached_json,
+    set_storage_config,
+    stored_file_exists,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+
+
+class Test_storage_backend(unittest.TestCase):
+    """Tests writing and reading json files with the storage backends."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.logical_filepath: str = (
+            "results/stage2/MDSA_0/no_adaptation/snns/ab12cd_rand_ef34.json"
+        )
+        self.some_dict = {"V": [[0.0, 1.5]], "spikes": [[False, True]]}
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd: str = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the working directory and the default storage config."""
+        set_storage_config(storage_config=Storage_config())
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_sharded_compressed_round_trip(self) -> None:
+        """Tests a file is stored in its hash prefix shard, compressed, and
+        loaded back through its logical filepath."""
+        for compression in ["gzip", "zlib"]:
+            set_storage_config(
+                storage_config=Storage_config(
+                    sharded=True, compression=compression
+                )
+            )
+            write_to_json(
+                output_filepath=self.logical_filepath,
+                some_dict=self.some_dict,
+            )
+            storage_filepath: str = get_storage_filepath(
+                filepath=self.logical_filepath
+            )
+            self.assertTrue(
+                storage_filepath.startswith(
+                    "results/stage2/MDSA_0/no_adaptation/snns/ab/"
+                )
+            )
+            self.assertTrue(os.path.isfile(storage_filepath))
+            self.assertFalse(os.path.isfile(self.logical_filepath))
+            self.assertEqual(
+                load_json_file_into_dict(json_filepath=self.logical_filepath),
+                self.some_dict,
+            )
+            os.remove(storage_filepath)
+
+    @typechecked
+    def test_flat_results_remain_readable(self) -> None:
+        """Tests results written with the flat backend are found after
+        switching to the sharded backend."""
+        write_to_json(
+            output_filepath=self.logical_filepath, some_dict=self.some_dict
+        )
+        self.assertTrue(os.path.isfile(self.logical_filepath))
+        set_storage_config(
+            storage_config=Storage_config(sharded=True, compression="gzip")
+        )
+        self.assertTrue(stored_file_exists(filepath=self.logical_filepath))
+        self.assertEqual(
+            load_json_file_into_dict(json_filepath=self.logical_filepath),
+            self.some_dict,
+        )
+
+    @typechecked
+    def test_config_dirs_are_not_sharded(self) -> None:
+        """Tests run configs stay flat and uncompressed, as they are searched
+        for text."""
+        set_storage_config(
+            storage_config=Storage_config(sharded=True, compression="gzip")
+        )
+        run_config_filepath: str = "results/stage1/run_configs/abc.json"
+        self.assertEqual(
+            get_storage_filepath(filepath=run_config_filepath),
+            run_config_filepath,
+        )
+
+    @typechecked
+    def test_cached_json_is_reloaded_after_change(self) -> None:
+        """Tests the cached json is a copy, and a rewritten file is parsed
+        again."""
+        write_to_json(
+            output_filepath=self.logical_filepath, some_dict={"V": [1]}
+        )
+        loaded_dict = load_cached_json(filepath=self.logical_filepath)
+        loaded_dict["V"].append(2)
+        self.assertEqual(
+            load_cached_json(filepath=self.logical_filepath), {"V": [1]}
+        )
+
+        write_to_json(
+            output_filepath=self.logical_filepath, some_dict={"V": [1, 2, 3]}
+        )
+        self.assertEqual(
+            load_cached_json(filepath=self.logical_filepath), {"V": [1, 2, 3]}
+        )
@@ -0,0 +1,157 @@
+"""Verifies the checksum verification policy stores checksums in the
+manifest instead of reading the written files back."""
+import os
+import tempfile
+import unittest
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.export_results.export_json_results import write_to_json
+from snncompare.export_results.storage_backend import (
+    Storage_config,
+    set_storage_config,
+)
+from snncompare.export_results.verify_output import (
+    get_checksum,
+    get_manifest_filepath,
+    get_manifest_filepaths,
+    load_manifest,
+    verify_manifests,
+)
+from snncompare.graph_generation.export_input_graphs import (
+    has_outputted_input_graph_for_graph_size_and_nr,
+    load_input_graph_based_on_nr,
+    write_undirected_graph_to_json,
+)
+from snncompare.run_config.helper import get_run_config_filepath
+
+
+class Test_verify_output(unittest.TestCase):
+    """Tests the full, checksum and none verification policies."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.filepath: str = "results/stage4/MDSA_0/no_adaptation/snns/a.json"
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd: str = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the working directory and the default storage config."""
+        set_storage_config(storage_config=Storage_config())
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_checksum_policy_detects_modified_files(self) -> None:
+        """Tests the checksum is stored, and a modified file is reported."""
+        set_storage_config(
+            storage_config=Storage_config(verification="checksum")
+        )
+        write_to_json(output_filepath=self.filepath, some_dict={"passed": 1})
+        with open(self.filepath, "rb") as json_file:
+            expected_checksum: str = get_checksum(json_bytes=json_file.read())
+        self.assertEqual(
+            load_manifest(
+                manifest_filepath=get_manifest_filepath(filepath=self.filepath)
+            ),
+            {self.filepath: expected_checksum},
+        )
+        self.assertEqual(verify_manifests(), [])
+
+        with open(self.filepath, "w", encoding="utf-8") as json_file:
+            json_file.write('{"passed": 0}')
+        self.assertEqual(verify_manifests(), [self.filepath])
+
+    @typechecked
+    def test_manifest_per_shard_directory(self) -> None:
+        """Tests the checksums of files in different (shard) directories are
+        stored in the manifest of their directory."""
+        set_storage_config(
+            storage_config=Storage_config(
+                sharded=True, verification="checksum"
+            )
+        )
+        other_filepath: str = self.filepath.replace("a.json", "b.json")
+        for filepath in [self.filepath, other_filepath]:
+            write_to_json(output_filepath=filepath, some_dict={"passed": 1})
+        self.assertNotEqual(
+            get_manifest_filepath(filepath=self.filepath),
+            get_manifest_filepath(filepath=other_filepath),
+        )
+        self.assertEqual(len(get_manifest_filepaths()), 2)
+        for filepath in [self.filepath, other_filepath]:
+            self.assertEqual(
+                list(
+                    load_manifest(
+                        manifest_filepath=get_manifest_filepath(
+                            filepath=filepath
+                        )
+                    ).keys()
+                ),
+                [filepath],
+            )
+        self.assertEqual(verify_manifests(), [])
+
+    @typechecked
+    def test_full_and_none_policies_skip_the_manifest(self) -> None:
+        """Tests the full and none policies do not write a manifest."""
+        for verification in ["full", "none"]:
+            set_storage_config(
+                storage_config=Storage_config(verification=verification)
+            )
+            write_to_json(
+                output_filepath=self.filepath, some_dict={"passed": 1}
+            )
+        self.assertEqual(get_manifest_filepaths(), [])
+
+    @typechecked
+    def test_result_dirs_only_contain_result_files(self) -> None:
+        """Tests a run config and an input graph that are written with the
+        default policy can be found and loaded from their directories."""
+        write_to_json(
+            output_filepath="results/stage1/run_configs/some_id.json",
+            some_dict={"unique_id": "some_id"},
+        )
+        self.assertEqual(
+            get_run_config_filepath(run_config_unique_id="some_id"),
+            "results/stage1/run_configs/some_id",
+        )
+
+        input_graph: nx.Graph = nx.path_graph(3)
+        os.makedirs("results/stage1/input_graphs/3/")
+        write_undirected_graph_to_json(
+            output_filepath="results/stage1/input_graphs/3/some_hash.json",
+            the_graph=input_graph,
+        )
+        self.assertTrue(
+            has_outputted_input_graph_for_graph_size_and_nr(
+                graph_size=3, graph_nr=0
+            )
+        )
+        self.assertFalse(
+            has_outputted_input_graph_for_graph_size_and_nr(
+                graph_size=3, graph_nr=1
+            )
+        )
+        self.assertEqual(
+            list(load_input_graph_based_on_nr(graph_size=3, graph_nr=0).edges),
+            list(input_graph.edges),
+        )
+        self.assertEqual(
+            get_manifest_filepaths(),
+            [
+                "results/manifests/stage1/input_graphs/3.jsonl",
+                "results/manifests/stage1/run_configs.jsonl",
+            ],
+        )
+        self.assertEqual(verify_manifests(), [])
@@ -0,0 +1,160 @@
+"""Verifies the snns of a seed are derived from the snns of another seed by
+writing the rand_edge_weights of the seed."""
+import unittest
+from typing import Dict, List
+
+import networkx as nx
+import numpy as np
+from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
+from typeguard import typechecked
+
+from snncompare.graph_generation import seed_batch as seed_batch_module
+from snncompare.graph_generation.seed_batch import (
+    Seed_batch,
+    get_seed_batch,
+    set_seed_batch,
+)
+from snncompare.graph_generation.snn_arrays import (
+    verify_simsnn_graphs_are_equal,
+)
+from snncompare.graph_generation.stage_1_create_graphs import (
+    nx_lif_graph_to_simsnn_graph,
+)
+
+
+class Test_seed_batch(unittest.TestCase):
+    """Tests the snns of seeds that share a topology."""
+
+    @typechecked
+    def get_nx_lif_graphs(
+        self, *, rand_edge_weights: List[int], spike_once_weight: int = 1
+    ) -> Dict:
+        """Returns an input graph and an snn in which the rand_ neurons (and
+        a redundant copy) have a synapse with their rand weight to a
+        degree_receiver_ neuron. rand_0 also has a synapse to spike_once_0,
+        whose constant weight equals the first rand weight of seed 7."""
+        input_graph: nx.Graph = nx.Graph()
+        input_graph.add_edge(0, 1)
+        input_graph.graph["alg_props"] = {
+            "rand_edge_weights": rand_edge_weights
+        }
+        snn_graph: nx.DiGraph = nx.DiGraph()
+        for name in [
+            "rand_0",
+            "rand_1",
+            "r_1_rand_1",
+            "spike_once_0",
+            "degree_receiver_0_1_0",
+            "degree_receiver_1_0_0",
+        ]:
+            lif = LIF_neuron(name=name, bias=0.0, du=0.0, dv=0.0, vth=1.0)
+            lif.pos = (0.0, 0.0)
+            snn_graph.add_node(lif.full_name, nx_lif=[lif])
+        names: List[str] = list(snn_graph.nodes)
+        for edge, weight in [
+            ((names[0], names[5]), rand_edge_weights[0]),
+            ((names[0], names[3]), 3),
+            ((names[1], names[4]), rand_edge_weights[1]),
+            ((names[2], names[4]), rand_edge_weights[1]),
+            ((names[3], names[0]), spike_once_weight),
+        ]:
+            snn_graph.add_edge(
+                *edge,
+                synapse=Synapse(weight=weight, delay=0, change_per_t=0),
+            )
+        snn_graph.graph["alg_props"] = input_graph.graph["alg_props"]
+        return {"input_graph": input_graph, "snn_algo_graph": snn_graph}
+
+    @typechecked
+    def test_derived_snns_equal_built_snns(self) -> None:
+        """Verifies the snn arrays and weights of a derived seed equal those
+        of the built snn of the seed."""
+        seed_batch = Seed_batch(
+            nx_lif_graphs=self.get_nx_lif_graphs(rand_edge_weights=[3, 4]),
+            seed=7,
+        )
+        synapse_indices, nodes = seed_batch.rand_synapses["snn_algo_graph"]
+        # The synapses are in the order of the edges of the snn graph, the
+        # constant rand_0->spike_once_0 synapse is not a rand synapse.
+        self.assertEqual(synapse_indices.tolist(), [0, 2, 3])
+        self.assertEqual(nodes.tolist(), [0, 1, 1])
+
+        other_graphs: Dict = self.get_nx_lif_graphs(rand_edge_weights=[6, 2])
+        self.assertTrue(
+            seed_batch.derives(Seed_batch(nx_lif_graphs=other_graphs, seed=8))
+        )
+        self.assertEqual(
+            seed_batch.get_seed_graph_properties(
+                graph_name="snn_algo_graph",
+                input_graph=other_graphs["input_graph"],
+            ),
+            other_graphs["snn_algo_graph"].graph,
+        )
+        np.testing.assert_array_equal(
+            seed_batch.get_weight_matrix(
+                graph_name="snn_algo_graph",
+                rand_edge_weights_per_seed=[[3, 4], [6, 2]],
+            ),
+            [[3, 3, 4, 4, 1], [6, 3, 2, 2, 1]],
+        )
+
+    @typechecked
+    def test_snns_of_own_seed_equal_direct_conversion(self) -> None:
+        """Verifies the snns that a seed batch derives for its own seed equal
+        the directly converted snns."""
+        nx_lif_graphs: Dict = self.get_nx_lif_graphs(rand_edge_weights=[3, 4])
+        seed_batch = Seed_batch(nx_lif_graphs=nx_lif_graphs, seed=7)
+        verify_simsnn_graphs_are_equal(
+            expected_snn=nx_lif_graph_to_simsnn_graph(
+                snn_graph=nx_lif_graphs["snn_algo_graph"],
+                add_to_multimeter=False,
+                add_to_raster=False,
+            ),
+            snn=seed_batch.get_simsnn_graphs(
+                input_graph=nx_lif_graphs["input_graph"]
+            )["snn_algo_graph"],
+        )
+
+    @typechecked
+    def test_rand_synapse_with_other_weight_raises_error(self) -> None:
+        """Verifies a synapse from a rand_ to a degree_receiver_ neuron that
+        does not have the rand weight of its node raises an error."""
+        nx_lif_graphs: Dict = self.get_nx_lif_graphs(rand_edge_weights=[3, 4])
+        nx_lif_graphs["input_graph"].graph["alg_props"][
+            "rand_edge_weights"
+        ] = [3, 5]
+        with self.assertRaises(ValueError):
+            Seed_batch(nx_lif_graphs=nx_lif_graphs, seed=7)
+
+    @typechecked
+    def test_seed_dependent_topology_is_not_derived(self) -> None:
+        """Verifies a seed with a different weight that is not a rand weight,
+        can not be derived."""
+        seed_batch = Seed_batch(
+            nx_lif_graphs=self.get_nx_lif_graphs(rand_edge_weights=[3, 4]),
+            seed=7,
+        )
+        self.assertFalse(
+            seed_batch.derives(
+                Seed_batch(
+                    nx_lif_graphs=self.get_nx_lif_graphs(
+                        rand_edge_weights=[6, 2], spike_once_weight=2
+                    ),
+                    seed=8,
+                )
+            )
+        )
+
+    @typechecked
+    def test_least_recently_used_batch_is_removed(self) -> None:
+        """Verifies at most MAX_SEED_BATCHES seed batches are stored."""
+        seed_batch_module._seed_batches.clear()
+        max_seed_batches: int = seed_batch_module.MAX_SEED_BATCHES
+        for index in range(max_seed_batches):
+            set_seed_batch(topology_key=(index,), seed_batch=None)
+        # Using the first key keeps it in memory.
+        get_seed_batch(topology_key=(0,))
+        set_seed_batch(topology_key=(max_seed_batches,), seed_batch=None)
+        self.assertEqual(get_seed_batch(topology_key=(0,)), (True, None))
+        self.assertEqual(get_seed_batch(topology_key=(1,)), (False, None))
+        seed_batch_module._seed_batches.clear()
@@ -0,0 +1,89 @@
+"""Verifies the simsnn graph that is built from the parameter and synapse
+arrays of an nx_lif graph equals the simsnn graph that is converted neuron by
+neuron."""
+import copy
+import unittest
+
+import networkx as nx
+from simsnn.core.simulators import Simulator
+from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
+from typeguard import typechecked
+
+from snncompare.graph_generation.snn_arrays import (
+    nx_lif_graph_to_snn_arrays,
+    verify_simsnn_graphs_are_equal,
+)
+from snncompare.graph_generation.stage_1_create_graphs import (
+    nx_lif_graph_to_simsnn_graph,
+)
+from snncompare.import_results.load_stage1_snn_arrays import (
+    stage1_snn_arrays_to_simulator,
+)
+from snncompare.simulation.network_index import get_network_index
+
+
+class Test_snn_arrays(unittest.TestCase):
+    """Tests the arrays of nx_lif graphs, and the simsnn graphs that are built
+    from them."""
+
+    @typechecked
+    def get_snn_graph(self) -> nx.DiGraph:
+        """Returns an nx_lif snn graph with different neuron parameters."""
+        snn_graph: nx.DiGraph = nx.DiGraph()
+        for i, name in enumerate(["spike_once_0", "rand_0", "selector_0"]):
+            lif = LIF_neuron(
+                name=name, bias=float(i), du=0.1 * i, dv=-0.5 * i, vth=i + 1.0
+            )
+            lif.pos = (float(i), 1.0)
+            snn_graph.add_node(lif.full_name, nx_lif=[lif])
+        names = list(snn_graph.nodes)
+        for weight, edge in enumerate(
+            [(names[0], names[2]), (names[2], names[1]), (names[1], names[0])]
+        ):
+            snn_graph.add_edge(
+                *edge,
+                synapse=Synapse(weight=weight - 1, delay=0, change_per_t=0)
+            )
+        snn_graph.graph["alg_props"] = {"rand_edge_weights": [1]}
+        return snn_graph
+
+    @typechecked
+    def test_array_snn_equals_neuron_by_neuron_snn(self) -> None:
+        """Verifies both conversions yield the same neurons, parameters and
+        synapses, and the network index is kept."""
+        snn_graph: nx.DiGraph = self.get_snn_graph()
+        expected_snn: Simulator = nx_lif_graph_to_simsnn_graph(
+            snn_graph=snn_graph, add_to_multimeter=True, add_to_raster=True
+        )
+        snn: Simulator = stage1_snn_arrays_to_simulator(
+            add_to_multimeter=True,
+            add_to_raster=True,
+            snn_arrays=nx_lif_graph_to_snn_arrays(snn_graph=snn_graph),
+        )
+        verify_simsnn_graphs_are_equal(expected_snn=expected_snn, snn=snn)
+        self.assertEqual(
+            get_network_index(snn=snn).get_role_indices("selector").tolist(),
+            [2],
+        )
+
+        # A different synapse weight is detected.
+        different_snn: Simulator = copy.deepcopy(snn)
+        different_snn.network.synapses[1].w = 42
+        with self.assertRaises(ValueError):
+            verify_simsnn_graphs_are_equal(
+                expected_snn=expected_snn, snn=different_snn
+            )
+
+    @typechecked
+    def test_arrays(self) -> None:
+        """Verifies the parameter and synapse arrays follow the node and edge
+        order."""
+        snn_graph: nx.DiGraph = self.get_snn_graph()
+        snn_arrays = nx_lif_graph_to_snn_arrays(snn_graph=snn_graph)
+        self.assertEqual(snn_arrays.get_nr_of_neurons(), 3)
+        self.assertEqual(snn_arrays.synapse_pre.tolist(), [0, 1, 2])
+        self.assertEqual(snn_arrays.synapse_post.tolist(), [2, 0, 1])
+        self.assertEqual(
+            [kwargs["w"] for kwargs in snn_arrays.get_synapse_kwargs()],
+            [-1, 1, 0],
+        )
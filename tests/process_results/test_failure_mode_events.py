@@ -0,0 +1,130 @@
+"""Verifies the failure mode events are filtered and grouped per run
+config."""
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.export_results.output_failure_mode_events import (
+    FAILURE_KINDS,
+    SPIKE_FAILURE_KINDS,
+    get_failure_mode_events_filepath,
+)
+from snncompare.import_results.load_failure_mode_events import (
+    Failure_mode_events,
+    concatenate_failure_mode_events,
+    load_failure_mode_events,
+)
+
+
+@typechecked
+def get_events(
+    *, run_config_id: str, seed: int, failures: List[tuple]
+) -> Failure_mode_events:
+    """Returns the events of a run config, with a (timestep, failure kind,
+    neuron name) per failure."""
+    nr_of_events: int = len(failures)
+    return Failure_mode_events(
+        columns={
+            "run_config_id": np.full(nr_of_events, run_config_id),
+            "adaptation": np.full(nr_of_events, "redundancy_2"),
+            "algorithm_setting": np.full(nr_of_events, "MDSA_0"),
+            "seed": np.full(nr_of_events, seed, dtype=np.int64),
+            "graph_size": np.full(nr_of_events, 3, dtype=np.int64),
+            "timestep": np.asarray(
+                [failure[0] for failure in failures], dtype=np.int64
+            ),
+            "failure_kind": np.asarray(
+                [FAILURE_KINDS.index(failure[1]) for failure in failures],
+                dtype=np.int8,
+            ),
+            "neuron_name": np.asarray(
+                [failure[2] for failure in failures], dtype=str
+            ),
+        }
+    )
+
+
+class Test_failure_mode_events(unittest.TestCase):
+    """Tests the filtering and grouping of the failure mode events."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.events: Failure_mode_events = concatenate_failure_mode_events(
+            events_list=[
+                get_events(
+                    run_config_id="a",
+                    seed=1,
+                    failures=[
+                        (7, "incorrectly_spikes", "n_0"),
+                        (4, "excitatory_delta_u", "n_1"),
+                        (5, "incorrectly_silent", "n_1"),
+                        (5, "incorrectly_silent", "n_2"),
+                    ],
+                ),
+                get_events(
+                    run_config_id="b",
+                    seed=2,
+                    failures=[(3, "incorrectly_spikes", "n_0")],
+                ),
+                get_events(run_config_id="c", seed=1, failures=[]),
+            ]
+        )
+
+    @typechecked
+    def test_filter_events(self) -> None:
+        """Verifies the events are filtered on their settings."""
+        spike_events: Failure_mode_events = self.events.select(
+            self.events.get_mask(seed=1, failure_kinds=SPIKE_FAILURE_KINDS)
+        )
+        self.assertEqual(
+            spike_events.columns["neuron_name"].tolist(), ["n_0", "n_1", "n_2"]
+        )
+        self.assertEqual(len(self.events.select(self.events.get_mask())), 5)
+
+    @typechecked
+    def test_first_divergence(self) -> None:
+        """Verifies the first timestep with a failure is found per run config,
+        for the selected failure kinds."""
+        self.assertEqual(self.events.get_first_divergence(), {"a": 4, "b": 3})
+        spike_events: Failure_mode_events = self.events.select(
+            self.events.get_mask(failure_kinds=SPIKE_FAILURE_KINDS)
+        )
+        first_events: Failure_mode_events = spike_events.select(
+            spike_events.get_first_divergence_mask()
+        )
+        self.assertEqual(
+            first_events.columns["neuron_name"].tolist(), ["n_1", "n_2", "n_0"]
+        )
+        self.assertEqual(first_events.columns["timestep"].tolist(), [5, 5, 3])
+
+    @typechecked
+    def test_load_events(self) -> None:
+        """Verifies the event table is loaded next to the stage 7 file, and
+        that None is returned if it has not been outputted."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stage_7_filepath: str = os.path.join(tmp_dir, "some_snn.json")
+            self.assertIsNone(
+                load_failure_mode_events(stage_7_filepath=stage_7_filepath)
+            )
+            columns: Dict[str, np.ndarray] = self.events.columns
+            np.savez_compressed(
+                get_failure_mode_events_filepath(
+                    json_filepath=stage_7_filepath
+                ),
+                **columns,
+            )
+            loaded_events = load_failure_mode_events(
+                stage_7_filepath=stage_7_filepath
+            )
+            self.assertIsNotNone(loaded_events)
+            for key, column in columns.items():
+                np.testing.assert_array_equal(
+                    loaded_events.columns[key],
+                    column,  # type:ignore[union-attr]
+                )
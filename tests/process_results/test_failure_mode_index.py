@@ -0,0 +1,162 @@
+"""Verifies the failure mode index groups the run configs per dropdown
+selection, and loads the records of a selection on demand."""
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+from snnadaptation.Adaptation import Adaptation
+from snnradiation.Rad_damage import Rad_damage
+from typeguard import typechecked
+
+from snncompare.export_results.output_failure_mode_events import (
+    get_failure_mode_event_columns,
+)
+from snncompare.import_results.load_failure_mode_events import (
+    Failure_mode_events,
+)
+from snncompare.process_results import failure_mode_index
+from snncompare.process_results.failure_mode_index import (
+    Failure_mode_index,
+    Failure_mode_record,
+    get_selection_key,
+    load_failure_mode_record,
+)
+from snncompare.run_config.interned_settings import get_interned_setting
+from snncompare.run_config.Run_config import Run_config
+
+
+class Test_failure_mode_index(unittest.TestCase):
+    """Tests the selection index, the lazy loading and the json fallback of
+    the failure mode records."""
+
+    @typechecked
+    def get_run_config(
+        self, *, graph_nr: int, m_val: int, seed: int
+    ) -> Run_config:
+        """Returns a radiated, adapted run config."""
+        return Run_config(
+            adaptation=get_interned_setting(
+                setting_class=Adaptation,
+                adaptation_type="redundancy",
+                redundancy=2,
+            ),
+            algorithm={"MDSA": {"m_val": m_val}},
+            graph_size=4,
+            graph_nr=graph_nr,
+            radiation=get_interned_setting(
+                setting_class=Rad_damage,
+                amplitude=float(-(10**10)),
+                effect_type="neuron_death",
+                excitatory=False,
+                inhibitory=True,
+                probability_per_t=0.1,
+            ),
+            seed=seed,
+            simulator="simsnn",
+        )
+
+    @typechecked
+    def test_run_configs_are_indexed_per_selection(self) -> None:
+        """Verifies the run configs that only differ in their graph nr share
+        a selection, and other seeds and algorithm settings do not."""
+        run_configs: List[Run_config] = [
+            self.get_run_config(graph_nr=0, m_val=0, seed=1),
+            self.get_run_config(graph_nr=1, m_val=0, seed=1),
+            self.get_run_config(graph_nr=0, m_val=0, seed=2),
+            self.get_run_config(graph_nr=0, m_val=1, seed=1),
+        ]
+        index: Failure_mode_index = Failure_mode_index(run_configs=run_configs)
+        self.assertEqual(len(index.run_configs), 3)
+        self.assertEqual(
+            index.run_configs[get_selection_key(run_config=run_configs[0])],
+            run_configs[:2],
+        )
+        self.assertEqual(
+            index.run_configs[get_selection_key(run_config=run_configs[3])],
+            run_configs[3:],
+        )
+
+    @typechecked
+    def test_records_are_loaded_once_per_selection(self) -> None:
+        """Verifies the records of a selection are loaded when the selection
+        is first shown, and again after they are evicted from the cache."""
+        run_configs: List[Run_config] = [
+            self.get_run_config(graph_nr=0, m_val=0, seed=seed)
+            for seed in [1, 2]
+        ]
+        index: Failure_mode_index = Failure_mode_index(
+            run_configs=run_configs, cache_size=1
+        )
+        loaded_run_configs: List[Run_config] = []
+
+        def load_record(*, run_config: Run_config) -> Failure_mode_record:
+            """Stores which run config is loaded, and returns a record without
+            failure modes."""
+            loaded_run_configs.append(run_config)
+            return Failure_mode_record(
+                events=Failure_mode_events(
+                    columns=get_failure_mode_event_columns(
+                        failure_modes={}, run_config=run_config
+                    )
+                ),
+                passed=True,
+                run_config=run_config,
+            )
+
+        with mock.patch.object(
+            failure_mode_index, "load_failure_mode_record", load_record
+        ):
+            for run_config in [run_configs[0]] * 2 + run_configs[1:]:
+                index.get_records(*get_selection_key(run_config=run_config))
+            self.assertEqual(loaded_run_configs, run_configs)
+
+            # The first selection was evicted by the second one.
+            index.get_records(*get_selection_key(run_config=run_configs[0]))
+            self.assertEqual(len(loaded_run_configs), 3)
+            self.assertEqual(
+                index.get_records("unknown_setting", 1, 4),
+                [],
+            )
+
+    @typechecked
+    def test_events_fall_back_to_stage_7_json(self) -> None:
+        """Verifies the events are read from the stage 7 json file, if the
+        event table has not been outputted."""
+        run_config: Run_config = self.get_run_config(
+            graph_nr=0, m_val=0, seed=1
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepaths: Dict[int, str] = {
+                stage_index: os.path.join(tmp_dir, f"stage{stage_index}.json")
+                for stage_index in [4, 7]
+            }
+            for stage_index, content in [
+                (4, {"passed": False}),
+                (7, {"incorrectly_silent": {"5": ["n_1", "n_2"]}}),
+            ]:
+                with open(
+                    filepaths[stage_index], "w", encoding="utf-8"
+                ) as json_file:
+                    json.dump(content, json_file)
+            with mock.patch.object(
+                failure_mode_index,
+                "get_rad_adapted_filepaths",
+                return_value=filepaths,
+            ):
+                record: Failure_mode_record = load_failure_mode_record(
+                    run_config=run_config
+                )
+
+        self.assertFalse(record.passed)
+        self.assertEqual(len(record.events), 2)
+        self.assertEqual(record.events.columns["timestep"].tolist(), [5, 5])
+        self.assertEqual(
+            record.events.columns["neuron_name"].tolist(), ["n_1", "n_2"]
+        )
+        self.assertEqual(
+            record.events.columns["run_config_id"].tolist(),
+            [run_config.unique_id] * 2,
+        )
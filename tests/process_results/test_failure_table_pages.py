@@ -0,0 +1,62 @@
+"""Verifies the failure mode table is converted into rows that are sent to
+the browser per page."""
+import unittest
+from typing import Dict, Tuple
+
+from typeguard import typechecked
+
+from snncompare.process_results.helper import (
+    convert_table_to_records,
+    get_table_page,
+)
+
+
+class Test_failure_table_pages(unittest.TestCase):
+    """Tests the rows and pages of the failure mode table."""
+
+    @typechecked
+    def test_convert_table_to_records(self) -> None:
+        """Verifies the cells with multiple neuron lists are joined, and
+        missing cells stay empty."""
+        records: Tuple[Dict[str, str], ...] = convert_table_to_records(
+            table=[
+                ["Timestep", "redundancy_2", "redundancy_4"],
+                ["3", ["<b>a</b>", "<u>b</u>"], ""],
+            ]
+        )
+        self.assertEqual(
+            records,
+            (
+                {
+                    "Timestep": "3",
+                    "redundancy_2": "<b>a</b><u>b</u>",
+                    "redundancy_4": "",
+                },
+            ),
+        )
+
+    @typechecked
+    def test_get_table_page(self) -> None:
+        """Verifies only the rows of the page are returned, and that a page
+        beyond the end of a shorter table moves to its last page."""
+        records: Tuple[Dict[str, str], ...] = tuple(
+            {"Timestep": str(t)} for t in range(7)
+        )
+        page_records, page_count, page_current = get_table_page(
+            records=records, page_current=1, page_size=3
+        )
+        self.assertEqual(
+            [record["Timestep"] for record in page_records], ["3", "4", "5"]
+        )
+        self.assertEqual((page_count, page_current), (3, 1))
+
+        page_records, page_count, page_current = get_table_page(
+            records=records[:2], page_current=2, page_size=3
+        )
+        self.assertEqual(len(page_records), 2)
+        self.assertEqual((page_count, page_current), (1, 0))
+
+        self.assertEqual(
+            get_table_page(records=(), page_current=0, page_size=3),
+            ([], 1, 0),
+        )
@@ -0,0 +1,123 @@
+"""Tests whether the stage benchmarks are compared against the baseline
+correctly."""
+import os
+import tempfile
+import unittest
+from typing import Dict
+from unittest import mock
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.progress_report import benchmark_stages
+from snncompare.progress_report.benchmark_stages import (
+    compare_benchmarks,
+    create_synthetic_input_graph,
+    load_benchmark,
+    store_benchmark,
+)
+
+
+class Test_benchmark_stages(unittest.TestCase):
+    """Tests the comparison of stage benchmarks."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.baseline = {
+            "metadata": {},
+            "durations": {
+                "simsnn_size_3_m_0": {
+                    "simulation": 1.0,
+                    "set_results": 0.5,
+                    "stage_2_import": 0.0001,
+                }
+            },
+        }
+
+    @typechecked
+    def test_flags_regression_above_threshold(self) -> None:
+        """Verifies only the operations that are slower than the threshold
+        are reported."""
+        current = {
+            "metadata": {},
+            "durations": {
+                "simsnn_size_3_m_0": {
+                    "simulation": 1.5,
+                    "set_results": 0.55,
+                    # Below the minimum duration, so noise.
+                    "stage_2_import": 0.001,
+                },
+                # Not in the baseline.
+                "simsnn_size_4_m_0": {"simulation": 9.0},
+            },
+        }
+        regressions = compare_benchmarks(
+            baseline=self.baseline, current=current, threshold=0.2
+        )
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["case"], "simsnn_size_3_m_0")
+        self.assertEqual(regressions[0]["operation"], "simulation")
+        self.assertAlmostEqual(regressions[0]["slowdown"], 0.5)
+
+    @typechecked
+    def test_no_regression_against_itself(self) -> None:
+        """Verifies a benchmark has no regressions against itself, also after
+        storing and loading it."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath: str = os.path.join(tmp_dir, "benchmarks/baseline.json")
+            store_benchmark(benchmark=self.baseline, filepath=filepath)
+            loaded = load_benchmark(filepath=filepath)
+        self.assertEqual(loaded, self.baseline)
+        self.assertEqual(
+            compare_benchmarks(
+                baseline=self.baseline, current=loaded, threshold=0.0
+            ),
+            [],
+        )
+
+    @typechecked
+    def test_synthetic_input_graph_is_reproducible(self) -> None:
+        """Verifies the synthetic input graphs are connected and
+        reproducible."""
+        for graph_size in [3, 10, 20]:
+            input_graph: nx.Graph = create_synthetic_input_graph(
+                graph_size=graph_size, seed=7
+            )
+            self.assertEqual(len(input_graph), graph_size)
+            self.assertTrue(nx.is_connected(input_graph))
+            self.assertTrue(
+                nx.utils.misc.graphs_equal(
+                    input_graph,
+                    create_synthetic_input_graph(
+                        graph_size=graph_size, seed=7
+                    ),
+                )
+            )
+
+    @typechecked
+    def test_repetitions_keep_working_directory(self) -> None:
+        """Verifies the median over the repetitions is stored, and the
+        working directory of this process is not changed."""
+        original_cwd: str = os.getcwd()
+        repetition_durations = iter([1.0, 3.0, 2.0])
+
+        def run_repetition(**_: object) -> Dict[str, Dict[str, float]]:
+            """Returns the durations of a repetition, and verifies it is
+            started from the original working directory."""
+            self.assertEqual(os.getcwd(), original_cwd)
+            return {
+                "simsnn_size_3_m_0": {"simulation": next(repetition_durations)}
+            }
+
+        with mock.patch.object(
+            benchmark_stages, "run_benchmark_repetition", run_repetition
+        ):
+            benchmark = benchmark_stages.benchmark_stages(
+                graph_sizes=[3], m_vals=[0], repetitions=3
+            )
+        self.assertEqual(os.getcwd(), original_cwd)
+        self.assertEqual(
+            benchmark["durations"], {"simsnn_size_3_m_0": {"simulation": 2.0}}
+        )
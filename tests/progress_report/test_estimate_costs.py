@@ -0,0 +1,152 @@
+"""Verifies the pre-run cost estimator scales with the snn size, and
+calibrates against stored run metrics."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.progress_report.estimate_costs import (
+    Cost_calibration,
+    calibrate_from_run_metrics,
+    predict_graph_size,
+    predict_mdsa_snn_size,
+)
+
+
+class Test_estimate_costs(unittest.TestCase):
+    """Tests the first-order MDSA snn size model and its calibration."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(  # type: ignore[no-untyped-def]
+        self, *args, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_snn_size_grows_with_m_val_and_redundancy(self) -> None:
+        """Tests more rounds and more redundancy yield larger snns."""
+        m_0 = predict_mdsa_snn_size(graph_size=5, m_val=0, nr_of_edges=6)
+        m_2 = predict_mdsa_snn_size(graph_size=5, m_val=2, nr_of_edges=6)
+        self.assertLess(m_0[0], m_2[0])
+        self.assertLess(m_0[1], m_2[1])
+
+        unadapted = predict_graph_size(
+            adaptation_type="redundancy",
+            calibration=Cost_calibration(),
+            graph_name="snn_algo_graph",
+            graph_size=5,
+            m_val=1,
+            nr_of_edges=6,
+            redundancy=2,
+        )
+        adapted = predict_graph_size(
+            adaptation_type="redundancy",
+            calibration=Cost_calibration(),
+            graph_name="adapted_snn_graph",
+            graph_size=5,
+            m_val=1,
+            nr_of_edges=6,
+            redundancy=2,
+        )
+        self.assertAlmostEqual(adapted[0], 3 * unadapted[0])
+        self.assertAlmostEqual(adapted[1], 9 * unadapted[1])
+
+    @typechecked
+    def test_calibrates_on_run_metrics(self) -> None:
+        """Tests the neuron scale and stage 2 bytes per neuron timestep are
+        derived from the stored run metrics."""
+        pred_neurons, _ = predict_mdsa_snn_size(
+            graph_size=4, m_val=1, nr_of_edges=3
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(
+                os.path.join(tmp_dir, "some_id.json"), "w", encoding="utf-8"
+            ) as json_file:
+                json.dump(
+                    {
+                        "algorithm_name": "MDSA",
+                        "algorithm_parameter": 1,
+                        "adaptation_type": "redundancy",
+                        "redundancy": 1,
+                        "graph_size": 4,
+                        "nr_of_edges": 3,
+                        "simulator": "simsnn",
+                        "stage_durations": {"1": 1.0, "2": 2.0, "4": 0.5},
+                        "graphs": {
+                            "snn_algo_graph": {
+                                "neurons": int(2 * pred_neurons),
+                                "synapses": 100,
+                                "timesteps": 40,
+                                "bytes": {"1": 1000, "2": 8000, "4": 300},
+                            }
+                        },
+                    },
+                    json_file,
+                )
+            calibration = calibrate_from_run_metrics(
+                calibration=Cost_calibration(),
+                run_metrics_dir=f"{tmp_dir}/",
+            )
+        self.assertEqual(calibration.nr_of_calibration_runs, 1)
+        self.assertAlmostEqual(
+            calibration.neuron_scale,
+            int(2 * pred_neurons) / pred_neurons,
+        )
+        self.assertAlmostEqual(
+            calibration.bytes_per_neuron_timestep_stage_2,
+            8000 / (int(2 * pred_neurons) * 40),
+        )
+        self.assertEqual(calibration.bytes_per_graph_stage_4, 300)
+        self.assertEqual(calibration.seconds_per_graph_stage_4, 0.5)
+
+    @typechecked
+    def test_loaded_stages_are_not_calibrated(self) -> None:
+        """Tests the time coefficients of the stages that a run loaded from
+        file, and therefore did not record, keep their default values."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(
+                os.path.join(tmp_dir, "some_id.json"), "w", encoding="utf-8"
+            ) as json_file:
+                json.dump(
+                    {
+                        "algorithm_name": "MDSA",
+                        "algorithm_parameter": 1,
+                        "adaptation_type": "redundancy",
+                        "redundancy": 1,
+                        "graph_size": 4,
+                        "nr_of_edges": 3,
+                        "simulator": "simsnn",
+                        "stage_durations": {"4": 0.4},
+                        "graphs": {
+                            graph_name: {
+                                "neurons": 50,
+                                "synapses": 100,
+                                "timesteps": 40,
+                                "bytes": {"1": 0, "2": 0, "4": 300},
+                            }
+                            for graph_name in [
+                                "snn_algo_graph",
+                                "adapted_snn_graph",
+                            ]
+                        },
+                    },
+                    json_file,
+                )
+            calibration = calibrate_from_run_metrics(
+                calibration=Cost_calibration(),
+                run_metrics_dir=f"{tmp_dir}/",
+            )
+        default_calibration: Cost_calibration = Cost_calibration()
+        self.assertEqual(
+            calibration.seconds_per_element_stage_1,
+            default_calibration.seconds_per_element_stage_1,
+        )
+        self.assertEqual(
+            calibration.seconds_per_element_timestep,
+            default_calibration.seconds_per_element_timestep,
+        )
+        self.assertAlmostEqual(calibration.seconds_per_graph_stage_4, 0.2)
@@ -0,0 +1,112 @@
+"""Verifies the long-lived worker executes the jobs of a client, and streams
+their output."""
+import io
+import multiprocessing
+import os
+import socket
+import subprocess  # nosec
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+
+from typeguard import typechecked
+
+from snncompare.server.client import run_client, submit_request
+from snncompare.server.serve import serve
+
+
+class Test_serve(unittest.TestCase):
+    """Tests a job is executed by the server and its output is streamed to
+    the client."""
+
+    @typechecked
+    def setUp(self) -> None:
+        """Starts the server in a separate process, on a socket in an empty
+        directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path: str = os.path.join(self.tmp_dir.name, "test.sock")
+        self.server = multiprocessing.Process(
+            target=serve,
+            kwargs={
+                "custom_config_path": "src/snncompare/json_configurations/",
+                "socket_path": self.socket_path,
+            },
+        )
+        self.server.start()
+        while not os.path.exists(self.socket_path):
+            time.sleep(0.01)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Stops the server."""
+        submit_request(
+            request={"command": "shutdown"}, socket_path=self.socket_path
+        )
+        self.server.join()
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_job_output_is_streamed_to_client(self) -> None:
+        """Tests the help text of a job is streamed, and that the server
+        keeps running after the job."""
+        client_output = io.StringIO()
+        with redirect_stdout(client_output):
+            exit_code: int = run_client(
+                argv=["--submit", "-sp", self.socket_path, "--help"]
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertIn("--experiment-settings-name", client_output.getvalue())
+        self.assertEqual(
+            submit_request(
+                request={"command": "ping"}, socket_path=self.socket_path
+            ),
+            0,
+        )
+
+    @typechecked
+    def test_fast_profile_job_is_rejected(self) -> None:
+        """Tests a job can not select the --fast profile, because the profile
+        of the server is fixed when it imports its modules."""
+        client_output = io.StringIO()
+        with redirect_stdout(client_output):
+            exit_code: int = run_client(
+                argv=["--submit", "-sp", self.socket_path, "--fast"]
+            )
+        self.assertEqual(exit_code, 2)
+        self.assertIn(
+            "--fast only applies to --serve", client_output.getvalue()
+        )
+
+    @typechecked
+    def test_second_server_is_refused(self) -> None:
+        """Tests a second server does not remove the socket of a running
+        server."""
+        with self.assertRaises(ValueError):
+            serve(
+                custom_config_path="src/snncompare/json_configurations/",
+                socket_path=self.socket_path,
+            )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(self.socket_path)
+
+    @typechecked
+    def test_client_only_imports_standard_library(self) -> None:
+        """Verifies submitting a job does not import third party packages."""
+        imported = subprocess.run(  # nosec
+            [
+                sys.executable,
+                "-c",
+                "import sys; import snncompare.server.client; "
+                + "print(sorted(sys.modules))",
+            ],
+            check=True,
+            capture_output=True,
+            env={**os.environ, "PYTHONPATH": "src"},
+            text=True,
+        ).stdout
+        for package in ["typeguard", "numpy", "networkx"]:
+            self.assertNotIn(f"'{package}'", imported)
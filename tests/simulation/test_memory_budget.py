@@ -0,0 +1,138 @@
+"""Verifies the simulation arrays are spilled to memory mapped files and
+released, and the peak memory of a run is measured."""
+import os
+import tempfile
+import time
+import unittest
+from typing import Optional
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.simulation.memory_budget import (
+    Peak_rss_monitor,
+    exceeds_memory_budget,
+    get_current_rss_bytes,
+    release_simulation_arrays,
+    spill_if_exceeds_memory_budget,
+    spill_simulation_arrays,
+)
+
+
+class Test_memory_budget(unittest.TestCase):
+    """Tests the spilling and releasing of the simulation arrays."""
+
+    @typechecked
+    def get_simulated_graphs_dict(self) -> dict:
+        """Returns a graphs dict with a simulator that has simulation
+        arrays."""
+        snn: Simulator = Simulator(Network())
+        snn.multimeter.V = np.arange(12, dtype=float).reshape(4, 3)
+        snn.multimeter.I = np.ones((4, 3))
+        snn.raster.spikes = np.eye(4, 3, dtype=bool)
+        return {"input_graph": None, "snn_algo_graph": snn}
+
+    @typechecked
+    def test_spilled_arrays_are_equal_and_released(self) -> None:
+        """Verifies the spilled arrays have the same values, and the spill
+        files are removed when the arrays are released."""
+        graphs_dict: dict = self.get_simulated_graphs_dict()
+        expected_v: np.ndarray = graphs_dict[
+            "snn_algo_graph"
+        ].multimeter.V.copy()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            spill_dir: str = os.path.join(tmp_dir, "spill")
+            spilled_bytes: int = spill_simulation_arrays(
+                graphs_dict=graphs_dict, spill_dir=spill_dir
+            )
+            snn: Simulator = graphs_dict["snn_algo_graph"]
+            self.assertEqual(spilled_bytes, 96 + 96 + 12)
+            self.assertIsInstance(snn.multimeter.V, np.memmap)
+            np.testing.assert_array_equal(snn.multimeter.V, expected_v)
+            np.testing.assert_array_equal(
+                snn.raster.spikes, np.eye(4, 3, dtype=bool)
+            )
+
+            # Copy-on-write: the spill files are not modified.
+            snn.multimeter.V[0, 0] = 42
+            np.testing.assert_array_equal(
+                np.load(os.path.join(spill_dir, "snn_algo_graph_V.npy")),
+                expected_v,
+            )
+
+            release_simulation_arrays(
+                graphs_dict=graphs_dict, spill_dir=spill_dir
+            )
+            self.assertEqual(snn.multimeter.V.size, 0)
+            self.assertEqual(snn.raster.spikes.size, 0)
+            self.assertFalse(os.path.exists(spill_dir))
+
+    @typechecked
+    def test_peak_rss_includes_temporary_allocation(self) -> None:
+        """Verifies the peak memory includes an array that is freed before
+        the measurement ends."""
+        if get_current_rss_bytes() == 0:
+            self.skipTest("Resident memory is not available on platform.")
+        with Peak_rss_monitor() as peak_rss_monitor:
+            start_rss: int = get_current_rss_bytes()
+            some_array: np.ndarray = np.ones(64 * 1024**2 // 8)
+            del some_array
+        self.assertGreater(
+            peak_rss_monitor.peak_rss, start_rss + 48 * 1024**2
+        )
+
+    @typechecked
+    def test_exceeds_memory_budget(self) -> None:
+        """Verifies no budget is never exceeded."""
+        self.assertFalse(exceeds_memory_budget(memory_budget=None))
+        if get_current_rss_bytes() > 0:
+            self.assertTrue(exceeds_memory_budget(memory_budget=1))
+
+    @typechecked
+    def get_peak_rss_of_simulations(
+        self, *, memory_budget: Optional[int], spill_dir: str
+    ) -> int:
+        """Returns the peak memory of simulating 4 snns one after the other,
+        with a memory budget check after each simulation, like stage 2."""
+        graphs_dict: dict = {
+            graph_name: Simulator(Network())
+            for graph_name in [
+                "snn_algo_graph",
+                "adapted_snn_graph",
+                "rad_snn_algo_graph",
+                "rad_adapted_snn_graph",
+            ]
+        }
+        with Peak_rss_monitor() as peak_rss_monitor:
+            for snn in graphs_dict.values():
+                # Simulating writes 32 MB of voltages.
+                snn.multimeter.V = np.ones((1024, 4096))
+                time.sleep(0.1)
+                spill_if_exceeds_memory_budget(
+                    graphs_dict=graphs_dict,
+                    memory_budget=memory_budget,
+                    spill_dir=spill_dir,
+                )
+        release_simulation_arrays(graphs_dict=graphs_dict, spill_dir=spill_dir)
+        return peak_rss_monitor.peak_rss
+
+    @typechecked
+    def test_spilling_during_simulation_lowers_peak(self) -> None:
+        """Verifies spilling the simulated arrays before the next snn is
+        simulated lowers the peak memory of the simulations."""
+        if get_current_rss_bytes() == 0:
+            self.skipTest("Resident memory is not available on platform.")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            spill_dir: str = os.path.join(tmp_dir, "spill")
+            peak_without_budget: int = self.get_peak_rss_of_simulations(
+                memory_budget=None, spill_dir=spill_dir
+            )
+            peak_with_budget: int = self.get_peak_rss_of_simulations(
+                memory_budget=get_current_rss_bytes() // 1024**2 + 1,
+                spill_dir=spill_dir,
+            )
+        # Without a budget, the arrays of all 4 snns are resident, with the
+        # budget at most those of the last snn and a spill are resident.
+        self.assertLess(peak_with_budget, peak_without_budget - 48 * 1024**2)
@@ -0,0 +1,180 @@
+"""Verifies the network index finds the neurons by name and role, and the
+synapses of each neuron, of simsnn networks and networkx snn graphs."""
+import unittest
+from typing import List
+
+import networkx as nx
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.helper import get_rand_synapse_weights
+from snncompare.simulation.add_radiation_graphs import (
+    apply_radiation_death_to_empty_simsnn_neuron,
+)
+from snncompare.simulation.network_index import (
+    Network_index,
+    drop_network_index,
+    get_network_index,
+)
+
+
+class Test_network_index(unittest.TestCase):
+    """Tests the network index of simsnn networks and networkx graphs."""
+
+    @typechecked
+    def get_snn(self, *, neuron_names: List[str], edges: List) -> Simulator:
+        """Returns a simsnn network with the neurons and synapses."""
+        net = Network()
+        neurons = []
+        for neuron_name in neuron_names:
+            neuron = net.createLIF(ID=neuron_name)
+            neuron.name = neuron_name
+            neurons.append(neuron)
+        for pre, post, weight in edges:
+            net.createSynapse(pre=neurons[pre], post=neurons[post], w=weight)
+        return Simulator(net)
+
+    @typechecked
+    def test_names_roles_and_adjacency(self) -> None:
+        """Verifies the name map, role groups and the in- and outgoing
+        synapses match a scan over the network."""
+        neuron_names: List[str] = [
+            "rand_0",
+            "degree_receiver_0_1_0",
+            "selector_0",
+            "r_1_rand_0",
+            "spike_once_0",
+            "connector_0",
+        ]
+        edges: List = [(0, 1, 3), (2, 1, 1), (0, 2, 5), (4, 0, 1), (1, 2, 2)]
+        snn: Simulator = self.get_snn(neuron_names=neuron_names, edges=edges)
+        network_index: Network_index = get_network_index(snn=snn)
+
+        for index, neuron_name in enumerate(neuron_names):
+            self.assertEqual(
+                network_index.get_neuron_index(neuron_name), index
+            )
+            self.assertEqual(
+                network_index.get_out_synapse_indices(index).tolist(),
+                [s for s, edge in enumerate(edges) if edge[0] == index],
+            )
+            self.assertEqual(
+                network_index.get_in_synapse_indices(index).tolist(),
+                [s for s, edge in enumerate(edges) if edge[1] == index],
+            )
+        self.assertEqual(network_index.get_successors(0).tolist(), [1, 2])
+        self.assertEqual(network_index.get_predecessors(2).tolist(), [0, 1])
+        self.assertEqual(network_index.get_role_indices("rand").tolist(), [0])
+        self.assertEqual(
+            network_index.get_role_indices("redundant").tolist(), [3]
+        )
+        self.assertEqual(
+            network_index.role_names["connector"], {"connector_0"}
+        )
+        with self.assertRaises(KeyError):
+            network_index.get_neuron_index("unknown")
+
+        # The index is cached, and rebuilt when the network grows.
+        self.assertIs(get_network_index(snn=snn), network_index)
+        snn.network.createSynapse(
+            pre=snn.network.nodes[5], post=snn.network.nodes[0]
+        )
+        self.assertEqual(
+            get_network_index(snn=snn).get_in_synapse_indices(0).tolist(),
+            [3, 5],
+        )
+
+    @typechecked
+    def test_renamed_or_reordered_network_is_reindexed(self) -> None:
+        """Verifies the cached index is rebuilt if a boundary neuron is
+        renamed or the neurons are reordered, or if the index is dropped."""
+        snn: Simulator = self.get_snn(
+            neuron_names=["a", "b", "c"], edges=[(0, 1, 1)]
+        )
+        self.assertEqual(get_network_index(snn=snn).get_neuron_index("c"), 2)
+
+        snn.network.nodes[2].name = "d"
+        self.assertEqual(get_network_index(snn=snn).get_neuron_index("d"), 2)
+
+        snn.network.nodes.reverse()
+        self.assertEqual(get_network_index(snn=snn).get_neuron_index("d"), 0)
+
+        # A renamed middle neuron is only reindexed after dropping the index.
+        snn.network.nodes[1].name = "e"
+        drop_network_index(snn=snn)
+        self.assertEqual(get_network_index(snn=snn).get_neuron_index("e"), 1)
+
+        snn_graph: nx.DiGraph = nx.DiGraph()
+        snn_graph.add_edges_from([("a", "b"), ("b", "c")])
+        self.assertEqual(
+            get_network_index(snn=snn_graph).get_neuron_index("c"), 2
+        )
+        nx.relabel_nodes(snn_graph, {"c": "d"}, copy=False)
+        self.assertEqual(
+            get_network_index(snn=snn_graph).get_neuron_index("d"), 2
+        )
+
+    @typechecked
+    def test_radiation_death_ignores_unknown_neurons(self) -> None:
+        """Verifies radiation kills a neuron by name, and ignores names that
+        are not in the snn."""
+        snn: Simulator = self.get_snn(neuron_names=["a", "b"], edges=[])
+        apply_radiation_death_to_empty_simsnn_neuron(
+            neuron_name="unknown", snn_graph=snn
+        )
+        apply_radiation_death_to_empty_simsnn_neuron(
+            neuron_name="b", snn_graph=snn
+        )
+        self.assertEqual([node.thr for node in snn.network.nodes], [1, 999])
+
+    @typechecked
+    def test_nx_graph_index(self) -> None:
+        """Verifies the index of a networkx graph follows the node and edge
+        order."""
+        snn_graph: nx.DiGraph = nx.DiGraph()
+        snn_graph.add_edges_from([("a", "connector_b"), ("c", "a")])
+        network_index: Network_index = get_network_index(snn=snn_graph)
+        self.assertEqual(network_index.neuron_names, ["a", "connector_b", "c"])
+        self.assertEqual(
+            network_index.role_names["connector"], {"connector_b"}
+        )
+        self.assertEqual(network_index.get_predecessors(0).tolist(), [2])
+
+    @typechecked
+    def test_duplicate_and_mismatching_arrays(self) -> None:
+        """Verifies duplicate names and unequal synapse arrays raise an
+        error."""
+        with self.assertRaises(ValueError):
+            Network_index(
+                neuron_names=["a", "a"],
+                synapse_pre=np.zeros(0, dtype=np.int64),
+                synapse_post=np.zeros(0, dtype=np.int64),
+            )
+        with self.assertRaises(ValueError):
+            Network_index(
+                neuron_names=["a"],
+                synapse_pre=np.zeros(1, dtype=np.int64),
+                synapse_post=np.zeros(0, dtype=np.int64),
+            )
+
+    @typechecked
+    def test_rand_synapse_weights(self) -> None:
+        """Verifies the rand_ synapse weights are found through the index."""
+        input_graph: nx.Graph = nx.Graph()
+        input_graph.add_edge(0, 1)
+        input_graph.graph["alg_props"] = {"rand_edge_weights": [7, 8]}
+        snn: Simulator = self.get_snn(
+            neuron_names=[
+                "rand_0",
+                "rand_1",
+                "degree_receiver_0_1_0",
+                "degree_receiver_1_0_0",
+                "degree_receiver_1_0_1",
+            ],
+            edges=[(0, 3, 7), (1, 2, 8), (1, 4, 8)],
+        )
+        self.assertEqual(
+            get_rand_synapse_weights(input_graph=input_graph, snn=snn), [1, 1]
+        )
@@ -0,0 +1,74 @@
+"""Verifies the fast profile skips the type checks of the modules that opt
+in, and that the tests themselves use the checked profile."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from typeguard import typechecked
+
+from snncompare.progress_report.benchmark_profiles import (
+    copy_exp_config_file,
+    get_package_parent_dir,
+    get_summed_stage_durations,
+)
+from snncompare.typecheck_profile import PROFILE_ENV_VAR, get_profile
+from snncompare.typecheck_profile import typechecked as profile_typechecked
+
+
+def add_one(x: int) -> int:
+    """Returns x+1, used to test the type checks."""
+    return x + 1
+
+
+class Test_typecheck_profile(unittest.TestCase):
+    """Tests the checked and fast execution profiles."""
+
+    @typechecked
+    def test_tests_use_checked_profile(self) -> None:
+        """Tests the test package enforces the checked profile."""
+        self.assertEqual(get_profile(), "checked")
+        with self.assertRaises(TypeError):
+            profile_typechecked(add_one)("1")  # type:ignore[arg-type]
+
+    @typechecked
+    def test_fast_profile_returns_function_unchanged(self) -> None:
+        """Tests the fast profile does not wrap the function."""
+        with mock.patch.dict(os.environ, {PROFILE_ENV_VAR: "fast"}):
+            self.assertIs(profile_typechecked(add_one), add_one)
+        with mock.patch.dict(os.environ, {PROFILE_ENV_VAR: "slow"}):
+            with self.assertRaises(ValueError):
+                get_profile()
+
+    @typechecked
+    def test_missing_run_metrics_have_no_durations(self) -> None:
+        """Tests the benchmark reads no durations without run metrics."""
+        self.assertEqual(
+            get_summed_stage_durations(run_metrics_dir="non_existing/"), {}
+        )
+
+    @typechecked
+    def test_benchmark_runs_in_copy_of_exp_config(self) -> None:
+        """Tests the experiment config is copied into the temporary working
+        directory of a benchmark run, and the package can be imported from
+        there."""
+        custom_config_path: str = "src/snncompare/json_configurations/"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            copy_exp_config_file(
+                custom_config_path=custom_config_path,
+                exp_config_name="minimal_results",
+                tmp_dir=tmp_dir,
+            )
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(
+                        tmp_dir,
+                        custom_config_path,
+                        "exp_config",
+                        "minimal_results.json",
+                    )
+                )
+            )
+        self.assertTrue(
+            os.path.isdir(os.path.join(get_package_parent_dir(), "snncompare"))
+        )
@@ -0,0 +1,181 @@
+"""Verifies the work queue runs each item once on multiple simulated hosts,
+reclaims the leases of crashed workers, and retries failed items."""
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.export_results.file_locks import append_line
+from snncompare.work_queue.Work_queue import Work_queue
+from snncompare.work_queue.worker import run_worker, simulate_hosts
+
+
+class Item_logger:
+    """Logs the ids of the run items to a shared file."""
+
+    # pylint: disable=R0903
+    @typechecked
+    def __init__(self, log_filepath: str) -> None:
+        self.log_filepath: str = log_filepath
+
+    @typechecked
+    def __call__(self, item_id: str) -> None:
+        if item_id == "failing_item":
+            raise ValueError("Error, this item fails.")
+        time.sleep(0.01)
+        append_line(filepath=self.log_filepath, line=item_id)
+
+    @typechecked
+    def get_logged_item_ids(self) -> List[str]:
+        """Returns the logged item ids."""
+        with open(self.log_filepath, encoding="utf-8") as log_file:
+            return log_file.read().splitlines()
+
+
+class Test_work_queue(unittest.TestCase):
+    """Tests the shared filesystem work queue."""
+
+    @typechecked
+    def setUp(self) -> None:
+        """Creates an empty queue directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.item_logger = Item_logger(
+            log_filepath=os.path.join(self.tmp_dir.name, "log.txt")
+        )
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Removes the queue directory."""
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_simulated_hosts_run_each_item_once(self) -> None:
+        """Tests 3 simulated hosts complete all items exactly once."""
+        work_queue = Work_queue(queue_name="test", queue_dir=self.tmp_dir.name)
+        item_ids: List[str] = [f"run_{i}" for i in range(12)]
+        self.assertEqual(work_queue.enqueue(item_ids=item_ids), 12)
+        self.assertEqual(work_queue.enqueue(item_ids=item_ids), 0)
+
+        exit_codes: List[int] = simulate_hosts(
+            queue_name="test",
+            run_item=self.item_logger,
+            nr_of_hosts=3,
+            poll_interval=0.01,
+            queue_dir=self.tmp_dir.name,
+        )
+        self.assertEqual(exit_codes, [0, 0, 0])
+        self.assertEqual(
+            sorted(self.item_logger.get_logged_item_ids()), sorted(item_ids)
+        )
+        self.assertEqual(
+            work_queue.get_item_ids(sub_dir="done"), sorted(item_ids)
+        )
+        self.assertEqual(work_queue.get_unfinished_item_ids(), [])
+
+    @typechecked
+    def test_stale_lease_is_reclaimed(self) -> None:
+        """Tests the item of a crashed worker is run by another worker, and
+        the failing item is stored as failed after max_attempts attempts."""
+        work_queue = Work_queue(
+            queue_name="test",
+            lease_timeout=60,
+            queue_dir=self.tmp_dir.name,
+            max_attempts=2,
+        )
+        work_queue.enqueue(item_ids=["crashed_item", "failing_item"])
+        self.assertTrue(
+            work_queue.try_claim(item_id="crashed_item", worker_id="crashed")
+        )
+        self.assertFalse(
+            work_queue.try_claim(item_id="crashed_item", worker_id="other")
+        )
+
+        # Simulate the crashed worker stopped its heartbeat long ago.
+        lease_filepath: str = work_queue.get_item_filepath(
+            sub_dir="leases", item_id="crashed_item"
+        )
+        os.utime(lease_filepath, (time.time() - 120, time.time() - 120))
+
+        completed_item_ids: List[str] = run_worker(
+            work_queue=work_queue,
+            run_item=self.item_logger,
+            worker_id="other",
+            poll_interval=0.01,
+        )
+        self.assertEqual(completed_item_ids, ["crashed_item"])
+        self.assertEqual(
+            work_queue.get_item_ids(sub_dir="failed"), ["failing_item"]
+        )
+        self.assertEqual(
+            [
+                error["worker_id"]
+                for error in work_queue.get_errors(item_id="failing_item")
+            ],
+            ["other", "other"],
+        )
+        self.assertFalse(os.path.exists(lease_filepath))
+
+    @typechecked
+    def test_failed_item_is_retried(self) -> None:
+        """Tests an item that fails once is retried and completed."""
+        work_queue = Work_queue(queue_name="test", queue_dir=self.tmp_dir.name)
+        work_queue.enqueue(item_ids=["flaky_item"])
+        attempts: List[str] = []
+
+        @typechecked
+        def run_item(item_id: str) -> None:
+            attempts.append(item_id)
+            if len(attempts) == 1:
+                raise ValueError("Error, the first attempt fails.")
+
+        completed_item_ids: List[str] = run_worker(
+            work_queue=work_queue,
+            run_item=run_item,
+            worker_id="worker",
+            poll_interval=0.01,
+        )
+        self.assertEqual(completed_item_ids, ["flaky_item"])
+        self.assertEqual(attempts, ["flaky_item", "flaky_item"])
+        self.assertEqual(len(work_queue.get_errors(item_id="flaky_item")), 1)
+        self.assertEqual(work_queue.get_item_ids(sub_dir="failed"), [])
+
+    @typechecked
+    def test_lost_lease_is_not_marked_done(self) -> None:
+        """Tests a worker whose lease was reclaimed does not mark the item as
+        done, and leaves the item to the worker that reclaimed it."""
+        work_queue = Work_queue(
+            queue_name="test", lease_timeout=0.2, queue_dir=self.tmp_dir.name
+        )
+        work_queue.enqueue(item_ids=["slow_item"])
+        attempts: List[str] = []
+
+        @typechecked
+        def run_item(item_id: str) -> None:
+            attempts.append(item_id)
+            if len(attempts) == 1:
+                # Another worker reclaims the lease while this worker runs.
+                work_queue.release(item_id=item_id, worker_id=None)
+                self.assertTrue(
+                    work_queue.try_claim(item_id=item_id, worker_id="other")
+                )
+                self.assertFalse(
+                    work_queue.heartbeat(item_id=item_id, worker_id="slow")
+                )
+
+        completed_item_ids: List[str] = run_worker(
+            work_queue=work_queue,
+            run_item=run_item,
+            worker_id="slow",
+            poll_interval=0.01,
+        )
+        # The item is only completed after the lease of the other worker
+        # became stale, and was reclaimed by this worker.
+        self.assertEqual(attempts, ["slow_item", "slow_item"])
+        self.assertEqual(completed_item_ids, ["slow_item"])
+        self.assertEqual(
+            work_queue.get_item_ids(sub_dir="done"), ["slow_item"]
+        )